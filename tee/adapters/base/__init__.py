@@ -6,6 +6,7 @@ All components are re-exported here for backward compatibility.
 """
 
 # Import core components
+from .async_queries import QueryHandle
 from .config import AdapterConfig, MaterializationType
 from .core import DatabaseAdapter
 
@@ -15,4 +16,5 @@ __all__ = [
     "DatabaseAdapter",
     "AdapterConfig",
     "MaterializationType",
+    "QueryHandle",
 ]
@@ -0,0 +1,110 @@
+"""
+Columnar (Arrow) query results for database adapters.
+
+These methods are mixed into DatabaseAdapter via multiple inheritance. execute_query()
+returns Python row lists, which creates a Python object for every row and value;
+execute_arrow() and iter_arrow_batches() return pyarrow tables and record batches
+instead. Adapters whose drivers produce Arrow data natively (DuckDB, Snowflake,
+BigQuery) override them and set supports_arrow_results. PostgreSQL (psycopg2 only
+returns rows) converts its streamed row batches with their column names, and every
+other adapter gets a fallback that converts the rows of iter_query_batches() column
+by column.
+
+pyarrow is an optional dependency: callers that can work on rows as well should check
+supports_arrow_results(adapter) before using the Arrow path.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+# Default number of rows per record batch
+DEFAULT_ARROW_BATCH_SIZE = 10_000
+
+
+def import_pyarrow() -> Any:
+    """
+    Import pyarrow, with an installation hint if it is missing.
+
+    Returns:
+        The pyarrow module
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is not installed. Install it with: uv add pyarrow") from None
+    return pyarrow
+
+
+def supports_arrow_results(adapter: Any) -> bool:
+    """Whether an adapter returns Arrow results natively and pyarrow is installed."""
+    if getattr(adapter, "supports_arrow_results", False) is not True:
+        return False
+    try:
+        import_pyarrow()
+    except ImportError:
+        return False
+    return True
+
+
+def rows_to_record_batch(rows: list[Any], column_names: list[str]) -> Any:
+    """
+    Convert a list of row tuples to an Arrow record batch.
+
+    Args:
+        rows: Rows as tuples (or lists) of values
+        column_names: Names of the columns, in row order
+
+    Returns:
+        pyarrow.RecordBatch with one array per column
+    """
+    pa = import_pyarrow()
+    columns = list(zip(*rows, strict=True)) if rows else [() for _ in column_names]
+    return pa.RecordBatch.from_arrays([pa.array(column) for column in columns], names=column_names)
+
+
+class ArrowResultExecutor:
+    """Mixin class for fetching query results as Arrow data."""
+
+    # Adapters that produce Arrow results without building Python rows set this
+    supports_arrow_results: bool = False
+
+    def execute_arrow(self, query: str) -> Any:
+        """
+        Execute a query and return its result as an Arrow table.
+
+        Args:
+            query: SQL query to execute
+
+        Returns:
+            pyarrow.Table with the query result
+        """
+        pa = import_pyarrow()
+        batches = list(self.iter_arrow_batches(query))
+        if not batches:
+            return pa.table({})
+        return pa.Table.from_batches(batches)
+
+    def iter_arrow_batches(
+        self, query: str, batch_size: int = DEFAULT_ARROW_BATCH_SIZE
+    ) -> Iterator[Any]:
+        """
+        Execute a query and yield its result as Arrow record batches.
+
+        The default implementation converts the row batches of iter_query_batches().
+        Drivers do not report column names through it, so the columns are named
+        column_0, column_1, ... by position.
+
+        Args:
+            query: SQL query to execute
+            batch_size: Maximum number of rows per batch
+
+        Yields:
+            pyarrow.RecordBatch objects of at most batch_size rows
+        """
+        for rows in self.iter_query_batches(query, batch_size):
+            if rows:
+                names = [f"column_{i}" for i in range(len(rows[0]))]
+                yield rows_to_record_batch(rows, names)
@@ -0,0 +1,148 @@
+"""
+Asynchronous query submission for database adapters.
+
+These methods are mixed into DatabaseAdapter via multiple inheritance. Adapters whose
+drivers can submit a query and return before it finishes (e.g. Snowflake's
+execute_async) override them; every other adapter gets a synchronous fallback that runs
+the query on submit and returns an already finished handle.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+# Query handle states
+QUERY_RUNNING = "running"
+QUERY_SUCCEEDED = "succeeded"
+QUERY_FAILED = "failed"
+QUERY_CANCELLED = "cancelled"
+
+
+@dataclass
+class QueryHandle:
+    """A query submitted to the database."""
+
+    query: str
+    query_id: str | None = None
+    state: str = QUERY_RUNNING
+    result: Any = None
+    error: BaseException | None = None
+    submitted_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def done(self) -> bool:
+        """Whether the query has finished (successfully or not)."""
+        return self.state != QUERY_RUNNING
+
+
+class AsyncQueryExecutor:
+    """Mixin class for submitting queries without waiting for them to finish."""
+
+    # Adapters that keep queries running server-side after submit_query returns set this
+    supports_async_queries: bool = False
+
+    def submit_query(self, query: str) -> QueryHandle:
+        """
+        Submit a query and return a handle to it.
+
+        The default implementation runs the query synchronously, so the returned
+        handle is already finished.
+
+        Args:
+            query: SQL query to submit
+
+        Returns:
+            Handle to pass to poll(), wait() or cancel()
+        """
+        handle = QueryHandle(query=query)
+        try:
+            handle.result = self.execute_query(query)
+            handle.state = QUERY_SUCCEEDED
+        except Exception as e:
+            handle.error = e
+            handle.state = QUERY_FAILED
+        return handle
+
+    def poll(self, handle: QueryHandle) -> bool:
+        """
+        Refresh the state of a submitted query without blocking.
+
+        Args:
+            handle: Handle returned by submit_query()
+
+        Returns:
+            True if the query has finished
+        """
+        return handle.done
+
+    def wait(self, handle: QueryHandle, timeout: float | None = None) -> Any:  # noqa: ARG002
+        """
+        Block until a submitted query finishes and return its result.
+
+        The default implementation never waits: its queries finish on submit, so
+        timeout only applies to adapters that run queries asynchronously.
+
+        Args:
+            handle: Handle returned by submit_query()
+            timeout: Maximum number of seconds to wait (None waits indefinitely)
+
+        Returns:
+            The query result
+
+        Raises:
+            TimeoutError: If the query is still running after timeout seconds
+            Exception: The error the query failed with
+        """
+        if not handle.done:
+            raise TimeoutError(f"Query {handle.query_id} did not finish")
+        if handle.error is not None:
+            raise handle.error
+        return handle.result
+
+    def cancel(self, handle: QueryHandle) -> None:
+        """
+        Cancel a submitted query if it is still running.
+
+        Args:
+            handle: Handle returned by submit_query()
+        """
+        if not handle.done:
+            handle.state = QUERY_CANCELLED
+
+    def submit_create_table(
+        self, table_name: str, query: str, metadata: dict[str, Any] | None = None
+    ) -> QueryHandle:
+        """
+        Submit the statement that creates a table from a query.
+
+        The default implementation creates the table synchronously (including its
+        comments and tags) and returns a finished handle.
+
+        Args:
+            table_name: Name of the table to create
+            query: Qualified SQL query
+            metadata: Optional table metadata
+
+        Returns:
+            Handle to the CREATE TABLE statement
+        """
+        handle = QueryHandle(query=query)
+        try:
+            self.create_table(table_name, query, metadata)
+            handle.state = QUERY_SUCCEEDED
+        except Exception as e:
+            handle.error = e
+            handle.state = QUERY_FAILED
+        return handle
+
+    def complete_create_table(
+        self, table_name: str, metadata: dict[str, Any] | None = None
+    ) -> None:
+        """
+        Finish a table created with submit_create_table() (comments, tags, ...).
+
+        Args:
+            table_name: Name of the created table
+            metadata: Optional table metadata
+        """
+        pass
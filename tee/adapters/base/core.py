@@ -3,16 +3,28 @@ Core database adapter base class.
 """
 
 import logging
+import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
+from .arrow import ArrowResultExecutor
+from .async_queries import AsyncQueryExecutor
 from .config import AdapterConfig, MaterializationType
 from .metadata import MetadataHandler
 from .sql import SQLProcessor
 from .testing import TestQueryGenerator
 
 
-class DatabaseAdapter(ABC, SQLProcessor, MetadataHandler, TestQueryGenerator):
+class DatabaseAdapter(
+    ABC,
+    SQLProcessor,
+    MetadataHandler,
+    TestQueryGenerator,
+    AsyncQueryExecutor,
+    ArrowResultExecutor,
+):
     """
     Abstract base class for database adapters.
 
@@ -23,9 +35,18 @@ class DatabaseAdapter(ABC, SQLProcessor, MetadataHandler, TestQueryGenerator):
     # Override in subclasses to define required fields
     REQUIRED_FIELDS = ["type"]
 
+    # Adapters whose iter_query_batches() streams rows instead of fetching them all set this
+    supports_streaming_results: bool = False
+
     def __init__(self, config_dict: dict[str, Any]) -> None:
         self.connection: Any | None = None
         self.logger: logging.Logger = logging.getLogger(self.__class__.__name__)
+        # Ahead-of-time transpiled SQL keyed by the hash of its source SQL
+        self._precompiled_sql: dict[str, str] = {}
+        # Authoritative compile-time output schemas keyed by the hash of their source SQL
+        self._known_query_schemas: dict[str, list[dict[str, Any]]] = {}
+        # Nesting depth of transaction() blocks
+        self._transaction_depth = 0
 
         # Validate configuration first
         self._validate_config(config_dict)
@@ -136,6 +157,60 @@ class DatabaseAdapter(ABC, SQLProcessor, MetadataHandler, TestQueryGenerator):
         """Execute a SQL query and return results."""
         pass
 
+    @property
+    def in_transaction(self) -> bool:
+        """Whether statements currently run inside a transaction() block."""
+        return self._transaction_depth > 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Run a unit of work (e.g. all statements of one model) in a single transaction.
+
+        The transaction commits when the block exits and rolls back if it raises, so a
+        model is never left half-applied. Nested blocks join the outermost transaction.
+        Adapters override _begin_transaction, _commit_transaction and
+        _rollback_transaction; by default every statement keeps auto-committing.
+
+        Example:
+            with adapter.transaction():
+                adapter.execute_query(delete_sql)
+                adapter.execute_query(insert_sql)
+        """
+        if self._transaction_depth or not self.connection:
+            self._transaction_depth += 1
+            try:
+                yield
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        self._begin_transaction()
+        self._transaction_depth = 1
+        try:
+            yield
+        except BaseException:
+            self._transaction_depth = 0
+            try:
+                self._rollback_transaction()
+            except Exception as e:
+                self.logger.warning(f"Could not roll back transaction: {e}")
+            raise
+        self._transaction_depth = 0
+        self._commit_transaction()
+
+    def _begin_transaction(self) -> None:
+        """Start a transaction on the connection (no-op for auto-committing adapters)."""
+        pass
+
+    def _commit_transaction(self) -> None:
+        """Commit the transaction started by _begin_transaction."""
+        pass
+
+    def _rollback_transaction(self) -> None:
+        """Roll back the transaction started by _begin_transaction."""
+        pass
+
     @abstractmethod
     def create_table(
         self, table_name: str, query: str, metadata: dict[str, Any] | None = None
@@ -317,6 +392,102 @@ class DatabaseAdapter(ABC, SQLProcessor, MetadataHandler, TestQueryGenerator):
         self.execute_query(delete_sql)
         self.execute_query(insert_sql)
 
+    def execute_incremental_insert_overwrite(
+        self, table_name: str, source_sql: str, partition_by: list[str]
+    ) -> None:
+        """Replace the partitions of a table that a new batch of rows touches.
+
+        The batch is staged in a temporary table, the rows of every partition present in
+        the batch are deleted, and the batch is inserted. Adapters override this to run the
+        steps in one transaction or to use a native partition overwrite. By default the
+        steps run as separate statements, so a failure can leave partitions deleted.
+        """
+        self.logger.warning(
+            f"Adapter {self.__class__.__name__} does not support atomic insert_overwrite, "
+            "falling back to separate delete and insert statements"
+        )
+        staging_table = self.insert_overwrite_staging_name()
+        self.execute_query(f"CREATE TEMPORARY TABLE {staging_table} AS {source_sql}")
+        try:
+            self.execute_query(
+                self.build_partition_delete(table_name, staging_table, partition_by)
+            )
+            self.execute_query(f"INSERT INTO {table_name} SELECT * FROM {staging_table}")
+        finally:
+            self.execute_query(f"DROP TABLE IF EXISTS {staging_table}")
+
+    def insert_overwrite_staging_name(self) -> str:
+        """Return a unique name for the temporary table staging an insert_overwrite batch."""
+        return f"tee_overwrite_{uuid.uuid4().hex[:12]}"
+
+    def build_partition_delete(
+        self, table_name: str, staging_table: str, partition_by: list[str]
+    ) -> str:
+        """
+        Build a DELETE removing the rows of every partition present in a staged batch.
+
+        Partition values are compared with IS NOT DISTINCT FROM, so a NULL partition in the
+        batch replaces the NULL partition of the table.
+
+        Args:
+            table_name: Table whose partitions are replaced (qualified as it is referenced)
+            staging_table: Table holding the new batch
+            partition_by: Partition columns
+
+        Returns:
+            DELETE statement
+        """
+        if not partition_by:
+            raise ValueError(f"insert_overwrite for {table_name} requires partition columns")
+
+        conditions = " AND ".join(
+            f"batch.{column} IS NOT DISTINCT FROM {table_name}.{column}"
+            for column in partition_by
+        )
+        return (
+            f"DELETE FROM {table_name} WHERE EXISTS "
+            f"(SELECT 1 FROM {staging_table} AS batch WHERE {conditions})"
+        )
+
+    def iter_query_batches(self, query: str, batch_size: int = 1000) -> Iterator[list[Any]]:
+        """
+        Execute a query and yield its rows in batches.
+
+        Adapters that can stream results (e.g. with server-side cursors) override this so
+        large result sets are never held in memory at once. The default implementation
+        fetches all rows with execute_query and slices them.
+
+        Args:
+            query: SQL query to execute
+            batch_size: Maximum number of rows per batch
+
+        Yields:
+            Lists of at most batch_size rows
+        """
+        rows = self.execute_query(query) or []
+        for start in range(0, len(rows), batch_size):
+            yield rows[start : start + batch_size]
+
+    def estimate_query_bytes(self, query: str) -> int:
+        """
+        Estimate the bytes a query would scan, without running it.
+
+        Only databases that bill by bytes scanned and can validate a query without
+        running it (e.g. BigQuery dry runs) implement this.
+
+        Args:
+            query: SQL query to estimate
+
+        Returns:
+            Number of bytes the query would process
+
+        Raises:
+            NotImplementedError: If the database cannot estimate queries
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} cannot estimate the bytes scanned by a query"
+        )
+
     def get_database_info(self) -> dict[str, Any]:
         """Get information about the current database connection."""
         return {
@@ -57,6 +57,22 @@ class MetadataHandler:
 
         return column_descriptions
 
+    def get_table_fingerprint(self, table_name: str) -> str | None:  # noqa: ARG002
+        """
+        Get warehouse metadata that changes whenever the data of a table changes.
+
+        Used to tell whether a table was modified since a test last passed on it,
+        including by writes outside t4t. The default implementation has no such
+        metadata; adapters whose databases track a last-modified time override it.
+
+        Args:
+            table_name: Fully qualified table name
+
+        Returns:
+            Opaque fingerprint string, or None if the database does not track changes
+        """
+        return None
+
     def _add_column_comments(self, table_name: str, column_descriptions: dict[str, str]) -> None:
         """
         Add column comments to a table.
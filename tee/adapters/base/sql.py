@@ -4,12 +4,124 @@ SQL processing methods for database adapters.
 These methods are mixed into DatabaseAdapter via multiple inheritance.
 """
 
-import sqlglot
+import hashlib
+from typing import Any
+
+from tee.ast_registry import parse_sql
+from tee.instrumentation import span
+
+
+def sql_hash(sql: str) -> str:
+    """Return the SHA-256 hex digest identifying a model's source SQL."""
+    return hashlib.sha256(sql.encode("utf-8")).hexdigest()
 
 
 class SQLProcessor:
     """Mixin class for SQL dialect conversion and processing."""
 
+    @property
+    def transpile_target(self) -> str:
+        """Name of the dialect this adapter executes, used to key transpiled SQL."""
+        return self.config.target_dialect or self.get_default_dialect()
+
+    def transpile_model_sql(self, sql: str) -> str:
+        """
+        Convert a model's SQL into the statement this adapter executes for it.
+
+        Adapters that qualify table references at execution time override this so the
+        ahead-of-time result matches what execution would have produced.
+
+        Args:
+            sql: Model SQL (resolved_sql)
+
+        Returns:
+            SQL in the adapter's target dialect
+        """
+        return self.convert_sql_dialect(sql)
+
+    def build_transpiled_sql(self, sql: str) -> dict[str, Any]:
+        """
+        Transpile a model's SQL ahead of time.
+
+        Args:
+            sql: Model SQL (resolved_sql)
+
+        Returns:
+            Entry with the transpiled "sql", the "source_hash" of the input SQL and the
+            "schema" it was qualified against
+        """
+        return {
+            "sql": self.transpile_model_sql(sql),
+            "source_hash": sql_hash(sql),
+            "schema": self.config.schema,
+        }
+
+    def use_transpiled_sql(self, sql: str, transpiled: dict[str, Any] | None) -> bool:
+        """
+        Register ahead-of-time transpiled SQL so execution skips dialect conversion.
+
+        The entry for this adapter's target dialect is used only if it was built from
+        exactly this SQL and against the same schema; otherwise the SQL is converted at
+        execution time as usual.
+
+        Args:
+            sql: Model SQL about to be executed
+            transpiled: Transpiled SQL keyed by dialect name (code.sql.transpiled)
+
+        Returns:
+            True if precompiled SQL was registered
+        """
+        entry = (transpiled or {}).get(self.transpile_target)
+        if not isinstance(entry, dict) or not entry.get("sql"):
+            return False
+        if entry.get("source_hash") != sql_hash(sql) or entry.get("schema") != self.config.schema:
+            self.logger.debug("Ignoring stale transpiled SQL, converting at execution time")
+            return False
+
+        self._precompiled_sql[entry["source_hash"]] = entry["sql"]
+        return True
+
+    def get_precompiled_sql(self, sql: str) -> str | None:
+        """Return the registered transpiled SQL for a model's SQL, if any."""
+        if not self._precompiled_sql or not sql:
+            return None
+        return self._precompiled_sql.get(sql_hash(sql))
+
+    def use_output_schema(self, sql: str, output_schema: dict[str, Any] | None) -> bool:
+        """
+        Register a model's compile-time output schema so schema comparisons skip the query.
+
+        Only authoritative schemas inferred from exactly this SQL and rendered in this
+        adapter's dialect are registered; otherwise the schema of the query is
+        described by the database as usual.
+
+        Args:
+            sql: Model SQL about to be executed
+            output_schema: Output schema from the schema catalog (code.sql.output_schema)
+
+        Returns:
+            True if the output schema was registered
+        """
+        if not isinstance(output_schema, dict) or not output_schema.get("authoritative"):
+            return False
+        if (
+            output_schema.get("source_hash") != sql_hash(sql)
+            or output_schema.get("dialect") != self.transpile_target
+        ):
+            self.logger.debug("Ignoring stale output schema, describing the query instead")
+            return False
+
+        self._known_query_schemas[output_schema["source_hash"]] = [
+            {"name": col["name"], "type": col["type"]} for col in output_schema["columns"]
+        ]
+        return True
+
+    def get_known_query_schema(self, sql: str) -> list[dict[str, Any]] | None:
+        """Return the registered output schema of a model's SQL, if any."""
+        if not self._known_query_schemas or not sql:
+            return None
+        return self._known_query_schemas.get(sql_hash(sql))
+
     def convert_sql_dialect(self, sql: str, source_dialect: str | None = None) -> str:
         """
         Convert SQL from source dialect to target dialect.
@@ -28,14 +140,20 @@ class SQLProcessor:
         if not sql or not sql.strip():
             return sql
 
+        if source_dialect is None:
+            precompiled = self.get_precompiled_sql(sql)
+            if precompiled is not None:
+                return precompiled
+
         try:
             # Parse with source dialect (None = auto-detect, more flexible)
             # If source_dialect is provided, use it; otherwise let SQLGlot auto-detect
             read_dialect = self._get_dialect(source_dialect) if source_dialect else None
-            parsed = sqlglot.parse_one(sql, read=read_dialect)
+            with span("dialect_conversion"):
+                parsed = parse_sql(sql, dialect=read_dialect, copy=False)
 
-            # Convert to target dialect
-            converted = parsed.sql(dialect=self.target_dialect)
+                # Convert to target dialect
+                converted = parsed.sql(dialect=self.target_dialect)
 
             # Log info if conversion happened
             source_name = source_dialect or "auto-detect"
@@ -70,7 +188,7 @@ class SQLProcessor:
 
         try:
             # Parse the SQL
-            parsed = sqlglot.parse_one(sql, read=self.target_dialect)
+            parsed = parse_sql(sql, dialect=self.target_dialect)
 
             # Use sqlglot's qualify optimizer
             from sqlglot.optimizer.qualify import qualify
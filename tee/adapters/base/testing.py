@@ -2,6 +2,19 @@
 Test SQL generation methods for database adapters.
 
 These methods are mixed into DatabaseAdapter via multiple inheritance.
+
+Row-local tests (not_null, accepted_values, relationships) accept an optional `where`
+condition that limits them to some rows of the tested table, e.g. the rows of the last
+incremental batch. Uniqueness cannot be checked on those rows alone, so
+generate_unique_new_rows_test_query() checks their keys against the whole table.
+
+The same generators accept an optional `sample_percent` for tests run in sample mode:
+the tested table is read through generate_table_sample(), whose TABLESAMPLE syntax
+adapters override for their database. A sampled unique test checks the keys of the
+sampled rows against the whole table with the same semi-join, so a duplicate is found
+as soon as one of its rows is sampled. generate_unique_approx_query() estimates the
+duplicates of a column with APPROX_COUNT_DISTINCT, on databases that set
+supports_approx_count_distinct.
 """
 
 from typing import Any
@@ -10,7 +23,38 @@ from typing import Any
 class TestQueryGenerator:
     """Mixin class for generating test SQL queries."""
 
-    def generate_not_null_test_query(self, table_name: str, column_name: str) -> str:
+    # Databases with an APPROX_COUNT_DISTINCT aggregate set this
+    supports_approx_count_distinct: bool = False
+
+    def generate_table_sample(self, table_name: str, percent: float) -> str:
+        """
+        Generate a table reference reading a random sample of the table.
+
+        Uses standard TABLESAMPLE SYSTEM (block-level) sampling, which is much cheaper
+        than sampling single rows. The sample can be followed by a WHERE clause.
+
+        Args:
+            table_name: Fully qualified table name (e.g., "my_schema.my_table")
+            percent: Percentage of the table to read, in (0, 100]
+
+        Returns:
+            SQL table reference
+        """
+        return f"{table_name} TABLESAMPLE SYSTEM ({percent:g})"
+
+    def _sampled(self, table_name: str, sample_percent: float | None) -> str:
+        """Reference a table, or a sample of it if sample_percent is set."""
+        if sample_percent is None:
+            return table_name
+        return self.generate_table_sample(table_name, sample_percent)
+
+    def generate_not_null_test_query(
+        self,
+        table_name: str,
+        column_name: str,
+        where: str | None = None,
+        sample_percent: float | None = None,
+    ) -> str:
         """
         Generate SQL query for not_null test.
 
@@ -23,17 +67,27 @@ class TestQueryGenerator:
         Args:
             table_name: Fully qualified table name (e.g., "my_schema.my_table")
             column_name: Column name to test (e.g., "user_id")
+            where: Optional condition limiting the rows tested
+            sample_percent: Optional percentage of the table to sample
 
         Returns:
             SQL query string
         """
+        table_name = self._sampled(table_name, sample_percent)
         # Default implementation - adapters can override for optimizations
         # Note: table_name and column_name are expected to be simple identifiers
         # (no spaces, no special chars) from validated metadata
         # Using COUNT(*) for better performance on large tables
+        if where:
+            return f"SELECT COUNT(*) FROM {table_name} WHERE ({where}) AND {column_name} IS NULL"
         return f"SELECT COUNT(*) FROM {table_name} WHERE {column_name} IS NULL"
 
-    def generate_unique_test_query(self, table_name: str, columns: list[str] | None = None) -> str:
+    def generate_unique_test_query(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        sample_percent: float | None = None,
+    ) -> str:
         """
         Generate SQL query for unique test.
 
@@ -47,10 +101,13 @@ class TestQueryGenerator:
             table_name: Fully qualified table name (e.g., "my_schema.my_table")
             columns: List of column names to check for uniqueness (e.g., ["col1", "col2"]).
                     If None, checks all columns (entire row uniqueness).
+            sample_percent: Optional percentage of the table to sample (only duplicates
+                within the sample are found)
 
         Returns:
             SQL query string
         """
+        table_name = self._sampled(table_name, sample_percent)
         # Default implementation - adapters can override for optimizations
         # Note: table_name and columns are expected to be simple identifiers
         # (no spaces, no special chars) from validated metadata
@@ -80,6 +137,76 @@ class TestQueryGenerator:
                 ) AS duplicate_groups
             """
 
+    def generate_unique_new_rows_test_query(
+        self,
+        table_name: str,
+        columns: list[str],
+        where: str | None = None,
+        sample_percent: float | None = None,
+    ) -> str:
+        """
+        Generate SQL query for a unique test limited to some rows of a table.
+
+        Returns count of duplicate groups whose key appears in the rows matching `where`,
+        or in a sample of the table (test fails if count > 0). The keys of those rows are semi-joined to the table,
+        so only their groups are aggregated instead of the whole table. Rows with a NULL
+        key never match the semi-join; nulls are left to the not_null test.
+
+        Args:
+            table_name: Fully qualified table name (e.g., "my_schema.my_table")
+            columns: List of column names to check for uniqueness
+            where: Optional condition selecting the rows whose keys are checked
+            sample_percent: Optional percentage of the table to sample the checked rows
+                from (their keys are still checked against the whole table)
+
+        Returns:
+            SQL query string
+        """
+        new_rows = self._sampled(table_name, sample_percent)
+        if where:
+            new_rows = f"{new_rows} WHERE {where}"
+        column_list = ", ".join(f"existing.{column}" for column in columns)
+        key_list = ", ".join(columns)
+        join_clause = " AND ".join(f"new_rows.{column} = existing.{column}" for column in columns)
+        return f"""
+            SELECT COUNT(*)
+            FROM (
+                SELECT {column_list}, COUNT(*) as duplicate_count
+                FROM {table_name} AS existing
+                WHERE EXISTS (
+                    SELECT 1
+                    FROM (SELECT {key_list} FROM {new_rows}) AS new_rows
+                    WHERE {join_clause}
+                )
+                GROUP BY {column_list}
+                HAVING COUNT(*) > 1
+            ) AS duplicate_groups
+        """
+
+    def generate_unique_approx_query(self, table_name: str, column_name: str) -> str:
+        """
+        Generate SQL query estimating the duplicate rows of a column.
+
+        Returns the number of rows minus the approximate number of distinct values
+        (NULLs counting as one value, like in the unique test). The estimate is cheap
+        but not exact in either direction: a positive result means there may be
+        duplicates and the exact query should decide.
+
+        Only used by adapters that set supports_approx_count_distinct.
+
+        Args:
+            table_name: Fully qualified table name (e.g., "my_schema.my_table")
+            column_name: Column name to check (e.g., "user_id")
+
+        Returns:
+            SQL query string
+        """
+        return f"""
+            SELECT COUNT(*) - APPROX_COUNT_DISTINCT({column_name})
+                - CASE WHEN COUNT(*) > COUNT({column_name}) THEN 1 ELSE 0 END
+            FROM {table_name}
+        """
+
     def generate_no_duplicates_test_query(
         self, table_name: str, columns: list[str] | None = None
     ) -> str:
@@ -110,7 +237,12 @@ class TestQueryGenerator:
         return f"SELECT COUNT(*) FROM {table_name}"
 
     def generate_accepted_values_test_query(
-        self, table_name: str, column_name: str, values: list[Any]
+        self,
+        table_name: str,
+        column_name: str,
+        values: list[Any],
+        where: str | None = None,
+        sample_percent: float | None = None,
     ) -> str:
         """
         Generate SQL query for accepted_values test.
@@ -125,6 +257,8 @@ class TestQueryGenerator:
             table_name: Fully qualified table name (e.g., "my_schema.my_table")
             column_name: Column name to test (e.g., "status")
             values: List of accepted values (e.g., ["active", "inactive", "pending"])
+            where: Optional condition limiting the rows tested
+            sample_percent: Optional percentage of the table to sample
 
         Returns:
             SQL query string
@@ -151,7 +285,10 @@ class TestQueryGenerator:
                 formatted_values.append(f"'{escaped_val}'")
 
         values_list = ", ".join(formatted_values)
-        return f"SELECT COUNT(*) FROM {table_name} WHERE {column_name} NOT IN ({values_list})"
+        condition = f"{column_name} NOT IN ({values_list})"
+        if where:
+            condition = f"({where}) AND {condition}"
+        return f"SELECT COUNT(*) FROM {self._sampled(table_name, sample_percent)} WHERE {condition}"
 
     def generate_relationships_test_query(
         self,
@@ -159,6 +296,8 @@ class TestQueryGenerator:
         source_columns: list[str],
         target_table: str,
         target_columns: list[str],
+        where: str | None = None,
+        sample_percent: float | None = None,
     ) -> str:
         """
         Generate SQL query for relationships test.
@@ -175,6 +314,8 @@ class TestQueryGenerator:
             source_columns: List of column names in source table (e.g., ["user_id"] or ["region_id", "country_id"])
             target_table: Fully qualified target table name (e.g., "my_schema.users")
             target_columns: List of column names in target table (e.g., ["id"] or ["region_id", "country_id"])
+            where: Optional condition limiting the source rows tested
+            sample_percent: Optional percentage of the source table to sample
 
         Returns:
             SQL query string
@@ -197,6 +338,11 @@ class TestQueryGenerator:
         null_conditions = [f"target.{col} IS NULL" for col in target_columns]
         where_clause = " OR ".join(null_conditions)
 
+        if where or sample_percent is not None:
+            source_rows = self._sampled(source_table, sample_percent)
+            filter_clause = f" WHERE {where}" if where else ""
+            source_table = f"(SELECT * FROM {source_rows}{filter_clause})"
+
         # LEFT JOIN to find orphaned rows (rows in source that don't exist in target)
         return f"""
             SELECT COUNT(*) 
@@ -8,24 +8,45 @@ This module provides BigQuery-specific functionality including:
 - Materialization support including external tables
 """
 
+import time
+from collections.abc import Callable, Iterator
 from typing import Any
 
 from tee.adapters.base import AdapterConfig, DatabaseAdapter, MaterializationType
+from tee.adapters.base.arrow import DEFAULT_ARROW_BATCH_SIZE, import_pyarrow
 from tee.adapters.registry import register_adapter
+from tee.instrumentation import record_query
 
 
 class BigQueryAdapter(DatabaseAdapter):
     """BigQuery database adapter with SQLglot integration."""
 
-    def __init__(self, config: AdapterConfig) -> None:
-        try:
-            from google.cloud import bigquery
-        except ImportError:
-            raise ImportError(
-                "google-cloud-bigquery is not installed. Install it with: uv add google-cloud-bigquery"
-            ) from None
+    supports_arrow_results = True
+    supports_approx_count_distinct = True
+
+    def __init__(
+        self, config: AdapterConfig, job_config_factory: Callable[..., Any] | None = None
+    ) -> None:
+        """
+        Initialize the BigQuery adapter.
+
+        Args:
+            config: Adapter configuration
+            job_config_factory: Optional factory of query job configurations, defaults to
+                google.cloud.bigquery.QueryJobConfig (set with a local fake client, which
+                then runs without google-cloud-bigquery)
+        """
+        if job_config_factory is None:
+            try:
+                from google.cloud import bigquery
+            except ImportError:
+                raise ImportError(
+                    "google-cloud-bigquery is not installed. Install it with: uv add google-cloud-bigquery"
+                ) from None
+            job_config_factory = bigquery.QueryJobConfig
 
         super().__init__(config)
+        self.job_config_factory = job_config_factory
 
     def get_default_dialect(self) -> str:
         """Get the default SQL dialect for BigQuery."""
@@ -78,18 +99,18 @@ class BigQueryAdapter(DatabaseAdapter):
             raise RuntimeError("Not connected to database. Call connect() first.")
 
         try:
-            # Convert SQL if needed
-            converted_query = self.convert_sql_dialect(query)
-
-            # Qualify table references if dataset is specified
-            if self.config.database:
-                converted_query = self.qualify_table_references(
-                    converted_query, self.config.database
-                )
+            converted_query = self._prepare_query(query)
 
             # Execute query
+            start = time.perf_counter()
             query_job = self.client.query(converted_query)
             result = query_job.result()
+            record_query(
+                converted_query,
+                time.perf_counter() - start,
+                rows=query_job.num_dml_affected_rows,
+                bytes_processed=query_job.total_bytes_processed,
+            )
 
             # Convert to list of tuples for compatibility
             rows = []
@@ -102,6 +123,58 @@ class BigQueryAdapter(DatabaseAdapter):
             self.logger.error(f"Error executing query: {e}")
             raise
 
+    def execute_arrow(self, query: str) -> Any:
+        """Execute a SQL query and return its result as an Arrow table."""
+        if not self.client:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+        import_pyarrow()
+
+        converted_query = self._prepare_query(query)
+        start = time.perf_counter()
+        query_job = self.client.query(converted_query)
+        table = query_job.result().to_arrow()
+        record_query(
+            converted_query,
+            time.perf_counter() - start,
+            rows=table.num_rows,
+            bytes_processed=query_job.total_bytes_processed,
+        )
+        return table
+
+    def iter_arrow_batches(
+        self, query: str, batch_size: int = DEFAULT_ARROW_BATCH_SIZE
+    ) -> Iterator[Any]:
+        """Execute a SQL query and stream its result pages as Arrow record batches."""
+        if not self.client:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+        import_pyarrow()
+
+        converted_query = self._prepare_query(query)
+        start = time.perf_counter()
+        rows = 0
+        query_job = self.client.query(converted_query)
+        try:
+            for batch in query_job.result(page_size=batch_size).to_arrow_iterable():
+                rows += batch.num_rows
+                yield batch
+        finally:
+            record_query(
+                converted_query,
+                time.perf_counter() - start,
+                rows=rows,
+                bytes_processed=query_job.total_bytes_processed,
+            )
+
+    def _prepare_query(self, query: str) -> str:
+        """Convert a query to BigQuery SQL and qualify its tables with the dataset."""
+        # Convert SQL if needed
+        converted_query = self.convert_sql_dialect(query)
+
+        # Qualify table references if dataset is specified
+        if self.config.database:
+            converted_query = self.qualify_table_references(converted_query, self.config.database)
+        return converted_query
+
     def create_table(
         self, table_name: str, query: str, metadata: dict[str, Any] | None = None
     ) -> None:
@@ -206,7 +279,13 @@ class BigQueryAdapter(DatabaseAdapter):
             self.logger.error(f"Failed to create materialized view {full_view_name}: {e}")
             raise
 
-    def create_external_table(self, table_name: str, query: str, external_location: str) -> None:
+    def create_external_table(
+        self,
+        table_name: str,
+        query: str,
+        external_location: str,
+        metadata: dict[str, Any] | None = None,  # noqa: ARG002
+    ) -> None:
         """Create an external table from a qualified SQL query."""
         if not self.client:
             raise RuntimeError("Not connected to database. Call connect() first.")
@@ -295,21 +374,64 @@ class BigQueryAdapter(DatabaseAdapter):
             for field in table.schema:
                 schema.append({"column": field.name, "type": field.field_type})
 
-            # Get row count
-            count_query = f"SELECT COUNT(*) FROM `{full_table_name}`"
-            query_job = self.client.query(count_query)
-            result = query_job.result()
-            row_count = next(result)[0]
+            # Row count from the table metadata; a COUNT(*) would be a billed query.
+            # Views have no stored rows, so BigQuery reports none for them.
+            row_count = table.num_rows or 0
 
             return {"schema": schema, "row_count": row_count}
         except Exception as e:
             self.logger.error(f"Error getting table info for {table_name}: {e}")
             raise
 
+    def get_table_fingerprint(self, table_name: str) -> str | None:
+        """Get the last modification time and row count of a table from its metadata."""
+        if not self.client:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+
+        if "." not in table_name and self.config.database:
+            table_name = f"{self.config.project}.{self.config.database}.{table_name}"
+        table = self.client.get_table(table_name)
+        if table.modified is None:
+            return None
+        return f"{table.modified.isoformat()}|{table.num_rows}"
+
     def describe_query_schema(self, sql_query: str) -> list[dict[str, Any]]:
         """Infer schema from SQL query output using BigQuery dry run."""
-        # TODO: Implement BigQuery-specific schema inference
-        raise NotImplementedError("describe_query_schema not yet implemented for BigQuery")
+        try:
+            query_job = self._dry_run(sql_query)
+            return [{"name": field.name, "type": field.field_type} for field in query_job.schema]
+        except Exception as e:
+            self.logger.error(f"Error describing query schema: {e}")
+            raise
+
+    def estimate_query_bytes(self, query: str) -> int:
+        """Estimate the bytes a query would scan using BigQuery dry run."""
+        query_job = self._dry_run(query)
+        return query_job.total_bytes_processed or 0
+
+    def _dry_run(self, query: str) -> Any:
+        """
+        Validate a query with a dry run, which is free and does not execute it.
+
+        Args:
+            query: SQL query to dry-run
+
+        Returns:
+            The finished dry-run QueryJob (schema and total_bytes_processed are set)
+        """
+        if not self.client:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+
+        job_config = self.job_config_factory(dry_run=True, use_query_cache=False)
+        return self.client.query(self._prepare_query(query), job_config=job_config)
+
+    def generate_table_sample(self, table_name: str, percent: float) -> str:
+        """
+        Generate a table reference reading a random sample of the table (BigQuery-specific).
+
+        BigQuery requires the PERCENT keyword in TABLESAMPLE SYSTEM.
+        """
+        return f"{table_name} TABLESAMPLE SYSTEM ({percent:g} PERCENT)"
 
     def add_column(self, table_name: str, column: dict[str, Any]) -> None:
         """Add a column to an existing table."""
@@ -321,6 +443,67 @@ class BigQueryAdapter(DatabaseAdapter):
         # TODO: Implement BigQuery-specific column dropping
         raise NotImplementedError("drop_column not yet implemented for BigQuery")
 
+    def execute_incremental_insert_overwrite(
+        self, table_name: str, source_sql: str, partition_by: list[str]
+    ) -> None:
+        """
+        Replace the partitions touched by a batch with a single MERGE.
+
+        The MERGE deletes the target rows of every partition present in the batch and
+        inserts the batch in one atomic statement; the partition filter lets BigQuery prune
+        the scan to the replaced partitions.
+        """
+        if not self.client:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+        if len(partition_by) != 1:
+            raise ValueError(
+                f"BigQuery tables are partitioned by a single column, "
+                f"got {partition_by} for insert_overwrite of {table_name}"
+            )
+
+        # Convert SQL if needed
+        converted_query = self.convert_sql_dialect(source_sql)
+
+        # Qualify table references if dataset is specified
+        if self.config.database:
+            converted_query = self.qualify_table_references(converted_query, self.config.database)
+
+        # Create fully qualified table name
+        if "." not in table_name and self.config.database:
+            full_table_name = f"{self.config.project}.{self.config.database}.{table_name}"
+        else:
+            full_table_name = table_name
+
+        # Stage the batch once in a script-scoped temp table, then swap its partitions in
+        column = partition_by[0]
+        staging_table = self.insert_overwrite_staging_name()
+        script = f"""
+        CREATE TEMP TABLE {staging_table} AS {converted_query};
+        MERGE `{full_table_name}` AS target
+        USING {staging_table} AS source
+        ON FALSE
+        WHEN NOT MATCHED BY SOURCE AND (
+            target.{column} IN (SELECT DISTINCT {column} FROM {staging_table})
+            OR (target.{column} IS NULL
+                AND EXISTS (SELECT 1 FROM {staging_table} WHERE {column} IS NULL))
+        ) THEN DELETE
+        WHEN NOT MATCHED THEN INSERT ROW;
+        """
+
+        try:
+            start = time.perf_counter()
+            query_job = self.client.query(script)
+            query_job.result()  # Wait for completion
+            record_query(
+                script,
+                time.perf_counter() - start,
+                bytes_processed=query_job.total_bytes_processed,
+            )
+            self.logger.info(f"Executed insert_overwrite for table: {full_table_name}")
+        except Exception as e:
+            self.logger.error(f"Error executing insert_overwrite for {full_table_name}: {e}")
+            raise
+
     def create_function(
         self,
         function_name: str,
@@ -10,6 +10,8 @@ This adapter provides DuckDB-specific functionality including:
 """
 
 import os
+import time
+from collections.abc import Iterator
 from typing import Any
 
 try:
@@ -18,9 +20,12 @@ except ImportError:
     duckdb = None
 
 from tee.adapters.base import AdapterConfig, DatabaseAdapter, MaterializationType
+from tee.adapters.base.arrow import DEFAULT_ARROW_BATCH_SIZE, import_pyarrow
 from tee.adapters.registry import register_adapter
+from tee.instrumentation import get_recorder, record_query
 
 from .functions.function_manager import FunctionManager
+from .materialization.external_handler import ExternalHandler
 from .materialization.incremental_handler import IncrementalHandler
 from .materialization.table_handler import TableHandler
 from .materialization.view_handler import ViewHandler
@@ -30,6 +35,9 @@ from .utils.helpers import DuckDBUtils
 class DuckDBAdapter(DatabaseAdapter):
     """DuckDB and MotherDuck database adapter with SQLglot integration."""
 
+    supports_arrow_results = True
+    supports_approx_count_distinct = True
+
     def __init__(self, config: AdapterConfig) -> None:
         if duckdb is None:
             raise ImportError("DuckDB is not installed. Install it with: uv add duckdb")
@@ -40,6 +48,7 @@ class DuckDBAdapter(DatabaseAdapter):
         self.function_manager = FunctionManager(self)
         self.table_handler = TableHandler(self)
         self.view_handler = ViewHandler(self)
+        self.external_handler = ExternalHandler(self)
         self.incremental_handler = IncrementalHandler(self)
         self.utils = DuckDBUtils(self)
 
@@ -47,12 +56,17 @@ class DuckDBAdapter(DatabaseAdapter):
         """Get the default SQL dialect for DuckDB."""
         return "duckdb"
 
+    def transpile_model_sql(self, sql: str) -> str:
+        """Convert and schema-qualify a model's SQL, as the materialization handlers do."""
+        return self.utils.convert_and_qualify_sql(sql)
+
     def get_supported_materializations(self) -> list[MaterializationType]:
         """Get list of supported materialization types for DuckDB."""
         return [
             MaterializationType.TABLE,
             MaterializationType.VIEW,
             MaterializationType.INCREMENTAL,
+            MaterializationType.EXTERNAL_TABLE,
         ]
 
     def _extract_motherduck_path(self, db_path: str) -> str:
@@ -195,6 +209,21 @@ class DuckDBAdapter(DatabaseAdapter):
             self.connection = duckdb.connect(db_path)
             self.logger.info(f"Connected to DuckDB database: {db_path}")
 
+        self._attach_databases()
+
+    def _attach_databases(self) -> None:
+        """
+        Attach the read-only databases listed in the connection's extra "attach" mapping.
+
+        Each entry maps a catalog name to a database path, e.g. {"prod": "prod.duckdb"},
+        so models can read relations like prod.my_schema.my_table (used by --defer).
+        """
+        attach = (self.config.extra or {}).get("attach") or {}
+        for name, path in attach.items():
+            escaped_path = str(path).replace("'", "''")
+            self.connection.execute(f"ATTACH '{escaped_path}' AS {name} (READ_ONLY)")
+            self.logger.info(f"Attached database {path} as {name}")
+
     def disconnect(self) -> None:
         """Close the DuckDB or MotherDuck connection."""
         if self.connection:
@@ -209,19 +238,97 @@ class DuckDBAdapter(DatabaseAdapter):
             else:
                 self.logger.info(f"Disconnected from DuckDB database: {db_path}")
 
+    def _begin_transaction(self) -> None:
+        """Start a DuckDB transaction (DDL is transactional in DuckDB)."""
+        self.connection.begin()
+
+    def _commit_transaction(self) -> None:
+        """Commit the current DuckDB transaction."""
+        self.connection.commit()
+
+    def _rollback_transaction(self) -> None:
+        """Roll back the current DuckDB transaction."""
+        self.connection.rollback()
+
+    def _rows_reported(
+        self, query: str, description: list[tuple] | None, result: list[tuple]
+    ) -> int | None:
+        """
+        Count the rows a statement returned or changed, or None if DuckDB doesn't tell.
+
+        Queries return their rows. DML and CREATE TABLE AS return a single "Count" row
+        holding the number of rows changed, other DDL returns no rows at all.
+        """
+        if not description:
+            return None
+        if description[0][0] not in ("Count", "Success") or len(description) != 1:
+            return len(result)
+        try:
+            statements = duckdb.extract_statements(query)
+        except Exception:
+            return None
+        if len(statements) == 1 and statements[0].type == duckdb.StatementType.SELECT:
+            return len(result)
+        if len(result) == 1 and isinstance(result[0][0], int):
+            return result[0][0]
+        return None
+
     def execute_query(self, query: str) -> Any:
         """Execute a SQL query and return results."""
         if not self.connection:
             raise RuntimeError("Not connected to database. Call connect() first.")
 
         try:
-            result = self.connection.execute(query).fetchall()
+            start = time.perf_counter()
+            cursor = self.connection.execute(query)
+            result = cursor.fetchall()
+            # Telling row counts apart can take a parse: only pay for it in recorded runs
+            if get_recorder() is not None:
+                record_query(
+                    query,
+                    time.perf_counter() - start,
+                    rows=self._rows_reported(query, cursor.description, result),
+                )
             self.logger.debug(f"Executed query: {query[:100]}...")
             return result
         except Exception as e:
             self.logger.error(f"Error executing query: {e}")
             raise
 
+    def execute_arrow(self, query: str) -> Any:
+        """Execute a SQL query and return its result as an Arrow table."""
+        if not self.connection:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+        import_pyarrow()
+
+        start = time.perf_counter()
+        table = self.connection.execute(query).fetch_arrow_table()
+        record_query(query, time.perf_counter() - start, rows=table.num_rows)
+        return table
+
+    def iter_arrow_batches(
+        self, query: str, batch_size: int = DEFAULT_ARROW_BATCH_SIZE
+    ) -> Iterator[Any]:
+        """
+        Execute a SQL query and stream its result as Arrow record batches.
+
+        The batches are read from the adapter's connection, so they must be consumed
+        before other queries run on it.
+        """
+        if not self.connection:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+        import_pyarrow()
+
+        start = time.perf_counter()
+        rows = 0
+        reader = self.connection.execute(query).fetch_record_batch(batch_size)
+        try:
+            for batch in reader:
+                rows += batch.num_rows
+                yield batch
+        finally:
+            record_query(query, time.perf_counter() - start, rows=rows)
+
     def create_table(
         self, table_name: str, query: str, metadata: dict[str, Any] | None = None
     ) -> None:
@@ -234,6 +341,16 @@ class DuckDBAdapter(DatabaseAdapter):
         """Create a view from a qualified SQL query."""
         self.view_handler.create(view_name, query, metadata)
 
+    def create_external_table(
+        self,
+        table_name: str,
+        query: str,
+        external_location: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Write a qualified SQL query to Parquet files and create a view over them."""
+        self.external_handler.create(table_name, query, external_location, metadata)
+
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists in the database."""
         if not self.connection:
@@ -413,6 +530,12 @@ class DuckDBAdapter(DatabaseAdapter):
         """Execute incremental delete+insert operation."""
         self.incremental_handler.execute_delete_insert(table_name, delete_sql, insert_sql)
 
+    def execute_incremental_insert_overwrite(
+        self, table_name: str, source_sql: str, partition_by: list[str]
+    ) -> None:
+        """Execute incremental insert_overwrite operation."""
+        self.incremental_handler.execute_insert_overwrite(table_name, source_sql, partition_by)
+
     def _generate_merge_sql(
         self, table_name: str, source_sql: str, unique_key: list[str], columns: list[str]
     ) -> str:
@@ -453,6 +576,15 @@ class DuckDBAdapter(DatabaseAdapter):
             ) AS duplicate_groups
         """
 
+    def generate_table_sample(self, table_name: str, percent: float) -> str:
+        """
+        Generate a table reference reading a random sample of the table (DuckDB-specific).
+
+        DuckDB reads TABLESAMPLE SYSTEM (n) as a number of rows, so the percentage is
+        spelled out.
+        """
+        return f"{table_name} TABLESAMPLE SYSTEM ({percent:g} PERCENT)"
+
     def _build_motherduck_connection_string(self, db_path: str) -> str:
         """
         Build MotherDuck connection string with authentication token.
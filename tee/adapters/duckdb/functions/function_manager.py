@@ -99,13 +99,30 @@ class FunctionManager:
             schema_name = "main"  # DuckDB default schema
             func_name = function_name
 
-        # Try information_schema first (if available)
+        # duckdb_functions() lists SQL macros and UDFs in every catalog
+        if self._check_function_via_catalog(schema_name, func_name):
+            return True
+
+        # Try information_schema (if available)
         if self._check_function_via_information_schema(schema_name, func_name, signature):
             return True
 
         # Fallback to SHOW commands (for in-memory databases where information_schema isn't available)
         return self._check_function_via_show_commands(schema_name, func_name)
 
+    def _check_function_via_catalog(self, schema_name: str, func_name: str) -> bool:
+        """Check function existence via the duckdb_functions() table function."""
+        try:
+            query = """
+                SELECT COUNT(*)
+                FROM duckdb_functions()
+                WHERE schema_name = ? AND function_name = ? AND NOT internal
+            """
+            result = self.adapter.connection.execute(query, [schema_name, func_name]).fetchone()
+            return result[0] > 0 if result else False
+        except Exception:
+            return False
+
     def _check_function_via_information_schema(
         self, schema_name: str, func_name: str, signature: str | None = None
     ) -> bool:
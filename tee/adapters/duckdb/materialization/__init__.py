@@ -1,7 +1,8 @@
 """Materialization components for DuckDB."""
 
+from .external_handler import ExternalHandler
 from .incremental_handler import IncrementalHandler
 from .table_handler import TableHandler
 from .view_handler import ViewHandler
 
-__all__ = ["TableHandler", "ViewHandler", "IncrementalHandler"]
+__all__ = ["TableHandler", "ViewHandler", "IncrementalHandler", "ExternalHandler"]
@@ -0,0 +1,161 @@
+"""External (Parquet) materialization for DuckDB."""
+
+import logging
+import os
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tee.adapters.base.core import DatabaseAdapter
+
+logger = logging.getLogger(__name__)
+
+# File formats DuckDB external materializations can write
+SUPPORTED_EXTERNAL_FORMATS = ["parquet"]
+
+
+class ExternalHandler:
+    """
+    Writes model output to Parquet files and registers a view over them.
+
+    The query result is written with COPY ... TO into a directory, Hive-partitioned by
+    the model's partitions when it has any. A view reading the files back with
+    read_parquet keeps the model queryable under its own name, so downstream models
+    resolve it like any other relation.
+    """
+
+    def __init__(self, adapter: DatabaseAdapter) -> None:
+        """
+        Initialize the external handler.
+
+        Args:
+            adapter: DuckDBAdapter instance
+        """
+        self.adapter = adapter
+        self.config = adapter.config
+        self.logger = adapter.logger
+
+    def create(
+        self,
+        table_name: str,
+        query: str,
+        external_location: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Write a qualified SQL query to Parquet and create a view over the files.
+
+        Args:
+            table_name: Name of the view registered over the files
+            query: SQL query producing the model output
+            external_location: Directory the Parquet files are written to. Unless the
+                model sets external.location, this is the connection-level root, and the
+                files go to <root>/<schema>/<table> so models never overwrite each other.
+            metadata: Optional model metadata (partitions, external options, comments)
+
+        Raises:
+            ValueError: If the external configuration is invalid
+        """
+        if not self.adapter.connection:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+
+        metadata = metadata or {}
+        external_config = metadata.get("external") or {}
+        file_format = external_config.get("format", "parquet").lower()
+        if file_format not in SUPPORTED_EXTERNAL_FORMATS:
+            raise ValueError(
+                f"Unsupported external format for DuckDB: {file_format}. "
+                f"Must be one of: {', '.join(SUPPORTED_EXTERNAL_FORMATS)}"
+            )
+
+        partitions = metadata.get("partitions") or []
+        location = external_location.rstrip("/")
+        if not external_config.get("location"):
+            location = "/".join([location, *table_name.split(".")])
+
+        # Create schema if needed
+        self.adapter.utils.create_schema_if_needed(table_name)
+
+        # Convert SQL and qualify table references
+        converted_query = self.adapter.utils.convert_and_qualify_sql(query)
+
+        copy_query = (
+            f"COPY ({converted_query}) TO '{self._escape(location)}' "
+            f"({self._build_copy_options(partitions, external_config)})"
+        )
+        view_query = (
+            f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM read_parquet("
+            f"'{self._escape(location)}/**/*.parquet', "
+            f"hive_partitioning = {'true' if partitions else 'false'})"
+        )
+
+        try:
+            self._ensure_parent_directory(location)
+            self.adapter.utils.execute_query(copy_query)
+            self.logger.debug(f"Wrote {table_name} to {location}")
+
+            # A previous run may have materialized the model as a table
+            self._drop_existing_table(table_name)
+            self.adapter.utils.execute_query(view_query)
+            self.logger.info(f"Created external table: {table_name} ({location})")
+
+            if metadata.get("description"):
+                self.adapter.utils.add_table_comment(table_name, metadata["description"])
+            if metadata.get("schema"):
+                column_descriptions = self.adapter._validate_column_metadata(metadata)
+                if column_descriptions:
+                    self.adapter.utils.add_column_comments(table_name, column_descriptions)
+
+        except Exception as e:
+            self.logger.error(f"Failed to create external table {table_name}: {e}")
+            raise
+
+    def _build_copy_options(self, partitions: list[str], external_config: dict[str, Any]) -> str:
+        """Build the option list of the COPY statement."""
+        # OVERWRITE clears the directory, so files of a previous run never linger
+        options = ["FORMAT PARQUET", "OVERWRITE"]
+        if partitions:
+            options.append(f"PARTITION_BY ({', '.join(partitions)})")
+        else:
+            options.append("PER_THREAD_OUTPUT")
+
+        row_group_size = external_config.get("row_group_size")
+        if row_group_size is not None:
+            if not isinstance(row_group_size, int) or row_group_size <= 0:
+                raise ValueError(
+                    f"External row_group_size must be a positive integer, got {row_group_size!r}"
+                )
+            options.append(f"ROW_GROUP_SIZE {row_group_size}")
+
+        compression = external_config.get("compression")
+        if compression:
+            options.append(f"COMPRESSION '{self._escape(compression)}'")
+
+        return ", ".join(options)
+
+    def _drop_existing_table(self, table_name: str) -> None:
+        """Drop a base table of the same name, which CREATE OR REPLACE VIEW can't replace."""
+        if "." in table_name:
+            schema_name, name = table_name.split(".", 1)
+        else:
+            schema_name, name = self.config.schema or "main", table_name
+
+        result = self.adapter.connection.execute(
+            "SELECT COUNT(*) FROM information_schema.tables "
+            "WHERE table_schema = ? AND table_name = ? AND table_type = 'BASE TABLE'",
+            [schema_name, name],
+        ).fetchone()
+        if result and result[0] > 0:
+            self.adapter.utils.execute_query(f"DROP TABLE {table_name}")
+
+    @staticmethod
+    def _ensure_parent_directory(location: str) -> None:
+        """Create the parent directory of a local location; COPY only creates the leaf."""
+        if "://" in location:
+            return
+        parent = os.path.dirname(os.path.abspath(location))
+        os.makedirs(parent, exist_ok=True)
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        """Escape a value for use inside a single-quoted SQL string."""
+        return value.replace("'", "''")
@@ -88,18 +88,48 @@ class IncrementalHandler:
         self.logger.debug(f"INSERT: {converted_insert}")
 
         try:
-            # Execute delete
-            self.adapter.utils.execute_query(converted_delete)
-            self.logger.info(f"Executed delete for table: {table_name}")
-
-            # Execute insert
-            insert_query = f"INSERT INTO {table_name} {converted_insert}"
-            self.adapter.utils.execute_query(insert_query)
-            self.logger.info(f"Executed insert for table: {table_name}")
+            # Delete and insert commit together, so a failed insert keeps the deleted rows
+            with self.adapter.transaction():
+                self.adapter.utils.execute_query(converted_delete)
+                self.logger.info(f"Executed delete for table: {table_name}")
+
+                insert_query = f"INSERT INTO {table_name} {converted_insert}"
+                self.adapter.utils.execute_query(insert_query)
+                self.logger.info(f"Executed insert for table: {table_name}")
         except Exception as e:
             self.logger.error(f"Error executing incremental delete+insert for {table_name}: {e}")
             raise
 
+    def execute_insert_overwrite(
+        self, table_name: str, source_sql: str, partition_by: list[str]
+    ) -> None:
+        """Replace the partitions touched by a batch, in one transaction."""
+        if not self.adapter.connection:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+
+        # Convert SQL and qualify table references
+        converted_query = self.adapter.utils.convert_and_qualify_sql(source_sql)
+
+        # Stage the batch once, so the partitions deleted are exactly the ones inserted
+        staging_table = self.adapter.insert_overwrite_staging_name()
+        delete_sql = self.adapter.build_partition_delete(table_name, staging_table, partition_by)
+        self.logger.debug(f"Generated DuckDB insert_overwrite SQL for {table_name}: {delete_sql}")
+
+        try:
+            with self.adapter.transaction():
+                self.adapter.utils.execute_query(
+                    f"CREATE TEMPORARY TABLE {staging_table} AS {converted_query}"
+                )
+                self.adapter.utils.execute_query(delete_sql)
+                self.adapter.utils.execute_query(
+                    f"INSERT INTO {table_name} SELECT * FROM {staging_table}"
+                )
+                self.adapter.utils.execute_query(f"DROP TABLE {staging_table}")
+            self.logger.info(f"Executed insert_overwrite for table: {table_name}")
+        except Exception as e:
+            self.logger.error(f"Error executing insert_overwrite for {table_name}: {e}")
+            raise
+
     def _generate_merge_sql(
         self, table_name: str, source_sql: str, unique_key: list[str], columns: list[str]
     ) -> str:
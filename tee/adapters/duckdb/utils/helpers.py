@@ -1,8 +1,11 @@
 """Utility methods for DuckDB operations."""
 
 import logging
+import time
 from typing import TYPE_CHECKING
 
+from tee.instrumentation import record_query
+
 if TYPE_CHECKING:
     from tee.adapters.base.core import DatabaseAdapter
 
@@ -35,6 +38,9 @@ class DuckDBUtils:
 
     def convert_and_qualify_sql(self, query: str) -> str:
         """Convert SQL dialect and qualify table references if schema is specified."""
+        precompiled = self.adapter.get_precompiled_sql(query)
+        if precompiled is not None:
+            return precompiled
         converted_query = self.adapter.convert_sql_dialect(query)
         if self.config.schema:
             converted_query = self.adapter.qualify_table_references(
@@ -47,7 +53,9 @@ class DuckDBUtils:
         if not self.adapter.connection:
             raise RuntimeError("Not connected to database. Call connect() first.")
         try:
+            start = time.perf_counter()
             self.adapter.connection.execute(query)
+            record_query(query, time.perf_counter() - start)
         except Exception as e:
             self.logger.error(f"Error executing query: {e}")
             raise
@@ -8,7 +8,10 @@ This module provides PostgreSQL-specific functionality including:
 - Materialization support
 """
 
+import time
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 try:
@@ -16,13 +19,27 @@ try:
 except ImportError:
     psycopg2 = None
 
-from tee.adapters.base import AdapterConfig, DatabaseAdapter, MaterializationType
+from tee.adapters.base import AdapterConfig, DatabaseAdapter, MaterializationType, QueryHandle
+from tee.adapters.base.arrow import DEFAULT_ARROW_BATCH_SIZE, rows_to_record_batch
 from tee.adapters.registry import register_adapter
+from tee.instrumentation import record_query
+
+from .pool import (
+    DEFAULT_POOL_MAX_SIZE,
+    DEFAULT_POOL_MIN_SIZE,
+    PooledQueryRunner,
+    PostgreSQLConnectionPool,
+)
 
 
 class PostgreSQLAdapter(DatabaseAdapter):
     """PostgreSQL database adapter with SQLglot integration."""
 
+    # Submitted queries run in worker threads, each on its own pooled connection
+    supports_async_queries = True
+    # iter_query_batches() streams through a named cursor on a pooled connection
+    supports_streaming_results = True
+
     def __init__(self, config: AdapterConfig) -> None:
         try:
             import psycopg2
@@ -32,6 +49,10 @@ class PostgreSQLAdapter(DatabaseAdapter):
             ) from None
 
         super().__init__(config)
+        self.pool: PostgreSQLConnectionPool | None = None
+        self.query_runner: PooledQueryRunner | None = None
+        # Schemas already created (or confirmed) during this connection
+        self._ensured_schemas: set[str] = set()
 
     def get_default_dialect(self) -> str:
         """Get the default SQL dialect for PostgreSQL."""
@@ -60,10 +81,19 @@ class PostgreSQLAdapter(DatabaseAdapter):
             "password": self.config.password,
         }
 
+        extra = self.config.extra or {}
         try:
-            import psycopg2
-
-            self.connection = psycopg2.connect(**connection_params)
+            self.pool = PostgreSQLConnectionPool(
+                connection_params,
+                min_size=extra.get("pool_min_size", DEFAULT_POOL_MIN_SIZE),
+                max_size=extra.get("pool_max_size", DEFAULT_POOL_MAX_SIZE),
+            )
+            self.connection = self.pool.getconn()
+            # The primary connection stays with the adapter; the rest serve submitted queries
+            self.query_runner = PooledQueryRunner(
+                self.pooled_connection, max_workers=max(1, self.pool.max_size - 1)
+            )
+            self._ensured_schemas.clear()
             self.logger.info(
                 f"Connected to PostgreSQL: {self.config.host}:{self.config.port}/{self.config.database}"
             )
@@ -72,11 +102,166 @@ class PostgreSQLAdapter(DatabaseAdapter):
             raise
 
     def disconnect(self) -> None:
-        """Close the PostgreSQL connection."""
-        if self.connection:
+        """Close the PostgreSQL connection and its pool."""
+        if self.query_runner:
+            self.query_runner.close()
+            self.query_runner = None
+        if self.pool:
+            if self.connection:
+                self.pool.putconn(self.connection)
+            self.pool.close()
+            self.pool = None
+        elif self.connection:
             self.connection.close()
+        if self.connection:
             self.connection = None
             self.logger.info("Disconnected from PostgreSQL database")
+        self._ensured_schemas.clear()
+
+    @contextmanager
+    def pooled_connection(self) -> Iterator[Any]:
+        """
+        Borrow a dedicated connection from the pool.
+
+        Use this from concurrent executors (or the test runner) so each worker runs on
+        its own session instead of sharing the adapter's primary connection. The
+        transaction is committed on success and rolled back on error.
+        """
+        if not self.pool:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+
+        with self.pool.connection() as connection:
+            yield connection
+
+    def submit_query(self, query: str) -> QueryHandle:
+        """Submit a query to run on a pooled connection and return its handle."""
+        if not self.query_runner:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+        return self.query_runner.submit(query)
+
+    def poll(self, handle: QueryHandle) -> bool:
+        """Check whether a submitted query has finished."""
+        return self.query_runner.poll(handle)
+
+    def wait(self, handle: QueryHandle, timeout: float | None = None) -> Any:
+        """Block until a submitted query finishes and return its result."""
+        return self.query_runner.wait(handle, timeout)
+
+    def cancel(self, handle: QueryHandle) -> None:
+        """Cancel a submitted query."""
+        self.query_runner.cancel(handle)
+
+    def submit_create_table(
+        self,
+        table_name: str,
+        query: str,
+        metadata: dict[str, Any] | None = None,  # noqa: ARG002
+    ) -> QueryHandle:
+        """Submit the CREATE TABLE statement for a table without waiting for it."""
+        if not self.connection:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+        return self.submit_query(self._create_table_statement(table_name, query))
+
+    def iter_query_batches(self, query: str, batch_size: int = 1000) -> Iterator[list[Any]]:
+        """
+        Execute a query through a named server-side cursor and yield rows in batches.
+
+        Rows are streamed from the server batch_size at a time, so large test or
+        diagnostic queries never materialize the full result set on the client. The
+        cursor runs on a pooled connection, leaving the primary connection free.
+        """
+        for batch, _column_names in self._stream_batches(query, batch_size):
+            yield batch
+
+    def iter_arrow_batches(
+        self, query: str, batch_size: int = DEFAULT_ARROW_BATCH_SIZE
+    ) -> Iterator[Any]:
+        """
+        Stream a query through a server-side cursor as Arrow record batches.
+
+        psycopg2 only returns rows, so each streamed batch is converted column by
+        column, with the column names of the cursor.
+        """
+        for batch, column_names in self._stream_batches(query, batch_size):
+            yield rows_to_record_batch(batch, column_names)
+
+    def _stream_batches(self, query: str, batch_size: int) -> Iterator[tuple[list[Any], list[str]]]:
+        """Yield (rows, column names) batches of a query run on a named cursor."""
+        start = time.perf_counter()
+        rows = 0
+        with self.pooled_connection() as connection:
+            cursor = connection.cursor(name=f"tee_stream_{uuid.uuid4().hex[:8]}")
+            cursor.itersize = batch_size
+            try:
+                cursor.execute(query)
+                while batch := cursor.fetchmany(batch_size):
+                    rows += len(batch)
+                    yield batch, [column.name for column in cursor.description]
+            finally:
+                cursor.close()
+                record_query(query, time.perf_counter() - start, rows=rows)
+
+    def _ensure_schema(self, schema_name: str) -> None:
+        """Create a schema if needed, at most once per connection."""
+        if schema_name in self._ensured_schemas:
+            return
+
+        try:
+            with self._savepoint():
+                cursor = self.connection.cursor()
+                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
+                cursor.close()
+            self._ensured_schemas.add(schema_name)
+            self.logger.debug(f"Created schema: {schema_name}")
+        except Exception as e:
+            self.logger.warning(f"Could not create schema {schema_name}: {e}")
+
+    def _begin_transaction(self) -> None:
+        """psycopg2 opens a transaction implicitly with the first statement."""
+        pass
+
+    def _commit_transaction(self) -> None:
+        """Commit the current transaction."""
+        self.connection.commit()
+
+    def _rollback_transaction(self) -> None:
+        """Roll back the current transaction."""
+        self.connection.rollback()
+
+    def _commit(self) -> None:
+        """Commit the statements just run, unless they belong to a transaction() block."""
+        if not self.in_transaction:
+            self.connection.commit()
+
+    @contextmanager
+    def _savepoint(self) -> Iterator[None]:
+        """
+        Run statements whose failure is tolerated without aborting the enclosing work.
+
+        Outside a transaction() block the statements are committed (or rolled back) on
+        their own. Inside one, a savepoint undoes only them, since PostgreSQL otherwise
+        aborts the whole transaction on the first error.
+        """
+        if not self.in_transaction:
+            try:
+                yield
+            except Exception:
+                self.connection.rollback()
+                raise
+            self.connection.commit()
+            return
+
+        cursor = self.connection.cursor()
+        cursor.execute("SAVEPOINT tee_savepoint")
+        try:
+            yield
+        except Exception:
+            cursor.execute("ROLLBACK TO SAVEPOINT tee_savepoint")
+            raise
+        else:
+            cursor.execute("RELEASE SAVEPOINT tee_savepoint")
+        finally:
+            cursor.close()
 
     def execute_query(self, query: str) -> Any:
         """Execute a SQL query and return results."""
@@ -84,9 +269,11 @@ class PostgreSQLAdapter(DatabaseAdapter):
             raise RuntimeError("Not connected to database. Call connect() first.")
 
         try:
+            start = time.perf_counter()
             cursor = self.connection.cursor()
             cursor.execute(query)
             result = cursor.fetchall()
+            record_query(query, time.perf_counter() - start, rows=cursor.rowcount)
             cursor.close()
             self.logger.debug(f"Executed query: {query[:100]}...")
             return result
@@ -101,6 +288,20 @@ class PostgreSQLAdapter(DatabaseAdapter):
         if not self.connection:
             raise RuntimeError("Not connected to database. Call connect() first.")
 
+        create_query = self._create_table_statement(table_name, query)
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(create_query)
+            self._commit()
+            cursor.close()
+            self.logger.info(f"Created table: {table_name}")
+        except Exception as e:
+            self.logger.error(f"Failed to create table {table_name}: {e}")
+            raise
+
+    def _create_table_statement(self, table_name: str, query: str) -> str:
+        """Build the CREATE TABLE statement for a query, creating the table's schema if needed."""
         # Convert SQL if needed
         converted_query = self.convert_sql_dialect(query)
 
@@ -111,28 +312,10 @@ class PostgreSQLAdapter(DatabaseAdapter):
         # Extract schema and table name
         if "." in table_name:
             schema_name, _ = table_name.split(".", 1)
-            # Create schema if it doesn't exist
-            try:
-                cursor = self.connection.cursor()
-                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
-                self.connection.commit()
-                cursor.close()
-                self.logger.debug(f"Created schema: {schema_name}")
-            except Exception as e:
-                self.logger.warning(f"Could not create schema {schema_name}: {e}")
+            self._ensure_schema(schema_name)
 
         # Wrap the query in a CREATE TABLE statement
-        create_query = f"CREATE TABLE IF NOT EXISTS {table_name} AS {converted_query}"
-
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute(create_query)
-            self.connection.commit()
-            cursor.close()
-            self.logger.info(f"Created table: {table_name}")
-        except Exception as e:
-            self.logger.error(f"Failed to create table {table_name}: {e}")
-            raise
+        return f"CREATE TABLE IF NOT EXISTS {table_name} AS {converted_query}"
 
     def create_view(
         self, view_name: str, query: str, metadata: dict[str, Any] | None = None
@@ -151,15 +334,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         # Extract schema and view name
         if "." in view_name:
             schema_name, _ = view_name.split(".", 1)
-            # Create schema if it doesn't exist
-            try:
-                cursor = self.connection.cursor()
-                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
-                self.connection.commit()
-                cursor.close()
-                self.logger.debug(f"Created schema: {schema_name}")
-            except Exception as e:
-                self.logger.warning(f"Could not create schema {schema_name}: {e}")
+            self._ensure_schema(schema_name)
 
         # Wrap the query in a CREATE VIEW statement
         create_query = f"CREATE OR REPLACE VIEW {view_name} AS {converted_query}"
@@ -167,7 +342,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         try:
             cursor = self.connection.cursor()
             cursor.execute(create_query)
-            self.connection.commit()
+            self._commit()
             cursor.close()
             self.logger.info(f"Created view: {view_name}")
 
@@ -202,15 +377,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         # Extract schema and view name
         if "." in view_name:
             schema_name, _ = view_name.split(".", 1)
-            # Create schema if it doesn't exist
-            try:
-                cursor = self.connection.cursor()
-                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
-                self.connection.commit()
-                cursor.close()
-                self.logger.debug(f"Created schema: {schema_name}")
-            except Exception as e:
-                self.logger.warning(f"Could not create schema {schema_name}: {e}")
+            self._ensure_schema(schema_name)
 
         # PostgreSQL materialized view syntax
         create_query = f"CREATE MATERIALIZED VIEW IF NOT EXISTS {view_name} AS {converted_query}"
@@ -218,7 +385,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         try:
             cursor = self.connection.cursor()
             cursor.execute(create_query)
-            self.connection.commit()
+            self._commit()
             cursor.close()
             self.logger.info(f"Created materialized view: {view_name}")
         except Exception as e:
@@ -268,7 +435,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         try:
             cursor = self.connection.cursor()
             cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-            self.connection.commit()
+            self._commit()
             cursor.close()
             self.logger.info(f"Dropped table: {table_name}")
         except Exception as e:
@@ -353,7 +520,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
             # Drop temporary table
             cursor.execute(f"DROP TABLE IF EXISTS {temp_table_name}")
-            self.connection.commit()
+            self._commit()
             cursor.close()
 
             return schema
@@ -363,7 +530,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 if self.connection:
                     cursor = self.connection.cursor()
                     cursor.execute(f"DROP TABLE IF EXISTS {temp_table_name}")
-                    self.connection.commit()
+                    self._commit()
                     cursor.close()
             except Exception:
                 pass
@@ -382,7 +549,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
             ddl = f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"
             cursor = self.connection.cursor()
             cursor.execute(ddl)
-            self.connection.commit()
+            self._commit()
             cursor.close()
             self.logger.info(f"Added column {column_name} to {table_name}")
         except Exception as e:
@@ -398,13 +565,44 @@ class PostgreSQLAdapter(DatabaseAdapter):
             ddl = f"ALTER TABLE {table_name} DROP COLUMN {column_name}"
             cursor = self.connection.cursor()
             cursor.execute(ddl)
-            self.connection.commit()
+            self._commit()
             cursor.close()
             self.logger.info(f"Dropped column {column_name} from {table_name}")
         except Exception as e:
             self.logger.error(f"Error dropping column {column_name} from {table_name}: {e}")
             raise
 
+    def execute_incremental_insert_overwrite(
+        self, table_name: str, source_sql: str, partition_by: list[str]
+    ) -> None:
+        """Replace the partitions touched by a batch in one transaction."""
+        if not self.connection:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+
+        # Convert SQL if needed
+        converted_query = self.convert_sql_dialect(source_sql)
+
+        # Qualify table references if schema is specified
+        if self.config.schema:
+            converted_query = self.qualify_table_references(converted_query, self.config.schema)
+
+        # Stage the batch once, so the partitions deleted are exactly the ones inserted
+        staging_table = self.insert_overwrite_staging_name()
+        statements = [
+            f"CREATE TEMPORARY TABLE {staging_table} ON COMMIT DROP AS {converted_query}",
+            self.build_partition_delete(table_name, staging_table, partition_by),
+            f"INSERT INTO {table_name} SELECT * FROM {staging_table}",
+        ]
+
+        try:
+            with self.transaction(), self.connection.cursor() as cursor:
+                for statement in statements:
+                    cursor.execute(statement)
+            self.logger.info(f"Executed insert_overwrite for table: {table_name}")
+        except Exception as e:
+            self.logger.error(f"Error executing insert_overwrite for {table_name}: {e}")
+            raise
+
     def create_function(
         self,
         function_name: str,
@@ -418,21 +616,14 @@ class PostgreSQLAdapter(DatabaseAdapter):
         # Create schema if needed
         if "." in function_name:
             schema_name, _ = function_name.split(".", 1)
-            try:
-                cursor = self.connection.cursor()
-                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
-                self.connection.commit()
-                cursor.close()
-                self.logger.debug(f"Created schema: {schema_name}")
-            except Exception as e:
-                self.logger.warning(f"Could not create schema {schema_name}: {e}")
+            self._ensure_schema(schema_name)
 
         # Function SQL is already a complete CREATE OR REPLACE FUNCTION statement
         # Execute it as-is (should already be in PostgreSQL dialect)
         try:
             cursor = self.connection.cursor()
             cursor.execute(function_sql)
-            self.connection.commit()
+            self._commit()
             cursor.close()
             self.logger.info(f"Created function: {function_name}")
 
@@ -492,7 +683,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
             # This may fail if there are multiple overloads - that's expected behavior
             cursor = self.connection.cursor()
             cursor.execute(f"DROP FUNCTION IF EXISTS {function_name}")
-            self.connection.commit()
+            self._commit()
             cursor.close()
             self.logger.info(f"Dropped function: {function_name}")
         except Exception as e:
@@ -0,0 +1,203 @@
+"""
+Connection pooling for the PostgreSQL adapter.
+"""
+
+import logging
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from contextlib import AbstractContextManager, contextmanager
+from typing import Any
+
+from tee.adapters.base.async_queries import (
+    QUERY_CANCELLED,
+    QUERY_FAILED,
+    QUERY_SUCCEEDED,
+    QueryHandle,
+)
+from tee.instrumentation import record_query
+
+logger = logging.getLogger(__name__)
+
+# Pool size defaults (overridable via connection extra.pool_min_size / extra.pool_max_size)
+DEFAULT_POOL_MIN_SIZE = 1
+DEFAULT_POOL_MAX_SIZE = 4
+
+
+class PostgreSQLConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections.
+
+    Wraps psycopg2.pool.ThreadedConnectionPool so concurrent executors and the test
+    runner can each borrow their own connection instead of sharing one session.
+    """
+
+    def __init__(
+        self,
+        connection_params: dict[str, Any],
+        min_size: int = DEFAULT_POOL_MIN_SIZE,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+    ) -> None:
+        """
+        Open the pool.
+
+        Args:
+            connection_params: Keyword arguments for psycopg2.connect
+            min_size: Number of connections opened up front
+            max_size: Maximum number of connections the pool hands out
+
+        Raises:
+            ValueError: If the pool sizes are invalid
+            ImportError: If psycopg2 is not installed
+        """
+        if min_size < 1 or max_size < min_size:
+            raise ValueError(
+                f"Invalid PostgreSQL pool size: min_size={min_size}, max_size={max_size}"
+            )
+
+        try:
+            from psycopg2.pool import ThreadedConnectionPool
+        except ImportError:
+            raise ImportError(
+                "psycopg2 is not installed. Install it with: uv add psycopg2-binary"
+            ) from None
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self._pool = ThreadedConnectionPool(min_size, max_size, **connection_params)
+        logger.debug(f"Opened PostgreSQL connection pool ({min_size}-{max_size} connections)")
+
+    def getconn(self) -> Any:
+        """Borrow a connection from the pool."""
+        return self._pool.getconn()
+
+    def putconn(self, connection: Any, close: bool = False) -> None:
+        """Return a borrowed connection to the pool."""
+        self._pool.putconn(connection, close=close)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        Borrow a connection for the duration of a with block.
+
+        The transaction is committed when the block succeeds and rolled back when it
+        raises, so the connection goes back to the pool in a clean state.
+        """
+        connection = self.getconn()
+        try:
+            yield connection
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+        finally:
+            self.putconn(connection)
+
+    def close(self) -> None:
+        """Close every connection in the pool."""
+        if not self._pool.closed:
+            self._pool.closeall()
+            logger.debug("Closed PostgreSQL connection pool")
+
+
+class PooledQueryRunner:
+    """
+    Runs submitted queries in worker threads, each on its own pooled connection.
+
+    Backs the asynchronous query methods of the PostgreSQL adapter: psycopg2 blocks
+    until a statement finishes, so the query scheduler keeps several statements in
+    flight by running each one in a worker thread and session of its own.
+    """
+
+    def __init__(
+        self, connect: Callable[[], AbstractContextManager[Any]], max_workers: int
+    ) -> None:
+        """
+        Start the runner.
+
+        Args:
+            connect: Returns a context manager lending a pooled connection (committed
+                when the block succeeds, rolled back when it raises)
+            max_workers: Maximum number of queries running at the same time
+        """
+        self._connect = connect
+        self._workers = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tee-pg")
+        self._futures: dict[str, Future] = {}
+        # Connections of the queries currently running, by query ID
+        self._running: dict[str, Any] = {}
+
+    def submit(self, query: str) -> QueryHandle:
+        """Submit a query to a worker thread and return its handle."""
+        handle = QueryHandle(query=query, query_id=uuid.uuid4().hex)
+        self._futures[handle.query_id] = self._workers.submit(self._run, handle.query_id, query)
+        return handle
+
+    def poll(self, handle: QueryHandle) -> bool:
+        """Check whether a submitted query has finished, updating its handle."""
+        if handle.done:
+            return True
+
+        future = self._futures[handle.query_id]
+        if not future.done():
+            return False
+
+        del self._futures[handle.query_id]
+        try:
+            handle.result = future.result()
+            handle.state = QUERY_SUCCEEDED
+        except Exception as e:
+            handle.error = e
+            handle.state = QUERY_FAILED
+        return True
+
+    def wait(self, handle: QueryHandle, timeout: float | None = None) -> Any:
+        """Block until a submitted query finishes and return its result."""
+        if not handle.done:
+            wait_for_futures([self._futures[handle.query_id]], timeout=timeout)
+            if not self.poll(handle):
+                raise TimeoutError(f"Query {handle.query_id} still running after {timeout} seconds")
+
+        if handle.error is not None:
+            raise handle.error
+        return handle.result
+
+    def cancel(self, handle: QueryHandle) -> None:
+        """Cancel a submitted query, interrupting it on the server if it already started."""
+        if handle.done:
+            return
+
+        future = self._futures.pop(handle.query_id)
+        if not future.cancel():
+            connection = self._running.get(handle.query_id)
+            if connection is not None:
+                try:
+                    connection.cancel()
+                except Exception as e:
+                    logger.warning(f"Could not cancel query {handle.query_id}: {e}")
+        handle.state = QUERY_CANCELLED
+
+    def close(self) -> None:
+        """Interrupt the running queries and stop the worker threads."""
+        for connection in list(self._running.values()):
+            try:
+                connection.cancel()
+            except Exception as e:
+                logger.debug(f"Could not cancel a running query: {e}")
+        self._workers.shutdown(wait=True, cancel_futures=True)
+        self._futures.clear()
+
+    def _run(self, query_id: str, query: str) -> list[Any]:
+        """Run a query on a pooled connection (in a worker thread)."""
+        start = time.perf_counter()
+        with self._connect() as connection:
+            self._running[query_id] = connection
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(query)
+                    rows = cursor.fetchall() if cursor.description else []
+                    record_query(query, time.perf_counter() - start, rows=cursor.rowcount)
+                    return rows
+            finally:
+                self._running.pop(query_id, None)
@@ -9,7 +9,9 @@ This adapter provides Snowflake-specific functionality including:
 """
 
 import re
+import time
 import uuid
+from collections.abc import Iterator
 from typing import Any
 
 try:
@@ -22,14 +24,18 @@ try:
 except ImportError:
     sqlglot = None
 
-from tee.adapters.base import AdapterConfig, DatabaseAdapter, MaterializationType
+from tee.adapters.base import AdapterConfig, DatabaseAdapter, MaterializationType, QueryHandle
+from tee.adapters.base.arrow import DEFAULT_ARROW_BATCH_SIZE, import_pyarrow
 from tee.adapters.registry import register_adapter
+from tee.ast_registry import parse_sql
+from tee.instrumentation import record_query
 
 from .functions.function_manager import FunctionManager
 from .materialization.incremental_handler import IncrementalHandler
 from .materialization.table_handler import TableHandler
 from .materialization.view_handler import ViewHandler
 from .tags.tag_manager import TagManager
+from .utils.async_query_handler import AsyncQueryHandler
 from .utils.helpers import SnowflakeUtils
 
 
@@ -39,6 +45,11 @@ class SnowflakeAdapter(DatabaseAdapter):
     # Snowflake-specific required fields
     REQUIRED_FIELDS = ["type", "user", "password", "database"]
 
+    # Queries submitted with execute_async keep running in the warehouse
+    supports_async_queries = True
+    supports_arrow_results = True
+    supports_approx_count_distinct = True
+
     def __init__(self, config_dict: dict[str, Any]) -> None:
         if snowflake is None:
             raise ImportError(
@@ -53,6 +64,7 @@ class SnowflakeAdapter(DatabaseAdapter):
         self.table_handler = TableHandler(self)
         self.view_handler = ViewHandler(self)
         self.incremental_handler = IncrementalHandler(self)
+        self.async_query_handler = AsyncQueryHandler(self)
         self.utils = SnowflakeUtils(self)
 
     def _validate_field_values(self, config_dict: dict[str, Any]) -> None:
@@ -167,9 +179,11 @@ class SnowflakeAdapter(DatabaseAdapter):
             raise RuntimeError("Not connected to database. Call connect() first.")
 
         try:
+            start = time.perf_counter()
             cursor = self.connection.cursor()
             cursor.execute(query)
             result = cursor.fetchall()
+            record_query(query, time.perf_counter() - start, rows=cursor.rowcount)
             cursor.close()
             self.logger.debug(f"Executed query: {query[:100]}...")
             return result
@@ -177,12 +191,84 @@ class SnowflakeAdapter(DatabaseAdapter):
             self.logger.error(f"Error executing query: {e}")
             raise
 
+    def execute_arrow(self, query: str) -> Any:
+        """Execute a SQL query and return its result as an Arrow table."""
+        if not self.connection:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+        import_pyarrow()
+
+        start = time.perf_counter()
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(query)
+            table = cursor.fetch_arrow_all(force_return_table=True)
+        finally:
+            cursor.close()
+        record_query(query, time.perf_counter() - start, rows=table.num_rows)
+        return table
+
+    def iter_arrow_batches(
+        self, query: str, batch_size: int = DEFAULT_ARROW_BATCH_SIZE
+    ) -> Iterator[Any]:
+        """Execute a SQL query and stream its result chunks as Arrow record batches."""
+        if not self.connection:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+        import_pyarrow()
+
+        start = time.perf_counter()
+        rows = 0
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(query)
+            for table in cursor.fetch_arrow_batches():
+                for batch in table.to_batches(max_chunksize=batch_size):
+                    rows += batch.num_rows
+                    yield batch
+        finally:
+            cursor.close()
+            record_query(query, time.perf_counter() - start, rows=rows)
+
+    def transpile_model_sql(self, sql: str) -> str:
+        """Model SQL is executed as written on Snowflake, so there is nothing to transpile."""
+        return sql
+
     def create_table(
         self, table_name: str, query: str, metadata: dict[str, Any] | None = None
     ) -> None:
         """Create a table from a qualified SQL query with optional column metadata."""
         self.table_handler.create(table_name, query, metadata)
 
+    def submit_query(self, query: str) -> QueryHandle:
+        """Submit a query asynchronously and return its handle."""
+        return self.async_query_handler.submit(query)
+
+    def poll(self, handle: QueryHandle) -> bool:
+        """Check whether a submitted query has finished."""
+        return self.async_query_handler.poll(handle)
+
+    def wait(self, handle: QueryHandle, timeout: float | None = None) -> Any:
+        """Block until a submitted query finishes and return its result."""
+        return self.async_query_handler.wait(handle, timeout)
+
+    def cancel(self, handle: QueryHandle) -> None:
+        """Cancel a submitted query."""
+        self.async_query_handler.cancel(handle)
+
+    def submit_create_table(
+        self,
+        table_name: str,
+        query: str,
+        metadata: dict[str, Any] | None = None,  # noqa: ARG002
+    ) -> QueryHandle:
+        """Submit the CREATE TABLE statement for a table without waiting for it."""
+        return self.submit_query(self.table_handler.build_create_statement(table_name, query))
+
+    def complete_create_table(
+        self, table_name: str, metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Add comments and tags to a table created with submit_create_table()."""
+        self.table_handler.apply_metadata(table_name, metadata)
+
     def create_view(
         self, view_name: str, query: str, metadata: dict[str, Any] | None = None
     ) -> None:
@@ -261,6 +347,30 @@ class SnowflakeAdapter(DatabaseAdapter):
             self.logger.error(f"Error getting table info for {table_name}: {e}")
             raise
 
+    def get_table_fingerprint(self, table_name: str) -> str | None:
+        """Get the LAST_ALTERED time and row count of a table from INFORMATION_SCHEMA."""
+        if not self.connection:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+
+        if "." in table_name:
+            schema_name, table_name_only = table_name.split(".", 1)
+        else:
+            schema_name = self.config.schema or "PUBLIC"
+            table_name_only = table_name
+
+        result = self._execute_with_cursor(
+            """
+            SELECT last_altered, row_count
+            FROM information_schema.tables
+            WHERE table_schema = %s AND table_name = %s
+        """,
+            (schema_name.upper(), table_name_only.upper()),
+        )
+        if not result:
+            return None
+        last_altered, row_count = result[0]
+        return f"{last_altered}|{row_count}"
+
     def describe_query_schema(self, sql_query: str) -> list[dict[str, Any]]:
         """Infer schema from SQL query output using Snowflake DESCRIBE."""
         if not self.connection:
@@ -419,7 +529,7 @@ class SnowflakeAdapter(DatabaseAdapter):
 
         try:
             # Parse the SQL
-            parsed = sqlglot.parse_one(sql, read=self.target_dialect)
+            parsed = parse_sql(sql, dialect=self.target_dialect)
 
             # For Snowflake, we need to manually qualify table references
             # because the qualify optimizer quotes schema names incorrectly
@@ -524,6 +634,12 @@ class SnowflakeAdapter(DatabaseAdapter):
         """Execute delete+insert atomically in a transaction, aligning columns."""
         self.incremental_handler.execute_delete_insert(table_name, delete_sql, insert_sql)
 
+    def execute_incremental_insert_overwrite(
+        self, table_name: str, source_sql: str, partition_by: list[str]
+    ) -> None:
+        """Replace the partitions touched by a batch in one transaction."""
+        self.incremental_handler.execute_insert_overwrite(table_name, source_sql, partition_by)
+
     def attach_tags(self, object_type: str, object_name: str, tags: list[str]) -> None:
         """Attach tags to a Snowflake database object."""
         self.tag_manager.attach_tags(object_type, object_name, tags)
@@ -64,14 +64,13 @@ class FunctionManager:
 
             # Attach tags if provided (Snowflake supports full tag functionality)
             if metadata:
-                tags = metadata.get("tags", [])
-                object_tags = metadata.get("object_tags", {})
-                if tags:
-                    self.tag_manager.attach_tags("FUNCTION", qualified_function_name, tags)
-                if object_tags:
-                    self.tag_manager.attach_object_tags(
-                        "FUNCTION", qualified_function_name, object_tags
-                    )
+                self.tag_manager.apply_tags(
+                    "FUNCTION",
+                    qualified_function_name,
+                    tags=metadata.get("tags", []),
+                    object_tags=metadata.get("object_tags", {}),
+                    object_is_new=True,
+                )
 
         except Exception as e:
             self.logger.error(f"Failed to create function {qualified_function_name}: {e}")
@@ -105,6 +105,41 @@ class IncrementalHandler:
         finally:
             cursor.close()
 
+    def execute_insert_overwrite(
+        self, table_name: str, source_sql: str, partition_by: list[str]
+    ) -> None:
+        """Replace the partitions touched by a batch, in one transaction."""
+        if not self.adapter.connection:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+
+        qualified_table = self.adapter.utils.qualify_object_name(table_name)
+        staging_table = self.adapter.insert_overwrite_staging_name()
+        delete_sql = self.adapter.build_partition_delete(
+            qualified_table, staging_table, partition_by
+        )
+        cursor = self.adapter.connection.cursor()
+        try:
+            # Stage the batch once, so the partitions deleted are exactly the ones inserted.
+            # DDL commits implicitly in Snowflake, so it stays outside the transaction.
+            cursor.execute(f"CREATE TEMPORARY TABLE {staging_table} AS {source_sql}")
+            cursor.execute("BEGIN")
+            try:
+                cursor.execute(delete_sql)
+                cursor.execute(f"INSERT INTO {qualified_table} SELECT * FROM {staging_table}")
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+            self.logger.info(f"Executed insert_overwrite for table: {table_name}")
+        except Exception as e:
+            self.logger.error(f"Error executing insert_overwrite for {table_name}: {e}")
+            raise
+        finally:
+            try:
+                cursor.execute(f"DROP TABLE IF EXISTS {staging_table}")
+            finally:
+                cursor.close()
+
     def _generate_merge_sql(
         self,
         table_name: str,
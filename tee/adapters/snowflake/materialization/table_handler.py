@@ -26,6 +26,23 @@ class TableHandler:
 
     def create(self, table_name: str, query: str, metadata: dict[str, Any] | None = None) -> None:
         """Create a table from a qualified SQL query with optional column metadata."""
+        create_query = self.build_create_statement(table_name, query)
+
+        try:
+            cursor = self.adapter.connection.cursor()
+            cursor.execute(create_query)
+            cursor.close()
+            self.logger.info(f"Created table: {table_name}")
+
+            # Add table and column comments if metadata is provided
+            self.apply_metadata(table_name, metadata)
+
+        except Exception as e:
+            self.logger.error(f"Failed to create table {table_name}: {e}")
+            raise
+
+    def build_create_statement(self, table_name: str, query: str) -> str:
+        """Create the table's schema if needed and build its CREATE TABLE statement."""
         if not self.adapter.connection:
             raise RuntimeError("Not connected to database. Call connect() first.")
 
@@ -41,47 +58,37 @@ class TableHandler:
         self.logger.debug(f"  Original query: {query}")
         self.logger.debug(f"  Full CREATE statement: {create_query}")
 
-        try:
-            cursor = self.adapter.connection.cursor()
-            cursor.execute(create_query)
-            cursor.close()
-            self.logger.info(f"Created table: {table_name}")
+        return create_query
 
-            # Add table and column comments if metadata is provided
-            if metadata:
-                try:
-                    # Add table comment if description is provided
-                    table_description = metadata.get("description")
-                    if table_description:
-                        self.adapter.utils.add_table_comment(
-                            qualified_table_name, table_description
-                        )
-
-                    # Add column comments
-                    column_descriptions = self.adapter._validate_column_metadata(metadata)
-                    if column_descriptions:
-                        self.adapter.utils.add_column_comments(
-                            qualified_table_name, column_descriptions
-                        )
-
-                    # Add tags (dbt-style, list of strings) if present
-                    tags = metadata.get("tags", [])
-                    if tags:
-                        self.tag_manager.attach_tags("TABLE", qualified_table_name, tags)
-
-                    # Add object_tags (database-style, key-value pairs) if present
-                    object_tags = metadata.get("object_tags", {})
-                    if object_tags and isinstance(object_tags, dict):
-                        self.tag_manager.attach_object_tags(
-                            "TABLE", qualified_table_name, object_tags
-                        )
-                except ValueError as e:
-                    self.logger.error(f"Invalid metadata for table {table_name}: {e}")
-                    raise
-                except Exception as e:
-                    self.logger.warning(f"Could not add comments/tags for table {table_name}: {e}")
-                    # Don't raise here - table creation succeeded, comments/tags are optional
+    def apply_metadata(self, table_name: str, metadata: dict[str, Any] | None = None) -> None:
+        """Add table comment, column comments and tags to a freshly created table."""
+        if not metadata:
+            return
 
-        except Exception as e:
-            self.logger.error(f"Failed to create table {table_name}: {e}")
+        qualified_table_name = self.adapter.utils.qualify_object_name(table_name)
+        try:
+            # Add table comment if description is provided
+            table_description = metadata.get("description")
+            if table_description:
+                self.adapter.utils.add_table_comment(qualified_table_name, table_description)
+
+            # Add column comments
+            column_descriptions = self.adapter._validate_column_metadata(metadata)
+            if column_descriptions:
+                self.adapter.utils.add_column_comments(qualified_table_name, column_descriptions)
+
+            # Add tags (dbt-style, list of strings) and object_tags (database-style,
+            # key-value pairs) in a single pass
+            self.tag_manager.apply_tags(
+                "TABLE",
+                qualified_table_name,
+                tags=metadata.get("tags", []),
+                object_tags=metadata.get("object_tags", {}),
+                object_is_new=True,
+            )
+        except ValueError as e:
+            self.logger.error(f"Invalid metadata for table {table_name}: {e}")
             raise
+        except Exception as e:
+            self.logger.warning(f"Could not add comments/tags for table {table_name}: {e}")
+            # Don't raise here - table creation succeeded, comments/tags are optional
@@ -59,25 +59,19 @@ class ViewHandler:
 
             # Add tags if metadata is provided
             if metadata:
-                # Add tags (dbt-style, list of strings) if present
-                tags = metadata.get("tags", [])
-                if tags:
-                    try:
-                        self.tag_manager.attach_tags("VIEW", qualified_view_name, tags)
-                    except Exception as e:
-                        self.logger.warning(f"Could not add tags for view {view_name}: {e}")
-                        # Don't raise here - view creation succeeded, tags are optional
-
-                # Add object_tags (database-style, key-value pairs) if present
-                object_tags = metadata.get("object_tags", {})
-                if object_tags and isinstance(object_tags, dict):
-                    try:
-                        self.tag_manager.attach_object_tags(
-                            "VIEW", qualified_view_name, object_tags
-                        )
-                    except Exception as e:
-                        self.logger.warning(f"Could not add object_tags for view {view_name}: {e}")
-                        # Don't raise here - view creation succeeded, tags are optional
+                # Add tags (dbt-style, list of strings) and object_tags (database-style,
+                # key-value pairs) in a single pass
+                try:
+                    self.tag_manager.apply_tags(
+                        "VIEW",
+                        qualified_view_name,
+                        tags=metadata.get("tags", []),
+                        object_tags=metadata.get("object_tags", {}),
+                        object_is_new=True,
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Could not add tags for view {view_name}: {e}")
+                    # Don't raise here - view creation succeeded, tags are optional
 
             # Note: View and column comments are now included inline during creation
 
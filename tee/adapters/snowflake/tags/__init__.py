@@ -1,5 +1,6 @@
 """Tag management components for Snowflake."""
 
 from .tag_manager import TagManager
+from .tag_reconciler import TagReconciler
 
-__all__ = ["TagManager"]
+__all__ = ["TagManager", "TagReconciler"]
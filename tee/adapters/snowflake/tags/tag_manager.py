@@ -1,7 +1,9 @@
 """Tag management for Snowflake database objects."""
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from .tag_reconciler import TagReconciler
 
 if TYPE_CHECKING:
     from tee.adapters.base.core import DatabaseAdapter
@@ -22,6 +24,7 @@ class TagManager:
         self.adapter = adapter
         self.config = adapter.config
         self.logger = adapter.logger
+        self.reconciler = TagReconciler(adapter)
 
     @property
     def connection(self) -> Any:
@@ -35,85 +38,14 @@ class TagManager:
         Snowflake supports tags on tables, views, and other objects using:
         ALTER TABLE/VIEW object_name SET TAG tag_name = 'tag_value'
 
-        For simple string tags, we create/use a generic 'tag' tag and set values.
+        For simple string tags, we create/use a 'tee_tag_<value>' tag for each value.
 
         Args:
             object_type: Type of object ('TABLE', 'VIEW', etc.)
             object_name: Fully qualified object name (DATABASE.SCHEMA.OBJECT)
             tags: List of tag strings to attach
         """
-        if not self.connection:
-            raise RuntimeError("Not connected to database. Call connect() first.")
-
-        if not tags:
-            return
-
-        cursor = self.connection.cursor()
-        try:
-            # For each tag, we'll use Snowflake's tag system
-            # Snowflake tags work as key-value pairs, so we'll create a generic 'tag' tag
-            # and set multiple values, or create individual tags for each value
-
-            # Strategy: Create/use a generic 'tee_tags' tag and set comma-separated values
-            # OR create individual tags for each tag value
-            # We'll use the simpler approach: create a 'tee_tag' tag for each unique tag value
-
-            for tag_value in tags:
-                if not tag_value or not isinstance(tag_value, str) or not tag_value.strip():
-                    continue
-
-                # Sanitize tag name (Snowflake tag names must be valid identifiers)
-                # Use a prefix to avoid conflicts
-                sanitized_tag = f"tee_tag_{tag_value.replace(' ', '_').replace('-', '_').lower()}"
-                # Truncate if too long (Snowflake has limits)
-                if len(sanitized_tag) > 128:
-                    sanitized_tag = sanitized_tag[:128]
-
-                try:
-                    # Create tag if it doesn't exist (ignore error if it exists)
-                    try:
-                        create_tag_sql = f"CREATE TAG IF NOT EXISTS {sanitized_tag}"
-                        cursor.execute(create_tag_sql)
-                        self.logger.debug(f"Created tag: {sanitized_tag}")
-                    except Exception:
-                        # Tag might already exist, continue
-                        pass
-
-                    # Attach tag to object
-                    # Snowflake syntax: ALTER TABLE/VIEW object SET TAG tag_name = 'value'
-                    # Note: Functions in Snowflake may not support tags directly
-                    # If object_type is FUNCTION, we need to include the function signature
-                    # For now, we'll try the standard syntax and catch errors
-                    if object_type.upper() == "FUNCTION":
-                        # Snowflake functions require the full signature for ALTER statements
-                        # Since we don't have the signature here, we'll skip tag attachment for functions
-                        # and log a debug message
-                        self.logger.debug(
-                            f"Skipping tag attachment for FUNCTION {object_name}: "
-                            f"Snowflake requires function signature for ALTER FUNCTION statements"
-                        )
-                        continue
-
-                    alter_sql = f"ALTER {object_type} {object_name} SET TAG {sanitized_tag} = '{tag_value.replace("'", "''")}'"
-                    cursor.execute(alter_sql)
-                    self.logger.debug(
-                        f"Attached tag {sanitized_tag}='{tag_value}' to {object_type} {object_name}"
-                    )
-
-                except Exception as e:
-                    self.logger.warning(
-                        f"Could not attach tag '{tag_value}' to {object_type} {object_name}: {e}"
-                    )
-                    # Continue with other tags even if one fails
-                    continue
-
-            self.logger.info(f"Attached {len(tags)} tag(s) to {object_type} {object_name}")
-
-        except Exception as e:
-            self.logger.warning(f"Error attaching tags to {object_type} {object_name}: {e}")
-            # Don't raise - tag attachment is optional
-        finally:
-            cursor.close()
+        self.apply_tags(object_type, object_name, tags=tags)
 
     def attach_object_tags(
         self, object_type: str, object_name: str, object_tags: dict[str, str]
@@ -131,74 +63,96 @@ class TagManager:
             object_name: Fully qualified object name (DATABASE.SCHEMA.OBJECT)
             object_tags: Dictionary of tag key-value pairs
         """
+        self.apply_tags(object_type, object_name, object_tags=object_tags)
+
+    def apply_tags(
+        self,
+        object_type: str,
+        object_name: str,
+        tags: list[str] | None = None,
+        object_tags: dict[str, Any] | None = None,
+        object_is_new: bool = False,
+    ) -> None:
+        """
+        Apply dbt-style tags and object tags to a Snowflake object in one pass.
+
+        Missing tags are created once per run and all changed assignments are set with
+        a single ALTER ... SET TAG statement.
+
+        Args:
+            object_type: Type of object ('TABLE', 'VIEW', 'SCHEMA', etc.)
+            object_name: Fully qualified object name (DATABASE.SCHEMA.OBJECT)
+            tags: List of tag strings to attach
+            object_tags: Dictionary of tag key-value pairs
+            object_is_new: Whether the object was just (re)created and has no tags yet
+        """
         if not self.connection:
             raise RuntimeError("Not connected to database. Call connect() first.")
 
-        if not object_tags or not isinstance(object_tags, dict):
+        desired_tags = self.build_tag_assignments(tags, object_tags)
+        if not desired_tags:
+            return
+
+        # Note: Functions in Snowflake may not support tags directly
+        if object_type.upper() == "FUNCTION":
+            # Snowflake functions require the full signature for ALTER statements
+            # Since we don't have the signature here, we'll skip tag attachment for functions
+            self.logger.debug(
+                f"Skipping tag attachment for FUNCTION {object_name}: "
+                f"Snowflake requires function signature for ALTER FUNCTION statements"
+            )
             return
 
         cursor = self.connection.cursor()
         try:
-            for tag_key, tag_value in object_tags.items():
-                if not tag_key or not isinstance(tag_key, str):
-                    continue
-                if tag_value is None:
-                    continue
-
-                # Sanitize tag key (Snowflake tag names must be valid identifiers)
-                sanitized_tag_key = tag_key.replace(" ", "_").replace("-", "_")
-                # Truncate if too long (Snowflake has limits)
-                if len(sanitized_tag_key) > 128:
-                    sanitized_tag_key = sanitized_tag_key[:128]
-
-                # Convert tag value to string
-                tag_value_str = str(tag_value)
-
-                try:
-                    # Create tag if it doesn't exist (ignore error if it exists)
-                    try:
-                        create_tag_sql = f"CREATE TAG IF NOT EXISTS {sanitized_tag_key}"
-                        cursor.execute(create_tag_sql)
-                        self.logger.debug(f"Created tag: {sanitized_tag_key}")
-                    except Exception:
-                        # Tag might already exist, continue
-                        pass
-
-                    # Attach tag to object
-                    # Snowflake syntax: ALTER TABLE/VIEW object SET TAG tag_name = 'value'
-                    # Note: Functions in Snowflake may not support tags directly
-                    # If object_type is FUNCTION, we need to include the function signature
-                    # For now, we'll try the standard syntax and catch errors
-                    if object_type.upper() == "FUNCTION":
-                        # Snowflake functions require the full signature for ALTER statements
-                        # Since we don't have the signature here, we'll skip tag attachment for functions
-                        # and log a debug message
-                        self.logger.debug(
-                            f"Skipping object tag attachment for FUNCTION {object_name}: "
-                            f"Snowflake requires function signature for ALTER FUNCTION statements"
-                        )
-                        continue
-
-                    escaped_value = tag_value_str.replace("'", "''")
-                    alter_sql = f"ALTER {object_type} {object_name} SET TAG {sanitized_tag_key} = '{escaped_value}'"
-                    cursor.execute(alter_sql)
-                    self.logger.debug(
-                        f"Attached object tag {sanitized_tag_key}='{tag_value_str}' to {object_type} {object_name}"
-                    )
-
-                except Exception as e:
-                    self.logger.warning(
-                        f"Could not attach object tag '{tag_key}'='{tag_value}' to {object_type} {object_name}: {e}"
-                    )
-                    # Continue with other tags even if one fails
-                    continue
-
-            self.logger.info(
-                f"Attached {len(object_tags)} object tag(s) to {object_type} {object_name}"
+            applied = self.reconciler.reconcile(
+                cursor, object_type, object_name, desired_tags, object_is_new=object_is_new
             )
-
+            self.logger.info(f"Attached {len(applied)} tag(s) to {object_type} {object_name}")
         except Exception as e:
-            self.logger.warning(f"Error attaching object tags to {object_type} {object_name}: {e}")
+            self.logger.warning(f"Error attaching tags to {object_type} {object_name}: {e}")
             # Don't raise - tag attachment is optional
         finally:
             cursor.close()
+
+    @staticmethod
+    def build_tag_assignments(
+        tags: list[str] | None = None, object_tags: dict[str, Any] | None = None
+    ) -> dict[str, str]:
+        """
+        Build the Snowflake tag assignments for dbt-style tags and object tags.
+
+        Args:
+            tags: List of tag strings (each becomes a 'tee_tag_<value>' tag)
+            object_tags: Dictionary of tag key-value pairs
+
+        Returns:
+            Mapping of sanitized tag name to tag value
+        """
+        assignments: dict[str, str] = {}
+
+        for tag_value in tags or []:
+            if not tag_value or not isinstance(tag_value, str) or not tag_value.strip():
+                continue
+
+            # Sanitize tag name (Snowflake tag names must be valid identifiers)
+            # Use a prefix to avoid conflicts
+            sanitized_tag = f"tee_tag_{tag_value.replace(' ', '_').replace('-', '_').lower()}"
+            # Truncate if too long (Snowflake has limits)
+            assignments[sanitized_tag[:128]] = tag_value
+
+        if not isinstance(object_tags, dict):
+            object_tags = {}
+
+        for tag_key, tag_value in object_tags.items():
+            if not tag_key or not isinstance(tag_key, str):
+                continue
+            if tag_value is None:
+                continue
+
+            # Sanitize tag key (Snowflake tag names must be valid identifiers)
+            sanitized_tag_key = tag_key.replace(" ", "_").replace("-", "_")
+            # Truncate if too long (Snowflake has limits)
+            assignments[sanitized_tag_key[:128]] = str(tag_value)
+
+        return assignments
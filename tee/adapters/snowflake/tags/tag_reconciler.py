@@ -0,0 +1,160 @@
+"""Tag reconciliation for Snowflake database objects."""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tee.adapters.base.core import DatabaseAdapter
+
+# TAG_REFERENCES domain for each taggable object type
+TAG_REFERENCE_DOMAINS = {
+    "TABLE": "table",
+    "VIEW": "table",
+    "MATERIALIZED VIEW": "table",
+    "SCHEMA": "schema",
+    "DATABASE": "database",
+}
+
+
+class TagReconciler:
+    """
+    Applies tag assignments to Snowflake objects with as few statements as possible.
+
+    Existing tags are listed once (SHOW TAGS) and remembered for the lifetime of the
+    adapter, so each missing tag is created once per run instead of once per object.
+    Current assignments of an existing object are read with TAG_REFERENCES and only
+    the tags whose value differs are set, all in a single ALTER ... SET TAG statement.
+    """
+
+    def __init__(self, adapter: DatabaseAdapter) -> None:
+        """
+        Initialize the tag reconciler.
+
+        Args:
+            adapter: SnowflakeAdapter instance
+        """
+        self.adapter = adapter
+        self.config = adapter.config
+        self.logger = adapter.logger
+        self._known_tags: set[str] | None = None
+
+    def reconcile(
+        self,
+        cursor: Any,
+        object_type: str,
+        object_name: str,
+        desired_tags: dict[str, str],
+        object_is_new: bool = False,
+    ) -> dict[str, str]:
+        """
+        Bring the tag assignments of an object in line with the desired ones.
+
+        Tags assigned to the object but not desired are left untouched.
+
+        Args:
+            cursor: Open Snowflake cursor
+            object_type: Type of object ('TABLE', 'VIEW', 'SCHEMA', etc.)
+            object_name: Fully qualified object name (DATABASE.SCHEMA.OBJECT)
+            desired_tags: Mapping of sanitized tag name to tag value
+            object_is_new: Whether the object was just created (it has no assignments yet)
+
+        Returns:
+            The tag assignments that were set
+        """
+        if not desired_tags:
+            return {}
+
+        self._create_missing_tags(cursor, desired_tags)
+
+        current = {} if object_is_new else self._get_assignments(cursor, object_type, object_name)
+        changed = {
+            tag_name: tag_value
+            for tag_name, tag_value in desired_tags.items()
+            if current.get(tag_name.upper()) != tag_value
+        }
+        if not changed:
+            self.logger.debug(f"Tags on {object_type} {object_name} are up to date")
+            return {}
+
+        self._set_tags(cursor, object_type, object_name, changed)
+        return changed
+
+    def _get_known_tags(self, cursor: Any) -> set[str]:
+        """List the tags of the current schema (once)."""
+        if self._known_tags is None:
+            self._known_tags = set()
+            if self.config.database and self.config.schema:
+                show_tags_sql = f"SHOW TAGS IN SCHEMA {self.config.database}.{self.config.schema}"
+            else:
+                show_tags_sql = "SHOW TAGS IN SCHEMA"
+            try:
+                cursor.execute(show_tags_sql)
+                # The tag name is the second column of SHOW TAGS
+                for row in cursor.fetchall():
+                    self._known_tags.add(str(row[1]).upper())
+            except Exception as e:
+                self.logger.debug(f"Could not list existing tags: {e}")
+        return self._known_tags
+
+    def _create_missing_tags(self, cursor: Any, desired_tags: dict[str, str]) -> None:
+        """Create the desired tags that do not exist yet."""
+        known_tags = self._get_known_tags(cursor)
+        for tag_name in desired_tags:
+            if tag_name.upper() in known_tags:
+                continue
+            try:
+                cursor.execute(f"CREATE TAG IF NOT EXISTS {tag_name}")
+                self.logger.debug(f"Created tag: {tag_name}")
+            except Exception:
+                # Tag might already exist, continue
+                pass
+            known_tags.add(tag_name.upper())
+
+    def _get_assignments(self, cursor: Any, object_type: str, object_name: str) -> dict[str, str]:
+        """Get the tags set directly on an object, keyed by upper-cased tag name."""
+        domain = TAG_REFERENCE_DOMAINS.get(object_type.upper())
+        if domain is None:
+            return {}
+
+        database = object_name.split(".")[0] if "." in object_name else self.config.database
+        escaped_name = object_name.replace("'", "''")
+        query = (
+            f"SELECT tag_name, tag_value "
+            f"FROM TABLE({database}.information_schema.tag_references('{escaped_name}', '{domain}')) "
+            f"WHERE level = '{domain.upper()}'"
+        )
+        try:
+            cursor.execute(query)
+            return {str(row[0]).upper(): row[1] for row in cursor.fetchall()}
+        except Exception as e:
+            self.logger.debug(f"Could not read tag references for {object_name}: {e}")
+            return {}
+
+    def _set_tags(
+        self, cursor: Any, object_type: str, object_name: str, tags: dict[str, str]
+    ) -> None:
+        """Set several tags on an object in one statement, falling back to one per tag."""
+        assignments = ", ".join(
+            f"{tag_name} = '{tag_value.replace("'", "''")}'" for tag_name, tag_value in tags.items()
+        )
+        try:
+            cursor.execute(f"ALTER {object_type} {object_name} SET TAG {assignments}")
+            return
+        except Exception as e:
+            if len(tags) == 1:
+                raise
+            self.logger.debug(
+                f"Batched tag assignment failed for {object_type} {object_name}, "
+                f"setting tags one by one: {e}"
+            )
+
+        # Set tags individually so one bad tag does not prevent the others
+        for tag_name, tag_value in tags.items():
+            escaped_value = tag_value.replace("'", "''")
+            try:
+                cursor.execute(
+                    f"ALTER {object_type} {object_name} SET TAG {tag_name} = '{escaped_value}'"
+                )
+            except Exception as e:
+                self.logger.warning(
+                    f"Could not attach tag {tag_name}='{tag_value}' to {object_type} {object_name}: {e}"
+                )
@@ -1,5 +1,6 @@
 """Utility components for Snowflake."""
 
+from .async_query_handler import AsyncQueryHandler
 from .helpers import SnowflakeUtils
 
-__all__ = ["SnowflakeUtils"]
+__all__ = ["AsyncQueryHandler", "SnowflakeUtils"]
@@ -0,0 +1,115 @@
+"""Asynchronous query submission for Snowflake."""
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from tee.adapters.base.async_queries import (
+    QUERY_CANCELLED,
+    QUERY_FAILED,
+    QUERY_SUCCEEDED,
+    QueryHandle,
+)
+from tee.instrumentation import record_query
+
+if TYPE_CHECKING:
+    from tee.adapters.base.core import DatabaseAdapter
+
+# Polling backoff for wait() (seconds)
+INITIAL_POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 1.0
+
+
+class AsyncQueryHandler:
+    """
+    Submits queries with the connector's execute_async and tracks them by query id.
+
+    Submitted queries keep running in the warehouse while the client does other work,
+    so a single session can have many statements in flight.
+    """
+
+    def __init__(self, adapter: DatabaseAdapter) -> None:
+        """
+        Initialize the async query handler.
+
+        Args:
+            adapter: SnowflakeAdapter instance
+        """
+        self.adapter = adapter
+        self.logger = adapter.logger
+
+    def submit(self, query: str) -> QueryHandle:
+        """Submit a query and return immediately with its handle."""
+        if not self.adapter.connection:
+            raise RuntimeError("Not connected to database. Call connect() first.")
+
+        cursor = self.adapter.connection.cursor()
+        try:
+            cursor.execute_async(query)
+            handle = QueryHandle(query=query, query_id=cursor.sfqid)
+        finally:
+            cursor.close()
+
+        self.logger.debug(f"Submitted query {handle.query_id}: {query[:100]}...")
+        return handle
+
+    def poll(self, handle: QueryHandle) -> bool:
+        """Check whether a submitted query has finished, collecting its result if so."""
+        if handle.done:
+            return True
+
+        connection = self.adapter.connection
+        status = connection.get_query_status(handle.query_id)
+        if connection.is_still_running(status):
+            return False
+
+        self._collect(handle)
+        return True
+
+    def wait(self, handle: QueryHandle, timeout: float | None = None) -> Any:
+        """Block until a submitted query finishes and return its result."""
+        deadline = time.perf_counter() + timeout if timeout is not None else None
+        interval = INITIAL_POLL_INTERVAL
+
+        while not self.poll(handle):
+            if deadline is not None and time.perf_counter() >= deadline:
+                raise TimeoutError(
+                    f"Query {handle.query_id} still running after {timeout} seconds"
+                )
+            time.sleep(interval)
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+        if handle.error is not None:
+            raise handle.error
+        return handle.result
+
+    def cancel(self, handle: QueryHandle) -> None:
+        """Cancel a submitted query if it is still running."""
+        if handle.done:
+            return
+
+        cursor = self.adapter.connection.cursor()
+        try:
+            cursor.execute(f"SELECT SYSTEM$CANCEL_QUERY('{handle.query_id}')")
+            handle.state = QUERY_CANCELLED
+            self.logger.info(f"Cancelled query {handle.query_id}")
+        except Exception as e:
+            self.logger.warning(f"Could not cancel query {handle.query_id}: {e}")
+        finally:
+            cursor.close()
+
+    def _collect(self, handle: QueryHandle) -> None:
+        """Fetch the result (or error) of a finished query into its handle."""
+        cursor = self.adapter.connection.cursor()
+        try:
+            cursor.get_results_from_sfqid(handle.query_id)
+            handle.result = cursor.fetchall()
+            handle.state = QUERY_SUCCEEDED
+            record_query(
+                handle.query, time.perf_counter() - handle.submitted_at, rows=cursor.rowcount
+            )
+        except Exception as e:
+            self.logger.error(f"Query {handle.query_id} failed: {e}")
+            handle.error = e
+            handle.state = QUERY_FAILED
+        finally:
+            cursor.close()
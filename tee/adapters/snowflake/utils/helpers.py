@@ -66,19 +66,15 @@ class SnowflakeUtils:
                     not schema_exists or schema_metadata.get("force_tag_update", False)
                 ):
                     try:
-                        # Add tags (dbt-style, list of strings) if present
-                        tags = schema_metadata.get("tags", [])
-                        if tags:
-                            self.adapter.tag_manager.attach_tags(
-                                "SCHEMA", qualified_schema_name, tags
-                            )
-
-                        # Add object_tags (database-style, key-value pairs) if present
-                        object_tags = schema_metadata.get("object_tags", {})
-                        if object_tags and isinstance(object_tags, dict):
-                            self.adapter.tag_manager.attach_object_tags(
-                                "SCHEMA", qualified_schema_name, object_tags
-                            )
+                        # Add tags (dbt-style, list of strings) and object_tags
+                        # (database-style, key-value pairs) in a single pass
+                        self.adapter.tag_manager.apply_tags(
+                            "SCHEMA",
+                            qualified_schema_name,
+                            tags=schema_metadata.get("tags", []),
+                            object_tags=schema_metadata.get("object_tags", {}),
+                            object_is_new=not schema_exists,
+                        )
                     except Exception as e:
                         self.logger.warning(
                             f"Could not add tags to schema {qualified_schema_name}: {e}"
@@ -0,0 +1,151 @@
+"""
+Run-scoped registry of parsed SQL.
+
+Within a run, the same model SQL goes through many stages that each need its sqlglot
+AST: parsing the model, validating Python model output, schema inference, dialect
+conversion, incremental filters and schema change handling. The registry parses each
+distinct SQL text (per read dialect) once and hands the AST to every stage.
+
+Stages that only read the AST take the shared instance (copy=False). Stages that
+modify it take their own copy, which is much cheaper than parsing again, so no stage
+can see another stage's changes.
+
+Outside of a registry scope, parse_sql() parses directly, so library code can use it
+unconditionally.
+"""
+
+import functools
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import sqlglot
+from sqlglot import exp
+
+logger = logging.getLogger(__name__)
+
+
+class ASTRegistry:
+    """Parsed sqlglot expressions keyed by SQL hash and read dialect."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._expressions: dict[tuple[str, str | None], exp.Expression] = {}
+        self._lock = threading.Lock()
+        self.parse_count = 0
+        self.parse_time = 0.0
+        self.reuse_count = 0
+
+    def parse(self, sql: str, dialect: str | None = None, copy: bool = True) -> exp.Expression:
+        """
+        Return the AST of a SQL statement, parsing it only on first use.
+
+        Args:
+            sql: SQL statement
+            dialect: Dialect to read the SQL with (None auto-detects)
+            copy: Return a private copy; pass False only if the caller never modifies
+                the AST
+
+        Returns:
+            Parsed expression
+
+        Raises:
+            sqlglot.errors.ParseError: If the SQL cannot be parsed (failures are not cached)
+        """
+        key = (hashlib.sha256(sql.encode("utf-8")).hexdigest(), dialect)
+        with self._lock:
+            expression = self._expressions.get(key)
+            if expression is not None:
+                self.reuse_count += 1
+
+        if expression is None:
+            start = time.perf_counter()
+            expression = sqlglot.parse_one(sql, read=dialect)
+            elapsed = time.perf_counter() - start
+            if expression is None:
+                return expression
+            with self._lock:
+                self.parse_count += 1
+                self.parse_time += elapsed
+                expression = self._expressions.setdefault(key, expression)
+
+        return expression.copy() if copy else expression
+
+    def stats(self) -> dict[str, Any]:
+        """Return the parse counters of the registry."""
+        with self._lock:
+            return {
+                "statements": len(self._expressions),
+                "parse_count": self.parse_count,
+                "parse_time": self.parse_time,
+                "reuse_count": self.reuse_count,
+            }
+
+
+_active_registry: ASTRegistry | None = None
+
+
+@contextmanager
+def ast_registry_scope() -> Iterator[ASTRegistry]:
+    """
+    Share parsed SQL for the duration of a block.
+
+    Nested scopes join the outermost one. When the outermost scope ends, its parse
+    counters are logged at debug level.
+
+    Yields:
+        The active ASTRegistry
+    """
+    global _active_registry
+    if _active_registry is not None:
+        yield _active_registry
+        return
+
+    registry = _active_registry = ASTRegistry()
+    try:
+        yield registry
+    finally:
+        _active_registry = None
+        stats = registry.stats()
+        logger.debug(
+            f"Parsed {stats['parse_count']} SQL statement(s) in {stats['parse_time']:.3f}s, "
+            f"reused parsed SQL {stats['reuse_count']} time(s)"
+        )
+
+
+def shares_parsed_sql(func: Callable) -> Callable:
+    """Decorate a function so each call runs inside ast_registry_scope()."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with ast_registry_scope():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def get_registry() -> ASTRegistry | None:
+    """Return the active registry, if a scope is open."""
+    return _active_registry
+
+
+def parse_sql(sql: str, dialect: str | None = None, copy: bool = True) -> exp.Expression:
+    """
+    Parse SQL through the active registry (or directly outside of a registry scope).
+
+    Args:
+        sql: SQL statement
+        dialect: Dialect to read the SQL with (None auto-detects)
+        copy: Return a private copy; pass False only if the caller never modifies the AST
+
+    Returns:
+        Parsed expression
+    """
+    registry = _active_registry
+    if registry is None:
+        return sqlglot.parse_one(sql, read=dialect)
+    return registry.parse(sql, dialect=dialect, copy=copy)
@@ -4,7 +4,9 @@ CLI command implementations.
 
 from tee.cli.commands.build import cmd_build
 from tee.cli.commands.compile import cmd_compile
+from tee.cli.commands.critical_path import cmd_critical_path
 from tee.cli.commands.debug import cmd_debug
+from tee.cli.commands.dev import cmd_dev
 from tee.cli.commands.docs import cmd_docs
 from tee.cli.commands.help import cmd_help
 from tee.cli.commands.import_cmd import cmd_import
@@ -24,4 +26,6 @@ __all__ = [
     "cmd_compile",
     "cmd_import",
     "cmd_docs",
+    "cmd_dev",
+    "cmd_critical_path",
 ]
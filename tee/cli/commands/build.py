@@ -7,6 +7,7 @@ Builds models with interleaved test execution, stopping on test failures.
 import typer
 
 from tee.cli.context import CommandContext
+from tee.dev import ensure_no_dev_server
 from tee.engine.connection_manager import ConnectionManager
 from tee.executor import build_models
 
@@ -34,6 +35,12 @@ def cmd_build(
     verbose: bool = False,
     select: list[str] | None = None,
     exclude: list[str] | None = None,
+    force_ddl: bool = False,
+    full_tests: bool = False,
+    test_cache: bool = True,
+    defer: bool = False,
+    state: str | None = None,
+    defer_database: str | None = None,
 ) -> None:
     """Execute the build command."""
     ctx = CommandContext(
@@ -49,6 +56,11 @@ def cmd_build(
         typer.echo(f"Building project: {project_folder}")
         ctx.print_variables_info()
         ctx.print_selection_info()
+        if defer and not state:
+            raise ValueError("--defer requires --state pointing at the production artifacts")
+        if defer:
+            typer.echo(f"Deferring unselected upstream models to production state: {state}")
+        ensure_no_dev_server(ctx.project_path, "t4t build")
 
         # Create unified connection manager
         connection_manager = ConnectionManager(
@@ -66,6 +78,11 @@ def cmd_build(
             select_patterns=ctx.select_patterns,
             exclude_patterns=ctx.exclude_patterns,
             project_config=ctx.config,
+            full_tests=full_tests,
+            test_cache=test_cache,
+            force_ddl=force_ddl,
+            defer_state=state if defer else None,
+            defer_database=defer_database,
         )
 
         # Calculate statistics
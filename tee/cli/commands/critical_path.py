@@ -0,0 +1,114 @@
+"""
+Critical path command implementation.
+"""
+
+import typer
+
+from tee.cli.context import CommandContext
+from tee.engine.model_state import ModelStateManager
+from tee.engine.runtime_history import load_runtime_estimates
+from tee.parser.analysis.critical_path import CriticalPath, node_weights, slowest_chains
+from tee.parser.core.project_parser import ProjectParser
+
+
+def cmd_critical_path(
+    project_folder: str,
+    vars: str | None = None,
+    verbose: bool = False,
+    top: int = 5,
+) -> None:
+    """
+    Report the critical path of the project and its slowest chains of models.
+
+    Node durations are estimated from the runtime history that `t4t run` and `t4t build`
+    record in the state database. Without history, chains are ranked by their number of
+    nodes.
+
+    Args:
+        project_folder: Path to the project folder
+        vars: Optional variables for SQL substitution (JSON format)
+        verbose: Enable verbose output
+        top: Number of slowest chains to show
+    """
+    ctx = CommandContext(
+        project_folder=project_folder,
+        vars=vars,
+        verbose=verbose,
+    )
+    state_manager = None
+
+    try:
+        typer.echo(f"Analyzing critical path for project: {project_folder}")
+        ctx.print_variables_info()
+
+        parser = ProjectParser(
+            project_folder=str(ctx.project_path),
+            connection=ctx.config["connection"],
+            variables=ctx.vars,
+            project_config=ctx.config,
+        )
+        parser.collect_models()
+        graph = parser.build_dependency_graph()
+
+        # Report models and functions; tests only wait on the models they check
+        dependencies = {
+            node: [dep for dep in deps if not dep.startswith("test:")]
+            for node, deps in graph["dependencies"].items()
+            if not node.startswith("test:")
+        }
+        if not dependencies:
+            typer.echo("\n✅ No models to analyze")
+            return
+
+        state_manager = ModelStateManager(project_folder=str(ctx.project_path))
+        estimates = {
+            node: duration
+            for node, duration in load_runtime_estimates(state_manager).items()
+            if node in dependencies
+        }
+        chains = slowest_chains(dependencies, estimates, limit=top)
+
+        typer.echo("\n" + "=" * 50)
+        typer.echo("CRITICAL PATH")
+        typer.echo("=" * 50)
+        _print_critical_path(chains[0], timed=bool(estimates))
+
+        typer.echo(f"\nSlowest chains (top {len(chains)}):")
+        for i, chain in enumerate(chains, 1):
+            total = _format_total(chain, timed=bool(estimates))
+            typer.echo(f"  {i}. {total}  {' -> '.join(chain.nodes)}")
+
+        typer.echo("")
+        if not estimates:
+            typer.echo("No runtime history yet: chains are ranked by number of nodes.")
+            typer.echo("Run `t4t run` or `t4t build` to record how long each node takes.")
+        else:
+            weights = node_weights(dependencies, estimates)
+            unknown = [weight for node, weight in weights.items() if node not in estimates]
+            if unknown:
+                typer.echo(
+                    f"Runtime history covers {len(estimates)} of {len(weights)} node(s); "
+                    f"the others are estimated at {unknown[0]:.2f}s each."
+                )
+
+    except Exception as e:
+        typer.echo(f"\n❌ Critical path analysis failed: {e}", err=True)
+        ctx.handle_error(e)
+    finally:
+        if state_manager is not None:
+            state_manager.close()
+
+
+def _format_total(chain: CriticalPath, timed: bool) -> str:
+    """Format the length of a chain in estimated seconds, or in nodes without history."""
+    if timed:
+        return f"{chain.duration:.2f}s"
+    return f"{len(chain.nodes)} node(s)"
+
+
+def _print_critical_path(chain: CriticalPath, timed: bool) -> None:
+    """Print the nodes of the critical path with their estimated durations."""
+    typer.echo(f"Estimated length: {_format_total(chain, timed)}")
+    width = max(len(node) for node in chain.nodes)
+    for node, duration in zip(chain.nodes, chain.durations, strict=True):
+        typer.echo(f"  {node:<{width}}  {duration:8.2f}s" if timed else f"  {node}")
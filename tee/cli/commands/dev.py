@@ -0,0 +1,94 @@
+"""
+Dev command implementation.
+"""
+
+import typer
+
+from tee.cli.context import CommandContext
+from tee.dev import DevServer, DevSession
+
+
+def _print_results(results: dict) -> None:
+    """Print the tables and functions of a dev run."""
+    executed = results.get("executed_tables", [])
+    failed = results.get("failed_tables", [])
+    functions = results.get("executed_functions", [])
+    failed_functions = results.get("failed_functions", [])
+
+    if functions:
+        typer.echo(f"  ✅ Deployed {len(functions)} function(s)")
+    for failure in failed_functions:
+        typer.echo(f"  ❌ {failure['function']}: {failure['error']}")
+    if executed:
+        typer.echo(f"  ✅ Executed {len(executed)} model(s): {', '.join(executed)}")
+    for failure in failed:
+        typer.echo(f"  ❌ {failure['table']}: {failure['error']}")
+
+
+def _print_refresh(refresh: dict) -> None:
+    """Print the changed files, parse errors and affected models of a refresh."""
+    typer.echo(f"\n🔄 {len(refresh['changed_files'])} file(s) changed")
+    for file_path, error in refresh["errors"].items():
+        typer.echo(f"  ❌ {file_path}: {error}")
+    if refresh["affected"]:
+        typer.echo(f"  Re-running {len(refresh['affected'])} affected model(s)")
+
+
+def cmd_dev(
+    project_folder: str,
+    vars: str | None = None,
+    verbose: bool = False,
+    watch: bool = False,
+    interval: float = 1.0,
+    port: int = 0,
+) -> None:
+    """Execute the dev command."""
+    ctx = CommandContext(
+        project_folder=project_folder,
+        vars=vars,
+        verbose=verbose,
+    )
+    session = None
+    server = None
+
+    try:
+        typer.echo(f"Starting t4t dev session on project: {project_folder}")
+        ctx.print_variables_info()
+
+        session = DevSession(
+            str(ctx.project_path), ctx.config["connection"], ctx.vars, project_config=ctx.config
+        )
+        session.start()
+        status = session.status()
+        typer.echo(f"Loaded {status['models']} model(s) and {status['functions']} function(s)")
+
+        typer.echo("\nRunning all models")
+        _print_results(session.run())
+
+        server = DevServer(session, port=port)
+        server.start()
+        typer.echo(f"\nDev server listening on {server.host}:{server.port}")
+        if watch:
+            typer.echo("Watching models/, functions/, tests/ and seeds/ (Ctrl-C to stop)")
+        else:
+            typer.echo("Press Ctrl-C to stop")
+
+        while not server.shutdown_requested.wait(interval):
+            if not watch:
+                continue
+            refresh = session.refresh()
+            if not refresh["changed_files"]:
+                continue
+            _print_refresh(refresh)
+            if refresh["affected"]:
+                _print_results(session.run(models=refresh["affected"]))
+
+    except KeyboardInterrupt:
+        typer.echo("\nStopping t4t dev session")
+    except Exception as e:
+        ctx.handle_error(e)
+    finally:
+        if server:
+            server.stop()
+        if session:
+            session.close()
@@ -5,6 +5,7 @@ Run command implementation.
 import typer
 
 from tee.cli.context import CommandContext
+from tee.dev import ensure_no_dev_server, request_dev_server
 from tee.engine.connection_manager import ConnectionManager
 from tee.executor import execute_models
 
@@ -26,12 +27,102 @@ def _pluralize(count: int, singular: str, plural: str | None = None) -> str:
     return plural if count != 1 else singular
 
 
+def _print_summary(results: dict) -> None:
+    """
+    Print the completion summary of a run.
+
+    Args:
+        results: Execution results (executed/failed tables and functions, warnings)
+    """
+    # Calculate statistics
+    total_tables = len(results["executed_tables"]) + len(results["failed_tables"])
+    successful_tables = len(results["executed_tables"])
+    failed_tables = len(results["failed_tables"])
+    
+    executed_functions = results.get("executed_functions", [])
+    failed_functions = results.get("failed_functions", [])
+    total_functions = len(executed_functions) + len(failed_functions)
+    successful_functions = len(executed_functions)
+    failed_functions_count = len(failed_functions)
+    
+    warning_count = len(results.get("warnings", []))
+
+    # Build completion message
+    parts = []
+    if successful_tables > 0:
+        parts.append(f"{successful_tables} {_pluralize(successful_tables, 'table')}")
+    if successful_functions > 0:
+        parts.append(f"{successful_functions} {_pluralize(successful_functions, 'function')}")
+    
+    if parts:
+        typer.echo(f"\nCompleted! Successfully executed: {', '.join(parts)}")
+    else:
+        typer.echo("\nCompleted!")
+    
+    # Show failures if any
+    if failed_tables > 0 or failed_functions_count > 0 or warning_count > 0:
+        if successful_tables > 0 or successful_functions > 0:
+            typer.echo(f"  ✅ Successful: {successful_tables} {_pluralize(successful_tables, 'table')}, {successful_functions} {_pluralize(successful_functions, 'function')}")
+        if failed_tables > 0:
+            typer.echo(f"  ❌ Failed: {failed_tables} {_pluralize(failed_tables, 'table')}")
+        if failed_functions_count > 0:
+            typer.echo(f"  ❌ Failed: {failed_functions_count} {_pluralize(failed_functions_count, 'function')}")
+        if warning_count > 0:
+            typer.echo(f"  ⚠️  Warnings: {warning_count} {_pluralize(warning_count, 'warning')}")
+    elif successful_tables > 0 or successful_functions > 0:
+        # All successful
+        if successful_tables > 0:
+            typer.echo(f"  ✅ All {successful_tables} {_pluralize(successful_tables, 'table')} executed successfully!")
+        if successful_functions > 0:
+            typer.echo(f"  ✅ All {successful_functions} {_pluralize(successful_functions, 'function')} deployed successfully!")
+
+
+def _run_on_dev_server(ctx: CommandContext) -> dict | None:
+    """
+    Run the selection on the dev server of the project, if one is running.
+
+    Args:
+        ctx: Command context
+
+    Returns:
+        Execution results, or None if no dev server is running
+
+    Raises:
+        RuntimeError: If the dev server refused or failed the run (running locally
+            would fail on the locks the dev process holds)
+    """
+    response = request_dev_server(
+        ctx.project_path,
+        {
+            "command": "run",
+            "select": ctx.select_patterns,
+            "exclude": ctx.exclude_patterns,
+            "variables": ctx.vars,
+        },
+    )
+    if response is None:
+        return None
+    if not response.get("ok"):
+        raise RuntimeError(
+            f"The t4t dev server could not run the models ({response.get('error')}); "
+            "stop `t4t dev` to run them locally"
+        )
+
+    typer.echo("Using the running t4t dev server")
+    return response["results"]
+
+
 def cmd_run(
     project_folder: str,
     vars: str | None = None,
     verbose: bool = False,
     select: list[str] | None = None,
     exclude: list[str] | None = None,
+    force_ddl: bool = False,
+    defer: bool = False,
+    state: str | None = None,
+    defer_database: str | None = None,
+    estimate: bool = False,
 ) -> None:
     """Execute the run command."""
     ctx = CommandContext(
@@ -47,6 +138,29 @@ def cmd_run(
         typer.echo(f"Running t4t on project: {project_folder}")
         ctx.print_variables_info()
         ctx.print_selection_info()
+        if defer and not state:
+            raise ValueError("--defer requires --state pointing at the production artifacts")
+        if defer:
+            typer.echo(f"Deferring unselected upstream models to production state: {state}")
+
+        # Reuse a running `t4t dev` process of this project, which holds a warm session
+        # (and the locks on its state database)
+        local_options = [
+            option
+            for option, enabled in (
+                ("--force-ddl", force_ddl),
+                ("--defer", defer),
+                ("--estimate", estimate),
+            )
+            if enabled
+        ]
+        if local_options:
+            ensure_no_dev_server(ctx.project_path, f"t4t run {' '.join(local_options)}")
+        else:
+            results = _run_on_dev_server(ctx)
+            if results is not None:
+                _print_summary(results)
+                return
 
         # Create unified connection manager
         connection_manager = ConnectionManager(
@@ -64,49 +178,17 @@ def cmd_run(
             select_patterns=ctx.select_patterns,
             exclude_patterns=ctx.exclude_patterns,
             project_config=ctx.config,
+            defer_state=state if defer else None,
+            defer_database=defer_database,
+            estimate=estimate,
+            force_ddl=force_ddl,
         )
 
-        # Calculate statistics
-        total_tables = len(results["executed_tables"]) + len(results["failed_tables"])
-        successful_tables = len(results["executed_tables"])
-        failed_tables = len(results["failed_tables"])
-        
-        executed_functions = results.get("executed_functions", [])
-        failed_functions = results.get("failed_functions", [])
-        total_functions = len(executed_functions) + len(failed_functions)
-        successful_functions = len(executed_functions)
-        failed_functions_count = len(failed_functions)
-        
-        warning_count = len(results.get("warnings", []))
-
-        # Build completion message
-        parts = []
-        if successful_tables > 0:
-            parts.append(f"{successful_tables} {_pluralize(successful_tables, 'table')}")
-        if successful_functions > 0:
-            parts.append(f"{successful_functions} {_pluralize(successful_functions, 'function')}")
-        
-        if parts:
-            typer.echo(f"\nCompleted! Successfully executed: {', '.join(parts)}")
-        else:
-            typer.echo("\nCompleted!")
-        
-        # Show failures if any
-        if failed_tables > 0 or failed_functions_count > 0 or warning_count > 0:
-            if successful_tables > 0 or successful_functions > 0:
-                typer.echo(f"  ✅ Successful: {successful_tables} {_pluralize(successful_tables, 'table')}, {successful_functions} {_pluralize(successful_functions, 'function')}")
-            if failed_tables > 0:
-                typer.echo(f"  ❌ Failed: {failed_tables} {_pluralize(failed_tables, 'table')}")
-            if failed_functions_count > 0:
-                typer.echo(f"  ❌ Failed: {failed_functions_count} {_pluralize(failed_functions_count, 'function')}")
-            if warning_count > 0:
-                typer.echo(f"  ⚠️  Warnings: {warning_count} {_pluralize(warning_count, 'warning')}")
-        elif successful_tables > 0 or successful_functions > 0:
-            # All successful
-            if successful_tables > 0:
-                typer.echo(f"  ✅ All {successful_tables} {_pluralize(successful_tables, 'table')} executed successfully!")
-            if successful_functions > 0:
-                typer.echo(f"  ✅ All {successful_functions} {_pluralize(successful_functions, 'function')} deployed successfully!")
+        if estimate:
+            typer.echo("\nCompleted! Models were dry-run only, nothing was executed")
+            return
+
+        _print_summary(results)
 
         if ctx.verbose:
             typer.echo(f"Analysis info: {results.get('analysis', {})}")
@@ -5,6 +5,7 @@ Seed command implementation.
 import typer
 
 from tee.cli.context import CommandContext
+from tee.dev import ensure_no_dev_server
 from tee.engine.execution_engine import ExecutionEngine
 from tee.engine.seeds import SeedDiscovery, SeedLoader
 
@@ -23,6 +24,7 @@ def cmd_seed(
 
     try:
         typer.echo(f"Loading seeds from project: {project_folder}")
+        ensure_no_dev_server(ctx.project_path, "t4t seed")
 
         # Get seeds folder
         seeds_folder = ctx.project_path / "seeds"
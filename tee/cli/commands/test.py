@@ -8,6 +8,7 @@ import typer
 
 from tee.cli.context import CommandContext
 from tee.cli.selection import ModelSelector
+from tee.dev import ensure_no_dev_server
 from tee.engine.execution_engine import ExecutionEngine
 from tee.parser import ProjectParser
 from tee.testing import TestExecutor
@@ -19,6 +20,8 @@ def cmd_test(
     verbose: bool = False,
     select: list[str] | None = None,
     exclude: list[str] | None = None,
+    full_tests: bool = False,
+    test_cache: bool = True,
 ) -> None:
     """Execute the test command."""
     ctx = CommandContext(
@@ -33,6 +36,7 @@ def cmd_test(
         typer.echo(f"Running tests for project: {project_folder}")
         ctx.print_variables_info()
         ctx.print_selection_info()
+        ensure_no_dev_server(ctx.project_path, "t4t test")
 
         # Step 1: Compile project to OTS modules
         typer.echo("\n" + "=" * 50)
@@ -76,7 +80,9 @@ def cmd_test(
         # Apply selection filtering if specified
         if ctx.select_patterns or ctx.exclude_patterns:
             selector = ModelSelector(
-                select_patterns=ctx.select_patterns, exclude_patterns=ctx.exclude_patterns
+                select_patterns=ctx.select_patterns,
+                exclude_patterns=ctx.exclude_patterns,
+                column_lineage=graph.get("column_lineage"),
             )
 
             parsed_models, execution_order = selector.filter_models(parsed_models, execution_order)
@@ -100,7 +106,12 @@ def cmd_test(
 
             # Create test executor (discover SQL tests from tests/ folder)
             test_executor = TestExecutor(
-                execution_engine.adapter, project_folder=str(ctx.project_path)
+                execution_engine.adapter,
+                project_folder=str(ctx.project_path),
+                state_manager=execution_engine.state_checker.state_manager,
+                full_tests=full_tests,
+                test_config=ctx.config.get("tests"),
+                test_cache=test_cache,
             )
 
             typer.echo("\n" + "=" * 50)
@@ -125,7 +136,9 @@ def cmd_test(
             # Print test results
             typer.echo("\nTest Results:")
             typer.echo(f"  Total tests: {test_results['total']}")
-            typer.echo(f"  ✅ Passed: {test_results['passed']}")
+            cached = test_results.get("cached", 0)
+            cached_info = f" ({cached} cached)" if cached else ""
+            typer.echo(f"  ✅ Passed: {test_results['passed']}{cached_info}")
             typer.echo(f"  ❌ Failed: {test_results['failed']}")
 
             if test_results["warnings"]:
@@ -12,7 +12,9 @@ from tee.adapters import is_adapter_supported, list_available_adapters
 from tee.cli.commands import (
     cmd_build,
     cmd_compile,
+    cmd_critical_path,
     cmd_debug,
+    cmd_dev,
     cmd_docs,
     cmd_help,
     cmd_import,
@@ -90,6 +92,37 @@ SELECT_OPTION = typer.Option(
 EXCLUDE_OPTION = typer.Option(
     None, "-e", "--exclude", help="Exclude models. Can be used multiple times."
 )
+FORCE_DDL_OPTION = typer.Option(
+    False,
+    "--force-ddl",
+    help="Reissue view and function DDL even if their definitions are unchanged",
+)
+FULL_TESTS_OPTION = typer.Option(
+    False,
+    "--full-tests",
+    help=(
+        "Test incremental models over the whole table instead of their last batch, "
+        "and run every test exactly (no sampling or approximation)"
+    ),
+)
+NO_TEST_CACHE_OPTION = typer.Option(
+    False,
+    "--no-test-cache",
+    help="Re-run tests that passed in an earlier run on unchanged tables",
+)
+DEFER_OPTION = typer.Option(
+    False,
+    "--defer",
+    help="Read unselected, unchanged upstream models from production (requires --state)",
+)
+STATE_OPTION = typer.Option(
+    None, "--state", help="Production project or output folder with compiled OTS modules"
+)
+DEFER_DATABASE_OPTION = typer.Option(
+    None,
+    "--defer-database",
+    help="Production database holding deferred models (default: from the --state modules)",
+)
 
 
 def _check_required_argument(ctx: typer.Context, arg_name: str, arg_value: Any) -> None:
@@ -107,6 +140,15 @@ def run(
     vars: str | None = VARS_OPTION,
     select: list[str] | None = SELECT_OPTION,
     exclude: list[str] | None = EXCLUDE_OPTION,
+    force_ddl: bool = FORCE_DDL_OPTION,
+    defer: bool = DEFER_OPTION,
+    state: str | None = STATE_OPTION,
+    defer_database: str | None = DEFER_DATABASE_OPTION,
+    estimate: bool = typer.Option(
+        False,
+        "--estimate",
+        help="Dry-run the models and report bytes to be scanned instead of running (BigQuery)",
+    ),
 ) -> None:
     """Parse and execute SQL models."""
     _check_required_argument(ctx, "project_folder", project_folder)
@@ -116,6 +158,39 @@ def run(
         verbose=verbose,
         select=select,
         exclude=exclude,
+        force_ddl=force_ddl,
+        defer=defer,
+        state=state,
+        defer_database=defer_database,
+        estimate=estimate,
+    )
+
+
+@app.command()
+def dev(
+    ctx: typer.Context,
+    project_folder: str | None = PROJECT_FOLDER_ARG,
+    verbose: bool = VERBOSE_OPTION,
+    vars: str | None = VARS_OPTION,
+    watch: bool = typer.Option(
+        False, "-w", "--watch", help="Re-run affected models when project files change"
+    ),
+    interval: float = typer.Option(
+        1.0, "--interval", help="Seconds between checks for changed files"
+    ),
+    port: int = typer.Option(
+        0, "--port", help="Port of the local dev server (default: any free port)"
+    ),
+) -> None:
+    """Keep the project warm in a resident dev session."""
+    _check_required_argument(ctx, "project_folder", project_folder)
+    cmd_dev(
+        project_folder=project_folder,
+        vars=vars,
+        verbose=verbose,
+        watch=watch,
+        interval=interval,
+        port=port,
     )
 
 
@@ -143,6 +218,8 @@ def test(
     vars: str | None = VARS_OPTION,
     select: list[str] | None = SELECT_OPTION,
     exclude: list[str] | None = EXCLUDE_OPTION,
+    full_tests: bool = FULL_TESTS_OPTION,
+    no_test_cache: bool = NO_TEST_CACHE_OPTION,
 ) -> None:
     """Run data quality tests on models."""
     _check_required_argument(ctx, "project_folder", project_folder)
@@ -152,6 +229,8 @@ def test(
         verbose=verbose,
         select=select,
         exclude=exclude,
+        full_tests=full_tests,
+        test_cache=not no_test_cache,
     )
 
 
@@ -163,6 +242,12 @@ def build(
     vars: str | None = VARS_OPTION,
     select: list[str] | None = SELECT_OPTION,
     exclude: list[str] | None = EXCLUDE_OPTION,
+    force_ddl: bool = FORCE_DDL_OPTION,
+    full_tests: bool = FULL_TESTS_OPTION,
+    no_test_cache: bool = NO_TEST_CACHE_OPTION,
+    defer: bool = DEFER_OPTION,
+    state: str | None = STATE_OPTION,
+    defer_database: str | None = DEFER_DATABASE_OPTION,
 ) -> None:
     """Build models with tests (stops on test failure)."""
     _check_required_argument(ctx, "project_folder", project_folder)
@@ -172,6 +257,12 @@ def build(
         verbose=verbose,
         select=select,
         exclude=exclude,
+        force_ddl=force_ddl,
+        full_tests=full_tests,
+        test_cache=not no_test_cache,
+        defer=defer,
+        state=state,
+        defer_database=defer_database,
     )
 
 
@@ -253,6 +344,24 @@ def docs(
     )
 
 
+@app.command(name="critical-path")
+def critical_path(
+    ctx: typer.Context,
+    project_folder: str | None = PROJECT_FOLDER_ARG,
+    vars: str | None = VARS_OPTION,
+    verbose: bool = VERBOSE_OPTION,
+    top: int = typer.Option(5, "--top", min=1, help="Number of slowest chains to show"),
+) -> None:
+    """Report the critical path and slowest chains of models from the runtime history."""
+    _check_required_argument(ctx, "project_folder", project_folder)
+    cmd_critical_path(
+        project_folder=project_folder,
+        vars=vars,
+        verbose=verbose,
+        top=top,
+    )
+
+
 @app.command()
 def help(ctx: typer.Context) -> None:
     """Show help information."""
@@ -1,5 +1,5 @@
 """
-Model selection utilities for filtering models by name and tags.
+Model selection utilities for filtering models by name, tags and changed columns.
 
 Supports --select and --exclude flags similar to dbt's selection syntax.
 """
@@ -7,12 +7,20 @@ Supports --select and --exclude flags similar to dbt's selection syntax.
 from fnmatch import fnmatch
 from typing import Any
 
+from tee.parser.analysis.column_lineage import ColumnLineage
+
+# Prefix of patterns selecting the models affected by a change to some columns
+COLUMN_CHANGED_PREFIX = "column_changed:"
+
 
 class ModelSelector:
-    """Selects models based on name patterns and tags."""
+    """Selects models based on name patterns, tags and changed columns."""
 
     def __init__(
-        self, select_patterns: list[str] | None = None, exclude_patterns: list[str] | None = None
+        self,
+        select_patterns: list[str] | None = None,
+        exclude_patterns: list[str] | None = None,
+        column_lineage: ColumnLineage | dict[str, Any] | None = None,
     ) -> None:
         """
         Initialize model selector.
@@ -20,25 +28,38 @@ class ModelSelector:
         Args:
             select_patterns: List of selection patterns (e.g., ["my_model", "tag:nightly"])
             exclude_patterns: List of exclusion patterns (e.g., ["deprecated", "tag:test"])
+            column_lineage: Column lineage index (or its dict form, as stored in the
+                dependency graph), needed by column_changed: patterns
         """
         self.select_patterns = select_patterns or []
         self.exclude_patterns = exclude_patterns or []
+        if isinstance(column_lineage, dict):
+            column_lineage = ColumnLineage.from_dict(column_lineage)
+        self.column_lineage = column_lineage
 
-        # Parse patterns into name patterns and tag patterns
+        # Parse patterns into name patterns, tag patterns and column changes
         self.select_names: list[str] = []
         self.select_tags: list[str] = []
+        self.select_column_changes: list[str] = []
         self.exclude_names: list[str] = []
         self.exclude_tags: list[str] = []
+        self.exclude_column_changes: list[str] = []
 
         self._parse_patterns()
 
+        # Models matched by column_changed: patterns, resolved against the lineage index
+        self._column_selected = self._resolve_column_changes(self.select_column_changes)
+        self._column_excluded = self._resolve_column_changes(self.exclude_column_changes)
+
     def _parse_patterns(self) -> None:
-        """Parse selection and exclusion patterns into name and tag categories."""
+        """Parse selection and exclusion patterns into name, tag and column categories."""
         # Parse select patterns
         for pattern in self.select_patterns:
             if pattern.startswith("tag:"):
                 tag = pattern[4:]  # Remove "tag:" prefix
                 self.select_tags.append(tag)
+            elif pattern.startswith(COLUMN_CHANGED_PREFIX):
+                self.select_column_changes.append(pattern[len(COLUMN_CHANGED_PREFIX) :])
             else:
                 self.select_names.append(pattern)
 
@@ -47,9 +68,57 @@ class ModelSelector:
             if pattern.startswith("tag:"):
                 tag = pattern[4:]  # Remove "tag:" prefix
                 self.exclude_tags.append(tag)
+            elif pattern.startswith(COLUMN_CHANGED_PREFIX):
+                self.exclude_column_changes.append(pattern[len(COLUMN_CHANGED_PREFIX) :])
             else:
                 self.exclude_names.append(pattern)
 
+    def _resolve_column_changes(self, changes: list[str]) -> set[str]:
+        """
+        Find the models matched by column_changed: patterns.
+
+        A pattern is <model>.<column>[,<column>...] and matches the model itself; with a
+        trailing "+" it also matches every downstream model that reads a changed column,
+        directly or through another model's affected columns (see
+        ColumnLineage.affected_models()).
+
+        Args:
+            changes: Patterns without their column_changed: prefix
+
+        Returns:
+            Names of the matched models
+
+        Raises:
+            ValueError: If a pattern has no column, or no lineage index is available
+        """
+        if not changes:
+            return set()
+        if self.column_lineage is None:
+            raise ValueError("column_changed: selection requires the column lineage index")
+
+        relations = set(self.column_lineage.models) | set(self.column_lineage.dependencies)
+        for entry in self.column_lineage.models.values():
+            relations.update(entry["relations"])
+
+        matched: set[str] = set()
+        for change in changes:
+            downstream = change.endswith("+")
+            relation_pattern, _, columns = change.rstrip("+").rpartition(".")
+            if not relation_pattern or not columns:
+                raise ValueError(
+                    f"Invalid selector '{COLUMN_CHANGED_PREFIX}{change}', "
+                    "expected <model>.<column>[+]"
+                )
+            for relation in relations:
+                if not self._matches_name(relation, [relation_pattern]):
+                    continue
+                matched.add(relation)
+                if downstream:
+                    matched.update(
+                        self.column_lineage.affected_models(relation, columns.split(","))
+                    )
+        return matched
+
     def _matches_name(self, model_name: str, patterns: list[str]) -> bool:
         """
         Check if model name matches any of the patterns.
@@ -133,8 +202,8 @@ class ModelSelector:
 
         Selection logic:
         1. If no select patterns, all models are selected (unless excluded)
-        2. Model must match at least one select pattern (name or tag)
-        3. Model must not match any exclude pattern (name or tag)
+        2. Model must match at least one select pattern (name, tag or column change)
+        3. Model must not match any exclude pattern (name, tag or column change)
 
         Args:
             model_name: Full table name (e.g., "schema.table")
@@ -161,6 +230,10 @@ class ModelSelector:
         if self.select_tags:
             matches_select = matches_select or self._matches_tags(model_data, self.select_tags)
 
+        # Check column changes
+        if self.select_column_changes:
+            matches_select = matches_select or model_name in self._column_selected
+
         if not matches_select:
             return False
 
@@ -191,7 +264,8 @@ class ModelSelector:
             if self._matches_tags(model_data, self.exclude_tags):
                 return True
 
-        return False
+        # Check column change exclusion
+        return model_name in self._column_excluded
 
     def filter_models(
         self, parsed_models: dict[str, Any], execution_order: list[str] | None = None
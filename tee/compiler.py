@@ -16,6 +16,8 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+from tee.ast_registry import shares_parsed_sql
+from tee.instrumentation import span
 from tee.parser import ProjectParser
 from tee.parser.input import (
     OTSConverter,
@@ -36,12 +38,14 @@ class CompilationError(Exception):
     pass
 
 
+@shares_parsed_sql
 def compile_project(
     project_folder: str,
     connection_config: dict[str, Any],
     variables: dict[str, Any] | None = None,
     project_config: dict[str, Any] | None = None,
     format: str = "json",
+    select_patterns: list[str] | None = None,
 ) -> dict[str, Any]:
     """
     Compile a t4t project to OTS modules.
@@ -52,9 +56,16 @@ def compile_project(
     3. Detects conflicts (duplicate transformation_id)
     4. Merges all models (SQL, Python, and imported OTS)
     5. Builds dependency graph and saves analysis files
-    6. Converts to OTS format
-    7. Validates compiled modules
-    8. Exports to output/ots_modules/
+    6. Builds the schema catalog (output/schema_catalog.json) and the column lineage
+       index (output/column_lineage.json, also stored in the graph as column_lineage)
+    7. Transpiles model SQL to the target dialect and converts to OTS format
+    8. Validates compiled modules
+    9. Exports to output/ots_modules/
+
+    With select_patterns, compilation is lazy: a text pre-scan of the model files finds
+    the selected models and their upstream closure, and only those SQL files are parsed.
+    Analysis files and OTS modules are not written, since they would only describe part
+    of the project.
 
     Args:
         project_folder: Path to the project folder
@@ -62,6 +73,7 @@ def compile_project(
         variables: Optional variables for SQL substitution
         project_config: Optional project configuration
         format: Output format for OTS modules ("json" or "yaml")
+        select_patterns: Optional --select patterns enabling lazy compilation
 
     Returns:
         Dictionary with compilation results including:
@@ -70,6 +82,8 @@ def compile_project(
         - execution_order: Execution order list
         - ots_modules_count: Number of OTS modules created
         - exported_paths: Paths to exported OTS modules
+        - schema_catalog: Compile-time output columns of seeds and models
+        - lazy: Whether only the selection's closure was compiled
 
     Raises:
         CompilationError: If compilation fails
@@ -87,8 +101,23 @@ def compile_project(
         print("STEP 1: Parsing SQL and Python models and functions")
         print("=" * 50)
         parser = ProjectParser(project_folder, connection_config, variables, project_config)
-        parsed_models = parser.collect_models()
-        print(f"✅ Parsed {len(parsed_models)} models from SQL/Python files")
+        only_sql_files = None
+        if select_patterns:
+            from tee.parser.processing import FileDiscovery, select_model_files
+
+            with span("prescan"):
+                only_sql_files = select_model_files(
+                    FileDiscovery(models_folder).discover_all_files(),
+                    models_folder,
+                    parser.orchestrator.table_resolver,
+                    select_patterns,
+                )
+        lazy = only_sql_files is not None
+        parsed_models = parser.collect_models(only_sql_files=only_sql_files)
+        if lazy:
+            print(f"✅ Parsed {len(parsed_models)} models needed by the selection (lazy compile)")
+        else:
+            print(f"✅ Parsed {len(parsed_models)} models from SQL/Python files")
 
         # Discover and parse functions
         parsed_functions = parser.orchestrator.discover_and_parse_functions()
@@ -182,28 +211,100 @@ def compile_project(
         print("STEP 4: Merging models")
         print("=" * 50)
 
-        all_models = parsed_models.copy()
+        # Later steps rewrite code.sql (inlined ephemerals, output schemas, transpiled
+        # SQL), so the merged models get their own copies and the parser's keep the SQL
+        # as written
+        all_models = {name: _copy_model_sql(model) for name, model in parsed_models.items()}
         all_models.update(imported_ots_models)
         print(
             f"✅ Merged {len(parsed_models)} SQL/Python models with {len(imported_ots_models)} imported OTS transformations"
         )
         print(f"   Total: {len(all_models)} transformations")
 
+        # Column lineage keeps ephemeral models as nodes, so it reads the SQL as written
+        model_sql = {}
+        for name, model_data in all_models.items():
+            sql_data = (model_data.get("code") or {}).get("sql")
+            if isinstance(sql_data, dict) and sql_data.get("resolved_sql"):
+                model_sql[name] = sql_data["resolved_sql"]
+
+        # Inline ephemeral models as CTEs into the models that reference them, before
+        # any artifact is written
+        from tee.parser.processing import inline_ephemeral_models
+
+        inlined_into = inline_ephemeral_models(all_models)
+        if inlined_into:
+            print(f"✅ Inlined ephemeral models into {len(inlined_into)} model(s)")
+
         # Step 4.5: Build dependency graph and save analysis files
         # Inject merged models into parser for dependency graph building
         parser.parsed_models = all_models
-        graph = parser.build_dependency_graph()
+        if lazy:
+            # Build the graph without writing the analysis files ProjectParser saves
+            graph = parser.graph = parser.orchestrator.build_dependency_graph()
+        else:
+            graph = parser.build_dependency_graph()
         execution_order = parser.get_execution_order()
 
         # Save analysis files (dependency graph JSON, Mermaid diagram, Markdown report)
-        parser.save_dependency_graph()
-        parser.save_mermaid_diagram()
-        parser.save_markdown_report()
-        parser.save_to_json()
+        if not lazy:
+            with span("save_analysis"):
+                parser.save_dependency_graph()
+                parser.save_mermaid_diagram()
+                parser.save_markdown_report()
+                # The project's models with their ephemeral references inlined
+                parser.orchestrator.json_exporter.export_parsed_models(
+                    {name: all_models[name] for name in parsed_models}
+                )
 
         logger.debug(f"Built dependency graph with {len(graph['nodes'])} nodes")
         logger.debug(f"Execution order: {' -> '.join(execution_order)}")
 
+        # Infer the output columns of seeds and models without querying the database
+        with span("schema_catalog"):
+            schema_catalog = _build_schema_catalog(
+                all_models, execution_order, project_path, connection_config
+            )
+        if not lazy:
+            schema_catalog.save(project_path / "output")
+
+        # Trace the upstream columns each model reads, for column_changed: selection
+        from tee.parser.analysis import build_column_lineage
+
+        with span("column_lineage"):
+            column_lineage = build_column_lineage(
+                model_sql,
+                {name: deps for name, deps in graph["dependencies"].items() if name in all_models},
+                schema_catalog,
+            )
+        graph["column_lineage"] = column_lineage.to_dict()
+        if not lazy:
+            column_lineage.save(project_path / "output")
+
+        if lazy:
+            print("\nSkipping OTS module export (lazy compile for --select)")
+            return {
+                "success": True,
+                "parsed_models_count": len(parsed_models),
+                "imported_ots_count": len(imported_ots_models),
+                "total_transformations": len(all_models),
+                "ots_modules_count": 0,
+                "exported_paths": {},
+                "output_folder": str(output_folder),
+                "dependency_graph": graph,
+                "execution_order": execution_order,
+                "parsed_models": all_models,
+                "schema_catalog": schema_catalog.to_dict(),
+                "lazy": True,
+            }
+
+        # Transpile model SQL to the target dialect so runs from the compiled modules
+        # can skip dialect conversion
+        with span("transpile_models"):
+            transpiled_count, target_dialect = _transpile_models(all_models, connection_config)
+        if transpiled_count:
+            print(f"✅ Transpiled {transpiled_count} model(s) to {target_dialect}")
+
         # Step 5: Convert, validate, and export OTS modules
         print("\n" + "=" * 50)
         print("STEP 5: Building OTS modules")
@@ -230,9 +331,10 @@ def compile_project(
             project_path, tests_folder, output_folder, project_config, imported_ots_modules, format
         )
 
-        ots_modules = transformer.transform_to_ots_modules(
-            all_models, parsed_functions=parsed_functions, test_library_path=test_library_path
-        )
+        with span("build_ots_modules"):
+            ots_modules = transformer.transform_to_ots_modules(
+                all_models, parsed_functions=parsed_functions, test_library_path=test_library_path
+            )
 
         # Validate compiled modules
         for module_name, module in ots_modules.items():
@@ -261,12 +363,13 @@ def compile_project(
         exporter = JSONExporter(output_folder, project_config, project_path)
 
         # Export OTS modules in the specified format
-        exported_paths = exporter.export_ots_modules(
-            all_models,
-            parsed_functions=parsed_functions,
-            test_library_path=test_library_path,
-            format=format,
-        )
+        with span("export_ots_modules"):
+            exported_paths = exporter.export_ots_modules(
+                all_models,
+                parsed_functions=parsed_functions,
+                test_library_path=test_library_path,
+                format=format,
+            )
 
         print(f"✅ Built and exported {len(ots_modules)} OTS module(s)")
 
@@ -281,6 +384,8 @@ def compile_project(
             "dependency_graph": graph,
             "execution_order": execution_order,
             "parsed_models": all_models,
+            "schema_catalog": schema_catalog.to_dict(),
+            "lazy": False,
         }
 
     except (CompilationError, ParserError):
@@ -289,6 +394,111 @@ def compile_project(
         raise CompilationError(f"Compilation failed: {e}") from e
 
 
+def _copy_model_sql(model_data: dict[str, Any]) -> dict[str, Any]:
+    """Copy a parsed model down to its code.sql dict, the part compilation rewrites."""
+    code = model_data.get("code")
+    if not isinstance(code, dict) or not isinstance(code.get("sql"), dict):
+        return dict(model_data)
+    return {**model_data, "code": {**code, "sql": dict(code["sql"])}}
+
+
+def _transpile_models(
+    all_models: dict[str, Any], connection_config: dict[str, Any]
+) -> tuple[int, str | None]:
+    """
+    Store ahead-of-time transpiled SQL in each model's code.sql.transpiled.
+
+    The SQL is converted (and qualified, where the adapter does so) exactly as the
+    adapter would at execution time, and keyed by target dialect together with the hash
+    of the source SQL, so the engine only reuses it while the source is unchanged.
+    Models that cannot be transpiled are left to be converted at execution time.
+
+    Args:
+        all_models: Merged models, updated in place
+        connection_config: Database connection configuration
+
+    Returns:
+        Tuple of (number of transpiled models, target dialect name)
+    """
+    from tee.adapters import get_adapter
+    from tee.parser.shared.model_utils import is_ephemeral_model
+
+    try:
+        adapter = get_adapter(connection_config)
+    except Exception as e:
+        logger.debug(f"Skipping ahead-of-time transpilation: {e}")
+        return 0, None
+
+    target = adapter.transpile_target
+    transpiled_count = 0
+    for model_name, model_data in all_models.items():
+        if is_ephemeral_model(model_data):
+            continue
+        sql_data = (model_data.get("code") or {}).get("sql")
+        if not isinstance(sql_data, dict) or not sql_data.get("resolved_sql"):
+            continue
+
+        transpiled = dict(sql_data.get("transpiled") or {})
+        # Keep an entry that is still valid (e.g. from an imported OTS module)
+        if adapter.use_transpiled_sql(sql_data["resolved_sql"], transpiled):
+            transpiled_count += 1
+            continue
+        try:
+            transpiled[target] = adapter.build_transpiled_sql(sql_data["resolved_sql"])
+        except Exception as e:
+            logger.debug(f"Could not transpile {model_name}, it will be converted at run time: {e}")
+            continue
+        sql_data["transpiled"] = transpiled
+        transpiled_count += 1
+
+    return transpiled_count, target
+
+
+def _build_schema_catalog(
+    all_models: dict[str, Any],
+    execution_order: list[str],
+    project_path: Path,
+    connection_config: dict[str, Any],
+) -> Any:
+    """
+    Build the schema catalog of a project and store each model's output schema.
+
+    Column types are rendered in the adapter's target dialect, so authoritative entries
+    can replace describing the query in schema comparisons at execution time.
+
+    Args:
+        all_models: Merged models, updated in place with code.sql.output_schema
+        execution_order: Model names in dependency order
+        project_path: Project folder (for its seeds)
+        connection_config: Database connection configuration
+
+    Returns:
+        SchemaCatalog
+    """
+    from tee.adapters import get_adapter
+    from tee.parser.analysis import build_schema_catalog
+
+    try:
+        dialect = get_adapter(connection_config).transpile_target
+    except Exception as e:
+        logger.debug(f"Building the schema catalog without a target dialect: {e}")
+        dialect = None
+
+    catalog = build_schema_catalog(
+        all_models,
+        execution_order,
+        project_path=project_path,
+        connection_type=connection_config.get("type"),
+        dialect=dialect,
+    )
+    authoritative = sum(1 for entry in catalog.entries.values() if entry["authoritative"])
+    print(
+        f"✅ Cataloged output schemas of {len(catalog.entries)} relation(s) "
+        f"({authoritative} authoritative)"
+    )
+    return catalog
+
+
 def _merge_test_libraries(
     project_path: Path,
     tests_folder: Path,
@@ -0,0 +1,31 @@
+"""
+Resident dev mode for t4t.
+
+A dev session keeps the parsed project, the dependency graph and a database connection
+warm, re-parses only changed files and re-runs the models they affect. A local socket
+server lets editors and `t4t run` reuse the warm process.
+"""
+
+from .server import (
+    DEV_SERVER_FILENAME,
+    DevServer,
+    ensure_no_dev_server,
+    request_dev_server,
+    server_info_path,
+)
+from .session import DevSession
+from .watcher import ADDED, DELETED, MODIFIED, WATCHED_FOLDERS, ProjectWatcher
+
+__all__ = [
+    "ADDED",
+    "DELETED",
+    "DEV_SERVER_FILENAME",
+    "DevServer",
+    "DevSession",
+    "MODIFIED",
+    "ProjectWatcher",
+    "WATCHED_FOLDERS",
+    "ensure_no_dev_server",
+    "request_dev_server",
+    "server_info_path",
+]
@@ -0,0 +1,217 @@
+"""
+Local socket API of a dev session.
+
+The server listens on 127.0.0.1 and speaks newline-delimited JSON: each request is one
+JSON object on a line, e.g. {"command": "run", "select": ["my_model"]}, answered by one
+JSON object on a line. Its address is published in output/dev_server.json, so `t4t run`
+and editors can find the running session of a project.
+
+Any local user can connect to the port, so every request must carry the random "token"
+of the session. The token is published next to the address, in a file only its owner
+can read.
+
+Commands:
+    ping: Check that the server is alive
+    status: Summarize the session (models, functions, parse errors, runs)
+    refresh: Pick up file changes and report the affected models
+    run: Pick up file changes, then run models (optional "select" and "exclude")
+    shutdown: Stop the dev process
+"""
+
+import hmac
+import json
+import logging
+import os
+import secrets
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Any
+
+from .session import DevSession
+
+logger = logging.getLogger(__name__)
+
+# File in the project's output folder holding the address of a running dev server
+DEV_SERVER_FILENAME = "dev_server.json"
+
+
+def server_info_path(project_path: Path) -> Path:
+    """Return the path of the file publishing the dev server address of a project."""
+    return Path(project_path) / "output" / DEV_SERVER_FILENAME
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers one JSON request line with one JSON response line."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            response = self.server.dev_server.handle_request(json.loads(line))
+        except Exception as e:
+            logger.error(f"Dev server request failed: {e}")
+            response = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class DevServer:
+    """Serves a DevSession over a local TCP socket from a background thread."""
+
+    def __init__(self, session: DevSession, host: str = "127.0.0.1", port: int = 0) -> None:
+        """
+        Initialize the dev server.
+
+        Args:
+            session: Started dev session to serve
+            host: Interface to listen on (local only by default)
+            port: Port to listen on (0 picks a free port)
+        """
+        self.session = session
+        self.host = host
+        self.port = port
+        self.shutdown_requested = threading.Event()
+        self.token = secrets.token_urlsafe(32)
+        self._server: _TCPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def info_path(self) -> Path:
+        """Path of the file publishing the server address."""
+        return server_info_path(self.session.project_path)
+
+    def start(self) -> None:
+        """Start serving and publish the server address."""
+        self._server = _TCPServer((self.host, self.port), _RequestHandler)
+        self._server.dev_server = self
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="t4t-dev-server", daemon=True
+        )
+        self._thread.start()
+
+        self._write_info(
+            {"host": self.host, "port": self.port, "pid": os.getpid(), "token": self.token}
+        )
+        logger.info(f"Dev server listening on {self.host}:{self.port}")
+
+    def _write_info(self, info: dict[str, Any]) -> None:
+        """Publish the server address and token, readable by the owner only."""
+        self.info_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.info_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # The mode only applies to new files; restrict an existing one before writing
+        os.chmod(self.info_path, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(info))
+
+    def stop(self) -> None:
+        """Stop serving and remove the published address."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        try:
+            info = json.loads(self.info_path.read_text())
+            # Never remove the address of another dev process of the same project
+            if info.get("pid") == os.getpid():
+                self.info_path.unlink()
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not remove {self.info_path}: {e}")
+
+    def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Handle one API request.
+
+        Args:
+            request: Request object with "command" and "token" keys
+
+        Returns:
+            Response object with an "ok" key, and an "error" key when not ok
+        """
+        token = request.get("token")
+        if not isinstance(token, str) or not hmac.compare_digest(token, self.token):
+            return {"ok": False, "error": "Invalid dev server token"}
+
+        command = request.get("command")
+        if command == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if command == "status":
+            return {"ok": True, "status": self.session.status()}
+        if command == "refresh":
+            return {"ok": True, "refresh": self.session.refresh()}
+        if command == "run":
+            variables = request.get("variables")
+            if variables is not None and variables != self.session.variables:
+                return {"ok": False, "error": "Variables differ from those of the dev session"}
+            refresh = self.session.refresh()
+            results = self.session.run(select=request.get("select"), exclude=request.get("exclude"))
+            return {"ok": True, "refresh": refresh, "results": results}
+        if command == "shutdown":
+            self.shutdown_requested.set()
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown command: {command}"}
+
+
+def request_dev_server(
+    project_path: Path, payload: dict[str, Any], timeout: float | None = None
+) -> dict[str, Any] | None:
+    """
+    Send a request to the dev server of a project, if one is running.
+
+    The session token published with the server address is added to the request.
+
+    Args:
+        project_path: Path to the project folder
+        payload: Request object with a "command" key
+        timeout: Optional timeout in seconds for the response (None waits indefinitely)
+
+    Returns:
+        Response object, or None if no dev server is reachable
+    """
+    info_path = server_info_path(project_path)
+    if not info_path.exists():
+        return None
+
+    try:
+        info = json.loads(info_path.read_text())
+        request = {**payload, "token": info["token"]}
+        with socket.create_connection((info["host"], info["port"]), timeout=5) as conn:
+            conn.settimeout(timeout)
+            conn.sendall(json.dumps(request, default=str).encode("utf-8") + b"\n")
+            with conn.makefile("rb") as reader:
+                response = reader.readline()
+    except (OSError, ValueError, KeyError) as e:
+        logger.debug(f"No dev server reachable for {project_path}: {e}")
+        return None
+
+    if not response:
+        return None
+    return json.loads(response)
+
+
+def ensure_no_dev_server(project_path: Path, command: str) -> None:
+    """
+    Refuse to run a command locally while a dev server of the project is running.
+
+    The dev process keeps the state database (and a DuckDB warehouse file) open, so a
+    local run would fail on a lock held by it.
+
+    Args:
+        project_path: Path to the project folder
+        command: Command line shown in the error, e.g. "t4t build"
+
+    Raises:
+        RuntimeError: If a dev server of the project answers
+    """
+    if request_dev_server(project_path, {"command": "ping"}, timeout=5) is not None:
+        raise RuntimeError(
+            f"`t4t dev` is running for this project and holds its state database, "
+            f"so `{command}` cannot run locally: stop `t4t dev` first"
+        )
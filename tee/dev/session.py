@@ -0,0 +1,395 @@
+"""
+Resident dev session holding a warm, incrementally refreshed project.
+
+`t4t run` parses every model, builds the dependency graph and connects to the database
+on each invocation. A dev session does this once and keeps the parsed project, the
+graph and the connection (with its state session) in memory. When files change, only
+those files are re-parsed, and only the models they affect plus everything downstream
+of them are run again.
+"""
+
+import copy
+import logging
+import threading
+from pathlib import Path
+from typing import Any
+
+from tee.adapters import AdapterConfig
+from tee.ast_registry import ast_registry_scope
+from tee.engine.execution_engine import ExecutionEngine
+from tee.engine.executor import ModelExecutor
+from tee.engine.seeds import SeedDiscovery, SeedLoader
+from tee.parser import ProjectParser
+from tee.parser.input import OTSConverter, OTSModuleReader, validate_ots_module_location
+from tee.parser.processing import inline_ephemeral_models
+from tee.parser.shared.constants import SUPPORTED_PYTHON_EXTENSIONS, SUPPORTED_SQL_EXTENSIONS
+from tee.parser.shared.registry import ModelRegistry
+from tee.parser.shared.types import DependencyGraph, ParsedFunction, ParsedModel
+
+from .watcher import ProjectWatcher
+
+logger = logging.getLogger(__name__)
+
+# File name suffixes of imported OTS modules
+OTS_SUFFIXES = (".ots.json", ".ots.yaml", ".ots.yml")
+
+
+class DevSession:
+    """
+    A parsed project, its dependency graph and an open database connection.
+
+    All public methods are serialized with a lock, so the watch loop and the socket
+    server can share one session.
+    """
+
+    def __init__(
+        self,
+        project_folder: str,
+        connection_config: dict[str, Any] | AdapterConfig,
+        variables: dict[str, Any] | None = None,
+        project_config: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Initialize the dev session.
+
+        Args:
+            project_folder: Path to the project folder
+            connection_config: Database connection configuration
+            variables: Optional variables for SQL substitution and Python models
+            project_config: Optional project configuration
+        """
+        self.project_path = Path(project_folder).resolve()
+        self.connection_config = connection_config
+        self.variables = variables or {}
+        self.project_config = project_config
+        self.lock = threading.RLock()
+
+        self.parser = ProjectParser(
+            str(self.project_path), connection_config, self.variables, project_config
+        )
+        self.orchestrator = self.parser.orchestrator
+        self.watcher = ProjectWatcher(self.project_path)
+        self.seed_discovery = SeedDiscovery(self.project_path / "seeds")
+        self.engine: ExecutionEngine | None = None
+
+        # Parsed SQL/Python models, before ephemeral inlining (which rewrites models)
+        self.models: dict[str, ParsedModel] = {}
+        self.functions: dict[str, ParsedFunction] = {}
+        self.graph: DependencyGraph | None = None
+        # File path -> error of the last failed parse of that file
+        self.errors: dict[str, str] = {}
+        self.runs = 0
+
+        self._ots_models: dict[Path, dict[str, ParsedModel]] = {}
+        self._functions_pending = True
+
+    @property
+    def all_models(self) -> dict[str, ParsedModel]:
+        """SQL/Python models merged with the transformations of imported OTS modules."""
+        models = dict(self.models)
+        for module_models in self._ots_models.values():
+            models.update(module_models)
+        return models
+
+    def start(self) -> None:
+        """Parse the project, connect to the database and load the seeds."""
+        with self.lock:
+            self.watcher.snapshot()
+            self._load_project()
+
+            config = self.connection_config
+            if isinstance(config, dict):
+                config = ModelExecutor(str(self.project_path), dict(config)).config
+            self.engine = ExecutionEngine(
+                config, project_folder=str(self.project_path), variables=self.variables
+            )
+            self.engine.connect()
+            self._load_seeds(self.seed_discovery.discover_seed_files())
+            logger.info(
+                f"Dev session started with {len(self.all_models)} models "
+                f"and {len(self.functions)} functions"
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            if self.engine:
+                self.engine.disconnect()
+                self.engine = None
+
+    def refresh(self) -> dict[str, Any]:
+        """
+        Pick up file changes since the last refresh and re-parse the changed files.
+
+        Returns:
+            Dict with the changed files, the affected models in execution order
+            (changed models and all their dependents) and current parse errors
+        """
+        with self.lock:
+            return self.apply_changes(self.watcher.poll())
+
+    def apply_changes(self, changes: dict[Path, str]) -> dict[str, Any]:
+        """
+        Re-parse the given changed files and rebuild the dependency graph.
+
+        Args:
+            changes: Dict mapping changed file paths to their change kind
+
+        Returns:
+            Same as refresh()
+        """
+        with self.lock:
+            result = {
+                "changed_files": sorted(str(path) for path in changes),
+                "affected": [],
+                "errors": dict(self.errors),
+            }
+            if not changes:
+                return result
+
+            by_folder: dict[str, set[Path]] = {}
+            for path in changes:
+                folder = path.relative_to(self.project_path).parts[0]
+                by_folder.setdefault(folder, set()).add(path)
+
+            self.orchestrator.file_discovery.clear_cache()
+            changed: set[str] = set()
+            if "models" in by_folder:
+                changed |= self._refresh_models(by_folder["models"])
+            if "functions" in by_folder:
+                changed |= self._refresh_functions()
+            if "seeds" in by_folder:
+                changed |= self._refresh_seeds(by_folder["seeds"])
+            # Changes in tests/ only need the graph rebuilt, which always happens
+            self._rebuild_graph()
+
+            affected = self._with_dependents(changed)
+            all_models = self.all_models
+            result["affected"] = [
+                name
+                for name in self.graph["execution_order"]
+                if name in affected and name in all_models
+            ]
+            result["errors"] = dict(self.errors)
+            logger.info(
+                f"Refreshed {len(changes)} changed file(s), "
+                f"{len(result['affected'])} model(s) affected"
+            )
+            return result
+
+    def run(
+        self,
+        models: list[str] | None = None,
+        select: list[str] | None = None,
+        exclude: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Execute models on the session's connection.
+
+        Args:
+            models: Optional model names to run (e.g. the affected models of a refresh);
+                all models when None
+            select: Optional --select patterns
+            exclude: Optional --exclude patterns
+
+        Returns:
+            Execution results, as returned by the execution engine
+        """
+        with self.lock, ast_registry_scope():
+            if self.engine is None:
+                raise RuntimeError("Dev session is not started. Call start() first.")
+
+            # Execution rewrites models (ephemeral inlining, resolved SQL): work on a copy
+            run_models = copy.deepcopy(self.all_models)
+            inline_ephemeral_models(run_models)
+
+            execution_order = [name for name in self.graph["execution_order"] if name in run_models]
+            if models is not None:
+                requested = set(models)
+                execution_order = [name for name in execution_order if name in requested]
+            if select or exclude:
+                from tee.cli.selection import ModelSelector
+
+                selector = ModelSelector(select_patterns=select, exclude_patterns=exclude)
+                _, execution_order = selector.filter_models(run_models, execution_order)
+
+            run_models = self.orchestrator.evaluate_python_models(run_models, self.variables)
+
+            # Functions are only redeployed after they changed
+            function_results = {}
+            if self.functions and self._functions_pending:
+                function_results = self.engine.execute_functions(
+                    self.functions, self.graph["execution_order"]
+                )
+                self._functions_pending = bool(function_results.get("failed_functions"))
+
+            results = self.engine.execute_models(run_models, execution_order)
+            if function_results:
+                results["executed_functions"] = function_results.get("executed_functions", [])
+                results["failed_functions"] = function_results.get("failed_functions", [])
+                results.setdefault("execution_log", []).extend(
+                    function_results.get("execution_log", [])
+                )
+
+            self.runs += 1
+            return results
+
+    def status(self) -> dict[str, Any]:
+        """Summarize the session state."""
+        with self.lock:
+            return {
+                "project_folder": str(self.project_path),
+                "models": len(self.all_models),
+                "functions": len(self.functions),
+                "connected": self.engine is not None,
+                "runs": self.runs,
+                "variables": self.variables,
+                "errors": dict(self.errors),
+            }
+
+    def _load_project(self) -> None:
+        """Parse all models, imported OTS modules and functions."""
+        self.models = dict(self.orchestrator.discover_and_parse_models())
+        for ots_file in self.orchestrator.file_discovery.discover_ots_modules():
+            self._ots_models[ots_file] = self._load_ots_module(ots_file)
+        self.functions = self.orchestrator.discover_and_parse_functions()
+        self._rebuild_graph()
+
+    def _rebuild_graph(self) -> None:
+        """Rebuild the dependency graph from the current models and functions."""
+        self.orchestrator.set_parsed_models(self.all_models)
+        self.graph = self.orchestrator.build_dependency_graph()
+
+    def _load_ots_module(self, ots_file: Path) -> dict[str, ParsedModel]:
+        """Load the transformations of an imported OTS module."""
+        validate_ots_module_location(ots_file, self.orchestrator.models_folder)
+        module = OTSModuleReader().read_module(ots_file)
+        module_models, _ = OTSConverter().convert_module(module)
+        return module_models
+
+    def _refresh_models(self, paths: set[Path]) -> set[str]:
+        """Re-parse changed model files and return the names of the models they define."""
+        python_stems = {
+            path.stem for path in self.orchestrator.file_discovery.discover_python_files()
+        }
+
+        to_parse = set()
+        for path in paths:
+            to_parse.add(path)
+            if path.suffix in SUPPORTED_SQL_EXTENSIONS:
+                # Metadata of a SQL model may come from a companion Python file
+                companion = path.with_suffix(".py")
+                if companion.exists():
+                    to_parse.add(companion)
+            elif path.suffix in SUPPORTED_PYTHON_EXTENSIONS:
+                # A deleted companion leaves its SQL file as a standalone model
+                companion = path.with_suffix(".sql")
+                if companion.exists():
+                    to_parse.add(companion)
+
+        changed = set()
+        for path in sorted(to_parse):
+            changed |= self._reparse_model_file(path, python_stems)
+        return changed
+
+    def _reparse_model_file(self, path: Path, python_stems: set[str]) -> set[str]:
+        """Replace the models of one file with a fresh parse of it."""
+        model_files = self.orchestrator.model_files
+        old_names = {name for name, source in model_files.items() if source == path}
+        for name in old_names:
+            self.models.pop(name, None)
+            del model_files[name]
+        old_names |= set(self._ots_models.pop(path, {}))
+        self.errors.pop(str(path), None)
+
+        is_ots = path.name.endswith(OTS_SUFFIXES)
+        is_python = not is_ots and path.suffix in SUPPORTED_PYTHON_EXTENSIONS
+        is_sql = not is_ots and path.suffix in SUPPORTED_SQL_EXTENSIONS
+        if is_python:
+            # Stale registrations would stop the file from registering its models again
+            ModelRegistry.unregister_file(str(path.absolute()))
+        if not path.exists() or not (is_ots or is_python or is_sql):
+            return old_names
+        if is_sql and path.stem in python_stems:
+            # Parsed through its companion Python file
+            return old_names
+
+        new_models: dict[str, ParsedModel] = {}
+        try:
+            if is_ots:
+                self._ots_models[path] = self._load_ots_module(path)
+                return old_names | set(self._ots_models[path])
+            if is_python:
+                new_models = self.orchestrator.parse_python_file(path)
+                new_models = self.orchestrator.evaluate_python_models(new_models, self.variables)
+            else:
+                table_name, parsed_model = self.orchestrator.parse_sql_file(path)
+                new_models = {table_name: parsed_model}
+        except Exception as e:
+            logger.error(f"Error processing model file {path}: {e}")
+            self.errors[str(path)] = str(e)
+            return old_names
+
+        for name, model in new_models.items():
+            self.models[name] = model
+            model_files[name] = path
+        return old_names | set(new_models)
+
+    def _refresh_functions(self) -> set[str]:
+        """Re-parse the functions and return the names of those that changed."""
+        old_hashes = {name: f.get("function_hash") for name, f in self.functions.items()}
+        self.orchestrator.invalidate_functions()
+        self.errors.pop("functions", None)
+        try:
+            self.functions = self.orchestrator.discover_and_parse_functions()
+        except Exception as e:
+            logger.error(f"Error processing functions: {e}")
+            self.errors["functions"] = str(e)
+            self.functions = {}
+
+        new_hashes = {name: f.get("function_hash") for name, f in self.functions.items()}
+        changed = {
+            name
+            for name in old_hashes.keys() | new_hashes.keys()
+            if old_hashes.get(name) != new_hashes.get(name)
+        }
+        if changed:
+            self._functions_pending = True
+        return changed
+
+    def _refresh_seeds(self, paths: set[Path]) -> set[str]:
+        """Reload changed seeds and return the names of the models reading them."""
+        self.seed_discovery.clear_cache()
+        self._load_seeds(
+            [seed for seed in self.seed_discovery.discover_seed_files() if seed[0] in paths]
+        )
+
+        seed_tables = {path.stem.lower() for path in paths}
+        readers = set()
+        for name, model in self.all_models.items():
+            sql_data = (model.get("code") or {}).get("sql") or {}
+            source_tables = {table.lower() for table in sql_data.get("source_tables", [])}
+            if source_tables & seed_tables:
+                readers.add(name)
+        return readers
+
+    def _load_seeds(self, seed_files: list[tuple[Path, str | None]]) -> None:
+        """Load seed files into database tables."""
+        if not seed_files or self.engine is None:
+            return
+        seed_results = SeedLoader(self.engine.adapter).load_all_seeds(seed_files)
+        for failure in seed_results["failed_tables"]:
+            logger.warning(f"Failed to load seed {failure['file']}: {failure['error']}")
+
+    def _with_dependents(self, names: set[str]) -> set[str]:
+        """Return the given nodes plus all their transitive dependents."""
+        dependents = self.graph["dependents"]
+        affected: set[str] = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name in affected:
+                continue
+            affected.add(name)
+            pending.extend(dependents.get(name, []))
+        return affected
@@ -0,0 +1,91 @@
+"""
+Polling file watcher for the project folders a dev session depends on.
+"""
+
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Project folders watched by default
+WATCHED_FOLDERS = ("models", "functions", "tests", "seeds")
+
+# Change kinds reported by ProjectWatcher.poll()
+ADDED = "added"
+MODIFIED = "modified"
+DELETED = "deleted"
+
+
+class ProjectWatcher:
+    """
+    Detects added, modified and deleted files in the watched project folders.
+
+    Files are compared by modification time and size between two polls, so no
+    platform-specific notification API (or extra dependency) is needed. Hidden files
+    and __pycache__ folders are ignored.
+    """
+
+    def __init__(self, project_path: Path, folders: tuple[str, ...] = WATCHED_FOLDERS) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            project_path: Path to the project folder
+            folders: Folders below the project folder to watch
+        """
+        self.project_path = Path(project_path)
+        self.folders = folders
+        self._snapshot: dict[Path, tuple[int, int]] = {}
+
+    def snapshot(self) -> dict[Path, tuple[int, int]]:
+        """
+        Record the current state of the watched files.
+
+        Returns:
+            Dict mapping file path to (mtime_ns, size)
+        """
+        self._snapshot = self._scan()
+        return self._snapshot
+
+    def poll(self) -> dict[Path, str]:
+        """
+        Compare the watched files with the last snapshot and record the new state.
+
+        Returns:
+            Dict mapping each changed file to ADDED, MODIFIED or DELETED
+        """
+        current = self._scan()
+        changes = {}
+        for path, stat in current.items():
+            previous = self._snapshot.get(path)
+            if previous is None:
+                changes[path] = ADDED
+            elif previous != stat:
+                changes[path] = MODIFIED
+        for path in self._snapshot.keys() - current.keys():
+            changes[path] = DELETED
+
+        self._snapshot = current
+        if changes:
+            logger.debug(f"Detected {len(changes)} changed file(s)")
+        return changes
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        """Stat every watched file."""
+        files = {}
+        for folder in self.folders:
+            root = self.project_path / folder
+            if not root.is_dir():
+                continue
+            for path in root.rglob("*"):
+                relative_parts = path.relative_to(root).parts
+                if any(part.startswith(".") or part == "__pycache__" for part in relative_parts):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    # Deleted between listing and stat
+                    continue
+                if path.is_file():
+                    files[path] = (stat.st_mtime_ns, stat.st_size)
+        return files
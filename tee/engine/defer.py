@@ -0,0 +1,271 @@
+"""
+Deferral of unselected upstream models to their production relations.
+
+When a subset of the DAG runs in a development or CI database, the models it selects
+usually read from upstream models that were not selected and were never built there.
+With deferral, every such upstream model that is unchanged relative to a production
+manifest (the compiled OTS modules of a production run, plus its state database when
+available) is read from its production relation instead: references to it in the
+selected models' resolved SQL are rewritten to <production database>.<schema>.<table>.
+Only changed models then need to be rebuilt.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import duckdb
+from sqlglot import exp
+
+from tee.adapters.base.sql import sql_hash
+from tee.ast_registry import parse_sql
+from tee.parser.input import OTSModuleReader, OTSModuleReaderError
+from tee.parser.shared.model_utils import compute_sqlglot_hash, is_ephemeral_model
+
+logger = logging.getLogger(__name__)
+
+# Name of the state database of a project (see StateManager)
+STATE_DATABASE_FILENAME = "tee_state.db"
+
+
+class DeferError(Exception):
+    """Raised when a production manifest cannot be loaded."""
+
+    pass
+
+
+@dataclass
+class ProductionManifest:
+    """Models built in production, identified by the hash of their resolved SQL."""
+
+    model_hashes: dict[str, str] = field(default_factory=dict)
+    database: str | None = None
+
+    def is_unchanged(self, model_name: str, model_data: dict[str, Any]) -> bool:
+        """Whether a model's resolved SQL matches the one built in production."""
+        production_hash = self.model_hashes.get(model_name)
+        if production_hash is None:
+            return False
+        sql_data = (model_data.get("code") or {}).get("sql") or {}
+        sql = sql_data.get("resolved_sql") or sql_data.get("original_sql")
+        return bool(sql) and sql_hash(sql) == production_hash
+
+
+def _find_modules_folder(state_path: Path) -> Path:
+    """Locate the compiled OTS modules below a project, output or ots_modules folder."""
+    candidates = (state_path, state_path / "ots_modules", state_path / "output" / "ots_modules")
+    for candidate in candidates:
+        if candidate.is_dir() and any(candidate.glob("*.ots.*")):
+            return candidate
+    raise DeferError(f"No compiled OTS modules found in {state_path}")
+
+
+def _find_state_database(state_path: Path) -> Path | None:
+    """Locate the state database next to a project, output or ots_modules folder."""
+    for candidate in (
+        state_path / STATE_DATABASE_FILENAME,
+        state_path / "data" / STATE_DATABASE_FILENAME,
+        state_path.parent / "data" / STATE_DATABASE_FILENAME,
+        state_path.parent.parent / "data" / STATE_DATABASE_FILENAME,
+    ):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _read_built_hashes(state_database: Path) -> dict[str, str]:
+    """
+    Read the SQL hash of every model recorded in a state database (read-only).
+
+    A state database that cannot be opened, e.g. because a production run holds its
+    lock, yields no hashes, so nothing is deferred.
+    """
+    try:
+        conn = duckdb.connect(database=str(state_database), read_only=True)
+    except duckdb.Error as e:
+        logger.warning(
+            f"Could not open production state database {state_database}, "
+            f"no models will be deferred: {e}"
+        )
+        return {}
+    try:
+        rows = conn.execute("SELECT model_name, sql_hash FROM tee_model_state").fetchall()
+    finally:
+        conn.close()
+    return dict(rows)
+
+
+def load_production_manifest(
+    state_path: str | Path, database: str | None = None
+) -> ProductionManifest:
+    """
+    Load the production manifest a run defers to.
+
+    The compiled OTS modules give the resolved SQL of every production model. If the
+    production state database is found as well, only models it records as built from
+    that same SQL are kept, so models that were compiled but never (re)built in
+    production are not deferred to.
+
+    Args:
+        state_path: Production project folder, its output folder or its ots_modules folder
+        database: Production database (catalog) holding the deferred relations; defaults
+            to the target database recorded in the compiled modules
+
+    Returns:
+        Production manifest
+
+    Raises:
+        DeferError: If no compiled OTS modules can be read
+    """
+    state_path = Path(state_path)
+    modules_folder = _find_modules_folder(state_path)
+    try:
+        modules = OTSModuleReader().read_modules_from_directory(modules_folder)
+    except OTSModuleReaderError as e:
+        raise DeferError(f"Failed to read production manifest {modules_folder}: {e}") from e
+
+    manifest = ProductionManifest(database=database)
+    for module in modules.values():
+        if manifest.database is None:
+            manifest.database = module.get("target", {}).get("database")
+        for transformation in module.get("transformations", []):
+            sql_code = transformation.get("code", {}).get("sql") or {}
+            sql = sql_code.get("resolved_sql") or sql_code.get("original_sql")
+            if sql:
+                manifest.model_hashes[transformation["transformation_id"]] = sql_hash(sql)
+
+    state_database = _find_state_database(state_path)
+    if state_database:
+        built = _read_built_hashes(state_database)
+        manifest.model_hashes = {
+            name: hash_value
+            for name, hash_value in manifest.model_hashes.items()
+            if built.get(name) == hash_value
+        }
+        logger.debug(f"Checked production manifest against state database {state_database}")
+
+    if not manifest.database:
+        raise DeferError(f"No production database recorded in {modules_folder}; pass it explicitly")
+
+    logger.info(
+        f"Loaded production manifest with {len(manifest.model_hashes)} model(s) "
+        f"from {modules_folder}"
+    )
+    return manifest
+
+
+def defer_to_production(
+    parsed_models: dict[str, Any],
+    selected: list[str],
+    manifest: ProductionManifest,
+    dialect: str | None = None,
+) -> dict[str, Any]:
+    """
+    Point the selected models at the production relations of unselected upstream models.
+
+    An unselected, non-ephemeral model referenced by a selected model is deferred if it
+    is unchanged relative to the manifest. Referenced upstream models that changed are
+    left pointing at the current database and reported, since they must be built (or
+    selected) first.
+
+    Args:
+        parsed_models: All parsed models (the selection and its upstream closure); the
+            resolved SQL of the selected models is updated in place
+        selected: Names of the models that will run
+        manifest: Production manifest to defer to
+        dialect: SQL dialect used to parse and generate the SQL
+
+    Returns:
+        Dict with "deferred" (model name -> production relation) and "modified"
+        (referenced upstream models not deferred because they changed)
+    """
+    selected_set = set(selected)
+    candidates = {
+        name: model_data
+        for name, model_data in parsed_models.items()
+        if name not in selected_set and not is_ephemeral_model(model_data)
+    }
+    relations = {
+        name: f"{manifest.database}.{name}"
+        for name, model_data in candidates.items()
+        if manifest.is_unchanged(name, model_data)
+    }
+
+    deferred: dict[str, str] = {}
+    modified: set[str] = set()
+    for name in selected:
+        model_data = parsed_models.get(name)
+        if not model_data or is_ephemeral_model(model_data):
+            continue
+        sql_data = (model_data.get("code") or {}).get("sql") or {}
+        sql = sql_data.get("resolved_sql") or sql_data.get("original_sql")
+        if not sql:
+            continue
+
+        expression = parse_sql(sql, dialect=dialect, copy=False)
+        references = _find_references(expression, candidates)
+        modified.update(reference for reference in references if reference not in relations)
+        to_defer = {
+            reference: relations[reference] for reference in references if reference in relations
+        }
+        if not to_defer:
+            continue
+
+        sql_data["resolved_sql"] = _rewrite(expression, candidates, to_defer).sql(dialect=dialect)
+        model_data["sqlglot_hash"] = compute_sqlglot_hash(sql_data)
+        deferred.update(to_defer)
+        logger.debug(f"Deferred {', '.join(sorted(to_defer))} in {name} to production")
+
+    return {"deferred": deferred, "modified": sorted(modified)}
+
+
+def _match_model(table: exp.Table, models: dict[str, Any]) -> str | None:
+    """Resolve a table reference to a model name, if it is one."""
+    if not table.name or table.catalog:
+        return None
+
+    reference = f"{table.db}.{table.name}" if table.db else table.name
+    if reference in models:
+        return reference
+    if table.db:
+        return None
+
+    # Unqualified reference: match on the model's table name
+    matches = [name for name in models if name.split(".")[-1] == table.name]
+    return matches[0] if len(matches) == 1 else None
+
+
+def _find_references(expression: exp.Expression, models: dict[str, Any]) -> list[str]:
+    """Names of the models referenced by an expression, in order of appearance."""
+    cte_names = {cte.alias_or_name.lower() for cte in expression.find_all(exp.CTE)}
+    found = []
+    for table in expression.find_all(exp.Table):
+        if not table.db and table.name.lower() in cte_names:
+            continue
+        name = _match_model(table, models)
+        if name and name not in found:
+            found.append(name)
+    return found
+
+
+def _rewrite(
+    expression: exp.Expression, models: dict[str, Any], relations: dict[str, str]
+) -> exp.Expression:
+    """Point model references at their production relations, keeping the original alias."""
+    cte_names = {cte.alias_or_name.lower() for cte in expression.find_all(exp.CTE)}
+
+    def transform(node: exp.Expression) -> exp.Expression:
+        if not isinstance(node, exp.Table):
+            return node
+        if not node.db and node.name.lower() in cte_names:
+            return node
+        name = _match_model(node, models)
+        if name is None or name not in relations:
+            return node
+
+        # Keep column qualifiers like orders.id valid by aliasing the relation as the table
+        alias = node.alias or node.name
+        return exp.to_table(relations[name]).as_(alias)
+
+    return expression.transform(transform)
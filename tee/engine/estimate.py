@@ -0,0 +1,80 @@
+"""
+Bytes-scanned estimation of a run.
+
+With `t4t run --estimate`, the query of every selected model is dry-run instead of
+executed, and the bytes each one would scan are reported per model and for the run.
+Only adapters that implement estimate_query_bytes() (BigQuery) support it.
+
+Views scan nothing when they are created, so they are dry-run to validate their SQL
+but left out of the run total. Incremental models are estimated as a full refresh,
+which is an upper bound of what an incremental run scans.
+"""
+
+import logging
+from typing import Any
+
+from tee.adapters.base import DatabaseAdapter
+from tee.parser.shared.model_utils import is_ephemeral_model
+
+logger = logging.getLogger(__name__)
+
+_BYTE_UNITS = ["B", "KiB", "MiB", "GiB", "TiB", "PiB"]
+
+
+def format_bytes(num_bytes: int) -> str:
+    """Format a byte count with a binary unit (e.g. 1.5 GiB)."""
+    size = float(num_bytes)
+    for unit in _BYTE_UNITS:
+        if size < 1024 or unit == _BYTE_UNITS[-1]:
+            break
+        size /= 1024
+    return f"{num_bytes} B" if unit == "B" else f"{size:.2f} {unit}"
+
+
+def estimate_models(
+    adapter: DatabaseAdapter, parsed_models: dict[str, Any], execution_order: list[str]
+) -> dict[str, Any]:
+    """
+    Dry-run the query of each model and collect the bytes it would scan.
+
+    Args:
+        adapter: Connected adapter that implements estimate_query_bytes()
+        parsed_models: Parsed models
+        execution_order: Names of the models to estimate, in execution order
+
+    Returns:
+        Dict with "estimates" (model name -> {"bytes", "materialization"}), "failed"
+        (list of {"model", "error"}) and "total_bytes" (sum over non-view models)
+
+    Raises:
+        NotImplementedError: If the adapter cannot estimate queries
+    """
+    estimates: dict[str, dict[str, Any]] = {}
+    failed: list[dict[str, str]] = []
+    total_bytes = 0
+
+    for name in execution_order:
+        model_data = parsed_models.get(name)
+        if not model_data or is_ephemeral_model(model_data):
+            continue
+        sql_data = (model_data.get("code") or {}).get("sql") or {}
+        sql = sql_data.get("resolved_sql") or sql_data.get("original_sql")
+        if not sql:
+            continue
+
+        metadata = (model_data.get("model_metadata") or {}).get("metadata") or {}
+        materialization = metadata.get("materialization") or "table"
+        try:
+            num_bytes = adapter.estimate_query_bytes(sql)
+        except NotImplementedError:
+            raise
+        except Exception as e:
+            logger.debug(f"Dry run of {name} failed: {e}")
+            failed.append({"model": name, "error": str(e)})
+            continue
+
+        estimates[name] = {"bytes": num_bytes, "materialization": materialization}
+        if materialization != "view":
+            total_bytes += num_bytes
+
+    return {"estimates": estimates, "failed": failed, "total_bytes": total_bytes}
@@ -15,7 +15,7 @@ from .config import load_database_config
 from .executors import FunctionExecutor, ModelExecutor
 from .materialization import MaterializationHandler
 from .metadata import MetadataExtractor
-from .state import StateChecker
+from .state import DDLLedger, StateChecker
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -38,6 +38,7 @@ class ExecutionEngine:
         config_name: str = "default",
         project_folder: str = ".",
         variables: dict[str, Any] | None = None,
+        force_ddl: bool = False,
     ) -> None:
         """
         Initialize the execution engine.
@@ -47,6 +48,7 @@ class ExecutionEngine:
             config_name: Configuration name to load (if config is None)
             project_folder: Project folder path for state management
             variables: Optional dictionary of variables for model execution
+            force_ddl: Reissue view and function DDL even if the DDL ledger has it unchanged
         """
         self.config = config or load_database_config(config_name)
         self.adapter = get_adapter(self.config)
@@ -57,8 +59,9 @@ class ExecutionEngine:
         # Initialize components
         self.state_checker = StateChecker(project_folder)
         self.metadata_extractor = MetadataExtractor()
+        self.ddl_ledger = self._create_ddl_ledger(force_ddl)
         self.materialization_handler = MaterializationHandler(
-            self.adapter, self.state_checker.state_manager, self.variables
+            self.adapter, self.state_checker.state_manager, self.variables, self.ddl_ledger
         )
         self.model_executor = ModelExecutor(
             self.adapter,
@@ -70,9 +73,18 @@ class ExecutionEngine:
             self.config,
         )
         self.function_executor = FunctionExecutor(
-            self.adapter, project_folder, self.metadata_extractor
+            self.adapter, project_folder, self.metadata_extractor, self.ddl_ledger
         )
 
+    def _create_ddl_ledger(self, force: bool) -> DDLLedger:
+        """Create the DDL ledger, scoped to the target database of this engine."""
+        config = self.adapter.config
+        scope = ":".join(
+            str(part or "")
+            for part in (config.type, config.host, config.path, config.database, config.schema)
+        )
+        return DDLLedger(self.state_checker.state_manager, scope=scope, force=force)
+
     def connect(self) -> None:
         """Establish connection to the database."""
         self.adapter.connect()
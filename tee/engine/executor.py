@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 from tee.adapters import AdapterConfig
+from tee.instrumentation import span
 
 from .config import load_database_config
 from .execution_engine import ExecutionEngine
@@ -24,6 +25,7 @@ class ModelExecutor:
         project_folder: str,
         config: AdapterConfig | dict[str, Any] | None = None,
         config_name: str = "default",
+        force_ddl: bool = False,
     ) -> None:
         """
         Initialize the ModelExecutor.
@@ -32,8 +34,10 @@ class ModelExecutor:
             project_folder: Path to the project folder containing SQL models
             config: Database adapter configuration (AdapterConfig or dict, if None, loads from config files)
             config_name: Configuration name to load (if config is None)
+            force_ddl: Reissue view and function DDL even if the DDL ledger has it unchanged
         """
         self.project_folder = project_folder
+        self.force_ddl = force_ddl
 
         # Handle configuration
         if config is None:
@@ -98,12 +102,16 @@ class ModelExecutor:
 
         # Create execution engine
         self.execution_engine = ExecutionEngine(
-            self.config, project_folder=self.project_folder, variables=variables
+            self.config,
+            project_folder=self.project_folder,
+            variables=variables,
+            force_ddl=self.force_ddl,
         )
 
         try:
             # Connect to database
-            self.execution_engine.connect()
+            with span("connect"):
+                self.execution_engine.connect()
             self.logger.info("Connected to database successfully")
 
             # Get parsed models and execution order from parser (or use provided filtered versions)
@@ -216,6 +224,54 @@ class ModelExecutor:
                 self.execution_engine.disconnect()
                 self.logger.info("Disconnected from database")
 
+    def estimate_models(
+        self,
+        parser: Any,
+        variables: dict[str, Any] | None = None,
+        parsed_models: dict[str, Any] | None = None,
+        execution_order: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Estimate the bytes the models would scan with dry runs, without executing them.
+
+        Args:
+            parser: Parser instance that has collected models and execution order
+            variables: Optional dictionary of variables to inject into Python model functions
+            parsed_models: Optional pre-filtered models dict (overrides parser.collect_models())
+            execution_order: Optional pre-filtered execution order (overrides the parser's)
+
+        Returns:
+            Estimation results (see tee.engine.estimate.estimate_models)
+        """
+        from .estimate import estimate_models
+
+        self.execution_engine = ExecutionEngine(
+            self.config, project_folder=self.project_folder, variables=variables
+        )
+
+        try:
+            with span("connect"):
+                self.execution_engine.connect()
+
+            if parsed_models is None:
+                parsed_models = parser.collect_models()
+            if execution_order is None:
+                execution_order = parser.get_execution_order()
+
+            # Python models only have SQL once they are evaluated
+            parsed_models = parser.orchestrator.evaluate_python_models(parsed_models, variables)
+            model_execution_order = [
+                name for name in execution_order if not name.startswith("test:")
+            ]
+
+            with span("estimate"):
+                return estimate_models(
+                    self.execution_engine.adapter, parsed_models, model_execution_order
+                )
+        finally:
+            if self.execution_engine:
+                self.execution_engine.disconnect()
+
     def get_database_info(self) -> dict[str, Any] | None:
         """Get database connection information."""
         if self.execution_engine:
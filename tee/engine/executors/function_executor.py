@@ -4,6 +4,8 @@ import logging
 from typing import Any
 
 from tee.adapters.base.core import DatabaseAdapter
+from tee.engine.state.ddl_ledger import FUNCTION, DDLLedger
+from tee.instrumentation import CATEGORY_NODE, span
 from tee.parser.shared.types import ParsedFunction
 
 from ..metadata.metadata_extractor import MetadataExtractor
@@ -19,6 +21,7 @@ class FunctionExecutor:
         adapter: DatabaseAdapter,
         project_folder: str,
         metadata_extractor: MetadataExtractor,
+        ddl_ledger: DDLLedger | None = None,
     ) -> None:
         """
         Initialize the function executor.
@@ -27,10 +30,12 @@ class FunctionExecutor:
             adapter: Database adapter instance
             project_folder: Project folder path
             metadata_extractor: Metadata extractor instance
+            ddl_ledger: Optional ledger used to skip unchanged function DDL
         """
         self.adapter = adapter
         self.project_folder = project_folder
         self.metadata_extractor = metadata_extractor
+        self.ddl_ledger = ddl_ledger
         # Track schemas that have been processed for tag attachment
         self._processed_schemas: dict[str, dict[str, Any]] = {}
 
@@ -74,61 +79,76 @@ class FunctionExecutor:
                 logger.debug(f"Skipping test node: {function_name}")
                 continue
 
-            try:
-                logger.info(f"Executing function: {function_name}")
-
-                if function_name not in parsed_functions:
-                    logger.warning(f"Function {function_name} not found in parsed functions")
-                    results["failed_functions"].append(
-                        {
-                            "function": function_name,
-                            "error": "Function not found in parsed functions",
-                        }
-                    )
-                    continue
-
-                function_data = parsed_functions[function_name]
-
-                # Extract function SQL
-                function_sql = self._extract_function_sql(function_data, function_name)
-                if not function_sql:
-                    results["failed_functions"].append(
-                        {"function": function_name, "error": "No SQL found for function"}
+            with span(
+                function_name, category=CATEGORY_NODE, node=function_name, node_type="function"
+            ) as node_span:
+                try:
+                    logger.info(f"Executing function: {function_name}")
+
+                    if function_name not in parsed_functions:
+                        logger.warning(f"Function {function_name} not found in parsed functions")
+                        results["failed_functions"].append(
+                            {
+                                "function": function_name,
+                                "error": "Function not found in parsed functions",
+                            }
+                        )
+                        node_span.set(
+                            status="error", error="Function not found in parsed functions"
+                        )
+                        continue
+
+                    function_data = parsed_functions[function_name]
+
+                    # Extract function SQL
+                    function_sql = self._extract_function_sql(function_data, function_name)
+                    if not function_sql:
+                        results["failed_functions"].append(
+                            {"function": function_name, "error": "No SQL found for function"}
+                        )
+                        node_span.set(status="error", error="No SQL found for function")
+                        continue
+
+                    # Extract metadata
+                    metadata = self.metadata_extractor.extract_function_metadata(function_data)
+
+                    # Extract schema name and attach schema-level tags if needed
+                    schema_name = self._extract_schema_name(function_name)
+                    if schema_name:
+                        self._attach_schema_tags_if_needed(schema_name)
+
+                    # Skip the DDL if the function exists and its definition is unchanged
+                    ddl_skipped = self._is_unchanged(function_name, function_sql, metadata)
+
+                    # Otherwise (re)create it; CREATE OR REPLACE handles replacement on all
+                    # supported databases (DuckDB, Snowflake, PostgreSQL, BigQuery)
+                    if not ddl_skipped:
+                        with span("materialize", materialization="function"):
+                            self.adapter.create_function(function_name, function_sql, metadata)
+                        self._record_definition(function_name, function_sql, metadata)
+
+                    results["executed_functions"].append(function_name)
+                    log_entry = {"function": function_name, "status": "success"}
+                    if ddl_skipped:
+                        log_entry["ddl"] = "skipped"
+                    results["execution_log"].append(log_entry)
+
+                    node_span.set(status="success", materialization="function")
+                    if ddl_skipped:
+                        node_span.set(ddl="skipped")
+
+                    logger.info(f"Successfully executed function: {function_name}")
+
+                except Exception as e:
+                    error_msg = f"Error executing function {function_name}: {str(e)}"
+                    logger.error(error_msg)
+                    results["failed_functions"].append({"function": function_name, "error": str(e)})
+                    results["execution_log"].append(
+                        {"function": function_name, "status": "failed", "error": str(e)}
                     )
-                    continue
-
-                # Extract metadata
-                metadata = self.metadata_extractor.extract_function_metadata(function_data)
-
-                # Extract schema name and attach schema-level tags if needed
-                schema_name = self._extract_schema_name(function_name)
-                if schema_name:
-                    self._attach_schema_tags_if_needed(schema_name)
-
-                # Execute function creation (always CREATE OR REPLACE)
-                # No need to check if function exists - CREATE OR REPLACE handles replacement
-                # All supported databases (DuckDB, Snowflake, PostgreSQL, BigQuery) support CREATE OR REPLACE
-                self.adapter.create_function(function_name, function_sql, metadata)
-
-                results["executed_functions"].append(function_name)
-                results["execution_log"].append(
-                    {
-                        "function": function_name,
-                        "status": "success",
-                    }
-                )
-
-                logger.info(f"Successfully executed function: {function_name}")
-
-            except Exception as e:
-                error_msg = f"Error executing function {function_name}: {str(e)}"
-                logger.error(error_msg)
-                results["failed_functions"].append({"function": function_name, "error": str(e)})
-                results["execution_log"].append(
-                    {"function": function_name, "status": "failed", "error": str(e)}
-                )
-                # Continue with other functions even if one fails
-                # Functions are independent, so one failure shouldn't stop others
+                    node_span.set(status="error", error=str(e))
+                    # Continue with other functions even if one fails
+                    # Functions are independent, so one failure shouldn't stop others
 
         logger.info(
             f"Function execution completed. {len(results['executed_functions'])} successful, "
@@ -136,6 +156,35 @@ class FunctionExecutor:
         )
         return results
 
+    def _is_unchanged(
+        self, function_name: str, function_sql: str, metadata: dict[str, Any] | None
+    ) -> bool:
+        """Check whether the function exists and was created from the same definition."""
+        if self.ddl_ledger is None:
+            return False
+
+        definition_hash = self.ddl_ledger.compute_hash(FUNCTION, function_sql, metadata)
+        if not self.ddl_ledger.is_unchanged(
+            FUNCTION,
+            function_name,
+            definition_hash,
+            lambda: self.adapter.function_exists(function_name),
+        ):
+            return False
+
+        logger.info(f"Function {function_name} is unchanged, skipping DDL")
+        return True
+
+    def _record_definition(
+        self, function_name: str, function_sql: str, metadata: dict[str, Any] | None
+    ) -> None:
+        """Record the definition a function was just created from."""
+        if self.ddl_ledger is None:
+            return
+
+        definition_hash = self.ddl_ledger.compute_hash(FUNCTION, function_sql, metadata)
+        self.ddl_ledger.record(FUNCTION, function_name, definition_hash)
+
     def _extract_function_sql(self, function_data: dict[str, Any], function_name: str) -> str:
         """
         Extract SQL query from function data and convert to target dialect.
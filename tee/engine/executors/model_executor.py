@@ -1,12 +1,20 @@
 """Model execution logic."""
 
 import logging
+import time
+from functools import partial
 from typing import Any
 
+from tee.adapters.base import QueryHandle
 from tee.adapters.base.core import DatabaseAdapter
+from tee.instrumentation import CATEGORY_NODE, record_span, span
+from tee.parser.analysis.critical_path import remaining_path_weights
+from tee.parser.shared.model_utils import is_ephemeral_model
 
 from ..materialization.materialization_handler import MaterializationHandler
 from ..metadata.metadata_extractor import MetadataExtractor
+from ..runtime_history import load_runtime_estimates
+from ..scheduler import QueryScheduler, ScheduledJob
 from ..state.state_checker import StateChecker
 
 logger = logging.getLogger(__name__)
@@ -87,12 +95,79 @@ class ModelExecutor:
                             table_mapping[table] = full_name
                             break
 
+        if self._use_scheduler():
+            dependencies = self._model_dependencies(parsed_models, execution_order, table_mapping)
+            self._execute_scheduled(parsed_models, dependencies, results)
+        else:
+            for table_name in execution_order:
+                # Skip test nodes - they are executed separately by TestExecutor
+                if table_name.startswith("test:"):
+                    logger.debug(f"Skipping test node: {table_name}")
+                    continue
+                if self._is_ephemeral(table_name, parsed_models):
+                    continue
+                self._execute_model(table_name, parsed_models, results)
+
+        logger.info(
+            f"Execution completed. {len(results['executed_tables'])} successful, {len(results['failed_tables'])} failed"
+        )
+        return results
+
+    def _model_dependencies(
+        self,
+        parsed_models: dict[str, Any],
+        execution_order: list[str],
+        table_mapping: dict[str, str],
+    ) -> dict[str, list[str]]:
+        """
+        Get the models the query scheduler builds, with the models each one depends on.
+
+        Test nodes (executed separately by TestExecutor) and ephemeral models (inlined
+        into their dependents) are left out.
+
+        Args:
+            parsed_models: Dictionary mapping table names to parsed SQL arguments
+            execution_order: List of table names in execution order
+            table_mapping: Mapping of referenced table names to model names
+
+        Returns:
+            Dict mapping model name -> sorted names of the models it depends on
+        """
+        dependencies: dict[str, list[str]] = {}
         for table_name in execution_order:
-            # Skip test nodes - they are executed separately by TestExecutor
             if table_name.startswith("test:"):
                 logger.debug(f"Skipping test node: {table_name}")
                 continue
+            if self._is_ephemeral(table_name, parsed_models):
+                continue
 
+            model_data = parsed_models.get(table_name) or {}
+            dependencies[table_name] = sorted(
+                {
+                    table_mapping[table]
+                    for table in model_data.get("tables", [])
+                    if table in table_mapping and table_mapping[table] != table_name
+                }
+            )
+        return dependencies
+
+    def _execute_model(
+        self, table_name: str, parsed_models: dict[str, Any], results: dict[str, Any]
+    ) -> bool:
+        """
+        Execute a single model synchronously and record the outcome in results.
+
+        Args:
+            table_name: Name of the model to execute
+            parsed_models: Dictionary mapping table names to parsed SQL arguments
+            results: Execution results to update
+
+        Returns:
+            True if the model was executed successfully
+        """
+        with span(
+            table_name, category=CATEGORY_NODE, node=table_name, node_type="model"
+        ) as node_span:
             try:
                 logger.debug(f"Executing model: {table_name}")
 
@@ -101,7 +176,8 @@ class ModelExecutor:
                     results["failed_tables"].append(
                         {"table": table_name, "error": "Model not found in parsed models"}
                     )
-                    continue
+                    node_span.set(status="error", error="Model not found in parsed models")
+                    return False
 
                 model_data = parsed_models[table_name]
 
@@ -111,20 +187,12 @@ class ModelExecutor:
                     results["failed_tables"].append(
                         {"table": table_name, "error": "No SQL query found"}
                     )
-                    continue
+                    node_span.set(status="error", error="No SQL query found")
+                    return False
+                self._use_compiled_sql(model_data, sql_query)
 
                 # Log dialect conversion if applicable
-                if (
-                    self.adapter.config.source_dialect
-                    and self.adapter.config.source_dialect != self.adapter.get_default_dialect()
-                ):
-                    results["dialect_conversions"].append(
-                        {
-                            "table": table_name,
-                            "from_dialect": self.adapter.config.source_dialect,
-                            "to_dialect": self.adapter.get_default_dialect(),
-                        }
-                    )
+                self._record_dialect_conversion(table_name, results)
 
                 # Execute based on materialization type
                 materialization = self._get_materialization_type(model_data)
@@ -135,23 +203,29 @@ class ModelExecutor:
                 if schema_name:
                     self._attach_schema_tags_if_needed(schema_name)
 
-                # Check for materialization changes and database existence
-                self.state_checker.check_model_state(
-                    table_name, materialization, metadata, self.adapter
-                )
+                # Run the model's statements as one unit of work that commits once
+                with self.adapter.transaction():
+                    # Check for materialization changes and database existence
+                    with span("state_check"):
+                        self.state_checker.check_model_state(
+                            table_name, materialization, metadata, self.adapter
+                        )
 
-                # Execute the model
-                self.materialization_handler.materialize(
-                    table_name, sql_query, materialization, metadata, self.config
-                )
+                    # Execute the model
+                    with span("materialize", materialization=materialization):
+                        self.materialization_handler.materialize(
+                            table_name, sql_query, materialization, metadata, self.config
+                        )
 
-                # Save model state after successful execution
-                self.state_checker.save_model_state(
-                    table_name, materialization, sql_query, metadata
-                )
+                    # Get table information
+                    with span("collect_stats"):
+                        table_info = self.adapter.get_table_info(table_name)
 
-                # Get table information
-                table_info = self.adapter.get_table_info(table_name)
+                # Save model state once the model's transaction has committed
+                with span("save_state"):
+                    self.state_checker.save_model_state(
+                        table_name, materialization, sql_query, metadata
+                    )
 
                 results["executed_tables"].append(table_name)
                 results["table_info"][table_name] = table_info
@@ -164,9 +238,16 @@ class ModelExecutor:
                     }
                 )
 
+                node_span.set(
+                    status="success",
+                    materialization=materialization,
+                    row_count=table_info["row_count"],
+                )
+
                 logger.debug(
                     f"Successfully executed {table_name} with {table_info['row_count']} rows"
                 )
+                return True
 
             except Exception as e:
                 error_msg = f"Error executing {table_name}: {str(e)}"
@@ -175,11 +256,226 @@ class ModelExecutor:
                 results["execution_log"].append(
                     {"table": table_name, "status": "failed", "error": str(e)}
                 )
+                node_span.set(status="error", error=str(e))
+                return False
+
+    def _is_ephemeral(self, table_name: str, parsed_models: dict[str, Any]) -> bool:
+        """Whether a model is ephemeral (inlined into its dependents, never built)."""
+        if table_name in parsed_models and is_ephemeral_model(parsed_models[table_name]):
+            logger.debug(f"Skipping ephemeral model: {table_name} (inlined as a CTE)")
+            return True
+        return False
+
+    def _max_concurrent_queries(self) -> int:
+        """Get the configured number of queries to keep in flight (1 disables scheduling)."""
+        extra = getattr(self.adapter.config, "extra", None)
+        value = extra.get("max_concurrent_queries", 1) if isinstance(extra, dict) else 1
+        return value if isinstance(value, int) and value > 0 else 1
+
+    def _use_scheduler(self) -> bool:
+        """Whether models should be built through the asynchronous query scheduler."""
+        return (
+            getattr(self.adapter, "supports_async_queries", False) is True
+            and self._max_concurrent_queries() > 1
+        )
 
-        logger.info(
-            f"Execution completed. {len(results['executed_tables'])} successful, {len(results['failed_tables'])} failed"
+    def _execute_scheduled(
+        self,
+        parsed_models: dict[str, Any],
+        dependencies: dict[str, list[str]],
+        results: dict[str, Any],
+    ) -> None:
+        """
+        Execute models through the query scheduler.
+
+        Table models are submitted asynchronously, so independent tables build in the
+        warehouse at the same time; other materializations run inline once their
+        dependencies have finished.
+        When several models are ready, the one with the heaviest remaining path
+        (estimated from the runtime history) starts first.
+
+        Args:
+            parsed_models: Dictionary mapping table names to parsed SQL arguments
+            dependencies: Models to build (in execution order) with their dependencies
+            results: Execution results to update
+        """
+        scheduler = QueryScheduler(self.adapter, max_in_flight=self._max_concurrent_queries())
+
+        # Start the models with the heaviest remaining path first
+        priorities = remaining_path_weights(
+            dependencies, load_runtime_estimates(self.state_checker.state_manager)
+        )
+
+        for table_name, depends_on in dependencies.items():
+            model_data = parsed_models.get(table_name)
+            if model_data and self._get_materialization_type(model_data) == "table":
+                self._schedule_table_model(
+                    scheduler,
+                    table_name,
+                    model_data,
+                    set(depends_on),
+                    priorities[table_name],
+                    results,
+                )
+            else:
+                scheduler.add(
+                    ScheduledJob(
+                        name=table_name,
+                        depends_on=set(depends_on),
+                        priority=priorities[table_name],
+                        run=partial(self._run_scheduled_model, table_name, parsed_models, results),
+                        on_error=partial(self._record_model_failure, table_name, results),
+                    )
+                )
+
+        scheduler.run()
+
+    def _run_scheduled_model(
+        self, table_name: str, parsed_models: dict[str, Any], results: dict[str, Any]
+    ) -> None:
+        """Execute a model inline, raising if it failed so dependents are skipped."""
+        if not self._execute_model(table_name, parsed_models, results):
+            raise RuntimeError(f"Model {table_name} failed")
+
+    def _schedule_table_model(
+        self,
+        scheduler: QueryScheduler,
+        table_name: str,
+        model_data: dict[str, Any],
+        depends_on: set[str],
+        priority: float,
+        results: dict[str, Any],
+    ) -> None:
+        """
+        Add a table model whose CREATE TABLE statement is submitted asynchronously.
+
+        The table goes through the materialization handler like a synchronously built
+        one. The statement itself runs outside of a transaction (it is still in flight
+        when submit returns), so the state check and the follow-up statements run in
+        one transaction each.
+        """
+        metadata = self.metadata_extractor.extract_model_metadata(model_data)
+        timing: dict[str, float] = {}
+
+        def submit() -> QueryHandle:
+            timing["start"] = time.time()
+            logger.debug(f"Submitting model: {table_name}")
+
+            sql_query = self._extract_sql_query(model_data, table_name)
+            if not sql_query:
+                raise ValueError("No SQL query found")
+            self._use_compiled_sql(model_data, sql_query)
+
+            self._record_dialect_conversion(table_name, results)
+            schema_name = self._extract_schema_name(table_name)
+            if schema_name:
+                self._attach_schema_tags_if_needed(schema_name)
+
+            with self.adapter.transaction(), span("state_check", node=table_name):
+                self.state_checker.check_model_state(table_name, "table", metadata, self.adapter)
+
+            timing["submitted"] = time.time()
+            return self.materialization_handler.submit_table(table_name, sql_query, metadata)
+
+        def complete(_result: Any) -> None:
+            record_span(
+                "materialize",
+                timing["submitted"],
+                time.time(),
+                node=table_name,
+                materialization="table",
+            )
+            with self.adapter.transaction():
+                self.materialization_handler.complete_table(table_name, metadata)
+                with span("collect_stats", node=table_name):
+                    table_info = self.adapter.get_table_info(table_name)
+
+            with span("save_state", node=table_name):
+                self.state_checker.save_model_state(
+                    table_name, "table", self._extract_sql_query(model_data, table_name), metadata
+                )
+
+            results["executed_tables"].append(table_name)
+            results["table_info"][table_name] = table_info
+            results["execution_log"].append(
+                {
+                    "table": table_name,
+                    "status": "success",
+                    "row_count": table_info["row_count"],
+                    "materialization": "table",
+                }
+            )
+            record_span(
+                table_name,
+                timing["start"],
+                time.time(),
+                category=CATEGORY_NODE,
+                node=table_name,
+                node_type="model",
+                status="success",
+                materialization="table",
+                row_count=table_info["row_count"],
+            )
+
+        def fail(error: BaseException) -> None:
+            self._record_model_failure(table_name, results, error)
+            record_span(
+                table_name,
+                timing.get("start", time.time()),
+                time.time(),
+                category=CATEGORY_NODE,
+                node=table_name,
+                node_type="model",
+                status="error",
+                error=str(error),
+            )
+
+        scheduler.add(
+            ScheduledJob(
+                name=table_name,
+                depends_on=depends_on,
+                priority=priority,
+                submit=submit,
+                on_complete=complete,
+                on_error=fail,
+            )
+        )
+
+    def _use_compiled_sql(self, model_data: dict[str, Any], sql_query: str) -> None:
+        """Let the adapter reuse the model's compiled SQL and output schema if they still apply."""
+        transpiled = model_data["code"]["sql"].get("transpiled")
+        if transpiled and self.adapter.use_transpiled_sql(sql_query, transpiled):
+            logger.debug("Using precompiled SQL, skipping dialect conversion")
+        output_schema = model_data["code"]["sql"].get("output_schema")
+        if output_schema and self.adapter.use_output_schema(sql_query, output_schema):
+            logger.debug("Using the compile-time output schema for schema comparisons")
+
+    def _record_dialect_conversion(self, table_name: str, results: dict[str, Any]) -> None:
+        """Log a dialect conversion for the model if one applies."""
+        if (
+            self.adapter.config.source_dialect
+            and self.adapter.config.source_dialect != self.adapter.get_default_dialect()
+        ):
+            results["dialect_conversions"].append(
+                {
+                    "table": table_name,
+                    "from_dialect": self.adapter.config.source_dialect,
+                    "to_dialect": self.adapter.get_default_dialect(),
+                }
+            )
+
+    def _record_model_failure(
+        self, table_name: str, results: dict[str, Any], error: BaseException
+    ) -> None:
+        """Record a failed or skipped model unless its failure was already recorded."""
+        if any(failure["table"] == table_name for failure in results["failed_tables"]):
+            return
+
+        logger.error(f"Error executing {table_name}: {error}")
+        results["failed_tables"].append({"table": table_name, "error": str(error)})
+        results["execution_log"].append(
+            {"table": table_name, "status": "failed", "error": str(error)}
         )
-        return results
 
     def _extract_sql_query(self, model_data: dict[str, Any], table_name: str) -> str:
         """
@@ -16,9 +16,10 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from tee.adapters.base.core import DatabaseAdapter
 
-import sqlglot
 from sqlglot import expressions as exp
 
+from tee.ast_registry import parse_sql
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,7 +46,7 @@ class AutoIncrementalWrapper:
             List of column names (aliases if present, otherwise column names)
         """
         try:
-            parsed = sqlglot.parse_one(sql_query)
+            parsed = parse_sql(sql_query, copy=False)
             if isinstance(parsed, exp.Select):
                 return [self._get_column_name_from_expression(expr) for expr in parsed.expressions]
             return []
@@ -163,7 +164,7 @@ class AutoIncrementalWrapper:
 
         # Try using sqlglot to find and replace the expression
         try:
-            parsed = sqlglot.parse_one(sql_query)
+            parsed = parse_sql(sql_query)
             if isinstance(parsed, exp.Select):
                 for expr in parsed.expressions:
                     # Check if this expression has the auto_incremental column as alias
@@ -173,7 +174,7 @@ class AutoIncrementalWrapper:
                         # Create new expression: (MAX(id) + original_expr) AS column_name
                         new_expr = exp.Alias(
                             this=exp.Add(
-                                this=sqlglot.parse_one(max_id_expr),
+                                this=parse_sql(max_id_expr),
                                 expression=original_expr,
                             ),
                             alias=auto_incremental_col,
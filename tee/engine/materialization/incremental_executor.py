@@ -5,6 +5,7 @@ This module handles the execution of incremental materializations including:
 - Append-only strategy
 - Merge strategy
 - Delete+insert strategy
+- Insert overwrite (partition replacement) strategy
 - Time-based filtering
 - State management integration
 """
@@ -17,29 +18,58 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from tee.adapters.base.core import DatabaseAdapter
 
-import sqlglot
 from sqlglot import expressions as exp
 
+from tee.ast_registry import parse_sql
 from tee.typing.metadata import (
     IncrementalAppendConfig,
     IncrementalConfig,
     IncrementalDeleteInsertConfig,
+    IncrementalInsertOverwriteConfig,
     IncrementalMergeConfig,
     OnSchemaChange,
 )
 
 from ..model_state import ModelStateManager
 from .auto_incremental_wrapper import AutoIncrementalWrapper
+from .schema_cache import SchemaCache
 
 logger = logging.getLogger(__name__)
 
 
+def parse_lookback(lookback: str) -> str | None:
+    """Parse lookback string to SQL interval format."""
+    lookback = lookback.lower().strip()
+
+    # Define time unit mappings
+    time_units = {
+        "minute": ("minutes", 1),
+        "hour": ("hours", 1),
+        "day": ("days", 1),
+        "week": ("days", 7),  # Convert weeks to days
+        "month": ("days", 30),  # Approximate months as 30 days
+    }
+
+    # Find matching time unit and extract value
+    for unit, (sql_unit, multiplier) in time_units.items():
+        if unit in lookback:
+            try:
+                value = int(lookback.split()[0])
+                converted_value = value * multiplier
+                return f"'{converted_value} {sql_unit}'"
+            except (ValueError, IndexError):
+                continue
+
+    return None
+
+
 class IncrementalExecutor:
     """Handles execution of incremental materializations."""
 
     def __init__(self, state_manager: ModelStateManager) -> None:
         """Initialize the incremental executor."""
         self.state_manager = state_manager
+        self.schema_cache = SchemaCache(state_manager)
         self._auto_incremental_wrapper: AutoIncrementalWrapper | None = None
 
     def _get_auto_incremental_wrapper(
@@ -305,28 +335,7 @@ class IncrementalExecutor:
 
     def _parse_lookback(self, lookback: str) -> str | None:
         """Parse lookback string to SQL interval format."""
-        lookback = lookback.lower().strip()
-
-        # Define time unit mappings
-        time_units = {
-            "minute": ("minutes", 1),
-            "hour": ("hours", 1),
-            "day": ("days", 1),
-            "week": ("days", 7),  # Convert weeks to days
-            "month": ("days", 30),  # Approximate months as 30 days
-        }
-
-        # Find matching time unit and extract value
-        for unit, (sql_unit, multiplier) in time_units.items():
-            if unit in lookback:
-                try:
-                    value = int(lookback.split()[0])
-                    converted_value = value * multiplier
-                    return f"'{converted_value} {sql_unit}'"
-                except (ValueError, IndexError):
-                    continue
-
-        return None
+        return parse_lookback(lookback)
 
     def _resolve_variable(
         self, variable_ref: str, variables: dict[str, Any] | None = None
@@ -403,6 +412,9 @@ class IncrementalExecutor:
 
         # Schema change handling will be done AFTER wrapping, so it can see the auto_incremental column
 
+        # Key the schema cache on the query as received, before time filters are applied
+        schema_cache_key = sql_query
+
         # Get current state
         state = self.state_manager.get_model_state(model_name)
         last_processed_value = state.last_processed_value if state else None
@@ -442,21 +454,12 @@ class IncrementalExecutor:
         # Handle schema changes if table exists (OTS 0.2.1)
         # This runs AFTER wrapping so it can see the auto_incremental column
         if table_exists:
-            from .schema_change_handler import SchemaChangeHandler
-            from .schema_comparator import SchemaComparator
-
-            handler = SchemaChangeHandler(adapter)
-            comparator = SchemaComparator(adapter)
-
-            query_schema = comparator.infer_query_schema(filtered_sql)
-            table_schema = comparator.get_table_schema(table_name)
-
-            handler.handle_schema_changes(
+            self.schema_cache.check_and_handle(
+                adapter,
                 table_name,
-                query_schema,
-                table_schema,
+                filtered_sql,
                 on_schema_change,
-                sql_query=filtered_sql,
+                cache_key=schema_cache_key,
                 full_incremental_refresh_config=full_incremental_refresh_config,
                 incremental_config={"strategy": "append", "append": config},
                 metadata=metadata,
@@ -466,10 +469,11 @@ class IncrementalExecutor:
         if not table_exists:
             logger.info(f"Table {table_name} doesn't exist yet, creating it as a full load")
             adapter.create_table(table_name, filtered_sql, metadata=None)
+            self.schema_cache.invalidate(table_name)
             # Update state after full load to enable incremental runs
             current_time = datetime.now(UTC).isoformat()
             self.state_manager.update_processed_value(
-                model_name, current_time, strategy="append"
+                model_name, current_time, strategy="append", full_load=True
             )
             return
 
@@ -503,6 +507,9 @@ class IncrementalExecutor:
         if on_schema_change is None:
             on_schema_change = "fail"
 
+        # Key the schema cache on the query as received, before time filters are applied
+        schema_cache_key = sql_query
+
         # Get current state
         state = self.state_manager.get_model_state(model_name)
         last_processed_value = state.last_processed_value if state else None
@@ -538,41 +545,30 @@ class IncrementalExecutor:
             # For first run, create table as full load (with wrapped query if auto_incremental)
             logger.info(f"Table {table_name} does not exist. Creating it as a full load first.")
             adapter.create_table(table_name, sql_query, metadata)
+            self.schema_cache.invalidate(table_name)
             # Update state after full load to enable incremental runs
             current_time = datetime.now(UTC).isoformat()
             self.state_manager.update_processed_value(
-                model_name, current_time, strategy="merge"
+                model_name, current_time, strategy="merge", full_load=True
             )
             return
 
         # Handle schema changes if table exists (OTS 0.2.1)
         # This runs AFTER wrapping so it can see the auto_incremental column
         if table_exists:
-            from .schema_change_handler import SchemaChangeHandler
-            from .schema_comparator import SchemaComparator
-
-            handler = SchemaChangeHandler(adapter)
-            comparator = SchemaComparator(adapter)
-
-            query_schema = comparator.infer_query_schema(sql_query)
-            table_schema = comparator.get_table_schema(table_name)
-
-            handler.handle_schema_changes(
+            self.schema_cache.check_and_handle(
+                adapter,
                 table_name,
-                query_schema,
-                table_schema,
+                sql_query,
                 on_schema_change,
-                sql_query=sql_query,
+                cache_key=schema_cache_key,
                 full_incremental_refresh_config=full_incremental_refresh_config,
                 incremental_config={"strategy": "merge", "merge": config},
                 metadata=metadata,
             )
 
         # Apply time filter if not already wrapped
-        if time_filter:
-            filtered_sql = self._add_where_clause(sql_query, time_filter)
-        else:
-            filtered_sql = sql_query
+        filtered_sql = self._add_where_clause(sql_query, time_filter) if time_filter else sql_query
 
         # Delegate to adapter for database-specific merge logic
         if hasattr(adapter, "execute_incremental_merge") and callable(
@@ -609,6 +605,9 @@ class IncrementalExecutor:
 
         # Schema change handling will be done AFTER wrapping, so it can see the auto_incremental column
 
+        # Key the schema cache on the query as received, before time filters are applied
+        schema_cache_key = sql_query
+
         # Get current state
         state = self.state_manager.get_model_state(model_name)
         last_processed_value = state.last_processed_value if state else None
@@ -646,29 +645,17 @@ class IncrementalExecutor:
             time_filter = None
 
         # Apply time filter if not already wrapped
-        if time_filter:
-            filtered_sql = self._add_where_clause(sql_query, time_filter)
-        else:
-            filtered_sql = sql_query
+        filtered_sql = self._add_where_clause(sql_query, time_filter) if time_filter else sql_query
 
         # Handle schema changes if table exists (OTS 0.2.1)
         # This runs AFTER wrapping so it can see the auto_incremental column
         if table_exists:
-            from .schema_change_handler import SchemaChangeHandler
-            from .schema_comparator import SchemaComparator
-
-            handler = SchemaChangeHandler(adapter)
-            comparator = SchemaComparator(adapter)
-
-            query_schema = comparator.infer_query_schema(filtered_sql)
-            table_schema = comparator.get_table_schema(table_name)
-
-            handler.handle_schema_changes(
+            self.schema_cache.check_and_handle(
+                adapter,
                 table_name,
-                query_schema,
-                table_schema,
+                filtered_sql,
                 on_schema_change,
-                sql_query=filtered_sql,
+                cache_key=schema_cache_key,
                 full_incremental_refresh_config=full_incremental_refresh_config,
                 incremental_config={"strategy": "delete_insert", "delete_insert": config},
                 metadata=metadata,
@@ -678,10 +665,11 @@ class IncrementalExecutor:
         if not table_exists:
             logger.info(f"Table {table_name} doesn't exist yet, creating it as a full load")
             adapter.create_table(table_name, filtered_sql, metadata=None)
+            self.schema_cache.invalidate(table_name)
             # Update state after full load to enable incremental runs
             current_time = datetime.now(UTC).isoformat()
             self.state_manager.update_processed_value(
-                model_name, current_time, strategy="delete_insert"
+                model_name, current_time, strategy="delete_insert", full_load=True
             )
             return
 
@@ -702,15 +690,16 @@ class IncrementalExecutor:
 
         delete_sql = f"DELETE FROM {qualified_table_name} WHERE {where_condition}"
 
-        # Execute delete and insert
-        if hasattr(adapter, "execute_incremental_delete_insert") and callable(
-            adapter.execute_incremental_delete_insert
-        ):
-            adapter.execute_incremental_delete_insert(table_name, delete_sql, filtered_sql)
-        else:
-            # Fallback to regular execution
-            adapter.execute_query(delete_sql)
-            adapter.execute_query(filtered_sql)
+        # Execute delete and insert in one transaction, so they are never half-applied
+        with adapter.transaction():
+            if hasattr(adapter, "execute_incremental_delete_insert") and callable(
+                adapter.execute_incremental_delete_insert
+            ):
+                adapter.execute_incremental_delete_insert(table_name, delete_sql, filtered_sql)
+            else:
+                # Fallback to regular execution
+                adapter.execute_query(delete_sql)
+                adapter.execute_query(filtered_sql)
 
         # Update state
         current_time = datetime.now(UTC).isoformat()
@@ -718,10 +707,108 @@ class IncrementalExecutor:
             model_name, current_time, strategy="delete_insert"
         )
 
+    def execute_insert_overwrite_strategy(
+        self,
+        model_name: str,
+        sql_query: str,
+        config: IncrementalInsertOverwriteConfig,
+        adapter: DatabaseAdapter,
+        table_name: str,
+        variables: dict[str, Any] | None = None,
+        on_schema_change: OnSchemaChange | None = None,
+        full_incremental_refresh_config: dict[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Execute insert_overwrite incremental strategy.
+
+        The partitions present in the new batch are replaced as a whole: their existing
+        rows are deleted and the batch is inserted, using the adapter's native mechanism.
+        Unlike delete_insert, no where_condition is needed; the partitions to replace are
+        derived from the batch itself.
+        """
+        # Default to "fail" if not specified
+        if on_schema_change is None:
+            on_schema_change = "fail"
+
+        partition_by = self._get_partition_columns(config, metadata)
+        if not partition_by:
+            raise ValueError(
+                f"Insert_overwrite strategy for {model_name} requires partition columns "
+                "('partitions' in metadata or 'partition_by' in insert_overwrite configuration)"
+            )
+
+        # Key the schema cache on the query as received, before time filters are applied
+        schema_cache_key = sql_query
+
+        # Get current state
+        state = self.state_manager.get_model_state(model_name)
+        last_processed_value = state.last_processed_value if state else None
+
+        # Check if table exists
+        table_exists = adapter.table_exists(table_name)
+
+        # The batch is selected by the query itself unless a filter column is configured
+        time_filter = None
+        if config.get("filter_column"):
+            time_filter = self.get_time_filter_condition(
+                config, last_processed_value, variables, table_name, table_exists, adapter
+            )
+
+        filtered_sql = self._add_where_clause(sql_query, time_filter) if time_filter else sql_query
+
+        # Handle schema changes if table exists (OTS 0.2.1)
+        if table_exists:
+            self.schema_cache.check_and_handle(
+                adapter,
+                table_name,
+                filtered_sql,
+                on_schema_change,
+                cache_key=schema_cache_key,
+                full_incremental_refresh_config=full_incremental_refresh_config,
+                incremental_config={
+                    "strategy": "insert_overwrite",
+                    "insert_overwrite": {**config, "partition_by": partition_by},
+                },
+                metadata=metadata,
+            )
+
+        # If table doesn't exist, create it as a full load first
+        if not table_exists:
+            logger.info(f"Table {table_name} doesn't exist yet, creating it as a full load")
+            adapter.create_table(table_name, filtered_sql, metadata=None)
+            self.schema_cache.invalidate(table_name)
+            # Update state after full load to enable incremental runs
+            current_time = datetime.now(UTC).isoformat()
+            self.state_manager.update_processed_value(
+                model_name, current_time, strategy="insert_overwrite", full_load=True
+            )
+            return
+
+        # Replace the partitions the batch touches (the adapter qualifies the table name)
+        adapter.execute_incremental_insert_overwrite(table_name, filtered_sql, partition_by)
+
+        # Update state
+        current_time = datetime.now(UTC).isoformat()
+        self.state_manager.update_processed_value(
+            model_name, current_time, strategy="insert_overwrite"
+        )
+
+    def _get_partition_columns(
+        self,
+        config: IncrementalInsertOverwriteConfig,
+        metadata: dict[str, Any] | None = None,
+    ) -> list[str]:
+        """Get the partition columns of an insert_overwrite model."""
+        partition_by = config.get("partition_by") or (metadata or {}).get("partitions") or []
+        if isinstance(partition_by, str):
+            partition_by = [partition_by]
+        return list(partition_by)
+
     def _add_where_clause(self, sql_query: str, where_condition: str) -> str:
         """Add WHERE clause to SQL query."""
         try:
-            parsed = sqlglot.parse_one(sql_query)
+            parsed = parse_sql(sql_query)
 
             # Find existing WHERE clause
             where_clause = None
@@ -731,7 +818,7 @@ class IncrementalExecutor:
                     break
 
             # Parse the where condition as a proper SQL expression
-            where_expr = sqlglot.parse_one(where_condition)
+            where_expr = parse_sql(where_condition)
 
             if where_clause:
                 # Add to existing WHERE clause
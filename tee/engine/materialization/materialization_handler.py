@@ -3,7 +3,12 @@
 import logging
 from typing import Any
 
+from tee.adapters.base import QueryHandle
 from tee.adapters.base.core import DatabaseAdapter
+from tee.engine.state.ddl_ledger import VIEW, DDLLedger
+from tee.instrumentation import span
+
+from .schema_cache import SchemaCache
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +17,11 @@ class MaterializationHandler:
     """Handles different materialization types (table, view, incremental, etc.)."""
 
     def __init__(
-        self, adapter: DatabaseAdapter, state_manager: Any, variables: dict[str, Any]
+        self,
+        adapter: DatabaseAdapter,
+        state_manager: Any,
+        variables: dict[str, Any],
+        ddl_ledger: DDLLedger | None = None,
     ) -> None:
         """
         Initialize the materialization handler.
@@ -21,10 +30,13 @@ class MaterializationHandler:
             adapter: Database adapter instance
             state_manager: State manager instance
             variables: Variables dictionary for model execution
+            ddl_ledger: Optional ledger used to skip unchanged view DDL
         """
         self.adapter = adapter
         self.state_manager = state_manager
         self.variables = variables
+        self.schema_cache = SchemaCache(state_manager)
+        self.ddl_ledger = ddl_ledger or DDLLedger(state_manager)
 
     def materialize(
         self,
@@ -45,8 +57,13 @@ class MaterializationHandler:
             config: Optional adapter config
         """
         if materialization == "view":
-            self.adapter.create_view(table_name, sql_query, metadata)
-        elif materialization == "materialized_view":
+            self._create_view(table_name, sql_query, metadata)
+            return
+
+        # The name no longer holds a view tee created, so never skip its next view DDL
+        self.ddl_ledger.forget(VIEW, table_name)
+
+        if materialization == "materialized_view":
             if hasattr(self.adapter, "create_materialized_view"):
                 self.adapter.create_materialized_view(table_name, sql_query)
             else:
@@ -57,11 +74,11 @@ class MaterializationHandler:
         elif materialization == "external_table":
             if hasattr(self.adapter, "create_external_table"):
                 # External tables need additional configuration
-                external_location = (
-                    config.extra.get("external_location") if config and config.extra else None
-                )
+                external_location = self._resolve_external_location(metadata, config)
                 if external_location:
-                    self.adapter.create_external_table(table_name, sql_query, external_location)
+                    self.adapter.create_external_table(
+                        table_name, sql_query, external_location, metadata
+                    )
                 else:
                     logger.warning("External table location not configured, creating table instead")
                     self.adapter.create_table(table_name, sql_query, metadata)
@@ -72,9 +89,74 @@ class MaterializationHandler:
                 self.adapter.create_table(table_name, sql_query, metadata)
         elif materialization == "incremental":
             self._execute_incremental_materialization(table_name, sql_query, metadata)
+            return
         else:  # Default to table for "table" or any other type
             self.adapter.create_table(table_name, sql_query, metadata)
 
+        # The object was replaced, so any cached schema comparison for it is stale
+        self.schema_cache.invalidate(table_name)
+
+    def submit_table(
+        self, table_name: str, sql_query: str, metadata: dict[str, Any] | None = None
+    ) -> QueryHandle:
+        """
+        Submit the statement building a table model without waiting for it to finish.
+
+        The asynchronous counterpart of materialize() for the table materialization;
+        call complete_table() once the returned query has finished.
+
+        Args:
+            table_name: Name of the table
+            sql_query: SQL query to execute
+            metadata: Optional metadata dictionary
+
+        Returns:
+            Handle to the submitted statement
+        """
+        self.ddl_ledger.forget(VIEW, table_name)
+        return self.adapter.submit_create_table(table_name, sql_query, metadata)
+
+    def complete_table(self, table_name: str, metadata: dict[str, Any] | None = None) -> None:
+        """Finish a table model whose statement was submitted with submit_table()."""
+        self.adapter.complete_create_table(table_name, metadata)
+        self.schema_cache.invalidate(table_name)
+
+    def _resolve_external_location(
+        self, metadata: dict[str, Any] | None, config: Any | None
+    ) -> str | None:
+        """
+        Resolve the location passed to the adapter for an external table.
+
+        A location set in the model's external configuration takes precedence over the
+        connection-level extra.external_location. The adapter decides how to use it.
+        """
+        external_config = (metadata or {}).get("external") or {}
+        if external_config.get("location"):
+            return external_config["location"]
+        return config.extra.get("external_location") if config and config.extra else None
+
+    def _create_view(
+        self, table_name: str, sql_query: str, metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Create a view, skipping the DDL if it already exists with the same definition."""
+        # A rebuilt upstream relation may change the columns the view exposes, so the
+        # definition includes the DDL versions of the relations it reads
+        upstream = self.schema_cache.upstream_tables(table_name, sql_query)
+        definition_hash = self.ddl_ledger.compute_hash(
+            VIEW, sql_query, metadata, self.schema_cache.ddl_versions(upstream)
+        )
+        if self.ddl_ledger.is_unchanged(
+            VIEW, table_name, definition_hash, lambda: self.adapter.table_exists(table_name)
+        ):
+            logger.info(f"View {table_name} is unchanged, skipping DDL")
+            return
+
+        self.adapter.create_view(table_name, sql_query, metadata)
+        if upstream:
+            self.state_manager.track_ddl(upstream)
+        self.ddl_ledger.record(VIEW, table_name, definition_hash)
+        self.schema_cache.invalidate(table_name)
+
     def _execute_incremental_materialization(
         self, table_name: str, sql_query: str, metadata: dict[str, Any] | None = None
     ) -> None:
@@ -183,18 +265,24 @@ class MaterializationHandler:
             # Check for schema changes BEFORE deciding whether to run incrementally
             # If schema changes require full refresh, handle that first
             schema_change_requires_full_refresh = False
-            if self.adapter.table_exists(table_name):
+            # Skip the comparison if the last run found no changes for this SQL and table version
+            if self.adapter.table_exists(table_name) and not self.schema_cache.is_unchanged(
+                table_name, sql_query
+            ):
                 from .schema_change_handler import SchemaChangeHandler
                 from .schema_comparator import SchemaComparator
 
                 handler = SchemaChangeHandler(self.adapter)
                 comparator = SchemaComparator(self.adapter)
 
-                query_schema = comparator.infer_query_schema(sql_query)
-                table_schema = comparator.get_table_schema(table_name)
-                differences = comparator.compare_schemas(query_schema, table_schema)
+                with span("schema_comparison"):
+                    query_schema = comparator.infer_query_schema(sql_query)
+                    table_schema = comparator.get_table_schema(table_name)
+                    differences = comparator.compare_schemas(query_schema, table_schema)
 
-                if differences["has_changes"]:
+                if not differences["has_changes"]:
+                    self.schema_cache.save(table_name, sql_query, query_schema, table_schema)
+                else:
                     # Check if on_schema_change requires full refresh
                     if on_schema_change in ["full_refresh", "full_incremental_refresh", "recreate_empty"]:
                         schema_change_requires_full_refresh = True
@@ -202,16 +290,19 @@ class MaterializationHandler:
                             f"Schema changes detected for {table_name} with on_schema_change='{on_schema_change}'. "
                             f"Handling schema change before incremental run."
                         )
-                        handler.handle_schema_changes(
-                            table_name,
-                            query_schema,
-                            table_schema,
-                            on_schema_change,
-                            sql_query=sql_query,
-                            full_incremental_refresh_config=full_incremental_refresh_config,
-                            incremental_config={"strategy": strategy, strategy: incremental_config.get(strategy)},
-                            metadata=metadata,
-                        )
+                        try:
+                            handler.handle_schema_changes(
+                                table_name,
+                                query_schema,
+                                table_schema,
+                                on_schema_change,
+                                sql_query=sql_query,
+                                full_incremental_refresh_config=full_incremental_refresh_config,
+                                incremental_config={"strategy": strategy, strategy: incremental_config.get(strategy)},
+                                metadata=metadata,
+                            )
+                        finally:
+                            self.schema_cache.invalidate(table_name)
                     elif on_schema_change in ["append_new_columns", "sync_all_columns"]:
                         # These don't require full refresh, handle them later in strategy execution
                         pass
@@ -227,8 +318,11 @@ class MaterializationHandler:
             strategy = incremental_config.get("strategy") if incremental_config else None
             table_exists_for_incremental = self.adapter.table_exists(table_name)
             
-            # For merge and delete_insert, table must exist to run incrementally
-            if strategy in ["merge", "delete_insert"] and not table_exists_for_incremental:
+            # For merge, delete_insert and insert_overwrite, table must exist to run incrementally
+            if (
+                strategy in ["merge", "delete_insert", "insert_overwrite"]
+                and not table_exists_for_incremental
+            ):
                 logger.info(
                     f"Table {table_name} does not exist. Cannot run incremental {strategy}. "
                     "Running full load instead."
@@ -243,6 +337,7 @@ class MaterializationHandler:
             if not should_run_incremental:
                 # Run as full load (create/replace table)
                 self.adapter.create_table(table_name, sql_query, metadata)
+                self.schema_cache.invalidate(table_name)
 
                 # Save state after full load to enable incremental runs
                 # Compute hashes from the original query (not wrapped)
@@ -314,6 +409,21 @@ class MaterializationHandler:
                         metadata=metadata,
                     )
 
+                elif strategy == "insert_overwrite":
+                    # Partition columns default to the model's partitions, so config may be empty
+                    insert_overwrite_config = incremental_config.get("insert_overwrite") or {}
+                    executor.execute_insert_overwrite_strategy(
+                        table_name,
+                        sql_query,
+                        insert_overwrite_config,
+                        self.adapter,
+                        table_name,
+                        self.variables,
+                        on_schema_change=on_schema_change,
+                        full_incremental_refresh_config=full_incremental_refresh_config,
+                        metadata=metadata,
+                    )
+
                 else:
                     logger.error(f"Unknown incremental strategy: {strategy}")
                     return
@@ -322,5 +432,10 @@ class MaterializationHandler:
 
         except Exception as e:
             logger.error(f"Error executing incremental materialization: {e}")
+            # Inside the model's transaction the failed statement aborted it (DuckDB,
+            # PostgreSQL), so the fallback could not run: report the real error instead
+            if getattr(self.adapter, "in_transaction", False) is True:
+                raise
             # Fallback to table creation
             self.adapter.create_table(table_name, sql_query, metadata)
+            self.schema_cache.invalidate(table_name)
@@ -0,0 +1,166 @@
+"""
+Schema comparison cache for incremental models.
+
+Comparing an incremental model's query schema to its target table costs two
+round trips to the database (inferring the query schema and describing the
+table). When neither the model SQL nor the table has changed since the last
+comparison found them identical, the result is known in advance, so the
+comparison is skipped.
+
+Cache entries live in the state database and are keyed by the table's DDL
+version and a hash of the model SQL together with the DDL versions of the
+relations the SQL reads, so a rebuilt upstream table invalidates the entry as
+well. DDL versions are only tracked for the tables some cache entry depends on:
+DDL that tee issues against other tables costs no state database write. DDL
+issued outside of tee is not tracked.
+"""
+
+import logging
+from typing import Any
+
+from sqlglot import expressions as exp
+
+from tee.ast_registry import parse_sql
+from tee.instrumentation import span
+
+from ..state_manager import SchemaCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaCache:
+    """Skips schema comparisons that are known to find no changes."""
+
+    def __init__(self, state_manager: Any) -> None:
+        """
+        Initialize the schema cache.
+
+        Args:
+            state_manager: State manager holding the cache entries and DDL versions
+        """
+        self.state_manager = state_manager
+
+    def is_unchanged(self, table_name: str, sql_query: str) -> bool:
+        """
+        Check whether the last comparison for this SQL and table version found no changes.
+
+        Args:
+            table_name: Name of the target table
+            sql_query: Query the comparison is keyed on
+
+        Returns:
+            True if the comparison can be skipped
+        """
+        entry = self.state_manager.get_schema_cache(table_name)
+        if not isinstance(entry, SchemaCacheEntry):
+            return False
+
+        if entry.ddl_version != self.state_manager.get_ddl_version(table_name):
+            return False
+        return entry.sql_hash == self._key_hash(
+            sql_query, self.upstream_tables(table_name, sql_query)
+        )
+
+    def save(
+        self,
+        table_name: str,
+        sql_query: str,
+        query_schema: list[dict[str, Any]],
+        table_schema: list[dict[str, Any]],
+    ) -> None:
+        """Remember that the query and table schemas matched."""
+        upstream = self.upstream_tables(table_name, sql_query)
+        # Start tracking DDL versions for the tables the entry depends on
+        self.state_manager.track_ddl([table_name, *upstream])
+        self.state_manager.save_schema_cache(
+            table_name,
+            self._key_hash(sql_query, upstream),
+            self.state_manager.get_ddl_version(table_name),
+            query_schema,
+            table_schema,
+        )
+
+    def invalidate(self, table_name: str) -> None:
+        """Record that tee issued DDL against the table, invalidating the entries depending on it."""
+        self.state_manager.record_ddl(table_name, tracked_only=True)
+
+    def ddl_versions(self, table_names: list[str]) -> list[str]:
+        """List the DDL versions of tables as name=version."""
+        return [f"{name}={self.state_manager.get_ddl_version(name)}" for name in table_names]
+
+    def _key_hash(self, sql_query: str, upstream: list[str]) -> str:
+        """Hash the SQL together with the DDL versions of the relations it reads."""
+        return self.state_manager.compute_sql_hash(
+            "\n".join([sql_query, *self.ddl_versions(upstream)])
+        )
+
+    def upstream_tables(self, table_name: str, sql_query: str) -> list[str]:
+        """Names of the tables the SQL reads (as schema.table when qualified), sorted."""
+        try:
+            expression = parse_sql(sql_query, copy=False)
+        except Exception as e:
+            logger.debug(f"Could not parse the SQL of {table_name} for upstream tables: {e}")
+            return []
+
+        cte_names = {cte.alias_or_name.lower() for cte in expression.find_all(exp.CTE)}
+        upstream = set()
+        for table in expression.find_all(exp.Table):
+            if not table.name or (not table.db and table.name.lower() in cte_names):
+                continue
+            upstream.add(f"{table.db}.{table.name}" if table.db else table.name)
+        upstream.discard(table_name)
+        return sorted(upstream)
+
+    def check_and_handle(
+        self,
+        adapter: Any,
+        table_name: str,
+        sql_query: str,
+        on_schema_change: str,
+        cache_key: str | None = None,
+        **handler_kwargs: Any,
+    ) -> None:
+        """
+        Compare schemas (unless cached) and apply the on_schema_change policy.
+
+        Args:
+            adapter: Database adapter instance
+            table_name: Name of the target table
+            sql_query: Query whose schema is compared to the table
+            on_schema_change: Schema change policy
+            cache_key: SQL the cache entry is keyed on (defaults to sql_query)
+            **handler_kwargs: Extra arguments for SchemaChangeHandler.handle_schema_changes
+        """
+        from .schema_change_handler import SchemaChangeHandler
+        from .schema_comparator import SchemaComparator
+
+        cache_key = cache_key or sql_query
+        if self.is_unchanged(table_name, cache_key):
+            logger.debug(f"Schema of {table_name} unchanged since last run, skipping comparison")
+            return
+
+        handler = SchemaChangeHandler(adapter)
+        comparator = SchemaComparator(adapter)
+
+        with span("schema_comparison"):
+            query_schema = comparator.infer_query_schema(sql_query, schema_key=cache_key)
+            table_schema = comparator.get_table_schema(table_name)
+            differences = comparator.compare_schemas(query_schema, table_schema)
+
+        if not differences["has_changes"]:
+            self.save(table_name, cache_key, query_schema, table_schema)
+            return
+
+        try:
+            handler.handle_schema_changes(
+                table_name,
+                query_schema,
+                table_schema,
+                on_schema_change,
+                sql_query=sql_query,
+                **handler_kwargs,
+            )
+        finally:
+            # Every policy but "ignore" may have altered or recreated the table
+            if on_schema_change != "ignore":
+                self.invalidate(table_name)
@@ -25,19 +25,32 @@ class SchemaComparator:
         """
         self.adapter = adapter
 
-    def infer_query_schema(self, sql_query: str) -> list[dict[str, Any]]:
+    def infer_query_schema(
+        self, sql_query: str, schema_key: str | None = None
+    ) -> list[dict[str, Any]]:
         """
         Infer schema from SQL query output using database-specific methods.
 
-        Uses adapter.describe_query_schema() if available, otherwise falls back
-        to executing the query with LIMIT 0 and extracting metadata.
+        Uses the model's authoritative compile-time output schema when the adapter has
+        one registered for the query, which needs no database round trip. Otherwise
+        uses adapter.describe_query_schema() if available, and falls back to executing
+        the query with LIMIT 0 and extracting metadata.
 
         Args:
             sql_query: SQL query to analyze
+            schema_key: Model SQL the registered output schema is looked up by, when
+                sql_query only adds filters to it (defaults to sql_query)
 
         Returns:
             List of column definitions: [{"name": "col1", "type": "VARCHAR"}, ...]
         """
+        get_known_query_schema = getattr(self.adapter, "get_known_query_schema", None)
+        if callable(get_known_query_schema):
+            known_schema = get_known_query_schema(schema_key or sql_query)
+            if isinstance(known_schema, list):
+                logger.debug("Using the compile-time output schema of the query")
+                return known_schema
+
         # Use adapter's describe_query_schema method if available
         if hasattr(self.adapter, "describe_query_schema") and callable(
             self.adapter.describe_query_schema
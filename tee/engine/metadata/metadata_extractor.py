@@ -25,11 +25,8 @@ class MetadataExtractor:
             if model_metadata and "metadata" in model_metadata:
                 nested_metadata = model_metadata["metadata"]
 
-                # Check if this is incremental materialization
-                if (
-                    "materialization" in nested_metadata
-                    and nested_metadata["materialization"] == "incremental"
-                ):
+                # Incremental and external materializations need their config even without a schema
+                if nested_metadata.get("materialization") in ("incremental", "external_table"):
                     # Extract tags if present
                     self._extract_tags_to_metadata(nested_metadata, model_metadata)
                     return nested_metadata
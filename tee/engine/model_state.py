@@ -10,7 +10,13 @@ This is now a wrapper around the centralized StateManager for backward compatibi
 import logging
 from typing import Any
 
-from .state_manager import ModelState, StateManager
+from .state_manager import (
+    RUNTIME_ESTIMATE_WINDOW,
+    ModelState,
+    SchemaCacheEntry,
+    StateManager,
+    TestResultCacheEntry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,17 +60,28 @@ class ModelStateManager:
         config_hash: str,
         last_processed_value: str | None = None,
         strategy: str | None = None,
+        previous_processed_value: str | None = None,
     ) -> None:
         """Save or update model state."""
         self.state_manager.save_model_state(
-            model_name, materialization, sql_hash, config_hash, last_processed_value, strategy
+            model_name,
+            materialization,
+            sql_hash,
+            config_hash,
+            last_processed_value,
+            strategy,
+            previous_processed_value,
         )
 
     def update_processed_value(
-        self, model_name: str, value: str, strategy: str | None = None
+        self,
+        model_name: str,
+        value: str,
+        strategy: str | None = None,
+        full_load: bool = False,
     ) -> None:
         """Update the last processed value for a model."""
-        self.state_manager.update_processed_value(model_name, value, strategy)
+        self.state_manager.update_processed_value(model_name, value, strategy, full_load)
 
     def check_database_existence(self, adapter: Any, table_name: str) -> bool:
         """Check if the model exists in the target database."""
@@ -82,6 +99,80 @@ class ModelStateManager:
             model_name, current_materialization, behavior
         )
 
+    def get_ddl_version(self, table_name: str) -> int:
+        """Get the version of the last DDL tee issued against a table."""
+        return self.state_manager.get_ddl_version(table_name)
+
+    def track_ddl(self, table_names: list[str]) -> None:
+        """Start tracking the DDL versions of tables."""
+        self.state_manager.track_ddl(table_names)
+
+    def record_ddl(self, table_name: str, tracked_only: bool = False) -> int:
+        """Record that tee issued DDL against a table."""
+        return self.state_manager.record_ddl(table_name, tracked_only=tracked_only)
+
+    def get_schema_cache(self, table_name: str) -> SchemaCacheEntry | None:
+        """Get the cached schema comparison for a table."""
+        return self.state_manager.get_schema_cache(table_name)
+
+    def save_schema_cache(
+        self,
+        table_name: str,
+        sql_hash: str,
+        ddl_version: int,
+        query_schema: list[dict[str, Any]],
+        table_schema: list[dict[str, Any]],
+    ) -> None:
+        """Save or update the cached schema comparison for a table."""
+        self.state_manager.save_schema_cache(
+            table_name, sql_hash, ddl_version, query_schema, table_schema
+        )
+
+    def get_definition_hash(self, object_type: str, object_name: str) -> str | None:
+        """Get the definition hash of the last DDL tee issued for an object."""
+        return self.state_manager.get_definition_hash(object_type, object_name)
+
+    def save_definition_hash(
+        self, object_type: str, object_name: str, definition_hash: str
+    ) -> None:
+        """Record the definition hash of DDL tee issued for an object."""
+        self.state_manager.save_definition_hash(object_type, object_name, definition_hash)
+
+    def delete_definition_hash(self, object_type: str, object_name: str) -> None:
+        """Forget the recorded definition of an object."""
+        self.state_manager.delete_definition_hash(object_type, object_name)
+
+    def get_test_result(self, table_name: str, definition_hash: str) -> TestResultCacheEntry | None:
+        """Get the last recorded pass of a model test."""
+        return self.state_manager.get_test_result(table_name, definition_hash)
+
+    def save_test_result(
+        self,
+        table_name: str,
+        definition_hash: str,
+        fingerprint: str,
+        rows_returned: int | None,
+        mode: str,
+    ) -> None:
+        """Record a pass of a model test."""
+        self.state_manager.save_test_result(
+            table_name, definition_hash, fingerprint, rows_returned, mode
+        )
+
+    def delete_test_result(self, table_name: str, definition_hash: str) -> None:
+        """Forget the recorded pass of a model test."""
+        self.state_manager.delete_test_result(table_name, definition_hash)
+
+    def save_node_runtimes(
+        self, run_id: str, command: str | None, runtimes: list[tuple[str, float, str]]
+    ) -> None:
+        """Record how long the nodes of a run took."""
+        self.state_manager.save_node_runtimes(run_id, command, runtimes)
+
+    def get_node_runtime_estimates(self, window: int = RUNTIME_ESTIMATE_WINDOW) -> dict[str, float]:
+        """Estimate the duration of every node with runtime history."""
+        return self.state_manager.get_node_runtime_estimates(window)
+
     def get_all_models(self) -> list[ModelState]:
         """Get all model states."""
         return self.state_manager.get_all_models()
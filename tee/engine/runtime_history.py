@@ -0,0 +1,85 @@
+"""
+Runtime history of the nodes t4t executes.
+
+Every recorded run (`t4t run`, `t4t build`) saves how long each model, function and test
+took in the state database. The median of a node's recent durations estimates its next
+run: the query scheduler starts the models with the heaviest remaining path first, and
+`t4t critical-path` reports the slowest chains of the project.
+"""
+
+import logging
+from typing import Any
+
+from tee.instrumentation import RunRecorder
+
+from .model_state import ModelStateManager
+
+logger = logging.getLogger(__name__)
+
+# Node span statuses whose duration covers the node's full work
+COMPLETE_STATUSES = {"success", "pass", "fail"}
+
+
+def node_runtimes(recorder: RunRecorder) -> list[tuple[str, float, str]]:
+    """
+    Get the durations of the nodes a run executed in full.
+
+    Failed models and skipped nodes stopped early, and cached test passes did not run,
+    so their durations would not estimate a real run.
+
+    Args:
+        recorder: Recorder of a finished run
+
+    Returns:
+        (node name, duration in seconds, status) of each node
+    """
+    runtimes = []
+    for node_span in recorder.node_spans():
+        status = node_span.attributes.get("status")
+        if node_span.node is None or node_span.end is None or status not in COMPLETE_STATUSES:
+            continue
+        if node_span.attributes.get("cached"):
+            continue
+        runtimes.append((node_span.node, node_span.duration, status))
+    return runtimes
+
+
+def record_node_runtimes(recorder: RunRecorder, project_folder: str) -> int:
+    """
+    Save the node durations of a run in the project's state database.
+
+    Args:
+        recorder: Recorder of a finished run
+        project_folder: Path to the project folder
+
+    Returns:
+        Number of node durations saved
+    """
+    runtimes = node_runtimes(recorder)
+    if not runtimes:
+        return 0
+
+    state_manager = ModelStateManager(project_folder=project_folder)
+    try:
+        state_manager.save_node_runtimes(recorder.run_id, recorder.command, runtimes)
+    finally:
+        state_manager.close()
+    return len(runtimes)
+
+
+def load_runtime_estimates(state_manager: Any) -> dict[str, float]:
+    """
+    Load the estimated node durations, or none if the history cannot be read.
+
+    Args:
+        state_manager: Model state manager holding the runtime history
+
+    Returns:
+        Dict mapping node name -> estimated duration in seconds
+    """
+    try:
+        estimates = state_manager.get_node_runtime_estimates()
+    except Exception as e:
+        logger.debug(f"Could not load the runtime history: {e}")
+        return {}
+    return estimates if isinstance(estimates, dict) else {}
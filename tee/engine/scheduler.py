@@ -0,0 +1,213 @@
+"""
+Dependency-aware scheduler for asynchronously submitted queries.
+
+Adapters that support asynchronous submission (see AsyncQueryExecutor) let a single
+session keep several statements running in the warehouse at once. The scheduler walks
+a dependency graph of jobs, submits every job whose dependencies have succeeded (up to
+max_in_flight queries at a time), and polls the submitted queries instead of blocking on
+each one, so the limit on parallelism is warehouse concurrency rather than client threads.
+When several jobs are ready, the one with the highest priority starts first (ModelExecutor
+uses each model's heaviest remaining path, so long poles start early).
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from tee.adapters.base.async_queries import QueryHandle
+from tee.adapters.base.core import DatabaseAdapter
+
+logger = logging.getLogger(__name__)
+
+# Job statuses
+JOB_SUCCESS = "success"
+JOB_ERROR = "error"
+JOB_SKIPPED = "skipped"
+
+# Defaults
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_POLL_INTERVAL = 0.05
+
+
+@dataclass
+class ScheduledJob:
+    """
+    A node in the scheduler's dependency graph.
+
+    A job either submits a query (submit returns a QueryHandle and the scheduler polls
+    it) or runs synchronous work inline (run). on_complete receives the query result of
+    a submitted job once it finishes; on_error receives the exception of a failed job.
+    Ready jobs with a higher priority start before the others.
+    """
+
+    name: str
+    depends_on: set[str] = field(default_factory=set)
+    priority: float = 0.0
+    submit: Callable[[], QueryHandle] | None = None
+    run: Callable[[], None] | None = None
+    on_complete: Callable[[Any], None] | None = None
+    on_error: Callable[[BaseException], None] | None = None
+
+
+@dataclass
+class JobResult:
+    """Outcome of a scheduled job."""
+
+    name: str
+    status: str
+    error: str | None = None
+
+
+class QueryScheduler:
+    """Runs a graph of jobs, keeping up to max_in_flight queries running at once."""
+
+    def __init__(
+        self,
+        adapter: DatabaseAdapter,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            adapter: Database adapter used to poll, wait for and cancel queries
+            max_in_flight: Maximum number of submitted queries running at the same time
+            poll_interval: Seconds to sleep when no query finished and no job was started
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.adapter = adapter
+        self.max_in_flight = max_in_flight
+        self.poll_interval = poll_interval
+        self._jobs: dict[str, ScheduledJob] = {}
+
+    def add(self, job: ScheduledJob) -> None:
+        """Add a job to the graph (ready jobs of equal priority start in the order added)."""
+        if (job.submit is None) == (job.run is None):
+            raise ValueError(f"Job {job.name} must define exactly one of submit or run")
+        self._jobs[job.name] = job
+
+    def run(self) -> dict[str, JobResult]:
+        """
+        Run all jobs, respecting dependencies.
+
+        Dependencies on names that are not jobs of this scheduler are ignored. Jobs
+        downstream of a failed or skipped job are skipped. If the run is interrupted,
+        every query still in flight is cancelled.
+
+        Returns:
+            Mapping of job name to its result
+        """
+        # Stable sort: jobs of equal priority keep the order they were added in
+        pending = sorted(self._jobs.values(), key=lambda job: -job.priority)
+        in_flight: dict[str, QueryHandle] = {}
+        results: dict[str, JobResult] = {}
+        max_observed = 0
+
+        try:
+            while pending or in_flight:
+                progressed = self._start_ready_jobs(pending, in_flight, results)
+                max_observed = max(max_observed, len(in_flight))
+                progressed = self._collect_finished(in_flight, results) or progressed
+
+                if progressed:
+                    continue
+                if not in_flight:
+                    # Remaining jobs wait on each other (dependency cycle)
+                    for job in pending:
+                        self._fail(job, results, JOB_SKIPPED, "Dependency cycle")
+                    break
+                time.sleep(self.poll_interval)
+        except BaseException:
+            for name, handle in in_flight.items():
+                logger.info(f"Cancelling in-flight query for {name}")
+                self.adapter.cancel(handle)
+            raise
+
+        logger.debug(f"Scheduler finished {len(results)} job(s), max {max_observed} in flight")
+        return results
+
+    def _start_ready_jobs(
+        self,
+        pending: list[ScheduledJob],
+        in_flight: dict[str, QueryHandle],
+        results: dict[str, JobResult],
+    ) -> bool:
+        """Start every pending job whose dependencies succeeded, returning True if any did."""
+        progressed = False
+        for job in list(pending):
+            dependencies = [name for name in job.depends_on if name in self._jobs]
+            blocked_by = next(
+                (
+                    name
+                    for name in dependencies
+                    if name in results and results[name].status != JOB_SUCCESS
+                ),
+                None,
+            )
+            if blocked_by is not None:
+                pending.remove(job)
+                self._fail(job, results, JOB_SKIPPED, f"Upstream {blocked_by} did not succeed")
+                progressed = True
+                continue
+            if any(name not in results for name in dependencies):
+                continue
+            if job.submit is not None and len(in_flight) >= self.max_in_flight:
+                continue
+
+            pending.remove(job)
+            progressed = True
+            try:
+                if job.submit is not None:
+                    in_flight[job.name] = job.submit()
+                else:
+                    job.run()
+                    results[job.name] = JobResult(name=job.name, status=JOB_SUCCESS)
+            except Exception as e:
+                self._fail(job, results, JOB_ERROR, e)
+
+        return progressed
+
+    def _collect_finished(
+        self, in_flight: dict[str, QueryHandle], results: dict[str, JobResult]
+    ) -> bool:
+        """Complete every in-flight query that finished, returning True if any did."""
+        progressed = False
+        for name, handle in list(in_flight.items()):
+            if not self.adapter.poll(handle):
+                continue
+
+            del in_flight[name]
+            progressed = True
+            job = self._jobs[name]
+            try:
+                result = self.adapter.wait(handle)
+                if job.on_complete is not None:
+                    job.on_complete(result)
+                results[name] = JobResult(name=name, status=JOB_SUCCESS)
+            except Exception as e:
+                self._fail(job, results, JOB_ERROR, e)
+
+        return progressed
+
+    def _fail(
+        self,
+        job: ScheduledJob,
+        results: dict[str, JobResult],
+        status: str,
+        error: BaseException | str,
+    ) -> None:
+        """Record a failed or skipped job and notify its error callback."""
+        results[job.name] = JobResult(name=job.name, status=status, error=str(error))
+        if status == JOB_ERROR:
+            logger.error(f"Job {job.name} failed: {error}")
+        else:
+            logger.warning(f"Skipping {job.name}: {error}")
+
+        if job.on_error is not None:
+            exception = error if isinstance(error, BaseException) else RuntimeError(error)
+            job.on_error(exception)
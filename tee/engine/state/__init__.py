@@ -1,5 +1,6 @@
 """State management components."""
 
+from .ddl_ledger import DDLLedger
 from .state_checker import StateChecker
 
-__all__ = ["StateChecker"]
+__all__ = ["DDLLedger", "StateChecker"]
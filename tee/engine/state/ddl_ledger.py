@@ -0,0 +1,95 @@
+"""
+Definition-hash ledger for no-op DDL elimination.
+
+Views and functions are recreated with CREATE OR REPLACE on every run, together with
+their comments and tags, although their definitions rarely change. On warehouses such
+as Snowflake each of those statements takes metadata locks and a round trip. The ledger
+records a hash of the rendered definition of every object tee creates; when the object
+still exists and the hash is unchanged, the DDL is skipped. View definitions include the
+DDL versions of the relations the view reads, so rebuilding one of them reissues the view.
+
+DDL issued outside of tee is not tracked: if an object is altered by hand, rerun with
+--force-ddl to reissue every statement.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Object types tracked by the ledger
+VIEW = "VIEW"
+FUNCTION = "FUNCTION"
+
+
+class DDLLedger:
+    """Skips DDL for objects whose rendered definition has not changed."""
+
+    def __init__(self, state_manager: Any, scope: str = "", force: bool = False) -> None:
+        """
+        Initialize the ledger.
+
+        Args:
+            state_manager: State manager holding the recorded definition hashes
+            scope: Identifies the target database, so definitions recorded for another
+                connection are never matched
+            force: Reissue all DDL regardless of the ledger (--force-ddl)
+        """
+        self.state_manager = state_manager
+        self.scope = scope
+        self.force = force
+
+    def compute_hash(self, *parts: Any) -> str:
+        """
+        Hash the parts of a rendered object definition.
+
+        Args:
+            *parts: JSON-serializable parts of the definition (SQL, metadata, ...)
+
+        Returns:
+            SHA256 hash as hexadecimal string
+        """
+        payload = json.dumps([self.scope, *parts], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def is_unchanged(
+        self,
+        object_type: str,
+        object_name: str,
+        definition_hash: str,
+        exists: Callable[[], bool],
+    ) -> bool:
+        """
+        Check whether the DDL for an object can be skipped.
+
+        Args:
+            object_type: Object type (VIEW, FUNCTION)
+            object_name: Fully qualified object name
+            definition_hash: Hash of the definition about to be issued
+            exists: Callable checking that the object still exists in the database
+
+        Returns:
+            True if the object exists and was created from the same definition
+        """
+        if self.force:
+            return False
+        if self.state_manager.get_definition_hash(object_type, object_name) != definition_hash:
+            return False
+
+        try:
+            return bool(exists())
+        except Exception as e:
+            logger.debug(f"Could not check whether {object_type} {object_name} exists: {e}")
+            return False
+
+    def record(self, object_type: str, object_name: str, definition_hash: str) -> None:
+        """Record the definition an object was just created from."""
+        self.state_manager.save_definition_hash(object_type, object_name, definition_hash)
+
+    def forget(self, object_type: str, object_name: str) -> None:
+        """Forget an object, so its next DDL is always issued."""
+        if self.state_manager.get_definition_hash(object_type, object_name) is not None:
+            self.state_manager.delete_definition_hash(object_type, object_name)
@@ -112,6 +112,7 @@ class StateChecker:
 
         # Extract incremental-specific data if applicable
         last_processed_value = None
+        previous_processed_value = None
         strategy = None
         config_hash = None
 
@@ -121,13 +122,18 @@ class StateChecker:
                 strategy = incremental_config.get("strategy")
                 # For incremental models, compute config hash from incremental config only
                 config_hash = self.generate_config_hash(incremental_config)
-                # For incremental models, we might want to track the last processed value
-                # This would be set by the incremental executor
             else:
                 config_hash = self.generate_config_hash(metadata)
         else:
             config_hash = self.generate_config_hash(metadata)
 
+        if materialization == "incremental":
+            # The incremental executor recorded the processed values of this run's batch
+            existing_state = self.state_manager.get_model_state(table_name)
+            if existing_state:
+                last_processed_value = existing_state.last_processed_value
+                previous_processed_value = existing_state.previous_processed_value
+
         self.state_manager.save_model_state(
             model_name=table_name,
             materialization=materialization,
@@ -135,6 +141,7 @@ class StateChecker:
             config_hash=config_hash,
             last_processed_value=last_processed_value,
             strategy=strategy,
+            previous_processed_value=previous_processed_value,
         )
 
         logger.debug(f"Saved state for model: {table_name}")
@@ -18,6 +18,10 @@ import duckdb
 
 logger = logging.getLogger(__name__)
 
+# Durations kept per node, and how many recent ones estimate the next run
+RUNTIME_HISTORY_LIMIT = 20
+RUNTIME_ESTIMATE_WINDOW = 5
+
 
 @dataclass
 class ModelState:
@@ -32,6 +36,34 @@ class ModelState:
     updated_at: str
     last_processed_value: str | None = None
     strategy: str | None = None
+    # Processed value before the last incremental batch (None after a full load)
+    previous_processed_value: str | None = None
+
+
+@dataclass
+class SchemaCacheEntry:
+    """Cached schema comparison for an incremental model's target table."""
+
+    table_name: str
+    sql_hash: str
+    ddl_version: int
+    query_schema: list[dict[str, Any]]
+    table_schema: list[dict[str, Any]]
+    updated_at: str
+
+
+@dataclass
+class TestResultCacheEntry:
+    """Last pass of a model test, with the fingerprint of the relations it read."""
+
+    __test__ = False  # Tell pytest this is not a test class
+
+    table_name: str
+    definition_hash: str
+    fingerprint: str
+    rows_returned: int | None
+    mode: str
+    updated_at: str
 
 
 class StateManager:
@@ -83,7 +115,59 @@ class StateManager:
                 created_at VARCHAR,
                 updated_at VARCHAR,
                 last_processed_value VARCHAR,
-                strategy VARCHAR
+                strategy VARCHAR,
+                previous_processed_value VARCHAR
+            )
+        """)
+        # State databases created before previous_processed_value was tracked
+        conn.execute(
+            "ALTER TABLE tee_model_state ADD COLUMN IF NOT EXISTS previous_processed_value VARCHAR"
+        )
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS tee_ddl_versions (
+                table_name VARCHAR PRIMARY KEY,
+                ddl_version INTEGER NOT NULL,
+                updated_at VARCHAR
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS tee_schema_cache (
+                table_name VARCHAR PRIMARY KEY,
+                sql_hash VARCHAR NOT NULL,
+                ddl_version INTEGER NOT NULL,
+                query_schema VARCHAR,
+                table_schema VARCHAR,
+                updated_at VARCHAR
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS tee_ddl_ledger (
+                object_type VARCHAR NOT NULL,
+                object_name VARCHAR NOT NULL,
+                definition_hash VARCHAR NOT NULL,
+                updated_at VARCHAR,
+                PRIMARY KEY (object_type, object_name)
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS tee_test_results (
+                table_name VARCHAR NOT NULL,
+                definition_hash VARCHAR NOT NULL,
+                fingerprint VARCHAR NOT NULL,
+                rows_returned INTEGER,
+                mode VARCHAR,
+                updated_at VARCHAR,
+                PRIMARY KEY (table_name, definition_hash)
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS tee_node_runtimes (
+                node_name VARCHAR NOT NULL,
+                run_id VARCHAR NOT NULL,
+                command VARCHAR,
+                duration_seconds DOUBLE NOT NULL,
+                status VARCHAR,
+                recorded_at VARCHAR NOT NULL
             )
         """)
         conn.commit()
@@ -119,6 +203,7 @@ class StateManager:
             updated_at=result[6],
             last_processed_value=result[7],
             strategy=result[8],
+            previous_processed_value=result[9],
         )
 
     def save_model_state(
@@ -129,6 +214,7 @@ class StateManager:
         config_hash: str,
         last_processed_value: str | None = None,
         strategy: str | None = None,
+        previous_processed_value: str | None = None,
     ) -> None:
         """Save or update model state."""
         conn = self._get_connection()
@@ -142,7 +228,8 @@ class StateManager:
             update_sql = """
                 UPDATE tee_model_state 
                 SET materialization = ?, last_execution_timestamp = ?, sql_hash = ?,
-                    config_hash = ?, updated_at = ?, last_processed_value = ?, strategy = ?
+                    config_hash = ?, updated_at = ?, last_processed_value = ?, strategy = ?,
+                    previous_processed_value = ?
                 WHERE model_name = ?
             """
             conn.execute(
@@ -155,6 +242,7 @@ class StateManager:
                     now,
                     last_processed_value,
                     strategy,
+                    previous_processed_value,
                     model_name,
                 ],
             )
@@ -164,8 +252,9 @@ class StateManager:
             insert_sql = """
                 INSERT INTO tee_model_state
                 (model_name, materialization, last_execution_timestamp, sql_hash, config_hash,
-                 created_at, updated_at, last_processed_value, strategy)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 created_at, updated_at, last_processed_value, strategy,
+                 previous_processed_value)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """
             conn.execute(
                 insert_sql,
@@ -179,6 +268,7 @@ class StateManager:
                     now,
                     last_processed_value,
                     strategy,
+                    previous_processed_value,
                 ],
             )
             logger.debug(f"Created new state for model: {model_name}")
@@ -186,9 +276,25 @@ class StateManager:
         conn.commit()
 
     def update_processed_value(
-        self, model_name: str, value: str, strategy: str | None = None
+        self,
+        model_name: str,
+        value: str,
+        strategy: str | None = None,
+        full_load: bool = False,
     ) -> None:
-        """Update the last processed value for a model."""
+        """
+        Update the last processed value for a model.
+
+        The value it replaces is kept as previous_processed_value, so the rows of the
+        last incremental batch can be told apart from older ones (e.g. to test only
+        them). After a full load (full_load=True) there is no previous value.
+
+        Args:
+            model_name: Name of the model
+            value: New processed value
+            strategy: Incremental strategy (keeps the stored one if None)
+            full_load: Whether the table was loaded in full rather than incrementally
+        """
         state = self.get_model_state(model_name)
         if state is None:
             # State doesn't exist yet - this happens on first run after a full load
@@ -219,6 +325,7 @@ class StateManager:
             config_hash=state.config_hash,
             last_processed_value=value,
             strategy=strategy or state.strategy,
+            previous_processed_value=None if full_load else state.last_processed_value,
         )
 
     def check_database_existence(self, adapter: Any, table_name: str) -> bool:
@@ -278,6 +385,245 @@ class StateManager:
             elif behavior == "ignore":
                 logger.info(f"Ignoring materialization change for {model_name}")
 
+    def get_ddl_version(self, table_name: str) -> int:
+        """Get the version of the last DDL tee issued against a table (0 if none)."""
+        conn = self._get_connection()
+        query = "SELECT ddl_version FROM tee_ddl_versions WHERE table_name = ?"
+        result = conn.execute(query, [table_name]).fetchone()
+        return result[0] if result else 0
+
+    def track_ddl(self, table_names: list[str]) -> None:
+        """Start tracking the DDL versions of tables (at version 0 if not tracked yet)."""
+        conn = self._get_connection()
+        now = datetime.now(UTC).isoformat()
+        conn.executemany(
+            "INSERT OR IGNORE INTO tee_ddl_versions (table_name, ddl_version, updated_at) "
+            "VALUES (?, 0, ?)",
+            [[table_name, now] for table_name in table_names],
+        )
+        conn.commit()
+
+    def record_ddl(self, table_name: str, tracked_only: bool = False) -> int:
+        """
+        Record that tee issued DDL against a table.
+
+        Bumping the DDL version invalidates any cached schema comparison for the table.
+
+        Args:
+            table_name: Name of the table
+            tracked_only: Skip the write for tables whose DDL version is not tracked
+
+        Returns:
+            The new DDL version (0 if the table is not tracked and tracked_only is set)
+        """
+        conn = self._get_connection()
+        result = conn.execute(
+            "SELECT ddl_version FROM tee_ddl_versions WHERE table_name = ?", [table_name]
+        ).fetchone()
+        if result is None and tracked_only:
+            return 0
+        version = (result[0] if result else 0) + 1
+        conn.execute(
+            "INSERT OR REPLACE INTO tee_ddl_versions (table_name, ddl_version, updated_at) "
+            "VALUES (?, ?, ?)",
+            [table_name, version, datetime.now(UTC).isoformat()],
+        )
+        conn.commit()
+        logger.debug(f"Recorded DDL for {table_name} (version {version})")
+        return version
+
+    def get_schema_cache(self, table_name: str) -> SchemaCacheEntry | None:
+        """Get the cached schema comparison for a table."""
+        conn = self._get_connection()
+        query = "SELECT * FROM tee_schema_cache WHERE table_name = ?"
+        result = conn.execute(query, [table_name]).fetchone()
+        if result is None:
+            return None
+
+        return SchemaCacheEntry(
+            table_name=result[0],
+            sql_hash=result[1],
+            ddl_version=result[2],
+            query_schema=json.loads(result[3]) if result[3] else [],
+            table_schema=json.loads(result[4]) if result[4] else [],
+            updated_at=result[5],
+        )
+
+    def save_schema_cache(
+        self,
+        table_name: str,
+        sql_hash: str,
+        ddl_version: int,
+        query_schema: list[dict[str, Any]],
+        table_schema: list[dict[str, Any]],
+    ) -> None:
+        """Save or update the cached schema comparison for a table."""
+        conn = self._get_connection()
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO tee_schema_cache
+            (table_name, sql_hash, ddl_version, query_schema, table_schema, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                table_name,
+                sql_hash,
+                ddl_version,
+                json.dumps(query_schema, default=str),
+                json.dumps(table_schema, default=str),
+                datetime.now(UTC).isoformat(),
+            ],
+        )
+        conn.commit()
+        logger.debug(f"Cached schema comparison for {table_name}")
+
+    def get_definition_hash(self, object_type: str, object_name: str) -> str | None:
+        """Get the definition hash of the last DDL tee issued for an object."""
+        conn = self._get_connection()
+        query = (
+            "SELECT definition_hash FROM tee_ddl_ledger WHERE object_type = ? AND object_name = ?"
+        )
+        result = conn.execute(query, [object_type, object_name]).fetchone()
+        return result[0] if result else None
+
+    def save_definition_hash(
+        self, object_type: str, object_name: str, definition_hash: str
+    ) -> None:
+        """Record the definition hash of DDL tee issued for an object."""
+        conn = self._get_connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO tee_ddl_ledger "
+            "(object_type, object_name, definition_hash, updated_at) VALUES (?, ?, ?, ?)",
+            [object_type, object_name, definition_hash, datetime.now(UTC).isoformat()],
+        )
+        conn.commit()
+
+    def delete_definition_hash(self, object_type: str, object_name: str) -> None:
+        """Forget the recorded definition of an object."""
+        conn = self._get_connection()
+        conn.execute(
+            "DELETE FROM tee_ddl_ledger WHERE object_type = ? AND object_name = ?",
+            [object_type, object_name],
+        )
+        conn.commit()
+
+    def get_test_result(
+        self, table_name: str, definition_hash: str
+    ) -> TestResultCacheEntry | None:
+        """Get the last recorded pass of a model test."""
+        conn = self._get_connection()
+        query = "SELECT * FROM tee_test_results WHERE table_name = ? AND definition_hash = ?"
+        result = conn.execute(query, [table_name, definition_hash]).fetchone()
+        if result is None:
+            return None
+
+        return TestResultCacheEntry(
+            table_name=result[0],
+            definition_hash=result[1],
+            fingerprint=result[2],
+            rows_returned=result[3],
+            mode=result[4],
+            updated_at=result[5],
+        )
+
+    def save_test_result(
+        self,
+        table_name: str,
+        definition_hash: str,
+        fingerprint: str,
+        rows_returned: int | None,
+        mode: str,
+    ) -> None:
+        """Record a pass of a model test."""
+        conn = self._get_connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO tee_test_results "
+            "(table_name, definition_hash, fingerprint, rows_returned, mode, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                table_name,
+                definition_hash,
+                fingerprint,
+                rows_returned,
+                mode,
+                datetime.now(UTC).isoformat(),
+            ],
+        )
+        conn.commit()
+
+    def delete_test_result(self, table_name: str, definition_hash: str) -> None:
+        """Forget the recorded pass of a model test."""
+        conn = self._get_connection()
+        conn.execute(
+            "DELETE FROM tee_test_results WHERE table_name = ? AND definition_hash = ?",
+            [table_name, definition_hash],
+        )
+        conn.commit()
+
+    def save_node_runtimes(
+        self, run_id: str, command: str | None, runtimes: list[tuple[str, float, str]]
+    ) -> None:
+        """
+        Record how long the nodes of a run took, keeping the latest durations of each node.
+
+        Args:
+            run_id: Identifier of the run
+            command: Command of the run (e.g. "run", "build")
+            runtimes: (node name, duration in seconds, status) of each executed node
+        """
+        conn = self._get_connection()
+        recorded_at = datetime.now(UTC).isoformat()
+        conn.executemany(
+            "INSERT INTO tee_node_runtimes "
+            "(node_name, run_id, command, duration_seconds, status, recorded_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                [node_name, run_id, command, duration, status, recorded_at]
+                for node_name, duration, status in runtimes
+            ],
+        )
+        conn.execute(
+            """
+            DELETE FROM tee_node_runtimes
+            WHERE (node_name, run_id) IN (
+                SELECT node_name, run_id
+                FROM tee_node_runtimes
+                QUALIFY ROW_NUMBER() OVER (
+                    PARTITION BY node_name ORDER BY recorded_at DESC, run_id
+                ) > ?
+            )
+            """,
+            [RUNTIME_HISTORY_LIMIT],
+        )
+        conn.commit()
+        logger.debug(f"Recorded runtimes of {len(runtimes)} node(s) for run {run_id}")
+
+    def get_node_runtime_estimates(
+        self, window: int = RUNTIME_ESTIMATE_WINDOW
+    ) -> dict[str, float]:
+        """
+        Estimate the duration of every node with runtime history.
+
+        Args:
+            window: Number of most recent durations of a node to take the median of
+
+        Returns:
+            Dict mapping node name -> estimated duration in seconds
+        """
+        conn = self._get_connection()
+        query = """
+            SELECT node_name, MEDIAN(duration_seconds)
+            FROM (
+                SELECT node_name, duration_seconds
+                FROM tee_node_runtimes
+                QUALIFY ROW_NUMBER() OVER (
+                    PARTITION BY node_name ORDER BY recorded_at DESC, run_id
+                ) <= ?
+            )
+            GROUP BY node_name
+        """
+        return {row[0]: row[1] for row in conn.execute(query, [window]).fetchall()}
+
     def get_all_models(self) -> list[ModelState]:
         """Get all model states."""
         conn = self._get_connection()
@@ -295,6 +641,7 @@ class StateManager:
                 updated_at=row[6],
                 last_processed_value=row[7],
                 strategy=row[8],
+                previous_processed_value=row[9],
             )
             for row in results
         ]
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any
 from tee.compiler import CompilationError, compile_project
 from tee.engine import ModelExecutor
 from tee.executor_helpers import build_helpers, shared_helpers
+from tee.instrumentation import span
 from tee.parser import ProjectParser
 from tee.parser.shared.exceptions import ParserError
 
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
 SECTION_SEPARATOR = "=" * 50
 
 
+@shared_helpers.recorded_run("run")
 def execute_models(
     project_folder: str,
     connection_config: dict[str, Any] | AdapterConfig,
@@ -28,12 +30,16 @@ def execute_models(
     select_patterns: list[str] | None = None,
     exclude_patterns: list[str] | None = None,
     project_config: dict[str, Any] | None = None,
+    defer_state: str | None = None,
+    defer_database: str | None = None,
+    estimate: bool = False,
+    force_ddl: bool = False,
 ) -> dict[str, Any]:
     """
     Execute SQL models by compiling to OTS modules and running them in dependency order.
 
     This function handles the complete workflow:
-    1. Compile project to OTS modules (if needed)
+    1. Compile project to OTS modules (only the selection's closure with --select)
     2. Load OTS modules from output/ots_modules/
     3. Build dependency graph and determine execution order
     4. Execute models using the execution engine
@@ -49,24 +55,47 @@ def execute_models(
         select_patterns: Optional list of patterns to select models
         exclude_patterns: Optional list of patterns to exclude models
         project_config: Optional project configuration
+        defer_state: Optional production project/output folder; unselected upstream models
+            unchanged relative to its compiled modules are read from production
+        defer_database: Production database holding the deferred relations (defaults to
+            the target database recorded in the production modules)
+        estimate: Dry-run the models and report the bytes they would scan instead of
+            executing them (BigQuery only)
+        force_ddl: Reissue view and function DDL even if the DDL ledger has it unchanged
 
     Returns:
-        Dictionary containing execution results and analysis info
+        Dictionary containing execution results and analysis info (estimation results
+        under "estimate" with estimate=True)
     """
     logger = logging.getLogger(__name__)
 
+    # Load the production manifest up front, so a bad --state fails before compiling
+    production_manifest = None
+    if defer_state:
+        from tee.engine.defer import load_production_manifest
+
+        production_manifest = load_production_manifest(defer_state, defer_database)
+
     # Step 0: Compile project to OTS modules first
     print(f"\n{SECTION_SEPARATOR}")
     print("t4t: COMPILING PROJECT TO OTS MODULES")
     print(SECTION_SEPARATOR)
     try:
-        compile_results = compile_project(
-            project_folder=project_folder,
-            connection_config=connection_config,
-            variables=variables,
-            project_config=project_config,
-        )
-        print(f"✅ Compilation complete: {compile_results['ots_modules_count']} OTS module(s)")
+        with span("compile"):
+            compile_results = compile_project(
+                project_folder=project_folder,
+                connection_config=connection_config,
+                variables=variables,
+                project_config=project_config,
+                select_patterns=select_patterns,
+            )
+        if compile_results.get("lazy"):
+            print(
+                f"✅ Compilation complete: {len(compile_results['parsed_models'])} model(s) "
+                "needed by the selection"
+            )
+        else:
+            print(f"✅ Compilation complete: {compile_results['ots_modules_count']} OTS module(s)")
 
         # Extract and validate graph and execution order from compile results
         graph, execution_order, parsed_models = shared_helpers.validate_compile_results(compile_results)
@@ -99,7 +128,11 @@ def execute_models(
     if select_patterns or exclude_patterns:
         from .cli.selection import ModelSelector
 
-        selector = ModelSelector(select_patterns=select_patterns, exclude_patterns=exclude_patterns)
+        selector = ModelSelector(
+            select_patterns=select_patterns,
+            exclude_patterns=exclude_patterns,
+            column_lineage=graph.get("column_lineage"),
+        )
         original_count = len(parsed_models)
         filtered_parsed_models, filtered_execution_order = selector.filter_models(
             parsed_models, execution_order
@@ -115,24 +148,50 @@ def execute_models(
                 graph, warnings=["No models matched the selection criteria"]
             )
 
-    # Step 3: Execute models
-    print(f"\n{SECTION_SEPARATOR}")
-    print("EXECUTING SQL MODELS")
-    print(SECTION_SEPARATOR)
+    defer_results = None
+    if production_manifest:
+        from tee.engine.defer import defer_to_production
 
-    model_executor = ModelExecutor(project_folder, connection_config)
+        defer_results = defer_to_production(
+            parsed_models,
+            filtered_execution_order if filtered_execution_order is not None else execution_order,
+            production_manifest,
+        )
+        _print_defer_results(defer_results, production_manifest.database)
 
-    try:
-        # Execute models using the executor (pass filtered models if selection was applied)
-        results = model_executor.execute_models(
+    model_executor = ModelExecutor(project_folder, connection_config, force_ddl=force_ddl)
+
+    if estimate:
+        print(f"\n{SECTION_SEPARATOR}")
+        print("ESTIMATING BYTES SCANNED")
+        print(SECTION_SEPARATOR)
+        estimate_results = model_executor.estimate_models(
             parser,
             variables,
             parsed_models=filtered_parsed_models,
             execution_order=filtered_execution_order,
         )
+        _print_estimate_results(estimate_results)
+        return {"estimate": estimate_results}
+
+    # Step 3: Execute models
+    print(f"\n{SECTION_SEPARATOR}")
+    print("EXECUTING SQL MODELS")
+    print(SECTION_SEPARATOR)
+
+    try:
+        # Execute models using the executor (pass filtered models if selection was applied)
+        with span("execute"):
+            results = model_executor.execute_models(
+                parser,
+                variables,
+                parsed_models=filtered_parsed_models,
+                execution_order=filtered_execution_order,
+            )
 
         # Step 4: Save analysis files if requested (after execution to include qualified SQL)
-        if save_analysis:
+        # A lazy compile only parsed part of the project, so its analysis would be incomplete
+        if save_analysis and not compile_results.get("lazy"):
             parser.save_to_json()
             print("Analysis files saved to output folder")
 
@@ -183,6 +242,8 @@ def execute_models(
             "execution_order": final_order,
             "dependency_graph": graph,
         }
+        if defer_results is not None:
+            results["deferred_models"] = defer_results["deferred"]
 
         return results
 
@@ -191,6 +252,38 @@ def execute_models(
         raise
 
 
+def _print_defer_results(defer_results: dict[str, Any], database: str | None) -> None:
+    """Print the upstream models deferred to production and those that could not be."""
+    deferred = defer_results["deferred"]
+    if deferred:
+        print(f"\nDeferred {len(deferred)} upstream model(s) to production database {database}:")
+        for model_name, relation in sorted(deferred.items()):
+            print(f"  - {model_name} -> {relation}")
+    else:
+        print("\nNo upstream models deferred to production")
+    for model_name in defer_results["modified"]:
+        print(f"⚠️  {model_name} changed since the production run, read from this database")
+
+
+def _print_estimate_results(estimate_results: dict[str, Any]) -> None:
+    """Print the bytes each model would scan and the total of the run."""
+    from tee.engine.estimate import format_bytes
+
+    estimates = estimate_results["estimates"]
+    if estimates:
+        print("\nEstimated bytes scanned:")
+        for model_name, estimate in estimates.items():
+            note = " (view, scanned when queried)" if estimate["materialization"] == "view" else ""
+            print(f"  - {model_name}: {format_bytes(estimate['bytes'])}{note}")
+    for failure in estimate_results["failed"]:
+        print(f"  ❌ {failure['model']}: {failure['error']}")
+    print(
+        f"\nTotal estimated bytes scanned: {format_bytes(estimate_results['total_bytes'])} "
+        f"({len(estimates)} model(s) estimated)"
+    )
+
+
+@shared_helpers.recorded_run("build")
 def build_models(
     project_folder: str,
     connection_config: dict[str, Any] | AdapterConfig,
@@ -199,6 +292,11 @@ def build_models(
     select_patterns: list[str] | None = None,
     exclude_patterns: list[str] | None = None,
     project_config: dict[str, Any] | None = None,
+    full_tests: bool = False,
+    test_cache: bool = False,
+    force_ddl: bool = False,
+    defer_state: str | None = None,
+    defer_database: str | None = None,
 ) -> dict[str, Any]:
     """
     Build models with interleaved test execution, stopping on test failures.
@@ -219,6 +317,15 @@ def build_models(
         select_patterns: Optional list of patterns to select models
         exclude_patterns: Optional list of patterns to exclude models
         project_config: Optional project configuration
+        full_tests: Test incremental models over the whole table instead of their
+            last batch, and every test exactly (without sampling or approximation)
+        test_cache: Record test passes, and reuse the passes of tests on relations
+            unchanged since an earlier run
+        force_ddl: Reissue view and function DDL even if the DDL ledger has it unchanged
+        defer_state: Optional production project/output folder; unselected upstream models
+            unchanged relative to its compiled modules are read from production
+        defer_database: Production database holding the deferred relations (defaults to
+            the target database recorded in the production modules)
 
     Returns:
         Dictionary containing execution results and analysis info
@@ -228,6 +335,13 @@ def build_models(
     """
     logger = logging.getLogger(__name__)
 
+    # Load the production manifest up front, so a bad --state fails before compiling
+    production_manifest = None
+    if defer_state:
+        from tee.engine.defer import load_production_manifest
+
+        production_manifest = load_production_manifest(defer_state, defer_database)
+
     print(f"\n{SECTION_SEPARATOR}")
     print("t4t: BUILDING MODELS WITH TESTS")
     print(SECTION_SEPARATOR)
@@ -237,13 +351,21 @@ def build_models(
     print("t4t: COMPILING PROJECT TO OTS MODULES")
     print(SECTION_SEPARATOR)
     try:
-        compile_results = compile_project(
-            project_folder=project_folder,
-            connection_config=connection_config,
-            variables=variables,
-            project_config=project_config,
-        )
-        print(f"✅ Compilation complete: {compile_results['ots_modules_count']} OTS module(s)")
+        with span("compile"):
+            compile_results = compile_project(
+                project_folder=project_folder,
+                connection_config=connection_config,
+                variables=variables,
+                project_config=project_config,
+                select_patterns=select_patterns,
+            )
+        if compile_results.get("lazy"):
+            print(
+                f"✅ Compilation complete: {len(compile_results['parsed_models'])} model(s) "
+                "needed by the selection"
+            )
+        else:
+            print(f"✅ Compilation complete: {compile_results['ots_modules_count']} OTS module(s)")
 
         # Extract and validate graph and execution order from compile results
         graph, execution_order, parsed_models = shared_helpers.validate_compile_results(compile_results)
@@ -256,6 +378,7 @@ def build_models(
         raise CompilationError(f"Compilation failed: {e}") from e
 
     # Step 2: Set up build context using compile results
+    all_parsed_models = parsed_models
     parser, parsed_models, graph, execution_order = build_helpers.setup_build_context_from_compile(
         project_folder,
         connection_config,
@@ -268,6 +391,13 @@ def build_models(
         execution_order,
     )
 
+    defer_results = None
+    if production_manifest:
+        from tee.engine.defer import defer_to_production
+
+        defer_results = defer_to_production(all_parsed_models, execution_order, production_manifest)
+        _print_defer_results(defer_results, production_manifest.database)
+
     # Load seeds even if there are no models (seeds should load regardless)
     from tee.engine.execution_engine import ExecutionEngine
     from tee.engine import ModelExecutor
@@ -311,7 +441,14 @@ def build_models(
 
     try:
         model_executor, test_executor = build_helpers.initialize_build_executors(
-            project_folder, connection_config, variables, load_seeds=False
+            project_folder,
+            connection_config,
+            variables,
+            load_seeds=False,
+            full_tests=full_tests,
+            test_config=(project_config or {}).get("tests"),
+            test_cache=test_cache,
+            force_ddl=force_ddl,
         )
 
         # Evaluate Python models before execution
@@ -339,8 +476,8 @@ def build_models(
             all_test_results,
         )
 
-        # Step 4: Save analysis files if requested
-        if save_analysis:
+        # Step 4: Save analysis files if requested (skipped after a lazy compile)
+        if save_analysis and not compile_results.get("lazy"):
             parser.save_to_json()
             print("\nAnalysis files saved to output folder")
 
@@ -349,6 +486,8 @@ def build_models(
             execution_order, failed_models, skipped_models, all_test_results, parsed_models, graph, parsed_functions, function_results, seed_results
         )
         build_helpers.print_build_summary(results, failed_models, skipped_models)
+        if defer_results is not None:
+            results["deferred_models"] = defer_results["deferred"]
 
         return results
 
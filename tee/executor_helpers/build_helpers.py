@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any
 from tee.engine import ModelExecutor
 from tee.engine.seeds import SeedDiscovery, SeedLoader
 from tee.parser import ProjectParser
+from tee.parser.shared.model_utils import is_ephemeral_model
 from tee.testing import TestExecutor, TestSeverity
 
 if TYPE_CHECKING:
@@ -46,7 +47,11 @@ def setup_build_context_from_compile(
     if select_patterns or exclude_patterns:
         from tee.cli.selection import ModelSelector
 
-        selector = ModelSelector(select_patterns=select_patterns, exclude_patterns=exclude_patterns)
+        selector = ModelSelector(
+            select_patterns=select_patterns,
+            exclude_patterns=exclude_patterns,
+            column_lineage=graph.get("column_lineage"),
+        )
         filtered_parsed_models, filtered_execution_order = selector.filter_models(
             parsed_models, execution_order
         )
@@ -61,6 +66,10 @@ def initialize_build_executors(
     connection_config: dict[str, Any] | AdapterConfig,
     variables: dict[str, Any] | None,
     load_seeds: bool = True,
+    full_tests: bool = False,
+    test_config: dict[str, Any] | None = None,
+    test_cache: bool = False,
+    force_ddl: bool = False,
 ) -> tuple[ModelExecutor, TestExecutor]:
     """
     Initialize model and test executors and connect to database.
@@ -70,16 +79,24 @@ def initialize_build_executors(
         connection_config: Database connection configuration
         variables: Optional variables for SQL substitution
         load_seeds: Whether to load seeds (default: True). Set to False if seeds were already loaded.
+        full_tests: Test incremental models over the whole table instead of their last batch,
+            and every test exactly
+        test_config: Optional [tests] section of the project configuration
+        test_cache: Record test passes and reuse those on unchanged relations
+        force_ddl: Reissue view and function DDL even if the DDL ledger has it unchanged
 
     Returns:
         Tuple of (model_executor, test_executor)
     """
-    model_executor = ModelExecutor(project_folder, connection_config)
+    model_executor = ModelExecutor(project_folder, connection_config, force_ddl=force_ddl)
 
     from tee.engine.execution_engine import ExecutionEngine
 
     model_executor.execution_engine = ExecutionEngine(
-        model_executor.config, project_folder=project_folder, variables=variables
+        model_executor.config,
+        project_folder=project_folder,
+        variables=variables,
+        force_ddl=force_ddl,
     )
 
     model_executor.execution_engine.connect()
@@ -89,7 +106,12 @@ def initialize_build_executors(
         _load_seeds_for_build(model_executor, project_folder)
 
     test_executor = TestExecutor(
-        model_executor.execution_engine.adapter, project_folder=project_folder
+        model_executor.execution_engine.adapter,
+        project_folder=project_folder,
+        state_manager=model_executor.execution_engine.state_checker.state_manager,
+        full_tests=full_tests,
+        test_config=test_config,
+        test_cache=test_cache,
     )
 
     return model_executor, test_executor
@@ -463,6 +485,10 @@ def execute_models_with_tests(
                     skipped_models.add(node_name)
             continue
 
+        if node_name in parsed_models and is_ephemeral_model(parsed_models[node_name]):
+            print(f"\n📦 Skipping ephemeral model: {node_name} (inlined into dependents)")
+            continue
+
         try:
             # Execute the model
             model_results = execute_single_model(
@@ -5,9 +5,18 @@ This module contains helper functions used by both execute_models and build_mode
 to avoid code duplication.
 """
 
+import functools
+import inspect
 import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Any
 
+from tee import instrumentation
+from tee.ast_registry import ast_registry_scope
+from tee.engine.runtime_history import record_node_runtimes
+
 logger = logging.getLogger(__name__)
 
 
@@ -109,3 +118,70 @@ def create_empty_build_results(graph: dict[str, Any]) -> dict[str, Any]:
         },
     }
 
+
+@contextmanager
+def record_run(
+    command: str, project_folder: str, project_config: dict[str, Any] | None = None
+) -> Iterator[instrumentation.RunRecorder]:
+    """
+    Record spans for a run and write its artifacts to the project output folder.
+
+    output/run_results.json is always written; a Chrome trace (output/run_trace.json)
+    is written as well when `chrome_trace = true` is set under [flags] in project.toml.
+    The durations of the executed nodes are added to the runtime history in the state
+    database.
+
+    Args:
+        command: Name of the command being recorded (e.g. "run", "build")
+        project_folder: Path to the project folder
+        project_config: Optional project configuration
+
+    Yields:
+        The active RunRecorder
+    """
+    recorder = instrumentation.start_run(command)
+    try:
+        # Parse each SQL statement of the run once, whichever stages need it
+        with ast_registry_scope():
+            yield recorder
+    finally:
+        instrumentation.end_run()
+        output_folder = Path(project_folder) / "output"
+        flags = (project_config or {}).get("flags", {}) or {}
+        try:
+            instrumentation.write_run_results(recorder, output_folder)
+            if flags.get("chrome_trace"):
+                trace_path = instrumentation.write_chrome_trace(recorder, output_folder)
+                print(f"Chrome trace written to {trace_path}")
+        except Exception as e:
+            logger.warning(f"Could not write run artifacts to {output_folder}: {e}")
+        try:
+            record_node_runtimes(recorder, project_folder)
+        except Exception as e:
+            logger.warning(f"Could not record node runtimes: {e}")
+
+
+def recorded_run(command: str) -> Callable:
+    """
+    Decorate an executor entry point so each call is recorded with record_run().
+
+    The decorated function must accept `project_folder` and `project_config` arguments.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            with record_run(
+                command,
+                bound.arguments["project_folder"],
+                bound.arguments.get("project_config"),
+            ):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
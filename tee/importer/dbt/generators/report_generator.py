@@ -232,6 +232,31 @@ class ReportGenerator:
                 lines.append(f"- **{file}**: {err_msg}")
             lines.append("")
 
+        # Dry run errors and models the dry run could not verify
+        dry_run_errors = validation_result.get("dry_run_errors", [])
+        if dry_run_errors:
+            lines.append("### Dry Run Errors")
+            lines.append("")
+            for error in dry_run_errors:
+                file = error.get("file", "unknown")
+                err_msg = error.get("error", "Unknown error")
+                lines.append(f"- **{file}**: {err_msg}")
+            lines.append("")
+
+        dry_run_warnings = [
+            warning
+            for warning in validation_result.get("warnings", [])
+            if warning.get("type") == "dry_run"
+        ]
+        if dry_run_warnings:
+            lines.append("### Dry Run Warnings")
+            lines.append("")
+            for warning in dry_run_warnings:
+                file = warning.get("file", "unknown")
+                err_msg = warning.get("error", "Unknown error")
+                lines.append(f"- **{file}**: {err_msg}")
+            lines.append("")
+
         # Execution errors
         exec_errors = validation_result.get("execution_errors", [])
         if exec_errors:
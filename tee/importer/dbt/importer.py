@@ -105,6 +105,7 @@ def import_dbt_project(
     source_files = model_discovery.discover_source_files()
     source_parser = SourceParser(verbose=verbose)
     source_map = source_parser.parse_all_source_files(source_files)
+    source_columns = source_parser.parse_source_columns(source_files)
 
     # Get profile schema for schema resolution (needed before model conversion)
     profile_schema = None
@@ -301,6 +302,8 @@ def import_dbt_project(
             target_path=validation_target,
             model_name_map=model_converter.model_name_map if model_files else {},
             verbose=verbose,
+            dialect=target_dialect,
+            source_columns=source_columns,
         )
 
         # Get connection config for execution validation if needed
@@ -458,6 +461,10 @@ def import_dbt_project(
                         logger.warning(
                             f"  Metadata: {error.get('file', 'unknown')} - {error.get('error', 'unknown')}"
                         )
+                    for error in validation_result.dry_run_errors:
+                        logger.warning(
+                            f"  Dry run: {error.get('file', 'unknown')} - {error.get('error', 'unknown')}"
+                        )
 
         # Clean up temporary directory
         if dry_run and validation_target.exists():
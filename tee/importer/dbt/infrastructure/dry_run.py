@@ -0,0 +1,350 @@
+"""
+Zero-row dry run of imported dbt models.
+
+Broken SQL in a converted model would otherwise only show up at the first warehouse
+run. The dry run binds every converted SQL model in a local, in-memory DuckDB instead:
+each source and seed the models read gets an empty shadow table, and each model is
+created as a view over them in topological order. Creating a view makes DuckDB resolve
+every table, column and function of the query without reading any data, so a project
+is checked in seconds without touching the warehouse.
+
+The models of one level of the DAG don't depend on each other and are bound in
+parallel. A model whose upstream model failed is skipped.
+
+Shadow tables are exact when their columns are known: seeds (described from their
+files) and sources with columns declared in schema.yml. Relations without declared
+columns (and Python models, which are not run) are shadowed with the columns the
+models reference, typed VARCHAR. A model that fails over such a guessed relation is
+reported as a warning rather than an error, since the guess may be what failed.
+
+Models written in another dialect are transpiled to DuckDB first, which is lossy for
+dialect-specific syntax and functions (e.g. Snowflake's LATERAL FLATTEN or BigQuery's
+SAFE. prefix). For them, only errors binding a missing relation or column are errors;
+parser errors and unknown functions are reported as warnings.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import duckdb
+from sqlglot import exp
+from sqlglot.optimizer.qualify import qualify
+from sqlglot.optimizer.scope import Scope, traverse_scope
+
+logger = logging.getLogger(__name__)
+
+# Dialect the dry run binds the models in
+DRY_RUN_DIALECT = "duckdb"
+
+# Column of shadow tables none of whose columns are referenced by name
+PLACEHOLDER_COLUMN = "__t4t_placeholder"
+
+# DuckDB error messages of a missing relation or column, which break a model in any dialect
+BINDING_ERROR_MARKERS = (
+    "Table with name",
+    "Referenced table",
+    "Referenced column",
+    "does not have a column named",
+)
+
+
+@dataclass
+class DryRunModel:
+    """A converted SQL model to dry-run."""
+
+    name: str
+    file: str
+    expression: exp.Expression
+
+
+@dataclass
+class ShadowRelation:
+    """An empty table standing in for a source or seed."""
+
+    name: str
+    columns: list[dict[str, str]]
+    exact: bool = True
+
+
+@dataclass
+class DryRunResult:
+    """Outcome of a dry run."""
+
+    verified: list[str] = field(default_factory=list)
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    warnings: list[dict[str, Any]] = field(default_factory=list)
+
+
+def dry_run_models(
+    models: list[DryRunModel],
+    relations: dict[str, ShadowRelation] | None = None,
+    dialect: str | None = None,
+    max_workers: int | None = None,
+) -> DryRunResult:
+    """
+    Bind converted models against zero-row shadow relations in an in-memory DuckDB.
+
+    Args:
+        models: Converted SQL models, parsed in their source dialect
+        relations: Sources and seeds with known columns, keyed by schema.table name;
+            any other relation the models read is shadowed with the columns they reference
+        dialect: Dialect the models and declared column types are written in
+        max_workers: Maximum number of models bound at the same time
+
+    Returns:
+        DryRunResult with the verified models, the errors of models that failed over
+        exact relations and warnings for the others (and, for models written in another
+        dialect than DuckDB, for failures other than missing relations or columns)
+    """
+    result = DryRunResult()
+    transpiled = dialect is not None and dialect != DRY_RUN_DIALECT
+    by_name = {model.name: model for model in models}
+    relations = dict(relations or {})
+
+    dependencies: dict[str, set[str]] = {}
+    for model in models:
+        references = _referenced_relations(model.expression)
+        dependencies[model.name] = {_match(reference, by_name) for reference in references} - {
+            model.name
+        }
+
+    reads = _referenced_columns(models, by_name)
+    for model in models:
+        for name in dependencies[model.name]:
+            if name in by_name or name in relations:
+                continue
+            columns = sorted(reads.get(name, set())) or [PLACEHOLDER_COLUMN]
+            relations[name] = ShadowRelation(
+                name, [{"name": column, "type": "VARCHAR"} for column in columns], exact=False
+            )
+
+    conn = duckdb.connect()
+    pool = ThreadPoolExecutor(max_workers=max_workers or min(32, (os.cpu_count() or 1) + 4))
+    try:
+        for relation in relations.values():
+            _create_shadow(conn, relation, dialect)
+        for name in by_name:
+            _create_schema(conn, name)
+
+        levels, cyclic = _levels(dependencies, by_name)
+        for name in cyclic:
+            result.errors.append(
+                _failure(by_name[name], "Model is part of, or depends on, a cycle", "dry_run")
+            )
+
+        exact: dict[str, bool] = {}
+        for level in levels:
+            runnable = []
+            for name in level:
+                upstream = dependencies[name]
+                failed = sorted(dep for dep in upstream if dep in by_name and dep not in exact)
+                if failed:
+                    result.warnings.append(
+                        _failure(
+                            by_name[name],
+                            f"Not verified, upstream model(s) failed: {', '.join(failed)}",
+                            "dry_run",
+                        )
+                    )
+                    continue
+                runnable.append(name)
+
+            errors = list(pool.map(lambda name: _create_view(conn, by_name[name]), runnable))
+
+            for name, error in zip(runnable, errors, strict=True):
+                inputs_exact = all(
+                    exact[dep] if dep in by_name else relations[dep].exact
+                    for dep in dependencies[name]
+                )
+                if error is None:
+                    exact[name] = inputs_exact
+                    result.verified.append(name)
+                elif not inputs_exact:
+                    result.warnings.append(
+                        _failure(
+                            by_name[name],
+                            f"{error} (reads relations without declared columns)",
+                            "dry_run",
+                        )
+                    )
+                elif transpiled and not _is_binding_error(error):
+                    result.warnings.append(
+                        _failure(
+                            by_name[name],
+                            f"{error} (may not transpile from {dialect} to DuckDB)",
+                            "dry_run",
+                        )
+                    )
+                else:
+                    result.errors.append(_failure(by_name[name], error, "dry_run"))
+    finally:
+        pool.shutdown()
+        conn.close()
+
+    logger.debug(
+        f"Dry run verified {len(result.verified)} of {len(models)} model(s): "
+        f"{len(result.errors)} error(s), {len(result.warnings)} warning(s)"
+    )
+    return result
+
+
+def _failure(model: DryRunModel, error: str, error_type: str) -> dict[str, Any]:
+    """Describe a model that could not be verified."""
+    return {"file": model.file, "model": model.name, "error": error, "type": error_type}
+
+
+def _relation_sql(name: str) -> str:
+    """Render a relation name as a quoted DuckDB table reference."""
+    parts = name.split(".")
+    table = exp.table_(parts[-1], db=parts[-2] if len(parts) > 1 else None, quoted=True)
+    return table.sql(dialect=DRY_RUN_DIALECT)
+
+
+def _create_schema(conn: duckdb.DuckDBPyConnection, name: str) -> None:
+    """Create the schema of a relation, if it has one."""
+    if "." in name:
+        schema = exp.to_identifier(name.split(".")[-2], quoted=True).sql(DRY_RUN_DIALECT)
+        conn.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
+
+
+def _create_shadow(
+    conn: duckdb.DuckDBPyConnection, relation: ShadowRelation, dialect: str | None
+) -> None:
+    """Create the empty table standing in for a source or seed."""
+    _create_schema(conn, relation.name)
+    columns = []
+    for column in relation.columns:
+        name = exp.to_identifier(column["name"], quoted=True).sql(DRY_RUN_DIALECT)
+        columns.append(f"{name} {_duckdb_type(column.get('type'), dialect)}")
+    conn.execute(f"CREATE TABLE {_relation_sql(relation.name)} ({', '.join(columns)})")
+
+
+def _duckdb_type(data_type: str | None, dialect: str | None) -> str:
+    """Render a declared column type in DuckDB, falling back to VARCHAR."""
+    if not data_type:
+        return "VARCHAR"
+    try:
+        return exp.DataType.build(data_type, dialect=dialect).sql(dialect=DRY_RUN_DIALECT)
+    except Exception:
+        return "VARCHAR"
+
+
+def _create_view(conn: duckdb.DuckDBPyConnection, model: DryRunModel) -> str | None:
+    """Create a model as a view over its shadow inputs; return the error, if any."""
+    cursor = conn.cursor()
+    try:
+        query = _without_variables(model.expression).sql(dialect=DRY_RUN_DIALECT)
+        cursor.execute(f"CREATE VIEW {_relation_sql(model.name)} AS {query}")
+        return None
+    except Exception as e:
+        # DuckDB appends the query and a caret to the message; the first line says it all
+        return str(e).strip().splitlines()[0]
+    finally:
+        cursor.close()
+
+
+def _is_binding_error(error: str) -> bool:
+    """Whether a dry run error is a missing relation or column rather than a dialect gap."""
+    return any(marker in error for marker in BINDING_ERROR_MARKERS)
+
+
+def _without_variables(expression: exp.Expression) -> exp.Expression:
+    """Replace t4t variables (@name) with NULL, since they have no value in a dry run."""
+
+    def transform(node: exp.Expression) -> exp.Expression:
+        if isinstance(node, (exp.Parameter, exp.Placeholder)):
+            return exp.Null()
+        return node
+
+    return expression.transform(transform)
+
+
+def _referenced_relations(expression: exp.Expression) -> list[str]:
+    """Names of the physical relations a query reads."""
+    cte_names = {cte.alias_or_name.lower() for cte in expression.find_all(exp.CTE)}
+    found = []
+    for table in expression.find_all(exp.Table):
+        if not table.name or (not table.db and table.name.lower() in cte_names):
+            continue
+        name = f"{table.db}.{table.name}" if table.db else table.name
+        if name not in found:
+            found.append(name)
+    return found
+
+
+def _match(reference: str, models: dict[str, DryRunModel]) -> str:
+    """Resolve an unqualified reference to a model with that table name."""
+    if reference in models or "." in reference:
+        return reference
+    matches = [name for name in models if name.split(".")[-1] == reference]
+    return matches[0] if len(matches) == 1 else reference
+
+
+def _referenced_columns(
+    models: list[DryRunModel], by_name: dict[str, DryRunModel]
+) -> dict[str, set[str]]:
+    """Columns the models read from each relation, where sqlglot can attribute them."""
+    reads: dict[str, set[str]] = {}
+    for model in models:
+        try:
+            expression = qualify(
+                model.expression.copy(), validate_qualify_columns=False, quote_identifiers=False
+            )
+        except Exception as e:
+            logger.debug(f"Could not qualify {model.name}: {e}")
+            continue
+        for scope in traverse_scope(expression):
+            for column in scope.columns:
+                if column.name:
+                    _attribute(scope.sources.get(column.table), column.name, by_name, reads)
+    return reads
+
+
+def _attribute(
+    source: Any, column: str, models: dict[str, DryRunModel], reads: dict[str, set[str]]
+) -> None:
+    """Attribute a column read from a source to the relation it comes from."""
+    if isinstance(source, exp.Table):
+        name = f"{source.db}.{source.name}" if source.db else source.name
+        reads.setdefault(_match(name, models), set()).add(column)
+        return
+    if not isinstance(source, Scope) or not isinstance(source.expression, exp.Select):
+        return
+
+    # Follow a column of a CTE or subquery through the star it is selected by
+    for projection in source.expression.selects:
+        if projection.alias_or_name == column:
+            inner = projection.unalias()
+            if isinstance(inner, exp.Column):
+                _attribute(source.sources.get(inner.table), inner.name, models, reads)
+            return
+    for projection in source.expression.selects:
+        if isinstance(projection, exp.Star) and len(source.selected_sources) == 1:
+            inner = next(iter(source.selected_sources.values()))[1]
+            _attribute(inner, column, models, reads)
+        elif isinstance(projection, exp.Column) and isinstance(projection.this, exp.Star):
+            _attribute(source.sources.get(projection.table), column, models, reads)
+
+
+def _levels(
+    dependencies: dict[str, set[str]], models: dict[str, DryRunModel]
+) -> tuple[list[list[str]], list[str]]:
+    """Group models into levels whose models only depend on models of earlier levels."""
+    remaining = {
+        name: {dep for dep in deps if dep in models and dep != name}
+        for name, deps in dependencies.items()
+    }
+    levels = []
+    done: set[str] = set()
+    while remaining:
+        level = sorted(name for name, deps in remaining.items() if deps <= done)
+        if not level:
+            break
+        levels.append(level)
+        done.update(level)
+        for name in level:
+            del remaining[name]
+    return levels, sorted(remaining)
@@ -1,17 +1,23 @@
 """
 Validation system for imported dbt projects.
 
-Validates syntax, dependencies, metadata, and optionally execution.
+Validates syntax, dependencies, metadata, a local zero-row dry run of the models, and
+optionally execution.
 """
 
 import logging
+import re
 from pathlib import Path
 from typing import Any
 
 import sqlglot
+from sqlglot import exp
 
 logger = logging.getLogger(__name__)
 
+# table_name of a model, as written in its metadata file or @model decorator
+_TABLE_NAME_PATTERN = re.compile(r"""["']?table_name["']?\s*[:=]\s*["']([^"']+)["']""")
+
 
 class ValidationResult:
     """Results from validation checks."""
@@ -21,6 +27,7 @@ class ValidationResult:
         self.syntax_errors: list[dict[str, Any]] = []
         self.dependency_errors: list[dict[str, Any]] = []
         self.metadata_errors: list[dict[str, Any]] = []
+        self.dry_run_errors: list[dict[str, Any]] = []
         self.execution_errors: list[dict[str, Any]] = []
         self.warnings: list[dict[str, Any]] = []
 
@@ -31,6 +38,7 @@ class ValidationResult:
             len(self.syntax_errors) == 0
             and len(self.dependency_errors) == 0
             and len(self.metadata_errors) == 0
+            and len(self.dry_run_errors) == 0
             and len(self.execution_errors) == 0
         )
 
@@ -41,6 +49,7 @@ class ValidationResult:
             len(self.syntax_errors)
             + len(self.dependency_errors)
             + len(self.metadata_errors)
+            + len(self.dry_run_errors)
             + len(self.execution_errors)
         )
 
@@ -52,6 +61,7 @@ class ValidationResult:
             "syntax_errors": self.syntax_errors,
             "dependency_errors": self.dependency_errors,
             "metadata_errors": self.metadata_errors,
+            "dry_run_errors": self.dry_run_errors,
             "execution_errors": self.execution_errors,
             "warnings": self.warnings,
         }
@@ -65,6 +75,8 @@ class ProjectValidator:
         target_path: Path,
         model_name_map: dict[str, str],
         verbose: bool = False,
+        dialect: str | None = None,
+        source_columns: dict[str, list[dict[str, Any]]] | None = None,
     ) -> None:
         """
         Initialize project validator.
@@ -73,15 +85,24 @@ class ProjectValidator:
             target_path: Path to the imported t4t project
             model_name_map: Mapping of dbt model names to final table names
             verbose: Enable verbose logging
+            dialect: SQL dialect the models are written in (None auto-detects)
+            source_columns: Columns declared for dbt sources, keyed by schema.table
+                (see SourceParser.parse_source_columns)
         """
         self.target_path = target_path
         self.model_name_map = model_name_map
         self.verbose = verbose
+        self.dialect = dialect
+        self.source_columns = source_columns or {}
+
+        # Models parsed by validate_syntax, reused by the dry run
+        self._parsed: dict[Path, exp.Expression] = {}
 
     def validate_all(
         self,
         validate_execution: bool = False,
         connection_config: dict[str, Any] | None = None,
+        dry_run: bool = True,
     ) -> ValidationResult:
         """
         Run all validation checks.
@@ -89,6 +110,8 @@ class ProjectValidator:
         Args:
             validate_execution: Whether to run execution validation
             connection_config: Database connection config for execution validation
+            dry_run: Whether to bind the models against zero-row shadow relations in a
+                local DuckDB (see validate_dry_run)
 
         Returns:
             ValidationResult with all validation results
@@ -104,6 +127,11 @@ class ProjectValidator:
         # Metadata validation
         result.metadata_errors = self.validate_metadata()
 
+        # Zero-row dry run
+        if dry_run:
+            result.dry_run_errors, dry_run_warnings = self.validate_dry_run()
+            result.warnings.extend(dry_run_warnings)
+
         # Execution validation (optional)
         if validate_execution:
             result.execution_errors = self.validate_execution(connection_config)
@@ -141,7 +169,7 @@ class ProjectValidator:
 
                 # Try to parse with SQLGlot
                 try:
-                    parsed = sqlglot.parse_one(sql_content)
+                    parsed = sqlglot.parse_one(sql_content, read=self.dialect)
                     if parsed is None:
                         errors.append(
                             {
@@ -150,6 +178,8 @@ class ProjectValidator:
                                 "type": "syntax",
                             }
                         )
+                    else:
+                        self._parsed[sql_file] = parsed
                 except Exception as e:
                     errors.append(
                         {
@@ -298,6 +328,88 @@ class ProjectValidator:
 
         return errors
 
+    def validate_dry_run(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Bind every SQL model against zero-row shadow relations in an in-memory DuckDB.
+
+        Seeds are shadowed with the columns DuckDB reads from their files, sources with
+        their declared columns. Models are bound in topological order, each level in
+        parallel, and the warehouse is never queried. Models are parsed once: the ASTs
+        of validate_syntax are reused when it ran first.
+
+        Returns:
+            Tuple of (errors, warnings); failures over relations without declared
+            columns are warnings, since the guessed columns may be what failed
+        """
+        from tee.importer.dbt.infrastructure.dry_run import (
+            DryRunModel,
+            ShadowRelation,
+            dry_run_models,
+        )
+        from tee.parser.analysis.schema_catalog import SchemaCatalog
+
+        models_dir = self.target_path / "models"
+        if not models_dir.exists():
+            return [], []
+
+        models = []
+        for sql_file in sorted(models_dir.rglob("*.sql")):
+            expression = self._parsed.get(sql_file)
+            if expression is None:
+                try:
+                    sql_content = sql_file.read_text(encoding="utf-8")
+                    if not sql_content.strip():
+                        continue
+                    expression = sqlglot.parse_one(sql_content, read=self.dialect)
+                except Exception:
+                    # Reported by validate_syntax
+                    continue
+                if expression is None:
+                    continue
+            models.append(
+                DryRunModel(
+                    name=self._model_table_name(sql_file, models_dir),
+                    file=str(sql_file.relative_to(self.target_path)),
+                    expression=expression,
+                )
+            )
+
+        relations = {}
+        catalog = SchemaCatalog("duckdb")
+        catalog.add_seeds(self.target_path / "seeds", "duckdb")
+        for name, entry in catalog.entries.items():
+            relations[name] = ShadowRelation(name, entry["columns"])
+        for name, columns in self.source_columns.items():
+            if columns:
+                relations[name] = ShadowRelation(
+                    name,
+                    [{"name": col["name"], "type": col.get("type")} for col in columns],
+                    exact=all(col.get("type") for col in columns),
+                )
+
+        result = dry_run_models(models, relations, dialect=self.dialect)
+
+        if self.verbose:
+            logger.info(
+                f"Dry run verified {len(result.verified)} of {len(models)} model(s) "
+                f"against zero-row shadow relations"
+            )
+            if result.errors:
+                logger.warning(f"Found {len(result.errors)} dry run errors")
+
+        return result.errors, result.warnings
+
+    def _model_table_name(self, sql_file: Path, models_dir: Path) -> str:
+        """Name a SQL model after its metadata file, or its schema folder and file name."""
+        metadata_file = sql_file.with_suffix(".py")
+        if metadata_file.exists():
+            match = _TABLE_NAME_PATTERN.search(metadata_file.read_text(encoding="utf-8"))
+            if match:
+                return match.group(1)
+
+        parts = sql_file.relative_to(models_dir).parts
+        return f"{parts[0]}.{sql_file.stem}" if len(parts) >= 2 else sql_file.stem
+
     def validate_execution(
         self, connection_config: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
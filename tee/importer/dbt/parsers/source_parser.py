@@ -100,3 +100,44 @@ class SourceParser:
             logger.info(f"Parsed {len(all_sources)} total sources from {len(source_files)} files")
 
         return all_sources
+
+    def parse_source_columns(self, source_files: list[Path]) -> dict[str, list[dict[str, Any]]]:
+        """
+        Extract the columns declared for source tables.
+
+        Args:
+            source_files: List of source file Path objects
+
+        Returns:
+            Dictionary mapping "schema.table" to its declared columns
+            Format: {"schema.table": [{"name": ..., "type": ... or None}]}
+        """
+        columns: dict[str, list[dict[str, Any]]] = {}
+
+        for source_file in source_files:
+            try:
+                with source_file.open("r", encoding="utf-8") as f:
+                    content = yaml.safe_load(f)
+            except Exception as e:
+                logger.warning(f"Error parsing source file {source_file}: {e}")
+                continue
+
+            if not isinstance(content, dict):
+                continue
+
+            for source_def in content.get("sources") or []:
+                if not isinstance(source_def, dict) or "name" not in source_def:
+                    continue
+                source_schema = source_def.get("schema", source_def["name"])
+                for table_def in source_def.get("tables") or []:
+                    if not isinstance(table_def, dict) or "name" not in table_def:
+                        continue
+                    table_columns = [
+                        {"name": col["name"], "type": col.get("data_type")}
+                        for col in table_def.get("columns") or []
+                        if isinstance(col, dict) and "name" in col
+                    ]
+                    if table_columns:
+                        columns[f"{source_schema}.{table_def['name']}"] = table_columns
+
+        return columns
@@ -0,0 +1,51 @@
+"""
+Run instrumentation for t4t.
+
+Provides a span/timer API used across the parser, compiler, engine and testing,
+and writers for the per-run artifacts (output/run_results.json and an optional
+Chrome trace).
+"""
+
+from .artifacts import (
+    CHROME_TRACE_FILENAME,
+    RUN_RESULTS_FILENAME,
+    build_chrome_trace,
+    build_run_results,
+    write_chrome_trace,
+    write_run_results,
+)
+from .recorder import (
+    CATEGORY_NODE,
+    CATEGORY_PHASE,
+    CATEGORY_RUN,
+    QueryRecord,
+    RunRecorder,
+    Span,
+    end_run,
+    get_recorder,
+    record_query,
+    record_span,
+    span,
+    start_run,
+)
+
+__all__ = [
+    "CATEGORY_NODE",
+    "CATEGORY_PHASE",
+    "CATEGORY_RUN",
+    "CHROME_TRACE_FILENAME",
+    "RUN_RESULTS_FILENAME",
+    "QueryRecord",
+    "RunRecorder",
+    "Span",
+    "build_chrome_trace",
+    "build_run_results",
+    "end_run",
+    "get_recorder",
+    "record_query",
+    "record_span",
+    "span",
+    "start_run",
+    "write_chrome_trace",
+    "write_run_results",
+]
@@ -0,0 +1,184 @@
+"""
+Run artifacts built from recorded spans.
+
+- run_results.json: per-node start/end, per-phase durations, queries and rows/bytes
+- Chrome trace (trace event format): open in chrome://tracing or Perfetto to see the
+  critical path of a run
+"""
+
+import json
+import logging
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from .recorder import CATEGORY_PHASE, RunRecorder
+
+logger = logging.getLogger(__name__)
+
+RUN_RESULTS_FILENAME = "run_results.json"
+CHROME_TRACE_FILENAME = "run_trace.json"
+
+
+def _iso(timestamp: float | None) -> str | None:
+    """Format an epoch timestamp as an ISO-8601 UTC string."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=UTC).isoformat()
+
+
+def build_run_results(recorder: RunRecorder) -> dict[str, Any]:
+    """
+    Build the run_results document from a recorder.
+
+    Args:
+        recorder: Recorder of a (finished) run
+
+    Returns:
+        Dictionary ready to be serialized as JSON
+    """
+    finished_at = recorder.finished_at or max(
+        (s.end for s in recorder.spans if s.end is not None), default=recorder.started_at
+    )
+
+    run_phases: dict[str, float] = {}
+    node_phases: dict[str, dict[str, float]] = {}
+    for s in recorder.spans:
+        if s.category != CATEGORY_PHASE:
+            continue
+        target = run_phases if s.node is None else node_phases.setdefault(s.node, {})
+        target[s.name] = round(target.get(s.name, 0.0) + s.duration, 6)
+
+    node_queries: dict[str | None, list[Any]] = {}
+    for q in recorder.queries:
+        node_queries.setdefault(q.node, []).append(q)
+
+    results = []
+    for s in recorder.node_spans():
+        queries = node_queries.get(s.node, [])
+        rows = [q.rows for q in queries if q.rows is not None]
+        scanned = [q.bytes_processed for q in queries if q.bytes_processed is not None]
+        attributes = dict(s.attributes)
+        entry = {
+            "unique_id": s.node,
+            "node_type": attributes.pop("node_type", None),
+            "status": attributes.pop("status", "success"),
+            "started_at": _iso(s.start),
+            "completed_at": _iso(s.end),
+            "execution_time": round(s.duration, 6),
+            "phases": node_phases.get(s.node, {}),
+            "queries": len(queries),
+            "query_time": round(sum(q.duration for q in queries), 6),
+            "rows_affected": sum(rows) if rows else None,
+            "bytes_processed": sum(scanned) if scanned else None,
+        }
+        entry.update(attributes)
+        results.append(entry)
+
+    return {
+        "metadata": {
+            "run_id": recorder.run_id,
+            "command": recorder.command,
+            "generated_at": _iso(finished_at),
+        },
+        "started_at": _iso(recorder.started_at),
+        "completed_at": _iso(finished_at),
+        "elapsed_time": round(finished_at - recorder.started_at, 6),
+        "phases": run_phases,
+        "queries": len(recorder.queries),
+        "results": results,
+    }
+
+
+def write_run_results(recorder: RunRecorder, output_dir: str | Path) -> Path:
+    """
+    Write run_results.json into the output directory.
+
+    Args:
+        recorder: Recorder of the run
+        output_dir: Directory to write into (created if missing)
+
+    Returns:
+        Path of the written file
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    file_path = output_path / RUN_RESULTS_FILENAME
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(build_run_results(recorder), f, indent=2, default=str)
+    logger.debug(f"Run results written to {file_path}")
+    return file_path
+
+
+def build_chrome_trace(recorder: RunRecorder) -> dict[str, Any]:
+    """
+    Convert recorded spans and queries to Chrome trace event format.
+
+    Args:
+        recorder: Recorder of the run
+
+    Returns:
+        Trace document with complete ("X") events, timestamps in microseconds
+    """
+    thread_ids: dict[int, int] = {}
+
+    def tid(thread_id: int) -> int:
+        return thread_ids.setdefault(thread_id, len(thread_ids) + 1)
+
+    events = []
+    for s in sorted(recorder.spans, key=lambda s: s.start):
+        args = {k: v for k, v in s.attributes.items() if v is not None}
+        if s.node is not None:
+            args["node"] = s.node
+        events.append(
+            {
+                "name": s.name,
+                "cat": s.category,
+                "ph": "X",
+                "ts": int((s.start - recorder.started_at) * 1_000_000),
+                "dur": int(s.duration * 1_000_000),
+                "pid": 1,
+                "tid": tid(s.thread_id),
+                "args": args,
+            }
+        )
+
+    for q in recorder.queries:
+        events.append(
+            {
+                "name": q.sql[:80],
+                "cat": "query",
+                "ph": "X",
+                "ts": int((q.start - recorder.started_at) * 1_000_000),
+                "dur": int(q.duration * 1_000_000),
+                "pid": 1,
+                "tid": tid(q.thread_id),
+                "args": {"node": q.node, "phase": q.phase, "rows": q.rows},
+            }
+        )
+
+    return {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "otherData": {"run_id": recorder.run_id, "command": recorder.command},
+    }
+
+
+def write_chrome_trace(recorder: RunRecorder, output_dir: str | Path) -> Path:
+    """
+    Write the Chrome trace of a run into the output directory.
+
+    Args:
+        recorder: Recorder of the run
+        output_dir: Directory to write into (created if missing)
+
+    Returns:
+        Path of the written file
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    file_path = output_path / CHROME_TRACE_FILENAME
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(build_chrome_trace(recorder), f, default=str)
+    logger.debug(f"Chrome trace written to {file_path}")
+    return file_path
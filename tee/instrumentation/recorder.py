@@ -0,0 +1,277 @@
+"""
+Span recording for t4t runs.
+
+A RunRecorder collects timed spans (run phases, per-node execution and the phases
+inside each node) plus the queries issued while those spans are open. Spans opened
+inside a node span inherit its node name, so phase timings and queries can be
+attributed to the model, function or test that caused them.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Span categories
+CATEGORY_RUN = "run"
+CATEGORY_PHASE = "phase"
+CATEGORY_NODE = "node"
+
+
+@dataclass
+class Span:
+    """A single timed unit of work."""
+
+    name: str
+    category: str
+    node: str | None
+    start: float
+    thread_id: int
+    end: float | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (0.0 while the span is still open)."""
+        if self.end is None:
+            return 0.0
+        return self.end - self.start
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes (status, row_count, ...) to the span."""
+        self.attributes.update(attributes)
+
+
+@dataclass
+class QueryRecord:
+    """A query issued through an adapter while a span was open."""
+
+    sql: str
+    node: str | None
+    phase: str | None
+    start: float
+    duration: float
+    thread_id: int
+    rows: int | None = None
+    bytes_processed: int | None = None
+
+
+class RunRecorder:
+    """Collects spans and queries for a single t4t run."""
+
+    def __init__(self, command: str | None = None, run_id: str | None = None) -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            command: Name of the CLI command or API entry point being recorded
+            run_id: Optional run identifier (generated if not provided)
+        """
+        self.command = command
+        self.run_id = run_id or str(uuid.uuid4())
+        self.started_at = time.time()
+        self.finished_at: float | None = None
+        self.spans: list[Span] = []
+        self.queries: list[QueryRecord] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> list[Span]:
+        """Return the open-span stack of the calling thread."""
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def current_span(self) -> Span | None:
+        """Return the innermost open span of the calling thread."""
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        category: str = CATEGORY_PHASE,
+        node: str | None = None,
+        **attributes: Any,
+    ) -> Iterator[Span]:
+        """
+        Time a block of work.
+
+        Args:
+            name: Span name (phase name, or the node name for node spans)
+            category: One of run, phase or node
+            node: Node the work belongs to (inherited from the enclosing span if omitted)
+            **attributes: Initial span attributes
+
+        Yields:
+            The open Span; callers may attach attributes with Span.set()
+        """
+        stack = self._stack()
+        if node is None and stack:
+            node = stack[-1].node
+
+        span = Span(
+            name=name,
+            category=category,
+            node=node,
+            start=time.time(),
+            thread_id=threading.get_ident(),
+            attributes=dict(attributes),
+        )
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.attributes.setdefault("status", "error")
+            span.attributes.setdefault("error", str(e))
+            raise
+        finally:
+            span.end = time.time()
+            stack.pop()
+            with self._lock:
+                self.spans.append(span)
+
+    def record_span(
+        self,
+        name: str,
+        start: float,
+        end: float,
+        category: str = CATEGORY_PHASE,
+        node: str | None = None,
+        **attributes: Any,
+    ) -> Span:
+        """
+        Record a span whose start and end were measured by the caller.
+
+        Used for work that does not fit a with-block on one thread, such as a query
+        that stays in flight while other nodes are being scheduled.
+
+        Args:
+            name: Span name
+            start: Start time (time.time())
+            end: End time (time.time())
+            category: One of run, phase or node
+            node: Node the work belongs to
+            **attributes: Span attributes
+
+        Returns:
+            The recorded Span
+        """
+        span = Span(
+            name=name,
+            category=category,
+            node=node,
+            start=start,
+            end=end,
+            thread_id=threading.get_ident(),
+            attributes=dict(attributes),
+        )
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    def record_query(
+        self,
+        sql: str,
+        duration: float,
+        rows: int | None = None,
+        bytes_processed: int | None = None,
+    ) -> None:
+        """
+        Record a query against the innermost open span of the calling thread.
+
+        Args:
+            sql: Query text
+            duration: Wall time in seconds
+            rows: Rows returned or affected, if the adapter reports them
+            bytes_processed: Bytes scanned, if the adapter reports them
+        """
+        current = self.current_span()
+        record = QueryRecord(
+            sql=sql,
+            node=current.node if current else None,
+            phase=current.name if current and current.category == CATEGORY_PHASE else None,
+            start=time.time() - duration,
+            duration=duration,
+            thread_id=threading.get_ident(),
+            rows=rows if isinstance(rows, int) and rows >= 0 else None,
+            bytes_processed=bytes_processed if isinstance(bytes_processed, int) else None,
+        )
+        with self._lock:
+            self.queries.append(record)
+
+    def finish(self) -> None:
+        """Mark the run as finished."""
+        self.finished_at = time.time()
+
+    def node_spans(self) -> list[Span]:
+        """Return node spans ordered by start time."""
+        return sorted((s for s in self.spans if s.category == CATEGORY_NODE), key=lambda s: s.start)
+
+
+_active_recorder: RunRecorder | None = None
+
+
+def start_run(command: str | None = None) -> RunRecorder:
+    """Create a recorder and make it the active one for this process."""
+    global _active_recorder
+    _active_recorder = RunRecorder(command=command)
+    return _active_recorder
+
+
+def end_run() -> RunRecorder | None:
+    """Finish and deactivate the active recorder, returning it."""
+    global _active_recorder
+    recorder = _active_recorder
+    _active_recorder = None
+    if recorder is not None:
+        recorder.finish()
+    return recorder
+
+
+def get_recorder() -> RunRecorder | None:
+    """Return the active recorder, if a run is being recorded."""
+    return _active_recorder
+
+
+def span(name: str, category: str = CATEGORY_PHASE, node: str | None = None, **attributes: Any):
+    """
+    Time a block of work on the active recorder.
+
+    Outside of a recorded run this yields a detached span that is never stored, so
+    library code can be instrumented unconditionally.
+    """
+    if _active_recorder is None:
+        return nullcontext(Span(name=name, category=category, node=node, start=0.0, thread_id=0))
+    return _active_recorder.span(name, category=category, node=node, **attributes)
+
+
+def record_span(
+    name: str,
+    start: float,
+    end: float,
+    category: str = CATEGORY_PHASE,
+    node: str | None = None,
+    **attributes: Any,
+) -> None:
+    """Record a caller-timed span on the active recorder (no-op outside of a recorded run)."""
+    if _active_recorder is not None:
+        _active_recorder.record_span(name, start, end, category=category, node=node, **attributes)
+
+
+def record_query(
+    sql: str,
+    duration: float,
+    rows: int | None = None,
+    bytes_processed: int | None = None,
+) -> None:
+    """Record a query on the active recorder (no-op outside of a recorded run)."""
+    if _active_recorder is not None:
+        _active_recorder.record_query(sql, duration, rows=rows, bytes_processed=bytes_processed)
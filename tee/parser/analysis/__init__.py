@@ -2,12 +2,28 @@
 Analysis layer for dependency analysis and table resolution.
 """
 
+from .column_lineage import ColumnLineage, build_column_lineage
+from .critical_path import (
+    CriticalPath,
+    critical_path_order,
+    remaining_path_weights,
+    slowest_chains,
+)
 from .dependency_graph import DependencyGraphBuilder
+from .schema_catalog import SchemaCatalog, build_schema_catalog
 from .sql_qualifier import generate_resolved_sql
 from .table_resolver import TableResolver
 
 __all__ = [
+    "ColumnLineage",
+    "CriticalPath",
     "DependencyGraphBuilder",
+    "SchemaCatalog",
     "TableResolver",
+    "build_column_lineage",
+    "build_schema_catalog",
+    "critical_path_order",
     "generate_resolved_sql",
+    "remaining_path_weights",
+    "slowest_chains",
 ]
@@ -0,0 +1,305 @@
+"""
+Compile-time column-level lineage.
+
+The dependency graph only knows that a model reads another one, so a change to any
+column of a model makes every downstream model stale. The column lineage index records
+which upstream columns each model actually reads:
+
+- columns: for every output column, the upstream columns its values are derived from
+- filters: upstream columns read outside the projections (joins, WHERE, GROUP BY,
+  subqueries, ...), which decide the rows of the model and so affect every output column
+- opaque: upstream relations read with unknown columns (an unexpanded star), which are
+  treated as reading all of their columns
+- relations: every upstream relation the query reads
+
+It is built with sqlglot: each model's SQL is qualified once against the schema catalog
+(expanding stars over known relations), and the lineage of every output column is
+traced through CTEs and subqueries down to physical relations.
+
+affected_models() uses the index to propagate a change to some columns of a model, so
+only the downstream models that read a changed column (directly or through another
+affected column) are selected for a rebuild. Models whose SQL could not be analyzed
+fall back to table-level dependencies.
+"""
+
+import json
+import logging
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from sqlglot import exp
+from sqlglot.lineage import to_node
+from sqlglot.optimizer.qualify import qualify
+from sqlglot.optimizer.scope import Scope, build_scope
+
+from tee.ast_registry import parse_sql
+
+from .schema_catalog import SchemaCatalog
+
+logger = logging.getLogger(__name__)
+
+# File name of the lineage index in the output folder
+COLUMN_LINEAGE_FILENAME = "column_lineage.json"
+
+# Column name standing for every column of a relation
+ALL_COLUMNS = "*"
+
+
+class ColumnLineage:
+    """Upstream columns read by each model, with change propagation across models."""
+
+    def __init__(
+        self,
+        models: dict[str, dict[str, Any]] | None = None,
+        dependencies: dict[str, list[str]] | None = None,
+    ) -> None:
+        """
+        Initialize the lineage index.
+
+        Args:
+            models: Lineage entries keyed by model name, each with "columns", "filters",
+                "opaque" and "relations"
+            dependencies: Upstream dependencies of every model (from the dependency graph)
+        """
+        self.models = models or {}
+        self.dependencies = dependencies or {}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ColumnLineage:
+        """Create a lineage index from the dict returned by to_dict()."""
+        return cls(data.get("models"), data.get("dependencies"))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the lineage index as a JSON-serializable dict."""
+        return {"models": self.models, "dependencies": self.dependencies}
+
+    def save(self, output_folder: Path) -> Path:
+        """
+        Write the lineage index to the output folder.
+
+        Args:
+            output_folder: Project output folder
+
+        Returns:
+            Path of the written file
+        """
+        output_folder.mkdir(parents=True, exist_ok=True)
+        path = output_folder / COLUMN_LINEAGE_FILENAME
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def affected_models(self, model_name: str, columns: list[str]) -> dict[str, set[str]]:
+        """
+        Find the downstream models affected by a change to some columns of a model.
+
+        A downstream model is affected if it reads a changed column. Its changed output
+        columns are the ones derived from a changed column, or all of them when a changed
+        column is read in a filter, join or grouping (its rows may change), when the rows
+        of the relation it reads may change, or when it has no lineage entry.
+
+        Args:
+            model_name: Changed model (or seed/source relation)
+            columns: Changed column names (ALL_COLUMNS if the rows may change too)
+
+        Returns:
+            Affected downstream models mapped to their changed output columns, not
+            including model_name itself
+        """
+        dependents: dict[str, list[str]] = {}
+        for name, upstream in self.dependencies.items():
+            for dependency in upstream:
+                dependents.setdefault(dependency, []).append(name)
+        for name, entry in self.models.items():
+            for relation in entry["relations"]:
+                if name not in dependents.setdefault(relation, []):
+                    dependents[relation].append(name)
+
+        affected: dict[str, set[str]] = {}
+        changed = {model_name: {column.lower() for column in columns}}
+        pending = deque([model_name])
+        while pending:
+            relation = pending.popleft()
+            changed_columns = changed[relation]
+            for name in dependents.get(relation, []):
+                if name == model_name:
+                    continue
+                outputs = self._changed_outputs(name, relation, changed_columns)
+                if not outputs:
+                    continue
+                known = affected.setdefault(name, set())
+                if outputs <= known:
+                    continue
+                known.update(outputs)
+                changed[name] = known
+                pending.append(name)
+        return affected
+
+    def _changed_outputs(self, name: str, relation: str, changed: set[str]) -> set[str]:
+        """Output columns of a model that change when columns of a relation change."""
+        entry = self.models.get(name)
+        if entry is None or relation in entry["opaque"] or relation not in entry["relations"]:
+            # No lineage, or a dependency the lineage could not match to a relation it reads
+            return {ALL_COLUMNS}
+        if ALL_COLUMNS in changed:
+            # The rows of the relation may change, so everything read from it does
+            return {ALL_COLUMNS}
+
+        filters = {column.lower() for column in entry["filters"].get(relation, [])}
+        if filters & changed:
+            return {ALL_COLUMNS}
+
+        outputs = set()
+        for output, sources in entry["columns"].items():
+            if {column.lower() for column in sources.get(relation, [])} & changed:
+                outputs.add(output.lower())
+        return outputs
+
+
+def build_column_lineage(
+    model_sql: dict[str, str],
+    dependencies: dict[str, list[str]] | None = None,
+    catalog: SchemaCatalog | None = None,
+    dialect: str | None = None,
+) -> ColumnLineage:
+    """
+    Build the column lineage index of a project.
+
+    Args:
+        model_sql: SQL of every model, as written (before ephemeral models are inlined)
+        dependencies: Upstream dependencies of every model (from the dependency graph)
+        catalog: Schema catalog used to expand stars over upstream relations
+        dialect: Dialect to read the SQL with (None auto-detects)
+
+    Returns:
+        Column lineage index; models whose SQL could not be analyzed have no entry
+    """
+    schema = catalog.mapping_schema() if catalog is not None else None
+    known = set(model_sql) | set(catalog.entries if catalog is not None else [])
+
+    models: dict[str, dict[str, Any]] = {}
+    for name, sql in model_sql.items():
+        try:
+            models[name] = _model_lineage(sql, schema, dialect, known)
+        except Exception as e:
+            logger.debug(f"Could not trace the column lineage of {name}: {e}")
+    return ColumnLineage(models, dependencies)
+
+
+def _model_lineage(sql: str, schema: Any, dialect: str | None, known: set[str]) -> dict[str, Any]:
+    """Trace the upstream columns read by one model's query."""
+    expression = qualify(
+        parse_sql(sql, dialect=dialect),
+        schema=schema,
+        dialect=dialect,
+        validate_qualify_columns=False,
+        quote_identifiers=False,
+    )
+    root = build_scope(expression)
+    if root is None:
+        raise ValueError("Not a query")
+
+    relations = sorted(
+        {
+            _relation_name(table, known)
+            for scope in root.traverse()
+            for table in scope.tables
+            if not _is_cte(scope, table)
+        }
+    )
+    entry: dict[str, Any] = {"columns": {}, "filters": {}, "opaque": [], "relations": relations}
+    if any(_has_star(scope) or _has_unqualified_column(scope) for scope in root.traverse()):
+        # Unexpanded star or column of an unknown relation: the columns read are unknown
+        entry["opaque"] = relations
+        return entry
+
+    filters: dict[str, set[str]] = {}
+    for scope in root.traverse():
+        for column in scope.columns:
+            if not scope.is_subquery and _in_projection(column, scope):
+                continue
+            source = _find_source(scope, column.table)
+            if isinstance(source, exp.Table):
+                reads = [(_relation_name(source, known), column.name)]
+            elif isinstance(source, Scope):
+                reads = _trace(column.name, source, dialect, known)
+            else:
+                continue
+            for relation, read in reads:
+                filters.setdefault(relation, set()).add(read)
+    entry["filters"] = {relation: sorted(cols) for relation, cols in filters.items()}
+
+    for projection in expression.selects:
+        name = projection.alias_or_name
+        sources: dict[str, set[str]] = {}
+        for relation, column in _trace(name, root, dialect, known):
+            sources.setdefault(relation, set()).add(column)
+        entry["columns"][name] = {relation: sorted(cols) for relation, cols in sources.items()}
+    return entry
+
+
+def _trace(
+    column: str, scope: Scope, dialect: str | None, known: set[str]
+) -> list[tuple[str, str]]:
+    """Trace an output column of a scope down to the physical columns it reads."""
+    try:
+        node = to_node(column, scope, dialect, trim_selects=False)
+    except Exception as e:
+        logger.debug(f"Could not trace column {column}: {e}")
+        return []
+    reads = []
+    for leaf in node.walk():
+        if not leaf.downstream and isinstance(leaf.source, exp.Table):
+            reads.append((_relation_name(leaf.source, known), leaf.name.split(".")[-1]))
+    return reads
+
+
+def _relation_name(table: exp.Table, known: set[str]) -> str:
+    """Name a physical relation, resolving unqualified references to a known relation."""
+    name = ".".join(part for part in (table.catalog, table.db, table.name) if part)
+    if name in known or table.db:
+        return name
+    matches = [relation for relation in known if relation.split(".")[-1] == table.name]
+    return matches[0] if len(matches) == 1 else name
+
+
+def _is_cte(scope: Scope, table: exp.Table) -> bool:
+    """Whether a table reference in a scope names a CTE rather than a relation."""
+    return not table.db and isinstance(scope.sources.get(table.alias_or_name), Scope)
+
+
+def _has_star(scope: Scope) -> bool:
+    """Whether a scope projects an unexpanded star."""
+    if not isinstance(scope.expression, exp.Select):
+        return False
+    return any(
+        isinstance(projection.unalias(), exp.Star)
+        or (isinstance(projection, exp.Column) and isinstance(projection.this, exp.Star))
+        for projection in scope.expression.selects
+    )
+
+
+def _has_unqualified_column(scope: Scope) -> bool:
+    """Whether a scope reads a column that could not be attributed to one of its sources."""
+    return any(not column.table for column in scope.columns)
+
+
+def _in_projection(column: exp.Column, scope: Scope) -> bool:
+    """Whether a column is read inside one of the projections of its scope's SELECT."""
+    select = scope.expression
+    if not isinstance(select, exp.Select):
+        return False
+    node: exp.Expression = column
+    while node.parent is not None and node.parent is not select:
+        node = node.parent
+    return node.parent is select and node.arg_key == "expressions"
+
+
+def _find_source(scope: Scope | None, alias: str) -> Any:
+    """Find the source a column qualifier refers to, looking into outer scopes too."""
+    while scope is not None:
+        if alias in scope.sources:
+            return scope.sources[alias]
+        scope = scope.parent
+    return None
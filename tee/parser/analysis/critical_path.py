@@ -0,0 +1,167 @@
+"""
+Critical-path analysis of the dependency graph.
+
+A node's remaining path weight is its own estimated duration plus the heaviest remaining
+path among its dependents: however many nodes run at once, the graph below the node
+cannot finish sooner. Among the nodes whose dependencies are done, starting the one with
+the heaviest remaining path first starts the long poles first, instead of in whatever
+order a plain topological sort happens to emit them.
+
+Durations are estimates from the runtime history kept in the state database. Nodes
+without history are estimated at the median of the known durations; without any history
+every node weighs DEFAULT_NODE_WEIGHT, so paths are compared by their number of nodes.
+"""
+
+import heapq
+import statistics
+from dataclasses import dataclass
+from graphlib import TopologicalSorter
+
+from tee.parser.shared.types import DependencyInfo, ExecutionOrder
+
+# Weight of every node when no durations are known
+DEFAULT_NODE_WEIGHT = 1.0
+
+
+@dataclass
+class CriticalPath:
+    """A chain of dependent nodes (dependencies first) with their estimated durations."""
+
+    nodes: list[str]
+    durations: list[float]
+
+    @property
+    def duration(self) -> float:
+        """Estimated duration of the whole chain in seconds."""
+        return sum(self.durations)
+
+
+def node_weights(
+    dependencies: DependencyInfo, durations: dict[str, float] | None = None
+) -> dict[str, float]:
+    """
+    Estimate the duration of every node of a graph.
+
+    Args:
+        dependencies: Dict mapping node -> list of dependencies
+        durations: Known durations in seconds by node name
+
+    Returns:
+        Dict mapping every node (including dependencies that have no entry) to its weight
+    """
+    nodes = set(dependencies)
+    for deps in dependencies.values():
+        nodes.update(deps)
+
+    durations = durations or {}
+    known = [durations[node] for node in nodes if node in durations]
+    default = statistics.median(known) if known else DEFAULT_NODE_WEIGHT
+    return {node: durations.get(node, default) for node in nodes}
+
+
+def remaining_path_weights(
+    dependencies: DependencyInfo, durations: dict[str, float] | None = None
+) -> dict[str, float]:
+    """
+    Compute the heaviest path from every node to the end of the graph.
+
+    Args:
+        dependencies: Dict mapping node -> list of dependencies
+        durations: Known durations in seconds by node name
+
+    Returns:
+        Dict mapping node -> its weight plus the heaviest remaining path of its dependents
+
+    Raises:
+        graphlib.CycleError: If the graph has a cycle
+    """
+    weights = node_weights(dependencies, durations)
+    dependents: dict[str, list[str]] = {node: [] for node in weights}
+    for node, deps in dependencies.items():
+        for dep in deps:
+            dependents[dep].append(node)
+
+    remaining: dict[str, float] = {}
+    for node in reversed(list(TopologicalSorter(dependencies).static_order())):
+        remaining[node] = weights[node] + max(
+            (remaining[dependent] for dependent in dependents[node]), default=0.0
+        )
+    return remaining
+
+
+def critical_path_order(
+    dependencies: DependencyInfo, durations: dict[str, float] | None = None
+) -> ExecutionOrder:
+    """
+    Sort a graph topologically, taking the ready node with the heaviest remaining path first.
+
+    Ties are broken by node name, so the order is deterministic.
+
+    Args:
+        dependencies: Dict mapping node -> list of dependencies
+        durations: Known durations in seconds by node name
+
+    Returns:
+        List of nodes in dependency order (dependencies first)
+
+    Raises:
+        graphlib.CycleError: If the graph has a cycle
+    """
+    remaining = remaining_path_weights(dependencies, durations)
+    sorter = TopologicalSorter(dependencies)
+    sorter.prepare()
+
+    ready: list[tuple[float, str]] = []
+    order = []
+    while sorter.is_active():
+        for node in sorter.get_ready():
+            heapq.heappush(ready, (-remaining[node], node))
+        _, node = heapq.heappop(ready)
+        order.append(node)
+        sorter.done(node)
+    return order
+
+
+def slowest_chains(
+    dependencies: DependencyInfo, durations: dict[str, float] | None = None, limit: int = 5
+) -> list[CriticalPath]:
+    """
+    Find the slowest chains of dependent nodes, one for each node nothing depends on.
+
+    The first chain is the critical path of the graph.
+
+    Args:
+        dependencies: Dict mapping node -> list of dependencies
+        durations: Known durations in seconds by node name
+        limit: Maximum number of chains to return
+
+    Returns:
+        Chains ordered from slowest to fastest
+
+    Raises:
+        graphlib.CycleError: If the graph has a cycle
+    """
+    weights = node_weights(dependencies, durations)
+    finish: dict[str, float] = {}
+    previous: dict[str, str | None] = {}
+    for node in TopologicalSorter(dependencies).static_order():
+        slowest = max(dependencies.get(node, []), key=lambda dep: (finish[dep], dep), default=None)
+        finish[node] = weights[node] + (finish[slowest] if slowest is not None else 0.0)
+        previous[node] = slowest
+
+    has_dependents = {dep for deps in dependencies.values() for dep in deps}
+    ends = sorted(
+        (node for node in finish if node not in has_dependents),
+        key=lambda node: (-finish[node], node),
+    )
+
+    chains = []
+    for end in ends[:limit]:
+        nodes = []
+        node: str | None = end
+        while node is not None:
+            nodes.append(node)
+            node = previous[node]
+        nodes.reverse()
+        chains.append(CriticalPath(nodes=nodes, durations=[weights[node] for node in nodes]))
+    return chains
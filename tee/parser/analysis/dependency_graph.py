@@ -7,6 +7,7 @@ from graphlib import TopologicalSorter
 from pathlib import Path
 from typing import Any
 
+from tee.parser.analysis.critical_path import critical_path_order
 from tee.parser.shared.exceptions import DependencyError
 from tee.parser.shared.types import (
     DependencyGraph,
@@ -435,8 +436,9 @@ class DependencyGraphBuilder:
         """
         Perform topological sort using graphlib.TopologicalSorter.
         The topological sort naturally respects dependencies, so functions that depend
-        on tables will come after those tables. Functions without dependencies will
-        come first.
+        on tables will come after those tables. Among the nodes whose dependencies come
+        earlier, the one starting the longest remaining chain comes first (see
+        critical_path), so the order is deterministic and long chains start early.
 
         Args:
             dependencies: Dict mapping node -> list of dependencies
@@ -445,20 +447,9 @@ class DependencyGraphBuilder:
         Returns:
             List of nodes in dependency order (dependencies first)
         """
-        # Create a TopologicalSorter
-        ts = TopologicalSorter()
-
-        # Add all nodes and their dependencies
-        for node, deps in dependencies.items():
-            if deps:
-                ts.add(node, *deps)
-            else:
-                ts.add(node)
-
-        # Get the static order (topological sort)
-        # This already respects dependencies - functions depending on tables will come after tables
+        # Critical-path order - functions depending on tables still come after tables
         try:
-            return list(ts.static_order())
+            return critical_path_order(dependencies)
         except ValueError:
             # This should not happen if we check for cycles first
             return []
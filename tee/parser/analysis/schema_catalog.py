@@ -0,0 +1,313 @@
+"""
+Compile-time schema catalog.
+
+The catalog records the output columns of every seed and model without querying the
+database. Seeds are described from their files, models that declare a schema use it,
+and the other models are walked in execution order: sqlglot qualifies each query
+against the columns of its upstream relations and annotates the types of its output
+columns.
+
+An entry is authoritative when its column names and types are exactly what the
+database will report for the relation, so schema comparisons can use it instead of
+describing the query. That is the case for seeds and for models whose projections are
+only column references and casts over authoritative relations; literals, functions,
+set operations and declared (generic) datatypes are not trusted to match the database.
+"""
+
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from sqlglot import exp
+from sqlglot.optimizer.annotate_types import annotate_types
+from sqlglot.optimizer.qualify import qualify
+from sqlglot.schema import MappingSchema
+
+from tee.adapters.base.sql import sql_hash
+from tee.ast_registry import parse_sql
+from tee.parser.shared.types import ParsedModel
+
+logger = logging.getLogger(__name__)
+
+# File name of the catalog in the output folder
+SCHEMA_CATALOG_FILENAME = "schema_catalog.json"
+
+# SQL types used to propagate declared (OTS) datatypes to downstream models
+DECLARED_TYPES = {
+    "string": "VARCHAR",
+    "number": "DOUBLE",
+    "integer": "BIGINT",
+    "float": "DOUBLE",
+    "boolean": "BOOLEAN",
+    "timestamp": "TIMESTAMP",
+    "date": "DATE",
+    "time": "TIME",
+    "json": "JSON",
+}
+
+
+class SchemaCatalog:
+    """Output columns of seeds and models, inferred without database round trips."""
+
+    def __init__(self, dialect: str | None = None) -> None:
+        """
+        Initialize the schema catalog.
+
+        Args:
+            dialect: Target dialect the column types are rendered in
+        """
+        self.dialect = dialect
+        self.entries: dict[str, dict[str, Any]] = {}
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """Return the catalog entry of a relation, if known."""
+        return self.entries.get(name)
+
+    def is_authoritative(self, name: str) -> bool:
+        """Whether the entry of a relation matches what the database reports."""
+        entry = self.entries.get(name)
+        return bool(entry and entry["authoritative"])
+
+    def add(
+        self, name: str, columns: list[dict[str, Any]], authoritative: bool, source: str
+    ) -> None:
+        """
+        Record the output columns of a relation.
+
+        Args:
+            name: Relation name (schema.table)
+            columns: Columns as {"name": ..., "type": ...}; type is None when unknown
+            authoritative: Whether names and types match what the database reports
+            source: How the columns were obtained ("seed", "declared" or "inferred")
+        """
+        self.entries[name] = {
+            "columns": columns,
+            "authoritative": authoritative and all(col["type"] for col in columns),
+            "source": source,
+        }
+
+    def add_seeds(self, seeds_folder: Path, connection_type: str | None) -> int:
+        """
+        Describe the seed files of a project the way SeedLoader will load them.
+
+        DuckDB loads seeds with its file readers, which are run locally on the files to
+        get the exact column types; the other databases load every column as VARCHAR.
+
+        Args:
+            seeds_folder: Path to the project's seeds folder
+            connection_type: Database type of the connection
+
+        Returns:
+            Number of seeds described
+        """
+        from tee.engine.seeds import SeedDiscovery
+
+        count = 0
+        for file_path, schema_name in SeedDiscovery(seeds_folder).discover_seed_files():
+            name = f"{schema_name}.{file_path.stem}" if schema_name else file_path.stem
+            try:
+                if connection_type == "duckdb":
+                    columns = _describe_seed_with_duckdb(file_path)
+                else:
+                    columns = [
+                        {"name": column, "type": "VARCHAR"} for column in _seed_columns(file_path)
+                    ]
+            except Exception as e:
+                logger.debug(f"Could not describe seed {file_path}: {e}")
+                continue
+            self.add(name, columns, authoritative=True, source="seed")
+            count += 1
+        return count
+
+    def add_models(self, models: dict[str, ParsedModel], execution_order: list[str]) -> int:
+        """
+        Infer the output columns of models in execution order.
+
+        Each model's entry is also stored in its code.sql.output_schema, keyed by the
+        hash of the SQL it was inferred from.
+
+        Args:
+            models: Parsed models
+            execution_order: Model names in dependency order
+
+        Returns:
+            Number of models with an entry
+        """
+        count = 0
+        ordered = [name for name in execution_order if name in models]
+        in_order = set(ordered)
+        ordered += [name for name in models if name not in in_order]
+        for name in ordered:
+            model_data = models[name]
+            sql_data = (model_data.get("code") or {}).get("sql")
+            sql = sql_data.get("resolved_sql") if isinstance(sql_data, dict) else None
+
+            declared = (model_data.get("model_metadata") or {}).get("metadata", {}).get("schema")
+            if declared:
+                columns = [
+                    {"name": col["name"], "type": DECLARED_TYPES.get(col.get("datatype"))}
+                    for col in declared
+                ]
+                self.add(name, columns, authoritative=False, source="declared")
+            elif sql:
+                inferred = self._infer(sql)
+                if inferred is None:
+                    continue
+                self.add(name, inferred[0], authoritative=inferred[1], source="inferred")
+            else:
+                continue
+
+            count += 1
+            if sql:
+                entry = self.entries[name]
+                sql_data["output_schema"] = {
+                    "columns": entry["columns"],
+                    "authoritative": entry["authoritative"],
+                    "dialect": self.dialect,
+                    "source_hash": sql_hash(sql),
+                }
+        return count
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the catalog as a JSON-serializable dict."""
+        return {"dialect": self.dialect, "relations": self.entries}
+
+    def save(self, output_folder: Path) -> Path:
+        """
+        Write the catalog to the output folder.
+
+        Args:
+            output_folder: Project output folder
+
+        Returns:
+            Path of the written file
+        """
+        output_folder.mkdir(parents=True, exist_ok=True)
+        path = output_folder / SCHEMA_CATALOG_FILENAME
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def mapping_schema(self) -> MappingSchema:
+        """Build the sqlglot schema of the schema-qualified relations known so far."""
+        mapping: dict[str, dict[str, dict[str, str]]] = {}
+        for name, entry in self.entries.items():
+            parts = name.split(".")
+            # sqlglot needs a uniform nesting depth, so only schema.table names are used
+            if len(parts) != 2:
+                continue
+            mapping.setdefault(parts[0], {})[parts[1]] = {
+                col["name"]: col["type"] or "UNKNOWN" for col in entry["columns"]
+            }
+        return MappingSchema(mapping, dialect=self.dialect)
+
+    def _infer(self, sql: str) -> tuple[list[dict[str, Any]], bool] | None:
+        """Infer the output columns of a query and whether they are authoritative."""
+        schema = self.mapping_schema()
+        try:
+            expression = qualify(
+                parse_sql(sql),
+                schema=schema,
+                validate_qualify_columns=False,
+                quote_identifiers=False,
+            )
+            expression = annotate_types(expression, schema=schema)
+        except Exception as e:
+            logger.debug(f"Could not infer output schema: {e}")
+            return None
+
+        columns = []
+        for projection in expression.selects:
+            if isinstance(projection.unalias(), exp.Star) or not projection.alias_or_name:
+                # Unexpanded star: the columns of an upstream relation are unknown
+                return None
+            data_type = projection.type
+            known = data_type is not None and not data_type.is_type(exp.DataType.Type.UNKNOWN)
+            columns.append(
+                {
+                    "name": projection.alias_or_name,
+                    "type": data_type.sql(dialect=self.dialect) if known else None,
+                }
+            )
+        return columns, self._is_authoritative(expression)
+
+    def _is_authoritative(self, expression: exp.Expression) -> bool:
+        """Whether the types sqlglot annotated are the ones the database will report."""
+        if any(isinstance(node, exp.SetOperation) for node in expression.walk()):
+            return False
+
+        cte_names = {cte.alias_or_name for cte in expression.find_all(exp.CTE)}
+        for table in expression.find_all(exp.Table):
+            if not table.db and table.name in cte_names:
+                continue
+            name = f"{table.db}.{table.name}" if table.db else table.name
+            if table.catalog or not self.is_authoritative(name):
+                return False
+
+        for select in expression.find_all(exp.Select):
+            for projection in select.selects:
+                if not isinstance(projection.unalias(), (exp.Column, exp.Cast)):
+                    return False
+        return True
+
+
+def build_schema_catalog(
+    models: dict[str, ParsedModel],
+    execution_order: list[str],
+    project_path: Path | None = None,
+    connection_type: str | None = None,
+    dialect: str | None = None,
+) -> SchemaCatalog:
+    """
+    Build the schema catalog of a project.
+
+    Args:
+        models: Parsed models; each model's code.sql.output_schema is set in place
+        execution_order: Model names in dependency order
+        project_path: Project folder, whose seeds are described first
+        connection_type: Database type of the connection
+        dialect: Target dialect the column types are rendered in
+
+    Returns:
+        Schema catalog
+    """
+    catalog = SchemaCatalog(dialect)
+    if project_path is not None:
+        catalog.add_seeds(Path(project_path) / "seeds", connection_type)
+    catalog.add_models(models, execution_order)
+    return catalog
+
+
+def _seed_columns(file_path: Path) -> list[str]:
+    """Read the column names of a seed file."""
+    if file_path.suffix.lower() == ".json":
+        with open(file_path, encoding="utf-8") as f:
+            data = json.load(f)
+        first = data[0] if isinstance(data, list) else data
+        return list(first.keys())
+
+    delimiter = "\t" if file_path.suffix.lower() == ".tsv" else ","
+    with open(file_path, encoding="utf-8") as f:
+        return next(csv.reader(f, delimiter=delimiter))
+
+
+def _describe_seed_with_duckdb(file_path: Path) -> list[dict[str, Any]]:
+    """Describe a seed file with the DuckDB reader SeedLoader uses for it."""
+    import duckdb
+
+    file_path_str = str(file_path.absolute()).replace("\\", "/").replace("'", "''")
+    suffix = file_path.suffix.lower()
+    if suffix == ".json":
+        source = f"read_json_auto('{file_path_str}')"
+    else:
+        delimiter = "\\t" if suffix == ".tsv" else ","
+        source = f"read_csv_auto('{file_path_str}', delim='{delimiter}')"
+
+    conn = duckdb.connect()
+    try:
+        rows = conn.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()
+    finally:
+        conn.close()
+    return [{"name": row[0], "type": row[1]} for row in rows]
@@ -6,10 +6,11 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from tee.instrumentation import span
 from tee.parser.analysis import DependencyGraphBuilder, TableResolver
 from tee.parser.output import JSONExporter, ReportGenerator
 from tee.parser.parsers import FunctionPythonParser, FunctionSQLParser, ParserFactory
-from tee.parser.processing import FileDiscovery, substitute_sql_variables, validate_sql_variables
+from tee.parser.processing import FileDiscovery, compile_sql_template
 from tee.parser.shared.exceptions import ParserError
 from tee.parser.shared.function_utils import standardize_parsed_function
 from tee.parser.shared.registry import FunctionRegistry, ModelRegistry
@@ -63,15 +64,25 @@ class ParserOrchestrator:
         self.report_generator = ReportGenerator(self.project_folder / "output")
         self.transformer = project_config is not None  # Flag to enable OTS export
 
+        # Model name -> file the model was parsed from
+        self.model_files: dict[str, Path] = {}
+
         # Cached results
         self._parsed_models: dict[str, ParsedModel] | None = None
         self._parsed_functions: dict[str, ParsedFunction] | None = None
         self._dependency_graph: DependencyGraph | None = None
 
-    def discover_and_parse_models(self) -> dict[str, ParsedModel]:
+    def discover_and_parse_models(
+        self, only_sql_files: set[Path] | None = None
+    ) -> dict[str, ParsedModel]:
         """
         Discover and parse all model files in the project.
 
+        Args:
+            only_sql_files: Optional set of SQL model files to parse (lazy compile). SQL
+                files outside the set and their companion Python files are skipped;
+                Python files defining models of their own are always parsed.
+
         Returns:
             Dict mapping full_table_name to parsed model data
         """
@@ -86,7 +97,8 @@ class ParserOrchestrator:
             ModelRegistry.clear()
 
             # Discover all files
-            files = self.file_discovery.discover_all_files()
+            with span("discover_files"):
+                files = self.file_discovery.discover_all_files()
             logger.info(
                 f"Discovered {len(files['sql'])} SQL files, "
                 f"{len(files['python'])} Python files, "
@@ -104,37 +116,25 @@ class ParserOrchestrator:
                 # For now, we'll skip loading them here - they'll be loaded during compile
                 # This prevents conflicts during regular parsing
 
+            if only_sql_files is not None:
+                skipped = {f.with_suffix("") for f in files["sql"] if f not in only_sql_files}
+                files = {
+                    **files,
+                    "sql": [f for f in files["sql"] if f in only_sql_files],
+                    "python": [f for f in files["python"] if f.with_suffix("") not in skipped],
+                }
+                logger.info(f"Lazy compile: parsing {len(files['sql'])} selected SQL files")
+
             # Build a set of Python file bases to check for companion SQL files
             python_file_bases = {f.stem for f in files["python"]}
 
             # Parse Python files FIRST (as per the new approach)
             for python_file in files["python"]:
                 try:
-                    logger.debug(f"Processing Python file: {python_file}")
-
-                    # Read Python content
-                    with open(python_file, encoding="utf-8") as f:
-                        python_content = f.read()
-
-                    # Parse with Python parser
-                    parser = ParserFactory.create_parser(python_file)
-                    python_models = parser.parse(python_content, file_path=python_file)
-
-                    # Add each model to the result with proper table naming
-                    for table_name, model_data in python_models.items():
-                        # For Python models, use the table_name from the decorator directly
-                        # Only generate full table name if it doesn't already contain a schema
-                        if "." in table_name:
-                            # Table name already includes schema (e.g., "my_schema.incremental_example")
-                            full_table_name = table_name
-                        else:
-                            # Generate full table name for unqualified table names
-                            fake_file_path = python_file.parent / f"{table_name}.py"
-                            full_table_name = self.table_resolver.generate_full_table_name(
-                                fake_file_path, self.models_folder
-                            )
-
+                    python_models = self.parse_python_file(python_file)
+                    for full_table_name, model_data in python_models.items():
                         parsed_models[full_table_name] = model_data
+                        self.model_files[full_table_name] = python_file
                         logger.debug(f"Successfully parsed Python model: {full_table_name}")
 
                 except Exception as e:
@@ -150,34 +150,9 @@ class ParserOrchestrator:
                     )
                     continue
                 try:
-                    logger.debug(f"Processing SQL file: {sql_file}")
-
-                    # Read SQL content
-                    with open(sql_file, encoding="utf-8") as f:
-                        sql_content = f.read()
-
-                    # Apply variable substitution if variables are provided
-                    if self.variables:
-                        try:
-                            validate_sql_variables(sql_content, self.variables)
-                            sql_content = substitute_sql_variables(sql_content, self.variables)
-                            logger.debug(f"Applied variable substitution to {sql_file}")
-                        except Exception as e:
-                            logger.error(f"Variable substitution error in {sql_file}: {e}")
-                            continue
-
-                    # Generate full table name
-                    full_table_name = self.table_resolver.generate_full_table_name(
-                        sql_file, self.models_folder
-                    )
-
-                    # Parse with appropriate parser
-                    parser = ParserFactory.create_parser(sql_file)
-                    parsed_args = parser.parse(
-                        sql_content, file_path=sql_file, table_name=full_table_name
-                    )
-
+                    full_table_name, parsed_args = self.parse_sql_file(sql_file)
                     parsed_models[full_table_name] = parsed_args
+                    self.model_files[full_table_name] = sql_file
                     logger.debug(f"Successfully parsed SQL model: {full_table_name}")
 
                 except Exception as e:
@@ -197,6 +172,106 @@ class ParserOrchestrator:
         except Exception as e:
             raise ParserError(f"Failed to discover and parse models: {e}") from e
 
+    def parse_python_file(self, python_file: Path) -> dict[str, ParsedModel]:
+        """
+        Parse a single Python model file.
+
+        Args:
+            python_file: Path to the Python file
+
+        Returns:
+            Dict mapping full_table_name to parsed model data for every model the file
+            registers (decorated models, create_model() calls or companion SQL metadata)
+        """
+        logger.debug(f"Processing Python file: {python_file}")
+
+        # Read Python content
+        with open(python_file, encoding="utf-8") as f:
+            python_content = f.read()
+
+        # Parse with Python parser
+        parser = ParserFactory.create_parser(python_file)
+        with span("parse_python"):
+            python_models = parser.parse(python_content, file_path=python_file)
+
+        # Add each model to the result with proper table naming
+        models = {}
+        for table_name, model_data in python_models.items():
+            # For Python models, use the table_name from the decorator directly
+            # Only generate full table name if it doesn't already contain a schema
+            if "." in table_name:
+                # Table name already includes schema (e.g., "my_schema.incremental_example")
+                full_table_name = table_name
+            else:
+                # Generate full table name for unqualified table names
+                fake_file_path = python_file.parent / f"{table_name}.py"
+                full_table_name = self.table_resolver.generate_full_table_name(
+                    fake_file_path, self.models_folder
+                )
+            models[full_table_name] = model_data
+
+        return models
+
+    def parse_sql_file(self, sql_file: Path) -> tuple[str, ParsedModel]:
+        """
+        Parse a single SQL model file, applying variable substitution.
+
+        Args:
+            sql_file: Path to the SQL file
+
+        Returns:
+            Tuple of (full_table_name, parsed model data)
+
+        Raises:
+            ParserError: If variable substitution fails
+        """
+        logger.debug(f"Processing SQL file: {sql_file}")
+
+        # Read SQL content
+        with open(sql_file, encoding="utf-8") as f:
+            sql_content = f.read()
+
+        # Apply variable substitution if variables are provided
+        if self.variables:
+            try:
+                with span("variable_substitution"):
+                    template = compile_sql_template(sql_content)
+                    template.validate(self.variables)
+                    sql_content = template.render(self.variables)
+                logger.debug(f"Applied variable substitution to {sql_file}")
+            except Exception as e:
+                raise ParserError(f"Variable substitution error in {sql_file}: {e}") from e
+
+        # Generate full table name
+        full_table_name = self.table_resolver.generate_full_table_name(
+            sql_file, self.models_folder
+        )
+
+        # Parse with appropriate parser
+        parser = ParserFactory.create_parser(sql_file)
+        with span("parse_sql"):
+            parsed_args = parser.parse(sql_content, file_path=sql_file, table_name=full_table_name)
+
+        return full_table_name, parsed_args
+
+    def set_parsed_models(self, parsed_models: dict[str, ParsedModel]) -> None:
+        """
+        Replace the cached parsed models, e.g. after re-parsing changed files.
+
+        The cached dependency graph is dropped and rebuilt on next use.
+
+        Args:
+            parsed_models: Dict mapping full_table_name to parsed model data
+        """
+        self._parsed_models = parsed_models
+        self._dependency_graph = None
+
+    def invalidate_functions(self) -> None:
+        """Drop the cached functions and dependency graph, so both are rebuilt on next use."""
+        self.file_discovery.clear_cache()
+        self._parsed_functions = None
+        self._dependency_graph = None
+
     def discover_and_parse_functions(self) -> dict[str, ParsedFunction]:
         """
         Discover and parse all function files in the project.
@@ -478,12 +553,13 @@ class ParserOrchestrator:
                 self._parsed_functions = parsed_functions
 
             # Build the graph (pass project_folder for test discovery and parsed_functions)
-            self._dependency_graph = self.dependency_builder.build_graph(
-                parsed_models,
-                self.table_resolver,
-                project_folder=Path(self.project_folder),
-                parsed_functions=parsed_functions,
-            )
+            with span("dependency_graph"):
+                self._dependency_graph = self.dependency_builder.build_graph(
+                    parsed_models,
+                    self.table_resolver,
+                    project_folder=Path(self.project_folder),
+                    parsed_functions=parsed_functions,
+                )
 
             logger.debug(f"Built dependency graph with {len(self._dependency_graph['nodes'])} nodes")
 
@@ -561,7 +637,8 @@ class ParserOrchestrator:
         """
         try:
             python_parser = ParserFactory.create_parser(Path("dummy.py"))
-            return python_parser.evaluate_all_models(parsed_models, variables)
+            with span("evaluate_python_models"):
+                return python_parser.evaluate_all_models(parsed_models, variables)
         except Exception as e:
             logger.error(f"Error evaluating Python models: {e}")
             return parsed_models
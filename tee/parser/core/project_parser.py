@@ -55,19 +55,22 @@ class ProjectParser:
         self.parsed_models: dict[str, ParsedModel] | None = None
         self.graph: DependencyGraph | None = None
 
-    def collect_models(self) -> dict[str, ParsedModel]:
+    def collect_models(self, only_sql_files: set[Path] | None = None) -> dict[str, ParsedModel]:
         """
         Collect all .sql and .py files in the project folder, parse them,
         and return a JSON structure with parsed arguments.
 
         The result is cached in self.parsed_models for reuse.
 
+        Args:
+            only_sql_files: Optional set of SQL model files to restrict parsing to
+
         Returns:
             Dict mapping full_table_name to parsed SQL arguments
         """
         try:
             # Use orchestrator to discover and parse models
-            self.parsed_models = self.orchestrator.discover_and_parse_models()
+            self.parsed_models = self.orchestrator.discover_and_parse_models(only_sql_files)
             return self.parsed_models
         except Exception as e:
             raise ParserError(f"Failed to collect models: {e}") from e
@@ -152,14 +152,19 @@ class OTSConverter:
             original_sql = sql_code.get("original_sql", resolved_sql)
             source_tables = sql_code.get("source_tables", [])
 
-            return {
-                "sql": {
-                    "original_sql": original_sql,
-                    "resolved_sql": resolved_sql,
-                    "operation_type": "select",  # Default, could be inferred from SQL
-                    "source_tables": source_tables,
-                }
+            sql_data = {
+                "original_sql": original_sql,
+                "resolved_sql": resolved_sql,
+                "operation_type": "select",  # Default, could be inferred from SQL
+                "source_tables": source_tables,
             }
+            # Ahead-of-time transpiled SQL, reused by the engine while its hash matches
+            if sql_code.get("transpiled"):
+                sql_data["transpiled"] = sql_code["transpiled"]
+            # Compile-time output schema from the schema catalog
+            if sql_code.get("output_schema"):
+                sql_data["output_schema"] = sql_code["output_schema"]
+            return {"sql": sql_data}
         else:
             # For non-SQL transformations, preserve as-is for now
             logger.warning(
@@ -231,6 +236,8 @@ class OTSConverter:
                 )
             elif materialization_data.get("type") == "scd2":
                 nested_metadata["scd2_details"] = materialization_data.get("scd2_details", {})
+            elif materialization_data.get("type") == "external_table":
+                nested_metadata["external"] = materialization_data.get("external_details", {})
 
         if tests_data:
             # Add table tests
@@ -311,6 +318,8 @@ class OTSConverter:
             result["incremental_details"] = materialization.get("incremental_details", {})
         elif mat_type == "scd2":
             result["scd2_details"] = materialization.get("scd2_details", {})
+        elif mat_type == "external_table":
+            result["external_details"] = materialization.get("external_details", {})
 
         return result
 
@@ -391,6 +400,19 @@ class OTSConverter:
             update_columns = incremental_details.get("update_columns")
             if update_columns:
                 result["merge"]["update_columns"] = update_columns
+        elif strategy == "insert_overwrite":
+            # Partition columns default to the model's partitioning when not given
+            result["insert_overwrite"] = {
+                key: incremental_details[key]
+                for key in (
+                    "partition_by",
+                    "filter_column",
+                    "start_value",
+                    "destination_filter_column",
+                    "lookback",
+                )
+                if incremental_details.get(key)
+            }
 
         return result
 
@@ -136,6 +136,15 @@ class DocsGenerator:
         dependencies = self.dependency_graph.get("dependencies", {}).get(model_name, [])
         dependents = self.dependency_graph.get("dependents", {}).get(model_name, [])
 
+        # Without a declared schema, show the columns from the schema catalog
+        if not schema:
+            sql_data = (model.get("code") or {}).get("sql") or {}
+            output_schema = sql_data.get("output_schema") if isinstance(sql_data, dict) else None
+            schema = [
+                {"name": col["name"], "datatype": col.get("type") or ""}
+                for col in (output_schema or {}).get("columns", [])
+            ]
+
         # Prepare schema data
         schema_data = []
         for col in schema:
@@ -3,6 +3,7 @@
 import logging
 from typing import Any
 
+from tee.ast_registry import parse_sql
 from tee.parser.shared.types import ParsedModel
 
 logger = logging.getLogger(__name__)
@@ -11,6 +12,35 @@ logger = logging.getLogger(__name__)
 class SchemaInferencer:
     """Infers schema from SQL queries using sqlglot."""
 
+    def from_output_schema(self, model_data: ParsedModel) -> dict[str, Any] | None:
+        """
+        Build the schema from the model's output schema in the schema catalog.
+
+        Args:
+            model_data: Parsed model data
+
+        Returns:
+            Schema structure with the cataloged columns, or None if the model has no
+            output schema or some column names are unknown
+        """
+        sql_data = (model_data.get("code") or {}).get("sql") or {}
+        output_schema = sql_data.get("output_schema") if isinstance(sql_data, dict) else None
+        if not output_schema or not output_schema.get("columns"):
+            return None
+
+        columns = []
+        for col in output_schema["columns"]:
+            if not col.get("name"):
+                return None
+            columns.append(
+                {
+                    "name": col["name"],
+                    "datatype": self.map_sql_type(col.get("type") or ""),
+                    "description": None,
+                }
+            )
+        return {"columns": columns, "partitioning": []}
+
     def infer_from_sql(self, model_data: ParsedModel) -> dict[str, Any] | None:
         """
         Infer schema from SQL query using sqlglot.
@@ -22,8 +52,6 @@ class SchemaInferencer:
             Schema structure with inferred columns, or None if inference fails
         """
         try:
-            import sqlglot
-
             # Get SQL from code structure
             code_data = model_data.get("code", {})
             if not code_data or "sql" not in code_data:
@@ -34,7 +62,7 @@ class SchemaInferencer:
                 return None
 
             # Parse the SQL to extract column definitions
-            expr = sqlglot.parse_one(sql_content)
+            expr = parse_sql(sql_content, copy=False)
 
             # Extract SELECT columns
             columns = []
@@ -78,21 +106,32 @@ class SchemaInferencer:
         """
         # Check for obvious type hints in the expression
         if hasattr(col_expr, "this"):
-            sql_type = str(col_expr.this)
-
-            # Simple heuristic based on SQL type
-            if any(word in sql_type.upper() for word in ["TEXT", "VARCHAR", "CHAR", "STRING"]):
-                return "string"
-            elif any(
-                word in sql_type.upper() for word in ["INT", "BIGINT", "SMALLINT", "INTEGER"]
-            ) or any(
-                word in sql_type.upper() for word in ["FLOAT", "DOUBLE", "DECIMAL", "NUMERIC"]
-            ):
-                return "number"
-            elif any(word in sql_type.upper() for word in ["DATE", "TIMESTAMP", "TIME"]):
-                return "date"
-            elif any(word in sql_type.upper() for word in ["BOOLEAN", "BOOL"]):
-                return "boolean"
+            return self.map_sql_type(str(col_expr.this))
+
+        # Default to string if can't infer
+        return "string"
+
+    def map_sql_type(self, sql_type: str) -> str:
+        """
+        Map a SQL type to an OTS datatype.
+
+        Args:
+            sql_type: SQL type (e.g., "BIGINT", "DECIMAL(10, 2)")
+
+        Returns:
+            OTS datatype string (string if the type is not recognized)
+        """
+        # Simple heuristic based on SQL type
+        if any(word in sql_type.upper() for word in ["TEXT", "VARCHAR", "CHAR", "STRING"]):
+            return "string"
+        elif any(
+            word in sql_type.upper() for word in ["INT", "BIGINT", "SMALLINT", "INTEGER"]
+        ) or any(word in sql_type.upper() for word in ["FLOAT", "DOUBLE", "DECIMAL", "NUMERIC"]):
+            return "number"
+        elif any(word in sql_type.upper() for word in ["DATE", "TIMESTAMP", "TIME"]):
+            return "date"
+        elif any(word in sql_type.upper() for word in ["BOOLEAN", "BOOL"]):
+            return "boolean"
 
         # Default to string if can't infer
         return "string"
@@ -91,7 +91,8 @@ class ModelTransformer(BaseTransformer):
         """
         Transform schema structure from metadata.
 
-        If schema is not in metadata, attempts to infer from SQL query using sqlglot.
+        If schema is not in metadata, uses the model's output schema from the schema
+        catalog, or else attempts to infer from SQL query using sqlglot.
 
         Args:
             model_data: Parsed model data
@@ -126,8 +127,10 @@ class ModelTransformer(BaseTransformer):
 
             return schema_data
 
-        # If no explicit schema in metadata, try to infer from SQL
-        return self.schema_inferencer.infer_from_sql(model_data)
+        # If no explicit schema in metadata, use the schema catalog or infer from SQL
+        return self.schema_inferencer.from_output_schema(
+            model_data
+        ) or self.schema_inferencer.infer_from_sql(model_data)
 
     def _transform_materialization(self, model_data: ParsedModel) -> dict[str, Any]:
         """
@@ -153,6 +156,8 @@ class ModelTransformer(BaseTransformer):
         elif mat_type == "scd2":
             scd2_config = metadata.get("scd2_details", {})
             return {"type": "scd2", "scd2_details": scd2_config}
+        elif mat_type == "external_table":
+            return {"type": "external_table", "external_details": metadata.get("external") or {}}
         else:
             return {"type": mat_type}
 
@@ -164,7 +169,7 @@ class ModelTransformer(BaseTransformer):
 
         Args:
             inc_config: Incremental configuration
-            strategy: Strategy name (append, merge, delete_insert)
+            strategy: Strategy name (append, merge, delete_insert, insert_overwrite)
 
         Returns:
             Transformed incremental details
@@ -235,6 +240,14 @@ class ModelTransformer(BaseTransformer):
             # Add update_columns if specified
             if "update_columns" in merge_config:
                 details["update_columns"] = merge_config["update_columns"]
+        elif strategy == "insert_overwrite":
+            overwrite_config = inc_config.get("insert_overwrite") or {}
+            partition_by = overwrite_config.get("partition_by")
+            if partition_by:
+                details["partition_by"] = partition_by
+            for key in ("filter_column", "start_value", "destination_filter_column", "lookback"):
+                if overwrite_config.get(key):
+                    details[key] = overwrite_config[key]
 
         return details
 
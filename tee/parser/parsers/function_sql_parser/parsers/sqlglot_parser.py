@@ -23,9 +23,9 @@ import logging
 import re
 from typing import Any
 
-import sqlglot
 from sqlglot import exp
 
+from tee.ast_registry import parse_sql
 from tee.typing.metadata import FunctionType
 
 from ..extractors import (
@@ -61,7 +61,7 @@ class SQLglotParser:
         """
         try:
             # Try parsing with the specified dialect
-            parsed = sqlglot.parse_one(content, dialect=dialect)
+            parsed = parse_sql(content, dialect=dialect, copy=False)
 
             if not parsed or not isinstance(parsed, exp.Create):
                 return None
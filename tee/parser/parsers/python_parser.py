@@ -11,8 +11,7 @@ import sys
 from pathlib import Path
 from typing import Any
 
-import sqlglot
-
+from tee.ast_registry import parse_sql
 from tee.parser.shared.exceptions import (
     ModelConflictError,
     PythonParsingError,
@@ -152,7 +151,7 @@ class PythonParser(BaseParser):
 
             # Validate SQL syntax before proceeding
             try:
-                parsed = sqlglot.parse_one(sql_string)
+                parsed = parse_sql(sql_string, copy=False)
                 if parsed is None:
                     raise PythonModelError(
                         f"Function {function_name} returned invalid SQL (parse returned None)"
@@ -4,9 +4,9 @@ Unified SQL parsing functionality using sqlglot.
 
 import logging
 
-import sqlglot
 from sqlglot import exp
 
+from tee.ast_registry import parse_sql
 from tee.parser.analysis.sql_qualifier import generate_resolved_sql
 from tee.parser.shared.constants import SQL_BUILT_IN_FUNCTIONS
 from tee.parser.shared.exceptions import SQLParsingError
@@ -138,7 +138,7 @@ class SQLParser(BaseParser):
                 return cached_result
 
             # Parse the SQL
-            parsed = sqlglot.parse_one(content)
+            parsed = parse_sql(content, copy=False)
 
             if parsed is None:
                 raise SQLParsingError("Failed to parse SQL")
@@ -2,16 +2,25 @@
 Processing layer for variable substitution, file discovery, and model decorators.
 """
 
+from .ephemeral import EphemeralInliningError, inline_ephemeral_models
 from .file_discovery import FileDiscovery
 from .function_builder import SQLFunctionMetadata
 from .function_decorator import FunctionDecoratorError, functions
 from .model import create_model, model
 from .model_builder import SqlModelMetadata
-from .variable_substitution import substitute_sql_variables, validate_sql_variables
+from .selection_prescan import select_model_files
+from .variable_substitution import (
+    SQLTemplate,
+    compile_sql_template,
+    substitute_sql_variables,
+    validate_sql_variables,
+)
 
 __all__ = [
     "substitute_sql_variables",
     "validate_sql_variables",
+    "compile_sql_template",
+    "SQLTemplate",
     "model",
     "create_model",
     "FileDiscovery",
@@ -19,4 +28,7 @@ __all__ = [
     "FunctionDecoratorError",
     "SqlModelMetadata",
     "SQLFunctionMetadata",
+    "inline_ephemeral_models",
+    "EphemeralInliningError",
+    "select_model_files",
 ]
@@ -0,0 +1,226 @@
+"""
+Inlining of ephemeral models as CTEs.
+
+An ephemeral model is never materialized. At compile time its SQL is inlined as a common
+table expression into every model that references it, so intermediate staging steps cost
+neither a write nor a read of a physical table. Ephemeral nodes stay in the parsed models
+and the dependency graph for lineage and documentation; the engine skips them at run time.
+"""
+
+import logging
+from typing import Any
+
+from sqlglot import exp
+
+from tee.ast_registry import parse_sql
+from tee.parser.shared.exceptions import ParserError
+from tee.parser.shared.model_utils import compute_sqlglot_hash, is_ephemeral_model
+
+logger = logging.getLogger(__name__)
+
+
+class EphemeralInliningError(ParserError):
+    """Raised when ephemeral models cannot be inlined."""
+
+    pass
+
+
+def inline_ephemeral_models(parsed_models: dict[str, Any], dialect: str | None = None) -> list[str]:
+    """
+    Inline ephemeral models into the resolved SQL of the models that reference them.
+
+    Ephemeral models referencing other ephemeral models are inlined transitively: every
+    ephemeral a model needs becomes a CTE of that model, ordered so each CTE is defined
+    before it is used. CTE names are derived from the ephemeral model name and made
+    unique against the CTEs the model (or another inlined ephemeral) already defines.
+
+    Rewritten models are replaced in parsed_models by copies, so model dicts shared
+    with other mappings (e.g. the parser's own cache) keep the SQL as written.
+
+    Args:
+        parsed_models: Parsed models keyed by model name, updated in place
+        dialect: SQL dialect used to parse and generate the SQL
+
+    Returns:
+        Names of the models whose SQL was rewritten
+
+    Raises:
+        EphemeralInliningError: If ephemeral models reference each other in a cycle
+    """
+    ephemerals = {name: model for name, model in parsed_models.items() if is_ephemeral_model(model)}
+    if not ephemerals:
+        return []
+
+    rewritten = []
+    for name, model_data in parsed_models.items():
+        if name in ephemerals:
+            continue
+
+        sql_data = model_data.get("code", {}).get("sql", {})
+        sql = sql_data.get("resolved_sql") or sql_data.get("original_sql")
+        if not sql:
+            continue
+
+        expression = parse_sql(sql, dialect=dialect)
+        if not _find_ephemeral_references(expression, ephemerals):
+            continue
+
+        inlined = _inline(expression, ephemerals, dialect)
+        sql_data = {**sql_data, "resolved_sql": inlined.sql(dialect=dialect)}
+        parsed_models[name] = {
+            **model_data,
+            "code": {**model_data["code"], "sql": sql_data},
+            "sqlglot_hash": compute_sqlglot_hash(sql_data),
+        }
+        rewritten.append(name)
+        logger.debug(f"Inlined ephemeral models into {name}")
+
+    return rewritten
+
+
+def _inline(
+    expression: exp.Expression, ephemerals: dict[str, Any], dialect: str | None
+) -> exp.Expression:
+    """Return a copy of expression with every ephemeral reference replaced by a CTE."""
+    expression = expression.copy()
+
+    # Ephemerals needed by this query, dependencies first
+    ordered: list[str] = []
+    bodies: dict[str, exp.Expression] = {}
+    _collect(expression, ephemerals, dialect, ordered, bodies, visiting=[])
+
+    # Pick CTE names that don't clash with CTEs already defined anywhere in the query
+    taken = {cte.alias_or_name.lower() for cte in expression.find_all(exp.CTE)}
+    for body in bodies.values():
+        taken.update(cte.alias_or_name.lower() for cte in body.find_all(exp.CTE))
+    cte_names = {}
+    for name in ordered:
+        cte_name = _unique_name(name.replace(".", "__"), taken)
+        taken.add(cte_name.lower())
+        cte_names[name] = cte_name
+
+    ctes = []
+    for name in ordered:
+        body = _replace_references(bodies[name], ephemerals, cte_names)
+        alias = exp.TableAlias(this=exp.to_identifier(cte_names[name]))
+        ctes.append(exp.CTE(this=body, alias=alias))
+
+    expression = _replace_references(expression, ephemerals, cte_names)
+    with_key = "with_" if "with_" in type(expression).arg_types else "with"
+    existing = expression.args.get(with_key)
+    if existing is not None:
+        existing.set("expressions", ctes + list(existing.expressions))
+    else:
+        expression.set(with_key, exp.With(expressions=ctes))
+    return expression
+
+
+def _collect(
+    expression: exp.Expression,
+    ephemerals: dict[str, Any],
+    dialect: str | None,
+    ordered: list[str],
+    bodies: dict[str, exp.Expression],
+    visiting: list[str],
+) -> None:
+    """Depth-first collection of the ephemerals an expression references (post-order)."""
+    for name in _find_ephemeral_references(expression, ephemerals):
+        if name in bodies:
+            continue
+        if name in visiting:
+            cycle = " -> ".join(visiting[visiting.index(name) :] + [name])
+            raise EphemeralInliningError(f"Circular reference between ephemeral models: {cycle}")
+
+        sql_data = ephemerals[name].get("code", {}).get("sql", {})
+        sql = sql_data.get("resolved_sql") or sql_data.get("original_sql")
+        if not sql:
+            raise EphemeralInliningError(f"Ephemeral model {name} has no SQL to inline")
+
+        body = _qualify_relations(parse_sql(sql, dialect=dialect), name, ephemerals)
+        _collect(body, ephemerals, dialect, ordered, bodies, visiting + [name])
+        bodies[name] = body
+        ordered.append(name)
+
+
+def _qualify_relations(
+    body: exp.Expression, ephemeral_name: str, ephemerals: dict[str, Any]
+) -> exp.Expression:
+    """
+    Qualify unqualified table references in an ephemeral body with its own schema.
+
+    Once inlined, the body runs inside another model's query, so references must not
+    depend on the schema of the model they end up in.
+    """
+    if "." not in ephemeral_name:
+        return body
+
+    schema_name = ephemeral_name.rsplit(".", 1)[0]
+    local_ctes = {cte.alias_or_name.lower() for cte in body.find_all(exp.CTE)}
+    for table in body.find_all(exp.Table):
+        if table.db or not table.name or table.name.lower() in local_ctes:
+            continue
+        if _match_ephemeral(table, ephemerals):
+            continue
+        table.set("db", exp.to_identifier(schema_name))
+    return body
+
+
+def _find_ephemeral_references(expression: exp.Expression, ephemerals: dict[str, Any]) -> list[str]:
+    """Names of the ephemeral models referenced by an expression, in order of appearance."""
+    cte_names = {cte.alias_or_name.lower() for cte in expression.find_all(exp.CTE)}
+    found = []
+    for table in expression.find_all(exp.Table):
+        if not table.db and table.name.lower() in cte_names:
+            continue
+        name = _match_ephemeral(table, ephemerals)
+        if name and name not in found:
+            found.append(name)
+    return found
+
+
+def _match_ephemeral(table: exp.Table, ephemerals: dict[str, Any]) -> str | None:
+    """Resolve a table reference to an ephemeral model name, if it is one."""
+    if not table.name:
+        return None
+
+    reference = f"{table.db}.{table.name}" if table.db else table.name
+    if reference in ephemerals:
+        return reference
+    if table.db:
+        return None
+
+    # Unqualified reference: match on the model's table name
+    matches = [name for name in ephemerals if name.split(".")[-1] == table.name]
+    return matches[0] if len(matches) == 1 else None
+
+
+def _replace_references(
+    expression: exp.Expression, ephemerals: dict[str, Any], cte_names: dict[str, str]
+) -> exp.Expression:
+    """Point ephemeral table references at their CTEs, keeping the original alias."""
+    local_ctes = {cte.alias_or_name.lower() for cte in expression.find_all(exp.CTE)}
+
+    def transform(node: exp.Expression) -> exp.Expression:
+        if not isinstance(node, exp.Table):
+            return node
+        if not node.db and node.name.lower() in local_ctes:
+            return node
+        name = _match_ephemeral(node, ephemerals)
+        if name is None or name not in cte_names:
+            return node
+
+        # Keep column qualifiers like orders.id valid by aliasing the CTE as the table
+        alias = node.alias or node.name
+        return exp.Table(this=exp.to_identifier(cte_names[name])).as_(alias)
+
+    return expression.transform(transform)
+
+
+def _unique_name(base: str, taken: set[str]) -> str:
+    """Return base, or base with a numeric suffix if it's already taken."""
+    candidate = base
+    counter = 1
+    while candidate.lower() in taken:
+        candidate = f"{base}_{counter}"
+        counter += 1
+    return candidate
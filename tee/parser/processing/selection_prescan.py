@@ -0,0 +1,102 @@
+"""
+Reference pre-scan for selection-aware (lazy) compilation.
+
+A run with --select only executes the selected models, but the full compile parses every
+model file with sqlglot. The pre-scan reads the model files as plain text instead, and
+finds the SQL files the selection actually needs: the selected models plus everything
+they may depend on, directly or transitively. Only those files are then fully parsed.
+
+References are found with a tokenizer, not a SQL parser: every identifier in a file that
+matches a model's table name counts as a reference. This over-approximates (a column
+named like a model pulls that model in), which only costs an extra parse, but never
+misses a reference written in the SQL.
+"""
+
+import logging
+import re
+from collections import deque
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_COMMENT_PATTERN = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_$]*")
+
+
+def scan_identifiers(text: str) -> set[str]:
+    """
+    Return the lowercased identifiers appearing in a file, ignoring SQL comments.
+
+    Args:
+        text: File content
+
+    Returns:
+        Set of lowercased identifier tokens
+    """
+    text = _COMMENT_PATTERN.sub(" ", text)
+    return {token.lower() for token in _IDENTIFIER_PATTERN.findall(text)}
+
+
+def select_model_files(
+    files: dict[str, list[Path]],
+    models_folder: Path,
+    table_resolver,
+    select_patterns: list[str],
+) -> set[Path] | None:
+    """
+    Find the SQL model files needed to run a selection.
+
+    Python files defining models of their own and imported OTS modules can't be mapped
+    to model names without executing or loading them, so they are always parsed; the
+    models they reference are followed like those of a selected model.
+
+    Args:
+        files: Discovered model files ('sql', 'python' and 'ots' lists)
+        models_folder: Path to the models folder
+        table_resolver: TableResolver used to name models after their files
+        select_patterns: --select patterns
+
+    Returns:
+        SQL files to parse, or None if the selection can't be resolved by a pre-scan
+        (tag selection needs every model's metadata, column_changed: selection the
+        column lineage of the models downstream of the change)
+    """
+    from tee.cli.selection import COLUMN_CHANGED_PREFIX, ModelSelector
+
+    if any(pattern.startswith("tag:") for pattern in select_patterns):
+        logger.debug("Tag selection requires a full compile")
+        return None
+    if any(pattern.startswith(COLUMN_CHANGED_PREFIX) for pattern in select_patterns):
+        logger.debug("Column change selection requires a full compile")
+        return None
+
+    sql_files = {path.with_suffix(""): path for path in files["sql"]}
+
+    # Model name -> (SQL file, identifiers) for every SQL model
+    sql_models: dict[str, tuple[Path, set[str]]] = {}
+    for path in files["sql"]:
+        name = table_resolver.generate_full_table_name(path, models_folder)
+        sql_models[name] = (path, scan_identifiers(path.read_text(encoding="utf-8")))
+
+    # Files that are always parsed: Python files without a companion SQL file, OTS modules
+    always_parsed = [path for path in files["python"] if path.with_suffix("") not in sql_files]
+    always_parsed.extend(files["ots"])
+
+    by_table_name: dict[str, list[str]] = {}
+    for name in sql_models:
+        by_table_name.setdefault(name.split(".")[-1].lower(), []).append(name)
+
+    selector = ModelSelector(select_patterns=select_patterns)
+    needed = {name for name in sql_models if selector.is_selected(name, {})}
+
+    pending = deque(sql_models[name][1] for name in needed)
+    pending.extend(scan_identifiers(path.read_text(encoding="utf-8")) for path in always_parsed)
+    while pending:
+        for token in pending.popleft():
+            for name in by_table_name.get(token, []):
+                if name not in needed:
+                    needed.add(name)
+                    pending.append(sql_models[name][1])
+
+    logger.debug(f"Pre-scan selected {len(needed)} of {len(sql_models)} SQL models")
+    return {sql_models[name][0] for name in needed}
@@ -3,15 +3,47 @@ SQL Variable Substitution
 
 Handles variable substitution in SQL content using @variable_name and {{ variable_name }} syntax.
 Supports nested object access, default values, and proper error handling.
+
+SQL content is compiled once into a SQLTemplate: a single scan splits it into literal text
+and variable placeholders. Rendering joins the parts with the formatted values in one
+linear pass, and validation only looks up the placeholders. Compiled templates are cached
+by content, so the same file rendered with different variables (e.g. in a backfill loop)
+is only scanned once.
 """
 
+import functools
 import re
+from dataclasses import dataclass
 from typing import Any
 
-from tee.parser.shared.constants import SQL_VARIABLE_PATTERNS
 from tee.parser.shared.exceptions import VariableSubstitutionError
 from tee.parser.shared.types import Variables
 
+# Maximum number of compiled templates kept in the cache
+TEMPLATE_CACHE_SIZE = 2048
+
+_NAME = r"\w+(?:\.\w+)*"
+
+# All placeholder syntaxes in one alternation. At any position the first alternative
+# that matches wins, so a placeholder with a default is never read as one without.
+_PLACEHOLDER_PATTERN = re.compile(
+    "|".join(
+        [
+            # @variable_name:default
+            rf"@(?P<at_default_name>{_NAME}):(?P<at_default>[^@\s]+)",
+            # @variable_name (not followed by a default)
+            rf"@(?P<at_name>{_NAME})(?![:\w])",
+            # {{ variable_name:default }}
+            rf"\{{\{{\s*(?P<colon_default_name>{_NAME})\s*:\s*(?P<colon_default>[^}}]+)\s*\}}\}}",
+            # {{ variable_name }}
+            rf"\{{\{{\s*(?P<jinja_name>{_NAME})\s*\}}\}}",
+            # {{ variable_name | default('value') }}
+            rf"\{{\{{\s*(?P<jinja_default_name>{_NAME})\s*\|\s*default\s*\(\s*"
+            rf"(?P<jinja_default>[^)]+)\s*\)\s*\}}\}}",
+        ]
+    )
+)
+
 
 def _format_sql_value(value: Any) -> str:
     """
@@ -66,6 +98,154 @@ def get_nested_value(data: dict[str, Any], key_path: str) -> Any:
     return current
 
 
+@dataclass(frozen=True)
+class Placeholder:
+    """A variable reference in SQL content."""
+
+    name: str
+    default: str | None
+    display: str
+
+
+class SQLTemplate:
+    """
+    SQL content compiled into literal text and variable placeholders.
+
+    The literal parts surround the placeholders: parts[i] precedes placeholders[i], and
+    the last part follows the last placeholder.
+    """
+
+    def __init__(self, source: str, parts: list[str], placeholders: list[Placeholder]) -> None:
+        """
+        Initialize the template.
+
+        Args:
+            source: Original SQL content
+            parts: Literal text between the placeholders
+            placeholders: Placeholders in order of appearance
+        """
+        self.source = source
+        self.parts = parts
+        self.placeholders = placeholders
+
+    @property
+    def referenced_vars(self) -> list[str]:
+        """Names of the referenced variables, in order of first appearance."""
+        return list(dict.fromkeys(placeholder.name for placeholder in self.placeholders))
+
+    def render(self, variables: Variables) -> str:
+        """
+        Substitute the variables into the template.
+
+        Args:
+            variables: Dictionary of variables for substitution
+
+        Returns:
+            SQL content with variables substituted. The original SQL is returned when no
+            variables are provided, or when a variable without default is missing.
+        """
+        if not variables or not self.placeholders:
+            return self.source
+
+        rendered = []
+        for part, placeholder in zip(self.parts[:-1], self.placeholders, strict=True):
+            rendered.append(part)
+            try:
+                value = get_nested_value(variables, placeholder.name)
+            except KeyError:
+                if placeholder.default is None:
+                    return self.source
+                value = placeholder.default
+            rendered.append(_format_sql_value(value))
+        rendered.append(self.parts[-1])
+        return "".join(rendered)
+
+    def validate(self, variables: Variables) -> dict[str, Any]:
+        """
+        Validate that all variables without defaults are available.
+
+        Args:
+            variables: Dictionary of available variables
+
+        Returns:
+            Dict with validation result
+
+        Raises:
+            VariableSubstitutionError: If variables are missing
+        """
+        missing_vars = []
+        for placeholder in self.placeholders:
+            if placeholder.default is not None or placeholder.display in missing_vars:
+                continue
+            try:
+                get_nested_value(variables, placeholder.name)
+            except KeyError:
+                missing_vars.append(placeholder.display)
+
+        if missing_vars:
+            raise VariableSubstitutionError(
+                f"Missing variables: {', '.join(missing_vars)}. "
+                f"Available variables: {list(variables.keys())}"
+            )
+
+        referenced_vars = self.referenced_vars
+        referenced_roots = {name.split(".")[0] for name in referenced_vars}
+        return {
+            "valid": True,
+            "missing_vars": [],
+            "referenced_vars": referenced_vars,
+            "unused_vars": [var for var in variables.keys() if var not in referenced_roots],
+        }
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_sql_template(sql_content: str) -> SQLTemplate:
+    """
+    Compile SQL content into a template, scanning it once for placeholders.
+
+    Supports:
+    - @variable_name syntax
+    - @variable_name:default syntax
+    - {{ variable_name }} syntax (Jinja-style)
+    - {{ variable_name:default }} and {{ variable_name | default('value') }} syntax
+    - Nested object access with dot notation (e.g., config.database.host)
+
+    Args:
+        sql_content: SQL content with variable placeholders
+
+    Returns:
+        Compiled template (cached by content)
+    """
+    parts = []
+    placeholders = []
+    position = 0
+    for match in _PLACEHOLDER_PATTERN.finditer(sql_content):
+        groups = match.groupdict()
+        if groups["at_default_name"]:
+            name = groups["at_default_name"]
+            placeholder = Placeholder(name, groups["at_default"].strip(), f"@{name}")
+        elif groups["at_name"]:
+            name = groups["at_name"]
+            placeholder = Placeholder(name, None, f"@{name}")
+        elif groups["colon_default_name"]:
+            name = groups["colon_default_name"]
+            placeholder = Placeholder(name, groups["colon_default"].strip(), f"{{{{ {name} }}}}")
+        elif groups["jinja_name"]:
+            name = groups["jinja_name"]
+            placeholder = Placeholder(name, None, f"{{{{ {name} }}}}")
+        else:
+            name = groups["jinja_default_name"]
+            default = groups["jinja_default"].strip().strip("'\"")  # Remove quotes
+            placeholder = Placeholder(name, default, f"{{{{ {name} }}}}")
+
+        parts.append(sql_content[position : match.start()])
+        placeholders.append(placeholder)
+        position = match.end()
+    parts.append(sql_content[position:])
+
+    return SQLTemplate(sql_content, parts, placeholders)
+
+
 def substitute_sql_variables(sql_content: str, variables: Variables) -> str:
     """
     Substitute variables in SQL content using @variable_name and {{ variable_name }} syntax.
@@ -87,84 +267,12 @@ def substitute_sql_variables(sql_content: str, variables: Variables) -> str:
     Raises:
         VariableSubstitutionError: If variable substitution fails
     """
-    try:
-        result = sql_content
-
-        # If no variables provided, return original SQL unchanged
-        if not variables:
-            return result
-
-        # Handle @variable_name:default syntax first
-        at_with_default_pattern = r"@(\w+(?:\.\w+)*):([^@\s]+)"
-        for match in re.finditer(at_with_default_pattern, result):
-            var_name = match.group(1)
-            default_value = match.group(2).strip()
-
-            try:
-                value = get_nested_value(variables, var_name)
-                sql_value = _format_sql_value(value)
-            except KeyError:
-                # Use default value
-                sql_value = _format_sql_value(default_value)
-
-            result = result.replace(match.group(0), sql_value)
-
-        # Handle @variable_name syntax (without defaults)
-        at_pattern = r"@(\w+(?:\.\w+)*)(?![:\w])"  # Match @variable but not @variable:default
-        for match in re.finditer(at_pattern, result):
-            var_name = match.group(1)
-            try:
-                value = get_nested_value(variables, var_name)
-                sql_value = _format_sql_value(value)
-                result = result.replace(f"@{var_name}", sql_value)
-            except KeyError:
-                # If variable is missing and no default, return original SQL (don't raise error)
-                return sql_content
-
-        # Handle {{ variable_name:default }} syntax first
-        jinja_with_default_pattern = r"\{\{\s*(\w+(?:\.\w+)*)\s*:\s*([^}]+)\s*\}\}"
-        for match in re.finditer(jinja_with_default_pattern, result):
-            var_name = match.group(1).strip()
-            default_value = match.group(2).strip()
-
-            try:
-                value = get_nested_value(variables, var_name)
-                sql_value = _format_sql_value(value)
-            except KeyError:
-                # Use default value
-                sql_value = _format_sql_value(default_value)
-
-            result = result.replace(match.group(0), sql_value)
-
-        # Handle {{ variable_name }} syntax (without defaults)
-        jinja_pattern = SQL_VARIABLE_PATTERNS["jinja_variable"]
-        for match in re.finditer(jinja_pattern, result):
-            var_name = match.group(1).strip()
-            try:
-                value = get_nested_value(variables, var_name)
-                sql_value = _format_sql_value(value)
-                result = result.replace(match.group(0), sql_value)
-            except KeyError:
-                # If variable is missing and no default, return original SQL (don't raise error)
-                return sql_content
-
-        # Handle {{ variable_name | default('value') }} syntax
-        jinja_default_pattern = SQL_VARIABLE_PATTERNS["jinja_with_default"]
-        for match in re.finditer(jinja_default_pattern, result):
-            var_name = match.group(1).strip()
-            default_value = match.group(2).strip().strip("'\"")  # Remove quotes
-
-            try:
-                value = get_nested_value(variables, var_name)
-                sql_value = _format_sql_value(value)
-            except KeyError:
-                # Use default value
-                sql_value = _format_sql_value(default_value)
-
-            result = result.replace(match.group(0), sql_value)
-
-        return result
+    # If no variables provided, return original SQL unchanged
+    if not variables:
+        return sql_content
 
+    try:
+        return compile_sql_template(sql_content).render(variables)
     except Exception as e:
         if isinstance(e, VariableSubstitutionError):
             raise
@@ -186,51 +294,7 @@ def validate_sql_variables(sql_content: str, variables: Variables) -> dict[str,
         VariableSubstitutionError: If validation fails
     """
     try:
-        missing_vars = []
-        referenced_vars = []
-
-        # Check @variable_name syntax (without defaults)
-        at_pattern = SQL_VARIABLE_PATTERNS["at_variable"]
-        for match in re.finditer(at_pattern, sql_content):
-            var_name = match.group(1)
-            referenced_vars.append(var_name)
-            # Skip if this is part of a @variable:default pattern
-            if not re.search(rf"@{re.escape(var_name)}:", sql_content):
-                try:
-                    get_nested_value(variables, var_name)
-                except KeyError:
-                    missing_vars.append(f"@{var_name}")
-
-        # Check {{ variable_name }} syntax
-        jinja_pattern = SQL_VARIABLE_PATTERNS["jinja_variable"]
-        for match in re.finditer(jinja_pattern, sql_content):
-            var_name = match.group(1).strip()
-            referenced_vars.append(var_name)
-            try:
-                get_nested_value(variables, var_name)
-            except KeyError:
-                missing_vars.append(f"{{{{ {var_name} }}}}")
-
-        # Note: @variable:default and {{ variable_name | default('value') }} syntax
-        # don't need validation as they have default values
-
-        # Find unused variables
-        referenced_vars_set = set(referenced_vars)
-        unused_vars = [var for var in variables.keys() if var not in referenced_vars_set]
-
-        if missing_vars:
-            raise VariableSubstitutionError(
-                f"Missing variables: {', '.join(missing_vars)}. "
-                f"Available variables: {list(variables.keys())}"
-            )
-
-        return {
-            "valid": True,
-            "missing_vars": [],
-            "referenced_vars": list(referenced_vars_set),
-            "unused_vars": unused_vars,
-        }
-
+        return compile_sql_template(sql_content).validate(variables)
     except Exception as e:
         if isinstance(e, VariableSubstitutionError):
             raise
@@ -51,9 +51,15 @@ class ValidatedModelMetadata:
 
     def __post_init__(self):
         """Validate metadata after initialization."""
-        if self.materialization and self.materialization not in ["table", "view", "incremental"]:
+        if self.materialization and self.materialization not in [
+            "table",
+            "view",
+            "incremental",
+            "ephemeral",
+            "external_table",
+        ]:
             raise ValueError(
-                f"Invalid materialization type: {self.materialization}. Must be one of: table, view, incremental"
+                f"Invalid materialization type: {self.materialization}. Must be one of: table, view, incremental, ephemeral, external_table"
             )
         if self.tests is None:
             self.tests = []
@@ -73,9 +79,10 @@ class ValidatedModelMetadata:
         if not strategy:
             raise ValueError("Incremental strategy is required when incremental config is provided")
 
-        if strategy not in ["append", "merge", "delete_insert"]:
+        if strategy not in ["append", "merge", "delete_insert", "insert_overwrite"]:
             raise ValueError(
-                f"Invalid incremental strategy: {strategy}. Must be one of: append, merge, delete_insert"
+                f"Invalid incremental strategy: {strategy}. "
+                "Must be one of: append, merge, delete_insert, insert_overwrite"
             )
 
         # Validate strategy-specific configuration
@@ -108,6 +115,14 @@ class ValidatedModelMetadata:
                     "Delete+insert strategy requires 'filter_column' in delete_insert configuration"
                 )
 
+        elif strategy == "insert_overwrite":
+            insert_overwrite_config = self.incremental.get("insert_overwrite") or {}
+            if not insert_overwrite_config.get("partition_by") and not self.partitions:
+                raise ValueError(
+                    "Insert_overwrite strategy requires 'partitions' in the model metadata "
+                    "or 'partition_by' in insert_overwrite configuration"
+                )
+
 
 def validate_metadata_dict(metadata_dict: ModelMetadata) -> ValidatedModelMetadata:
     """
@@ -167,6 +182,10 @@ def validate_metadata_dict(metadata_dict: ModelMetadata) -> ValidatedModelMetada
         if incremental is not None and not isinstance(incremental, dict):
             raise ValueError("Incremental configuration must be a dictionary")
 
+        external = metadata_dict.get("external")
+        if external is not None and not isinstance(external, dict):
+            raise ValueError("External configuration must be a dictionary")
+
         return ValidatedModelMetadata(
             description=metadata_dict.get("description"),
             schema=schema,
@@ -211,9 +230,11 @@ def parse_metadata_from_python_file(file_path: str) -> dict[str, Any] | None:
                 ColumnDefinition,
                 ColumnTestName,
                 DataType,
+                ExternalTableConfig,
                 IncrementalAppendConfig,
                 IncrementalConfig,
                 IncrementalDeleteInsertConfig,
+                IncrementalInsertOverwriteConfig,
                 IncrementalMergeConfig,
                 IncrementalStrategy,
                 MaterializationType,
@@ -234,6 +255,8 @@ def parse_metadata_from_python_file(file_path: str) -> dict[str, Any] | None:
                     "IncrementalAppendConfig": IncrementalAppendConfig,
                     "IncrementalMergeConfig": IncrementalMergeConfig,
                     "IncrementalDeleteInsertConfig": IncrementalDeleteInsertConfig,
+                    "IncrementalInsertOverwriteConfig": IncrementalInsertOverwriteConfig,
+                    "ExternalTableConfig": ExternalTableConfig,
                 }
             )
 
@@ -68,6 +68,20 @@ def compute_sqlglot_hash(sql_data: dict[str, Any]) -> str:
     return hashlib.sha256(resolved_sql.encode("utf-8")).hexdigest()
 
 
+def is_ephemeral_model(model_data: dict[str, Any]) -> bool:
+    """
+    Check whether a parsed model uses the ephemeral materialization.
+
+    Args:
+        model_data: Parsed model data
+
+    Returns:
+        True if the model is inlined as a CTE instead of being materialized
+    """
+    metadata = model_data.get("model_metadata", {}).get("metadata") or {}
+    return isinstance(metadata, dict) and metadata.get("materialization") == "ephemeral"
+
+
 def standardize_parsed_model(
     model_data: dict[str, Any],
     table_name: str,
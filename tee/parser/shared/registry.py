@@ -116,6 +116,21 @@ class ModelRegistry:
             for model_data in cls._models.values()
         )
 
+    @classmethod
+    def unregister_file(cls, file_path: str) -> None:
+        """
+        Remove all models registered from a specific file path, so it can be re-parsed.
+
+        Args:
+            file_path: Absolute file path
+        """
+        for table_name in [
+            name
+            for name, model_data in cls._models.items()
+            if model_data.get("model_metadata", {}).get("file_path") == file_path
+        ]:
+            del cls._models[table_name]
+
     @classmethod
     def clear(cls) -> None:
         """
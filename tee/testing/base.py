@@ -1,5 +1,12 @@
 """
 Base classes and types for the testing framework.
+
+Standard tests compute exact answers by default. Tests that support it can also run in
+a cheaper mode (TestMode): `sample` checks a random sample of the table, and `approx`
+runs an approximate pre-check, escalating to the exact query only when it indicates a
+possible violation. An approximate check cannot prove a pass, so when it estimates no
+violation the test is reported as an unverified warning. Each TestResult records the
+mode its answer was computed in.
 """
 
 from abc import ABC, abstractmethod
@@ -7,6 +14,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+from tee.adapters.base.arrow import supports_arrow_results
+
 
 class TestSeverity(Enum):
     """Severity level for test failures."""
@@ -17,6 +26,64 @@ class TestSeverity(Enum):
     WARNING = "warning"
 
 
+class TestMode(Enum):
+    """How a test computes its answer."""
+
+    __test__ = False  # Tell pytest this is not a test class
+
+    EXACT = "exact"
+    SAMPLE = "sample"
+    APPROX = "approx"
+
+
+# Percentage of a table read by tests in sample mode, unless configured otherwise
+DEFAULT_SAMPLE_PERCENT = 10.0
+
+
+def parse_test_mode(mode: TestMode | str | None) -> TestMode:
+    """
+    Parse a test mode from its configured name.
+
+    Args:
+        mode: TestMode, mode name (case insensitive) or None for exact
+
+    Returns:
+        TestMode
+
+    Raises:
+        ValueError: If the mode name is unknown
+    """
+    if mode is None or isinstance(mode, TestMode):
+        return mode or TestMode.EXACT
+    try:
+        return TestMode(str(mode).lower())
+    except ValueError:
+        valid = ", ".join(m.value for m in TestMode)
+        raise ValueError(f"Invalid test mode '{mode}', expected one of: {valid}") from None
+
+
+def parse_sample_percent(percent: Any) -> float:
+    """
+    Validate the percentage of a table read by tests in sample mode.
+
+    Args:
+        percent: Percentage, or None for DEFAULT_SAMPLE_PERCENT
+
+    Returns:
+        Percentage as a float in (0, 100]
+
+    Raises:
+        ValueError: If the percentage is not a number in (0, 100]
+    """
+    if percent is None:
+        return DEFAULT_SAMPLE_PERCENT
+    if isinstance(percent, bool) or not isinstance(percent, (int, float)):
+        raise ValueError(f"Invalid sample_percent {percent!r}, expected a number")
+    if not 0 < percent <= 100:
+        raise ValueError(f"Invalid sample_percent {percent}, expected a value in (0, 100]")
+    return float(percent)
+
+
 @dataclass
 class TestResult:
     """Result of a test execution."""
@@ -32,9 +99,13 @@ class TestResult:
     severity: TestSeverity = TestSeverity.ERROR
     rows_returned: int | None = None
     error: str | None = None
+    mode: TestMode = TestMode.EXACT
+    cached: bool = False  # Passed on unchanged relations in an earlier run, not re-run
 
     def __str__(self) -> str:
         status = "✅ PASS" if self.passed else f"❌ FAIL ({self.severity.value.upper()})"
+        if self.cached:
+            status = "✅ CACHED PASS"
         if self.function_name:
             location = self.function_name
         elif self.column_name:
@@ -43,12 +114,30 @@ class TestResult:
             )
         else:
             location = self.table_name or "unknown"
+        if self.mode is not TestMode.EXACT:
+            status = f"{status} [{self.mode.value}]"
         return f"{status} {self.test_name} on {location}: {self.message}"
 
 
 class StandardTest(ABC):
     """Base class for standard tests."""
 
+    # Tests that can be limited to the last batch of an incremental model set this and
+    # implement get_scoped_test_query()
+    supports_incremental_scope: bool = False
+
+    # Tests that can check a sample of the table set this; they receive sample_percent
+    # in get_scoped_test_query()
+    supports_sampling: bool = False
+
+    # Tests with a cheap approximate pre-check set this and implement
+    # get_approx_check_query()
+    supports_approximation: bool = False
+
+    # Tests whose outcome only depends on the relations of get_input_relations() set
+    # this, so their passes can be cached until those relations change
+    supports_result_cache: bool = False
+
     def __init__(self, name: str, severity: TestSeverity = TestSeverity.ERROR):
         """
         Initialize a standard test.
@@ -89,6 +178,75 @@ class StandardTest(ABC):
         """
         pass
 
+    def get_scoped_test_query(
+        self,
+        adapter,
+        table_name: str,
+        column_name: str | None = None,
+        params: dict[str, Any] | None = None,
+        where: str | None = None,
+        sample_percent: float | None = None,
+    ) -> str:
+        """
+        Generate the SQL query for this test, limited to some rows of the table.
+
+        Only called for tests that set supports_incremental_scope (with `where`) or
+        supports_sampling (with `sample_percent`).
+
+        Args:
+            adapter: Database adapter instance (for database-specific SQL generation)
+            table_name: Fully qualified table name
+            column_name: Column name if this is a column-level test
+            params: Optional parameters for the test
+            where: Optional condition selecting the rows to test
+            sample_percent: Optional percentage of the table to sample
+
+        Returns:
+            SQL query string
+        """
+        raise NotImplementedError(f"{self.name} test cannot be limited to some rows")
+
+    def get_approx_check_query(
+        self,
+        adapter,  # noqa: ARG002
+        table_name: str,  # noqa: ARG002
+        column_name: str | None = None,  # noqa: ARG002
+        params: dict[str, Any] | None = None,  # noqa: ARG002
+    ) -> str | None:
+        """
+        Generate a cheap query estimating the number of violations of this test.
+
+        Only called for tests that set supports_approximation.
+
+        Args:
+            adapter: Database adapter instance (for database-specific SQL generation)
+            table_name: Fully qualified table name
+            column_name: Column name if this is a column-level test
+            params: Optional parameters for the test
+
+        Returns:
+            SQL query returning the estimated violation count, or None if this test
+            configuration (or the database) has no approximate check
+        """
+        return None
+
+    def get_input_relations(
+        self,
+        table_name: str,
+        params: dict[str, Any] | None = None,  # noqa: ARG002
+    ) -> list[str]:
+        """
+        List the relations whose data decides the outcome of this test.
+
+        Args:
+            table_name: Fully qualified table name
+            params: Optional parameters for the test
+
+        Returns:
+            Relation names, the tested table first
+        """
+        return [table_name]
+
     @abstractmethod
     def validate_params(
         self, params: dict[str, Any] | None = None, column_name: str | None = None
@@ -156,6 +314,31 @@ class StandardTest(ABC):
 
         return 0
 
+    def _count_result_rows(self, adapter: Any, query: str) -> int:
+        """
+        Count the rows a query returns.
+
+        Adapters with Arrow results count them on a columnar table, so violating rows
+        are never turned into Python objects. Adapters that stream results (PostgreSQL,
+        on a pooled connection) count them batch by batch; other adapters fetch them
+        as rows.
+
+        Args:
+            adapter: Database adapter instance
+            query: Query returning the violating rows
+
+        Returns:
+            Number of rows returned
+        """
+        if supports_arrow_results(adapter):
+            return adapter.execute_arrow(query).num_rows
+
+        if getattr(adapter, "supports_streaming_results", False) is True:
+            return sum(len(batch) for batch in adapter.iter_query_batches(query))
+
+        results = adapter.execute_query(query)
+        return len(results) if isinstance(results, list) else 0
+
     def check_passed(self, count: int) -> bool:
         """
         Determine if test passed based on count value.
@@ -195,10 +378,18 @@ class StandardTest(ABC):
         function_name: str | None = None,
         params: dict[str, Any] | None = None,
         severity: TestSeverity | None = None,
+        where: str | None = None,
+        mode: TestMode | None = None,
+        sample_percent: float | None = None,
     ) -> TestResult:
         """
         Execute the test against a table or function.
 
+        In approx mode, the approximate check runs first. If it estimates no violation,
+        the result is a warning that is not verified (the estimate may be wrong), never
+        a pass; otherwise the exact query decides, and the result is recorded as exact.
+        Modes the test (or configuration) does not support fall back to exact.
+
         Args:
             adapter: Database adapter instance
             table_name: Fully qualified table name (for model tests)
@@ -206,6 +397,10 @@ class StandardTest(ABC):
             function_name: Fully qualified function name (for function tests)
             params: Optional parameters for the test
             severity: Override severity level (uses test default if None)
+            where: Optional condition limiting the rows tested (requires
+                supports_incremental_scope)
+            mode: How to compute the answer (exact if None)
+            sample_percent: Percentage of the table checked in sample mode
 
         Returns:
             TestResult object
@@ -215,10 +410,54 @@ class StandardTest(ABC):
 
         # Use provided severity or test default
         test_severity = severity or self.severity
+        mode = self._effective_mode(mode, where)
 
         try:
+            notes = []
+            if where:
+                notes.append("last incremental batch")
+
+            if mode is TestMode.APPROX:
+                check_query = self.get_approx_check_query(adapter, table_name, column_name, params)
+                if check_query is None:
+                    mode = TestMode.EXACT
+                else:
+                    estimate = self._extract_row_count(adapter.execute_query(check_query))
+                    if estimate <= 0:
+                        # Estimates can exceed the true distinct count and hide duplicates,
+                        # so only the exact query can pass the test
+                        return TestResult(
+                            test_name=self.name,
+                            table_name=table_name,
+                            column_name=column_name,
+                            passed=False,
+                            message=(
+                                "Approximate check estimated no violations "
+                                "(not verified by the exact query)"
+                            ),
+                            severity=TestSeverity.WARNING,
+                            mode=TestMode.APPROX,
+                        )
+                    # The estimate may be wrong either way: let the exact query decide
+                    notes.append(f"approximate check estimated ~{estimate} violation(s)")
+                    mode = TestMode.EXACT
+
             # Get test query (adapter generates database-specific SQL)
-            query = self.get_test_query(adapter, table_name, column_name, function_name, params)
+            if mode is TestMode.SAMPLE:
+                sample_percent = parse_sample_percent(sample_percent)
+                query = self.get_scoped_test_query(
+                    adapter,
+                    table_name,
+                    column_name,
+                    params,
+                    where=where,
+                    sample_percent=sample_percent,
+                )
+                notes.append(f"{sample_percent:g}% sample")
+            elif where:
+                query = self.get_scoped_test_query(adapter, table_name, column_name, params, where)
+            else:
+                query = self.get_test_query(adapter, table_name, column_name, function_name, params)
 
             # Execute query
             results = adapter.execute_query(query)
@@ -231,6 +470,8 @@ class StandardTest(ABC):
 
             # Format message
             message = self.format_message(passed, count)
+            if notes:
+                message += f" ({', '.join(notes)})"
 
             return TestResult(
                 test_name=self.name,
@@ -240,6 +481,7 @@ class StandardTest(ABC):
                 message=message,
                 severity=test_severity,
                 rows_returned=count,
+                mode=mode,
             )
 
         except Exception as e:
@@ -252,8 +494,29 @@ class StandardTest(ABC):
                 message=error_msg,
                 severity=test_severity,
                 error=str(e),
+                mode=mode,
             )
 
+    def _effective_mode(self, mode: TestMode | None, where: str | None) -> TestMode:
+        """
+        Determine the mode a test actually runs in.
+
+        Sampling needs supports_sampling. Approximation needs supports_approximation and
+        a whole-table check (the last batch of an incremental model is already small).
+
+        Args:
+            mode: Requested mode
+            where: Optional condition limiting the rows tested
+
+        Returns:
+            Requested mode if supported, otherwise exact
+        """
+        if mode is TestMode.SAMPLE and self.supports_sampling:
+            return mode
+        if mode is TestMode.APPROX and self.supports_approximation and not where:
+            return mode
+        return TestMode.EXACT
+
 
 class TestRegistry:
     """Registry for standard tests."""
@@ -21,14 +21,34 @@ class TestExecutor:
 
     __test__ = False  # Tell pytest this is not a test class
 
-    def __init__(self, adapter: DatabaseAdapter, project_folder: str | None = None):
+    def __init__(
+        self,
+        adapter: DatabaseAdapter,
+        project_folder: str | None = None,
+        state_manager: Any = None,
+        full_tests: bool = False,
+        test_config: dict[str, Any] | None = None,
+        test_cache: bool = False,
+    ):
         """
         Initialize test executor.
 
         Args:
             adapter: Database adapter for executing test queries
             project_folder: Optional project folder path for discovering SQL tests
+            state_manager: Optional model state manager, used to limit the tests of
+                incremental models to their last batch
+            full_tests: Run every test exactly over the whole table, even for incremental
+                models and tests configured with another mode
+            test_config: Optional [tests] section of the project configuration, with the
+                default "mode" and "sample_percent" of model tests
+            test_cache: Reuse the passes of model tests on relations unchanged since an
+                earlier run, and record new passes (requires state_manager)
+
+        Raises:
+            ValueError: If the test configuration is invalid
         """
+        test_config = test_config or {}
         self.adapter = adapter
         self.project_folder = Path(project_folder) if project_folder else None
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -36,7 +56,14 @@ class TestExecutor:
 
         # Initialize executors
         self.function_executor = FunctionTestExecutor(adapter)
-        self.model_executor = ModelTestExecutor(adapter)
+        self.model_executor = ModelTestExecutor(
+            adapter,
+            state_manager,
+            full_tests,
+            mode=test_config.get("mode"),
+            sample_percent=test_config.get("sample_percent"),
+            test_cache=test_cache,
+        )
 
         # Discover and register SQL tests from tests/ folder
         if self.project_folder:
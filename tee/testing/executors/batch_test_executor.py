@@ -8,6 +8,7 @@ import logging
 from typing import Any
 
 from tee.adapters.base import DatabaseAdapter
+from tee.parser.shared.model_utils import is_ephemeral_model
 from tee.testing.base import TestResult, TestSeverity
 from tee.testing.executors.function_test_executor import FunctionTestExecutor
 from tee.testing.executors.model_test_executor import ModelTestExecutor
@@ -95,6 +96,7 @@ class BatchTestExecutor:
         return {
             "test_results": all_results,
             "passed": len([r for r in all_results if r.passed]),
+            "cached": len([r for r in all_results if getattr(r, "cached", False) is True]),
             "failed": len(actual_failures),
             "errors": categorized["errors"],
             "warnings": categorized["warnings"],
@@ -186,6 +188,11 @@ class BatchTestExecutor:
                 continue
 
             model_data = parsed_models[table_name]
+            if is_ephemeral_model(model_data):
+                # Ephemeral models have no relation to test against
+                logger.debug(f"Skipping tests for ephemeral model: {table_name}")
+                continue
+
             metadata = MetadataExtractor.extract_model_metadata(model_data)
 
             if not metadata:
@@ -9,6 +9,7 @@ import logging
 from typing import Any
 
 from tee.adapters.base import DatabaseAdapter
+from tee.instrumentation import CATEGORY_NODE, span
 from tee.testing.base import TestRegistry, TestResult, TestSeverity
 from tee.testing.parsers import TestDefinitionParser
 from tee.typing.metadata import TestDefinition
@@ -111,14 +112,23 @@ class FunctionTestExecutor:
         self._used_test_names.add(parsed.test_name)
 
         # Execute test
-        return self._run_function_test(
-            test=test,
-            function_name=function_name,
-            test_name=parsed.test_name,
-            params=parsed.params,
-            expected=parsed.expected,
-            severity_override=parsed.severity_override,
-        )
+        test_node = f"test:{function_name}.{parsed.test_name}"
+        with span(test_node, category=CATEGORY_NODE, node=test_node, node_type="test") as node_span:
+            result = self._run_function_test(
+                test=test,
+                function_name=function_name,
+                test_name=parsed.test_name,
+                params=parsed.params,
+                expected=parsed.expected,
+                severity_override=parsed.severity_override,
+            )
+            if result is None:
+                node_span.set(status="skipped")
+            else:
+                node_span.set(
+                    status="pass" if result.passed else "fail", severity=result.severity.value
+                )
+        return result
 
     def _run_function_test(
         self,
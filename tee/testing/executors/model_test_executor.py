@@ -1,15 +1,28 @@
 """
 Model test execution logic.
 
-Handles execution of tests for models (tables/views).
+Handles execution of tests for models (tables/views). Tests of incremental models that
+support it are limited to the rows of the last batch (see incremental_scope). Tests run
+in the mode of their definition, or the project's default mode (see TestMode). Passes
+on unchanged relations are reused from earlier runs (see result_cache).
 """
 
 import logging
 from typing import Any
 
 from tee.adapters.base import DatabaseAdapter
-from tee.testing.base import TestRegistry, TestResult, TestSeverity
-from tee.testing.parsers import TestDefinitionParser
+from tee.instrumentation import CATEGORY_NODE, span
+from tee.testing.base import (
+    TestMode,
+    TestRegistry,
+    TestResult,
+    TestSeverity,
+    parse_sample_percent,
+    parse_test_mode,
+)
+from tee.testing.incremental_scope import incremental_test_filter
+from tee.testing.parsers import ParsedTestDefinition, TestDefinitionParser
+from tee.testing.result_cache import TestResultCache, hash_test_definition
 from tee.typing.metadata import TestDefinition
 
 logger = logging.getLogger(__name__)
@@ -18,14 +31,42 @@ logger = logging.getLogger(__name__)
 class ModelTestExecutor:
     """Executes tests for models (tables/views)."""
 
-    def __init__(self, adapter: DatabaseAdapter):
+    def __init__(
+        self,
+        adapter: DatabaseAdapter,
+        state_manager: Any = None,
+        full_tests: bool = False,
+        mode: TestMode | str | None = None,
+        sample_percent: float | None = None,
+        test_cache: bool = False,
+    ):
         """
         Initialize model test executor.
 
         Args:
             adapter: Database adapter for executing test queries
+            state_manager: Optional model state manager; without it, tests of incremental
+                models run over the whole table
+            full_tests: Run every test exactly over the whole table, even for incremental
+                models and tests configured with another mode
+            mode: Default mode of tests that don't set one (exact if None)
+            sample_percent: Default percentage of the table checked in sample mode
+            test_cache: Reuse the passes of tests whose relations are unchanged since an
+                earlier run, and record new passes (requires state_manager)
+
+        Raises:
+            ValueError: If the mode or sample percentage is invalid
         """
         self.adapter = adapter
+        self.state_manager = state_manager
+        self.full_tests = full_tests
+        self.mode = parse_test_mode(mode)
+        self.sample_percent = parse_sample_percent(sample_percent)
+        self.result_cache = (
+            TestResultCache(adapter, state_manager)
+            if test_cache and state_manager is not None
+            else None
+        )
         self.logger = logger
         self._used_test_names: set[str] = set()
 
@@ -52,26 +93,53 @@ class ModelTestExecutor:
             return results
 
         severity_overrides = severity_overrides or {}
+        where = self._batch_filter(table_name, metadata)
+        if self.result_cache is not None:
+            # The model (or the relations its tests read) may have been rebuilt
+            self.result_cache.reset()
 
         # Execute column-level tests
         if "schema" in metadata and metadata["schema"]:
             results.extend(
-                self._execute_column_tests(table_name, metadata["schema"], severity_overrides)
+                self._execute_column_tests(
+                    table_name, metadata["schema"], severity_overrides, where
+                )
             )
 
         # Execute model-level tests
         if "tests" in metadata and metadata["tests"]:
             results.extend(
-                self._execute_model_level_tests(table_name, metadata["tests"], severity_overrides)
+                self._execute_model_level_tests(
+                    table_name, metadata["tests"], severity_overrides, where
+                )
             )
 
         return results
 
+    def _batch_filter(self, table_name: str, metadata: dict[str, Any]) -> str | None:
+        """
+        Get the condition limiting the tests of a model to its last incremental batch.
+
+        Args:
+            table_name: Fully qualified table name
+            metadata: Model metadata
+
+        Returns:
+            SQL condition, or None to test the whole table
+        """
+        if self.full_tests or self.state_manager is None:
+            return None
+        where = incremental_test_filter(self.adapter, self.state_manager, table_name, metadata)
+        if where:
+            self.logger.info(f"Testing the last incremental batch of {table_name}: {where}")
+        return where
+
     def _execute_column_tests(
         self,
         table_name: str,
         schema: list[dict[str, Any]],
         severity_overrides: dict[str, TestSeverity],
+        where: str | None = None,
     ) -> list[TestResult]:
         """
         Execute column-level tests.
@@ -80,6 +148,7 @@ class ModelTestExecutor:
             table_name: Fully qualified table name
             schema: List of column definitions with tests
             severity_overrides: Dict of severity overrides
+            where: Optional condition limiting scopable tests to some rows
 
         Returns:
             List of TestResult objects
@@ -101,6 +170,7 @@ class ModelTestExecutor:
                     column_name=column_name,
                     test_def=test_def,
                     severity_overrides=severity_overrides,
+                    where=where,
                 )
                 if result:
                     results.append(result)
@@ -112,6 +182,7 @@ class ModelTestExecutor:
         table_name: str,
         tests: list[TestDefinition],
         severity_overrides: dict[str, TestSeverity],
+        where: str | None = None,
     ) -> list[TestResult]:
         """
         Execute model-level tests.
@@ -120,6 +191,7 @@ class ModelTestExecutor:
             table_name: Fully qualified table name
             tests: List of test definitions
             severity_overrides: Dict of severity overrides
+            where: Optional condition limiting scopable tests to some rows
 
         Returns:
             List of TestResult objects
@@ -132,6 +204,7 @@ class ModelTestExecutor:
                 column_name=None,
                 test_def=test_def,
                 severity_overrides=severity_overrides,
+                where=where,
             )
             if result:
                 results.append(result)
@@ -144,6 +217,7 @@ class ModelTestExecutor:
         column_name: str | None,
         test_def: TestDefinition,
         severity_overrides: dict[str, TestSeverity],
+        where: str | None = None,
     ) -> TestResult | None:
         """
         Execute a single test definition.
@@ -153,6 +227,7 @@ class ModelTestExecutor:
             column_name: Column name (None for model-level tests)
             test_def: Test definition (string name or dict with name/params/severity)
             severity_overrides: Dict of severity overrides
+            where: Optional condition limiting the test to some rows, if it supports it
 
         Returns:
             TestResult or None if test not found
@@ -184,15 +259,93 @@ class ModelTestExecutor:
         # Track that this test was used
         self._used_test_names.add(parsed.test_name)
 
+        mode = TestMode.EXACT if self.full_tests else parsed.mode or self.mode
+        sample_percent = parsed.sample_percent or self.sample_percent
+        cache_key = self._cache_key(
+            test, table_name, column_name, parsed, where, mode, sample_percent
+        )
+
         # Execute test
-        return self._run_test(
-            test=test,
-            table_name=table_name,
-            column_name=column_name,
-            test_name=parsed.test_name,
-            params=parsed.params,
-            severity_override=parsed.severity_override,
+        test_node = f"test:{context}.{parsed.test_name}"
+        with span(test_node, category=CATEGORY_NODE, node=test_node, node_type="test") as node_span:
+            result = None
+            if cache_key:
+                result = self.result_cache.lookup(
+                    table_name,
+                    column_name,
+                    parsed.test_name,
+                    *cache_key,
+                    severity=parsed.severity_override or test.severity,
+                )
+            if result is None:
+                result = self._run_test(
+                    test=test,
+                    table_name=table_name,
+                    column_name=column_name,
+                    test_name=parsed.test_name,
+                    params=parsed.params,
+                    severity_override=parsed.severity_override,
+                    where=where,
+                    mode=mode,
+                    sample_percent=sample_percent,
+                )
+                if cache_key:
+                    self.result_cache.record(result, *cache_key)
+            node_span.set(
+                status="pass" if result.passed else "fail",
+                severity=result.severity.value,
+                rows_returned=result.rows_returned,
+                mode=result.mode.value,
+                cached=result.cached,
+            )
+        return result
+
+    def _cache_key(
+        self,
+        test: Any,
+        table_name: str,
+        column_name: str | None,
+        parsed: ParsedTestDefinition,
+        where: str | None,
+        mode: TestMode,
+        sample_percent: float,
+    ) -> tuple[str, str] | None:
+        """
+        Get the definition hash and relation fingerprint a test's pass is cached under.
+
+        Args:
+            test: Test instance from registry
+            table_name: Fully qualified table name
+            column_name: Column name (None for model-level tests)
+            parsed: Parsed test definition
+            where: Condition limiting scopable tests to some rows, if any
+            mode: Mode the test runs in
+            sample_percent: Sample percentage of sample mode
+
+        Returns:
+            Tuple of (definition_hash, fingerprint), or None if the test can't be cached
+        """
+        if self.result_cache is None or getattr(test, "supports_result_cache", False) is not True:
+            return None
+        if mode is TestMode.SAMPLE and getattr(test, "supports_sampling", False) is True:
+            # Each run checks a new sample
+            return None
+
+        relations = test.get_input_relations(table_name, parsed.params)
+        fingerprint = self.result_cache.fingerprint(relations)
+        if fingerprint is None:
+            return None
+
+        scoped = getattr(test, "supports_incremental_scope", False) is True
+        definition_hash = hash_test_definition(
+            parsed.test_name,
+            column_name,
+            parsed.params,
+            where if scoped else None,
+            mode,
+            sample_percent,
         )
+        return definition_hash, fingerprint
 
     def _run_test(
         self,
@@ -202,6 +355,9 @@ class ModelTestExecutor:
         test_name: str,
         params: dict[str, Any] | None,
         severity_override: TestSeverity | None,
+        where: str | None = None,
+        mode: TestMode | None = None,
+        sample_percent: float | None = None,
     ) -> TestResult:
         """
         Run a model test.
@@ -213,10 +369,26 @@ class ModelTestExecutor:
             test_name: Test name
             params: Test parameters
             severity_override: Optional severity override
+            where: Optional condition limiting the test to some rows; ignored by tests
+                that don't set supports_incremental_scope
+            mode: Mode to run the test in (exact if None)
+            sample_percent: Percentage of the table checked in sample mode
 
         Returns:
             TestResult
         """
+        scope: dict[str, Any] = {}
+        if where and getattr(test, "supports_incremental_scope", False) is True:
+            scope["where"] = where
+
+        mode = mode or TestMode.EXACT
+        if mode is TestMode.SAMPLE and getattr(test, "supports_sampling", False) is True:
+            scope["mode"] = mode
+            scope["sample_percent"] = sample_percent or self.sample_percent
+        elif mode is TestMode.APPROX and getattr(test, "supports_approximation", False) is True:
+            scope["mode"] = mode
+        elif mode is not TestMode.EXACT:
+            self.logger.debug(f"Test {test_name} has no {mode.value} mode, running it exactly")
         try:
             result = test.execute(
                 adapter=self.adapter,
@@ -224,6 +396,7 @@ class ModelTestExecutor:
                 column_name=column_name,
                 params=params,
                 severity=severity_override,
+                **scope,
             )
             return result
         except Exception as e:
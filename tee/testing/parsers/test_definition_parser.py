@@ -8,7 +8,7 @@ import logging
 from dataclasses import dataclass
 from typing import Any
 
-from tee.testing.base import TestSeverity
+from tee.testing.base import TestMode, TestSeverity, parse_sample_percent, parse_test_mode
 from tee.typing.metadata import TestDefinition
 
 logger = logging.getLogger(__name__)
@@ -22,6 +22,8 @@ class ParsedTestDefinition:
     params: dict[str, Any] | None = None
     expected: Any | None = None
     severity_override: TestSeverity | None = None
+    mode: TestMode | None = None
+    sample_percent: float | None = None
 
 
 class TestDefinitionParser:
@@ -37,7 +39,8 @@ class TestDefinitionParser:
         Parse a test definition into its components.
 
         Args:
-            test_def: Test definition (string name or dict with name/params/severity/expected)
+            test_def: Test definition (string name or dict with name/params/severity/expected,
+                and optionally the mode and sample_percent to run the test with)
             severity_overrides: Dict of severity overrides
             context: Context string for override key (e.g., "table_name.test_name" or "function_name.test_name")
 
@@ -58,11 +61,11 @@ class TestDefinitionParser:
                 logger.warning(f"Test definition missing name: {test_def}")
                 return None
 
-            # Extract params (everything except name/test, severity, and expected)
+            # Extract params (everything except name/test, severity, expected and mode)
             params = {
                 k: v
                 for k, v in test_def.items()
-                if k not in ["name", "test", "severity", "expected"]
+                if k not in ["name", "test", "severity", "expected", "mode", "sample_percent"]
             }
             if not params:
                 params = None
@@ -75,11 +78,15 @@ class TestDefinitionParser:
                 test_def, severity_overrides, context, test_name
             )
 
+            mode, sample_percent = TestDefinitionParser._extract_mode(test_def)
+
             return ParsedTestDefinition(
                 test_name=test_name,
                 params=params,
                 expected=expected,
                 severity_override=severity_override,
+                mode=mode,
+                sample_percent=sample_percent,
             )
 
         logger.warning(f"Invalid test definition type: {type(test_def)}")
@@ -115,3 +122,30 @@ class TestDefinitionParser:
         # Check severity_overrides dict (key format: "context.test_name" or just "test_name")
         override_key = f"{context}.{test_name}"
         return severity_overrides.get(override_key) or severity_overrides.get(test_name)
+
+    @staticmethod
+    def _extract_mode(test_def: dict[str, Any]) -> tuple[TestMode | None, float | None]:
+        """
+        Extract the mode and sample percentage of a test definition.
+
+        Args:
+            test_def: Test definition dict
+
+        Returns:
+            Tuple of (mode, sample_percent); None for values not set or invalid
+        """
+        mode = None
+        if test_def.get("mode"):
+            try:
+                mode = parse_test_mode(test_def["mode"])
+            except ValueError as e:
+                logger.warning(f"{e}, using default")
+
+        sample_percent = None
+        if test_def.get("sample_percent") is not None:
+            try:
+                sample_percent = parse_sample_percent(test_def["sample_percent"])
+            except ValueError as e:
+                logger.warning(f"{e}, using default")
+
+        return mode, sample_percent
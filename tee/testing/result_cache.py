@@ -0,0 +1,201 @@
+"""
+Caching the passes of model tests across runs.
+
+`t4t test` would otherwise re-run every test even when neither the tested data nor the
+test changed since it last passed. A pass is recorded in the state database, keyed by
+the tested table and a hash of the test definition (test, column, params, incremental
+scope and mode), together with a fingerprint of the relations the test reads. A test
+whose definition and fingerprint are unchanged is reported as a cached pass without
+running its query.
+
+A relation's fingerprint is taken from t4t's own build state: its materialization, the
+time of its last successful build and its DDL version. Databases that track when a
+table was last modified (Snowflake LAST_ALTERED, BigQuery table metadata) add it, so
+writes made outside t4t invalidate the cache too. Only tables and incremental models
+built by t4t are fingerprinted: views change with their upstream tables, and seeds and
+sources have no build state, so tests reading them always run.
+
+Only passes are cached, and sampled runs are not (each run checks a new sample).
+`--no-test-cache` re-runs every test.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any
+
+from tee.testing.base import TestMode, TestResult, TestSeverity
+
+logger = logging.getLogger(__name__)
+
+# Materializations whose data only changes when t4t builds them
+CACHEABLE_MATERIALIZATIONS = {"table", "incremental"}
+
+
+def hash_test_definition(
+    test_name: str,
+    column_name: str | None,
+    params: dict[str, Any] | None,
+    where: str | None,
+    mode: TestMode,
+    sample_percent: float | None = None,
+) -> str:
+    """
+    Hash everything about a test run that decides its outcome, except the data.
+
+    Args:
+        test_name: Test name
+        column_name: Column name (None for model-level tests)
+        params: Test parameters
+        where: Condition limiting the test to some rows, if any
+        mode: Mode the test runs in
+        sample_percent: Sample percentage (sample mode only)
+
+    Returns:
+        Hex digest of the definition
+    """
+    definition = {
+        "test": test_name,
+        "column": column_name,
+        "params": params or {},
+        "where": where,
+        "mode": mode.value,
+        "sample_percent": sample_percent if mode is TestMode.SAMPLE else None,
+    }
+    encoded = json.dumps(definition, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def relation_fingerprint(adapter: Any, state_manager: Any, table_name: str) -> str | None:
+    """
+    Fingerprint the data of a relation built by t4t.
+
+    Args:
+        adapter: Database adapter (for warehouse modification metadata)
+        state_manager: Model state manager holding the build state
+        table_name: Fully qualified table name
+
+    Returns:
+        Fingerprint string, or None if changes to the relation cannot be told
+    """
+    state = state_manager.get_model_state(table_name)
+    if state is None or state.materialization not in CACHEABLE_MATERIALIZATIONS:
+        return None
+
+    parts = [
+        state.materialization,
+        state.last_execution_timestamp or "",
+        str(state_manager.get_ddl_version(table_name)),
+    ]
+    try:
+        warehouse = adapter.get_table_fingerprint(table_name)
+    except Exception as e:
+        logger.debug(f"Could not get the warehouse fingerprint of {table_name}: {e}")
+        return None
+    if isinstance(warehouse, str):
+        parts.append(warehouse)
+    return "|".join(parts)
+
+
+class TestResultCache:
+    """Passes of model tests, reused while the relations they read are unchanged."""
+
+    __test__ = False  # Tell pytest this is not a test class
+
+    def __init__(self, adapter: Any, state_manager: Any):
+        """
+        Initialize the test result cache.
+
+        Args:
+            adapter: Database adapter
+            state_manager: Model state manager the passes are stored in
+        """
+        self.adapter = adapter
+        self.state_manager = state_manager
+        self._fingerprints: dict[str, str | None] = {}
+
+    def reset(self) -> None:
+        """Forget the fingerprints computed so far (relations may have been rebuilt)."""
+        self._fingerprints.clear()
+
+    def fingerprint(self, relations: list[str]) -> str | None:
+        """
+        Fingerprint the data of the relations a test reads.
+
+        Args:
+            relations: Relation names
+
+        Returns:
+            Combined fingerprint, or None if any relation cannot be fingerprinted
+        """
+        parts = []
+        for relation in relations:
+            if relation not in self._fingerprints:
+                self._fingerprints[relation] = relation_fingerprint(
+                    self.adapter, self.state_manager, relation
+                )
+            if self._fingerprints[relation] is None:
+                return None
+            parts.append(f"{relation}={self._fingerprints[relation]}")
+        return ";".join(parts)
+
+    def lookup(
+        self,
+        table_name: str,
+        column_name: str | None,
+        test_name: str,
+        definition_hash: str,
+        fingerprint: str,
+        severity: TestSeverity,
+    ) -> TestResult | None:
+        """
+        Get the cached pass of a test, if the relations it read are unchanged.
+
+        Args:
+            table_name: Fully qualified table name
+            column_name: Column name (None for model-level tests)
+            test_name: Test name
+            definition_hash: Hash of the test definition
+            fingerprint: Current fingerprint of the relations the test reads
+            severity: Severity of the test
+
+        Returns:
+            Cached pass, or None if the test must run
+        """
+        entry = self.state_manager.get_test_result(table_name, definition_hash)
+        if entry is None or entry.fingerprint != fingerprint:
+            return None
+
+        return TestResult(
+            test_name=test_name,
+            table_name=table_name,
+            column_name=column_name,
+            passed=True,
+            message=f"Cached pass: {test_name} (unchanged since {entry.updated_at})",
+            severity=severity,
+            rows_returned=entry.rows_returned,
+            mode=TestMode(entry.mode),
+            cached=True,
+        )
+
+    def record(self, result: TestResult, definition_hash: str, fingerprint: str) -> None:
+        """
+        Record the outcome of a test that ran.
+
+        Passes are stored; anything else forgets the previous pass.
+
+        Args:
+            result: Result of the test
+            definition_hash: Hash of the test definition
+            fingerprint: Fingerprint of the relations the test read
+        """
+        if result.passed and not result.error:
+            self.state_manager.save_test_result(
+                result.table_name,
+                definition_hash,
+                fingerprint,
+                result.rows_returned,
+                result.mode.value,
+            )
+        else:
+            self.state_manager.delete_test_result(result.table_name, definition_hash)
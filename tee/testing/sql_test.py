@@ -185,11 +185,11 @@ class SqlTest(StandardTest):
             # Get test query (with variable substitution)
             query = self.get_test_query(adapter, table_name, column_name, function_name, params)
 
-            # Execute query
-            results = adapter.execute_query(query)
-
             # Determine test result based on test type
             if function_name is not None:
+                results = adapter.execute_query(query)
+                rows_returned = len(results) if isinstance(results, list) else 0
+
                 # Function test: support both assertion-based and expected value patterns
                 passed = self._evaluate_function_test_result(results, expected)
                 if expected is not None:
@@ -224,10 +224,8 @@ class SqlTest(StandardTest):
                         )
             else:
                 # Model test: dbt pattern (0 rows = pass)
-                if isinstance(results, list):
-                    row_count = len(results)
-                else:
-                    row_count = 0
+                row_count = self._count_result_rows(adapter, query)
+                rows_returned = row_count
 
                 passed = row_count == 0
                 message = (
@@ -244,7 +242,7 @@ class SqlTest(StandardTest):
                 passed=passed,
                 message=message,
                 severity=test_severity,
-                rows_returned=len(results) if isinstance(results, list) else 0,
+                rows_returned=rows_returned,
             )
 
         except Exception as e:
@@ -7,9 +7,23 @@ from typing import Any
 from .base import StandardTest, TestRegistry, TestSeverity
 
 
+def _scope(where: str | None, sample_percent: float | None) -> dict[str, Any]:
+    """Keyword arguments limiting a generated test query to some rows, if any."""
+    scope: dict[str, Any] = {}
+    if where:
+        scope["where"] = where
+    if sample_percent is not None:
+        scope["sample_percent"] = sample_percent
+    return scope
+
+
 class NotNullTest(StandardTest):
     """Test that verifies a column contains no NULL values."""
 
+    supports_incremental_scope = True
+    supports_sampling = True
+    supports_result_cache = True
+
     def __init__(self):
         super().__init__("not_null", severity=TestSeverity.ERROR)
 
@@ -39,6 +53,23 @@ class NotNullTest(StandardTest):
         # Delegate SQL generation to adapter for database-specific syntax
         return adapter.generate_not_null_test_query(table_name, column_name)
 
+    def get_scoped_test_query(
+        self,
+        adapter,
+        table_name: str,
+        column_name: str | None = None,
+        params: dict[str, Any] | None = None,  # noqa: ARG002
+        where: str | None = None,
+        sample_percent: float | None = None,
+    ) -> str:
+        """Generate SQL query to find NULL values among the rows matching `where`, or a sample."""
+        if not column_name:
+            raise ValueError("not_null test requires a column name")
+
+        return adapter.generate_not_null_test_query(
+            table_name, column_name, **_scope(where, sample_percent)
+        )
+
 
 class UniqueTest(StandardTest):
     """
@@ -48,8 +79,17 @@ class UniqueTest(StandardTest):
     1. Column-level: Applied to a column, checks if that single column has duplicates
     2. Table-level: Applied at model level with params, checks composite uniqueness
         on multiple columns specified in params={"columns": ["col1", "col2"]}
+
+    Limited to the last batch of an incremental model, or to a sample of the table, the
+    keys of the selected rows are checked against the whole table. In approx mode, a single-column test first compares
+    the row count with APPROX_COUNT_DISTINCT, on databases that have it.
     """
 
+    supports_incremental_scope = True
+    supports_sampling = True
+    supports_result_cache = True
+    supports_approximation = True
+
     def __init__(self):
         super().__init__("unique", severity=TestSeverity.ERROR)
 
@@ -109,7 +149,65 @@ class UniqueTest(StandardTest):
         # Validate params first
         self.validate_params(params, column_name)
 
-        # Determine columns to check
+        # Delegate SQL generation to adapter for database-specific syntax
+        return adapter.generate_unique_test_query(
+            table_name, self._columns(adapter, table_name, column_name, params)
+        )
+
+    def get_scoped_test_query(
+        self,
+        adapter,
+        table_name: str,
+        column_name: str | None = None,
+        params: dict[str, Any] | None = None,
+        where: str | None = None,
+        sample_percent: float | None = None,
+    ) -> str:
+        """
+        Generate SQL query to find duplicates of the keys of the rows matching `where`.
+
+        Without `where`, checks the keys of a sample of the table against the whole
+        table. Falls back to the whole-table query (over the sample, if any) if the
+        columns of the table are unknown.
+        """
+        self.validate_params(params, column_name)
+
+        columns = self._columns(adapter, table_name, column_name, params)
+        if not columns or (not where and sample_percent is None):
+            return adapter.generate_unique_test_query(
+                table_name, columns, **_scope(None, sample_percent)
+            )
+        return adapter.generate_unique_new_rows_test_query(
+            table_name, columns, **_scope(where, sample_percent)
+        )
+
+    def get_approx_check_query(
+        self,
+        adapter,
+        table_name: str,
+        column_name: str | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> str | None:
+        """
+        Generate SQL query estimating the duplicate rows of a single column.
+
+        Returns None for composite keys and databases without APPROX_COUNT_DISTINCT.
+        """
+        if getattr(adapter, "supports_approx_count_distinct", False) is not True:
+            return None
+        columns = [column_name] if column_name else (params or {}).get("columns")
+        if not columns or len(columns) != 1:
+            return None
+        return adapter.generate_unique_approx_query(table_name, columns[0])
+
+    def _columns(
+        self,
+        adapter,
+        table_name: str | None,
+        column_name: str | None,
+        params: dict[str, Any] | None,
+    ) -> list[str] | None:
+        """Determine the columns whose values must be unique (None if unknown)."""
         if column_name:
             # Case 1: Column-level test
             columns = [column_name]
@@ -126,9 +224,7 @@ class UniqueTest(StandardTest):
             except Exception:
                 # If getting columns fails, adapter will handle None
                 pass
-
-        # Delegate SQL generation to adapter for database-specific syntax
-        return adapter.generate_unique_test_query(table_name, columns)
+        return columns
 
 
 # NoDuplicatesTest has been removed - use UniqueTest at table level without columns
@@ -142,6 +238,8 @@ class RowCountGreaterThanZeroTest(StandardTest):
     This is a model-level test that checks if the table contains any data.
     """
 
+    supports_result_cache = True
+
     def __init__(self):
         super().__init__("row_count_gt_0", severity=TestSeverity.ERROR)
 
@@ -212,6 +310,10 @@ class AcceptedValuesTest(StandardTest):
     are within a specified list of allowed values.
     """
 
+    supports_incremental_scope = True
+    supports_sampling = True
+    supports_result_cache = True
+
     def __init__(self):
         super().__init__("accepted_values", severity=TestSeverity.ERROR)
 
@@ -279,6 +381,22 @@ class AcceptedValuesTest(StandardTest):
         # Delegate SQL generation to adapter for database-specific syntax
         return adapter.generate_accepted_values_test_query(table_name, column_name, values)
 
+    def get_scoped_test_query(
+        self,
+        adapter,
+        table_name: str,
+        column_name: str | None = None,
+        params: dict[str, Any] | None = None,
+        where: str | None = None,
+        sample_percent: float | None = None,
+    ) -> str:
+        """Generate SQL query to find values not in the accepted list among matching rows."""
+        self.validate_params(params, column_name)
+
+        return adapter.generate_accepted_values_test_query(
+            table_name, column_name, params["values"], **_scope(where, sample_percent)
+        )
+
 
 class RelationshipsTest(StandardTest):
     """
@@ -290,6 +408,10 @@ class RelationshipsTest(StandardTest):
     Supports both single-column and composite key relationships.
     """
 
+    supports_incremental_scope = True
+    supports_sampling = True
+    supports_result_cache = True
+
     def __init__(self):
         super().__init__("relationships", severity=TestSeverity.ERROR)
 
@@ -385,6 +507,36 @@ class RelationshipsTest(StandardTest):
         Returns:
             SQL query string
         """
+        return self._query(adapter, table_name, column_name, params)
+
+    def get_scoped_test_query(
+        self,
+        adapter,
+        table_name: str,
+        column_name: str | None = None,
+        params: dict[str, Any] | None = None,
+        where: str | None = None,
+        sample_percent: float | None = None,
+    ) -> str:
+        """Generate SQL query to find orphaned rows among the rows matching `where`, or a sample."""
+        return self._query(adapter, table_name, column_name, params, where, sample_percent)
+
+    def get_input_relations(
+        self, table_name: str, params: dict[str, Any] | None = None
+    ) -> list[str]:
+        """List the source table and the target table of the relationship."""
+        return [table_name, params["to"]] if params and params.get("to") else [table_name]
+
+    def _query(
+        self,
+        adapter,
+        table_name: str | None,
+        column_name: str | None,
+        params: dict[str, Any] | None,
+        where: str | None = None,
+        sample_percent: float | None = None,
+    ) -> str:
+        """Generate SQL query to find orphaned rows, optionally among some rows only."""
         if not column_name:
             raise ValueError("relationships test requires a column name")
 
@@ -418,7 +570,11 @@ class RelationshipsTest(StandardTest):
 
         # Delegate SQL generation to adapter for database-specific syntax
         return adapter.generate_relationships_test_query(
-            table_name, source_columns, target_table, target_columns
+            table_name,
+            source_columns,
+            target_table,
+            target_columns,
+            **_scope(where, sample_percent),
         )
 
 
@@ -4,7 +4,7 @@ Result categorization utilities.
 Extracts result categorization logic from TestExecutor.
 """
 
-from tee.testing.base import TestResult, TestSeverity
+from tee.testing.base import TestMode, TestResult, TestSeverity
 
 
 class ResultCategorizer:
@@ -35,23 +35,23 @@ class ResultCategorizer:
     @staticmethod
     def _format_warning(result: TestResult) -> str:
         """Format a warning message."""
-        if result.function_name:
-            return f"{result.test_name} on {result.function_name}: {result.message}"
-        elif result.column_name:
-            return (
-                f"{result.test_name} on {result.table_name}.{result.column_name}: {result.message}"
-            )
-        else:
-            return f"{result.test_name} on {result.table_name}: {result.message}"
+        return ResultCategorizer._format(result)
 
     @staticmethod
     def _format_error(result: TestResult) -> str:
         """Format an error message."""
+        return ResultCategorizer._format(result)
+
+    @staticmethod
+    def _format(result: TestResult) -> str:
+        """Format a result message, tagged with its mode unless it is exact."""
         if result.function_name:
-            return f"{result.test_name} on {result.function_name}: {result.message}"
+            location = result.function_name
         elif result.column_name:
-            return (
-                f"{result.test_name} on {result.table_name}.{result.column_name}: {result.message}"
-            )
+            location = f"{result.table_name}.{result.column_name}"
         else:
-            return f"{result.test_name} on {result.table_name}: {result.message}"
+            location = f"{result.table_name}"
+        mode = getattr(result, "mode", TestMode.EXACT)
+        if isinstance(mode, TestMode) and mode is not TestMode.EXACT:
+            location += f" [{mode.value}]"
+        return f"{result.test_name} on {location}: {result.message}"
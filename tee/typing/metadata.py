@@ -20,10 +20,12 @@ DataType = Literal[
 ]
 
 # Materialization types
-MaterializationType = Literal["table", "view", "incremental", "scd2"]
+MaterializationType = Literal[
+    "table", "view", "incremental", "scd2", "ephemeral", "external_table"
+]
 
 # Incremental strategy types
-IncrementalStrategy = Literal["append", "merge", "delete_insert"]
+IncrementalStrategy = Literal["append", "merge", "delete_insert", "insert_overwrite"]
 
 # on_schema_change options (OTS 0.2.1)
 OnSchemaChange = Literal[
@@ -96,6 +98,25 @@ class IncrementalDeleteInsertConfig(TypedDict):
     lookback: NotRequired[str | None]  # e.g., "7 days", "1 week"
 
 
+class IncrementalInsertOverwriteConfig(TypedDict):
+    """Configuration for insert_overwrite incremental strategy."""
+
+    partition_by: NotRequired[list[str] | None]  # Defaults to the model's partitions
+    filter_column: NotRequired[str | None]  # Optional time filter selecting the new batch
+    start_value: NotRequired[str | None]  # "auto" for max(filter_column) pattern, or specific value
+    destination_filter_column: NotRequired[str | None]  # Column name in target table (if different from filter_column)
+    lookback: NotRequired[str | None]  # e.g., "7 days", "1 week"
+
+
+class ExternalTableConfig(TypedDict):
+    """Configuration for external_table materialization (files written by the adapter)."""
+
+    location: NotRequired[str | None]  # Default: extra.external_location (below it on DuckDB)
+    format: NotRequired[Literal["parquet"] | None]  # Default: "parquet"
+    row_group_size: NotRequired[int | None]  # Rows per Parquet row group
+    compression: NotRequired[str | None]  # e.g., "zstd", "snappy", "gzip"
+
+
 class FullIncrementalRefreshParameter(TypedDict):
     """Parameter configuration for full_incremental_refresh chunking (OTS 0.2.1)."""
 
@@ -119,6 +140,7 @@ class IncrementalConfig(TypedDict):
     append: NotRequired[IncrementalAppendConfig | None]
     merge: NotRequired[IncrementalMergeConfig | None]
     delete_insert: NotRequired[IncrementalDeleteInsertConfig | None]
+    insert_overwrite: NotRequired[IncrementalInsertOverwriteConfig | None]
 
 
 class ModelMetadata(TypedDict):
@@ -137,6 +159,7 @@ class ModelMetadata(TypedDict):
     incremental: NotRequired[IncrementalConfig | None]
     scd2_details: NotRequired[dict[str, Any] | None]  # For SCD2 materialization
     indexes: NotRequired[list[dict[str, Any]] | None]  # Explicit index definitions
+    external: NotRequired[ExternalTableConfig | None]  # For external_table materialization
     full_incremental_refresh: NotRequired[FullIncrementalRefreshConfig | None]  # For full_incremental_refresh on_schema_change (OTS 0.2.1)
 
 
@@ -7,6 +7,30 @@ from typing import Any, NotRequired, TypedDict
 from .metadata import ModelMetadata
 
 
+class TranspiledSQL(TypedDict):
+    """Ahead-of-time transpiled SQL of a model for one target dialect."""
+
+    sql: str
+    source_hash: str
+    schema: str | None
+
+
+class OutputColumn(TypedDict):
+    """Column of a model's output schema in the compile-time schema catalog."""
+
+    name: str
+    type: str | None
+
+
+class OutputSchema(TypedDict):
+    """Output schema of a model inferred at compile time."""
+
+    columns: list[OutputColumn]
+    authoritative: bool
+    dialect: str | None
+    source_hash: str
+
+
 class ModelCodeSQL(TypedDict):
     """SQL code structure within a model's code field."""
 
@@ -15,6 +39,8 @@ class ModelCodeSQL(TypedDict):
     operation_type: str
     source_tables: list[str]
     source_functions: list[str]
+    transpiled: NotRequired[dict[str, TranspiledSQL]]
+    output_schema: NotRequired[OutputSchema]
 
 
 class ModelCode(TypedDict):
@@ -0,0 +1,126 @@
+"""
+Local fake of a BigQuery client.
+
+Implements the subset of the google-cloud-bigquery client API the BigQuery adapter
+uses for schema inference, table metadata, cost estimation and Arrow results, so the
+adapter runs without the library (pass FakeQueryJobConfig as its job config factory). Jobs
+resolve the table a query reads: dry-run jobs report its schema and bytes, other jobs
+return its rows. Every job is recorded, so tests can check that no billed (non
+dry-run) query was issued.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class FakeQueryJobConfig:
+    """Query job configuration, as built by google.cloud.bigquery.QueryJobConfig."""
+
+    dry_run: bool = False
+    use_query_cache: bool = True
+
+
+@dataclass
+class FakeSchemaField:
+    """A column of a table or query result."""
+
+    name: str
+    field_type: str
+    mode: str = "NULLABLE"
+
+
+@dataclass
+class FakeTable:
+    """Table metadata as returned by Client.get_table."""
+
+    schema: list[FakeSchemaField]
+    num_rows: int | None
+    num_bytes: int = 0
+    rows: list[dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class FakeRowIterator:
+    """Result of a finished query job."""
+
+    rows: list[dict[str, Any]]
+    page_size: int | None = None
+
+    def to_arrow(self) -> Any:
+        import pyarrow
+
+        return pyarrow.Table.from_pylist(self.rows)
+
+    def to_arrow_iterable(self) -> Any:
+        import pyarrow
+
+        page_size = self.page_size or len(self.rows) or 1
+        for start in range(0, len(self.rows), page_size):
+            yield pyarrow.RecordBatch.from_pylist(self.rows[start : start + page_size])
+
+
+@dataclass
+class FakeQueryJob:
+    """A finished query job."""
+
+    query: str
+    dry_run: bool
+    schema: list[FakeSchemaField] = field(default_factory=list)
+    total_bytes_processed: int | None = None
+    num_dml_affected_rows: int | None = None
+    rows: list[dict[str, Any]] = field(default_factory=list)
+
+    def result(self, page_size: int | None = None) -> FakeRowIterator:
+        if self.dry_run:
+            raise AssertionError("Dry-run jobs have no results")
+        return FakeRowIterator(self.rows, page_size)
+
+
+class FakeBigQueryClient:
+    """In-memory stand-in for google.cloud.bigquery.Client."""
+
+    def __init__(self) -> None:
+        self.tables: dict[str, FakeTable] = {}
+        self.jobs: list[FakeQueryJob] = []
+
+    def add_table(
+        self,
+        table_id: str,
+        columns: dict[str, str],
+        num_rows: int | None,
+        num_bytes: int = 0,
+        rows: list[dict[str, Any]] | None = None,
+    ) -> None:
+        schema = [FakeSchemaField(name, field_type) for name, field_type in columns.items()]
+        self.tables[table_id] = FakeTable(schema, num_rows, num_bytes, rows or [])
+
+    def get_table(self, table_id: str) -> FakeTable:
+        if table_id not in self.tables:
+            raise LookupError(f"Not found: Table {table_id}")
+        return self.tables[table_id]
+
+    def query(self, query: str, job_config: Any = None) -> FakeQueryJob:
+        dry_run = bool(job_config is not None and job_config.dry_run)
+        job = FakeQueryJob(query=query, dry_run=dry_run)
+        self.jobs.append(job)
+        table = self._read_table(query)
+        job.schema = table.schema
+        job.total_bytes_processed = table.num_bytes
+        if not dry_run:
+            job.rows = table.rows
+        return job
+
+    @property
+    def billed_jobs(self) -> list[FakeQueryJob]:
+        return [job for job in self.jobs if not job.dry_run]
+
+    def close(self) -> None:
+        pass
+
+    def _read_table(self, query: str) -> FakeTable:
+        match = re.search(r"FROM\s+([\w.`-]+)", query, re.IGNORECASE)
+        if not match:
+            raise ValueError(f"Fake client cannot dry-run: {query}")
+        return self.get_table(match.group(1).replace("`", ""))
@@ -0,0 +1,44 @@
+"""
+Tests for Arrow query results on BigQuery.
+"""
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from tee.adapters.bigquery.adapter import BigQueryAdapter  # noqa: E402
+
+from .fake_client import FakeBigQueryClient, FakeQueryJobConfig  # noqa: E402
+
+
+@pytest.fixture
+def adapter():
+    """Create a BigQuery adapter connected to a fake client with one table."""
+    client = FakeBigQueryClient()
+    client.add_table(
+        "staging.orders",
+        {"id": "INTEGER"},
+        num_rows=5,
+        rows=[{"id": i} for i in range(5)],
+    )
+    adapter = BigQueryAdapter(
+        {"type": "bigquery", "project": "test-project", "database": "analytics"},
+        job_config_factory=FakeQueryJobConfig,
+    )
+    adapter.client = client
+    adapter.connection = client
+    return adapter
+
+
+class TestBigQueryArrowResults:
+    """Test cases for BigQueryAdapter.execute_arrow and iter_arrow_batches."""
+
+    def test_execute_arrow_returns_a_table(self, adapter):
+        table = adapter.execute_arrow("SELECT id FROM staging.orders")
+
+        assert table.column("id").to_pylist() == [0, 1, 2, 3, 4]
+
+    def test_result_pages_are_batches(self, adapter):
+        batches = list(adapter.iter_arrow_batches("SELECT id FROM staging.orders", batch_size=2))
+
+        assert [batch.num_rows for batch in batches] == [2, 2, 1]
@@ -0,0 +1,99 @@
+"""
+Tests for BigQuery dry-run schema inference, metadata row counts and cost estimation.
+"""
+
+import pytest
+
+from tee.adapters.bigquery.adapter import BigQueryAdapter
+from tee.engine.estimate import estimate_models
+from tee.engine.materialization.schema_comparator import SchemaComparator
+
+from .fake_client import FakeBigQueryClient, FakeQueryJobConfig
+
+ORDERS_SQL = "SELECT id, amount FROM staging.orders"
+
+
+@pytest.fixture
+def client():
+    """Create a fake client with one table."""
+    client = FakeBigQueryClient()
+    client.add_table(
+        "staging.orders", {"id": "INTEGER", "amount": "NUMERIC"}, num_rows=42, num_bytes=2048
+    )
+    return client
+
+
+@pytest.fixture
+def adapter(client):
+    """Create a BigQuery adapter connected to the fake client."""
+    adapter = BigQueryAdapter(
+        {"type": "bigquery", "project": "test-project", "database": "analytics"},
+        job_config_factory=FakeQueryJobConfig,
+    )
+    adapter.client = client
+    adapter.connection = client
+    return adapter
+
+
+def _model(sql, materialization="table"):
+    """Build parsed data for a SQL model."""
+    return {
+        "code": {"sql": {"original_sql": sql, "resolved_sql": sql}},
+        "model_metadata": {"metadata": {"materialization": materialization}},
+    }
+
+
+class TestBigQueryDryRun:
+    """Test cases for dry-run based BigQuery adapter methods."""
+
+    def test_describe_query_schema_uses_a_dry_run(self, adapter, client):
+        schema = adapter.describe_query_schema(ORDERS_SQL)
+
+        assert schema == [{"name": "id", "type": "INTEGER"}, {"name": "amount", "type": "NUMERIC"}]
+        assert len(client.jobs) == 1
+        assert client.billed_jobs == []
+
+    def test_schema_comparator_does_not_fall_back_to_limit_0(self, adapter, client):
+        comparator = SchemaComparator(adapter)
+
+        assert [col["name"] for col in comparator.infer_query_schema(ORDERS_SQL)] == [
+            "id",
+            "amount",
+        ]
+        assert client.billed_jobs == []
+
+    def test_get_table_info_reads_row_count_from_metadata(self, adapter, client):
+        info = adapter.get_table_info("staging.orders")
+
+        assert info["row_count"] == 42
+        assert info["schema"] == [
+            {"column": "id", "type": "INTEGER"},
+            {"column": "amount", "type": "NUMERIC"},
+        ]
+        assert client.jobs == []
+
+    def test_views_report_zero_rows(self, adapter, client):
+        client.add_table("staging.orders_view", {"id": "INTEGER"}, num_rows=None)
+
+        assert adapter.get_table_info("staging.orders_view")["row_count"] == 0
+
+    def test_estimate_query_bytes(self, adapter, client):
+        assert adapter.estimate_query_bytes(ORDERS_SQL) == 2048
+        assert client.billed_jobs == []
+
+    def test_estimate_models_reports_bytes_per_model_and_run(self, adapter, client):
+        parsed_models = {
+            "marts.orders": _model(ORDERS_SQL),
+            "marts.orders_view": _model(ORDERS_SQL, materialization="view"),
+            "marts.broken": _model("SELECT id FROM staging.missing"),
+        }
+
+        results = estimate_models(adapter, parsed_models, list(parsed_models))
+
+        assert results["estimates"] == {
+            "marts.orders": {"bytes": 2048, "materialization": "table"},
+            "marts.orders_view": {"bytes": 2048, "materialization": "view"},
+        }
+        assert results["total_bytes"] == 2048
+        assert [failure["model"] for failure in results["failed"]] == ["marts.broken"]
+        assert client.billed_jobs == []
@@ -0,0 +1,73 @@
+"""
+Tests for Arrow query results on DuckDB and the default row-based fallback.
+"""
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from tee.adapters.base.arrow import (  # noqa: E402
+    ArrowResultExecutor,
+    rows_to_record_batch,
+    supports_arrow_results,
+)
+from tee.adapters.duckdb.adapter import DuckDBAdapter  # noqa: E402
+
+
+@pytest.fixture
+def adapter():
+    """Create a connected in-memory DuckDB adapter with a small table."""
+    adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+    adapter.connect()
+    adapter.execute_query("CREATE TABLE numbers AS SELECT range AS n, 'x' AS label FROM range(5)")
+    yield adapter
+    adapter.disconnect()
+
+
+class RowOnlyAdapter(ArrowResultExecutor):
+    """Adapter stand-in that only returns rows."""
+
+    def iter_query_batches(self, query, batch_size=1000):  # noqa: ARG002
+        rows = [(1, "a"), (2, "b"), (3, "c")]
+        for start in range(0, len(rows), batch_size):
+            yield rows[start : start + batch_size]
+
+
+class TestDuckDBArrowResults:
+    """Test cases for DuckDBAdapter.execute_arrow and iter_arrow_batches."""
+
+    def test_execute_arrow_returns_a_table(self, adapter):
+        table = adapter.execute_arrow("SELECT n, label FROM numbers ORDER BY n")
+
+        assert table.column_names == ["n", "label"]
+        assert table.column("n").to_pylist() == [0, 1, 2, 3, 4]
+
+    def test_iter_arrow_batches_respects_batch_size(self, adapter):
+        batches = list(adapter.iter_arrow_batches("SELECT n FROM numbers", batch_size=2))
+
+        assert sum(batch.num_rows for batch in batches) == 5
+        assert all(batch.num_rows <= 2 for batch in batches)
+
+    def test_supports_arrow_results(self, adapter):
+        assert supports_arrow_results(adapter) is True
+        assert supports_arrow_results(RowOnlyAdapter()) is False
+
+
+class TestRowFallback:
+    """Test cases for the default implementation built on iter_query_batches."""
+
+    def test_rows_are_converted_column_by_column(self):
+        table = RowOnlyAdapter().execute_arrow("SELECT id, label FROM t")
+
+        assert table.to_pydict() == {"column_0": [1, 2, 3], "column_1": ["a", "b", "c"]}
+
+    def test_batches_follow_row_batches(self):
+        batches = list(RowOnlyAdapter().iter_arrow_batches("SELECT 1", batch_size=2))
+
+        assert [batch.num_rows for batch in batches] == [2, 1]
+
+    def test_empty_rows_keep_column_names(self):
+        batch = rows_to_record_batch([], ["id", "label"])
+
+        assert batch.schema.names == ["id", "label"]
+        assert batch.num_rows == 0
@@ -0,0 +1,96 @@
+"""
+Unit tests for the DuckDB adapter's per-model transactions.
+"""
+
+from unittest.mock import patch
+
+import duckdb
+import pytest
+
+from tee.adapters.duckdb.adapter import DuckDBAdapter
+from tee.engine.execution_engine import ExecutionEngine
+from tee.engine.materialization.incremental_executor import IncrementalExecutor
+
+
+class TestDuckDBTransactions:
+    """Test cases for adapter.transaction() on DuckDB."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create a connected in-memory DuckDB adapter."""
+        adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+        adapter.connect()
+        yield adapter
+        adapter.disconnect()
+
+    def test_commits_on_success(self, adapter):
+        """Statements of a successful block are committed together."""
+        with adapter.transaction():
+            assert adapter.in_transaction is True
+            adapter.create_table("main.committed", "SELECT 1 AS id")
+
+        assert adapter.in_transaction is False
+        assert adapter.table_exists("main.committed")
+
+    def test_rolls_back_on_error(self, adapter):
+        """A failing block leaves nothing behind."""
+        with pytest.raises(RuntimeError, match="model failed"), adapter.transaction():
+            adapter.create_table("main.rolled_back", "SELECT 1 AS id")
+            raise RuntimeError("model failed")
+
+        assert adapter.in_transaction is False
+        assert not adapter.table_exists("main.rolled_back")
+
+    def test_nested_blocks_join_the_outer_transaction(self, adapter):
+        """An inner block does not commit on its own."""
+        with pytest.raises(RuntimeError, match="outer failed"), adapter.transaction():
+            with adapter.transaction():
+                adapter.create_table("main.inner", "SELECT 1 AS id")
+            raise RuntimeError("outer failed")
+
+        assert not adapter.table_exists("main.inner")
+
+    def test_failed_delete_insert_keeps_deleted_rows(self, adapter):
+        """A failing insert does not leave the delete applied."""
+        adapter.create_table("main.events", "SELECT 1 AS id UNION ALL SELECT 2 AS id")
+
+        with pytest.raises(duckdb.CatalogException, match="missing"):
+            adapter.execute_incremental_delete_insert(
+                "main.events", "DELETE FROM main.events WHERE id = 1", "SELECT * FROM missing"
+            )
+
+        assert adapter.get_table_info("main.events")["row_count"] == 2
+
+    def test_failed_incremental_strategy_reports_its_error(self, temp_project_dir):
+        """A failing strategy fails the model with its own error and keeps the table."""
+        model = {
+            "code": {"sql": {"resolved_sql": "SELECT 1 AS id, CURRENT_TIMESTAMP AS updated_at"}},
+            "model_metadata": {
+                "metadata": {
+                    "materialization": "incremental",
+                    "incremental": {
+                        "strategy": "append",
+                        "append": {"filter_column": "updated_at"},
+                    },
+                }
+            },
+        }
+        engine = ExecutionEngine(
+            config={"type": "duckdb", "path": str(temp_project_dir / "warehouse.duckdb")},
+            project_folder=str(temp_project_dir),
+        )
+        engine.connect()
+        try:
+            assert engine.execute_models({"s.events": model}, ["s.events"])["executed_tables"]
+
+            def failing_append(*_args, **_kwargs):
+                engine.adapter.execute_query("SELECT 'not a number'::INTEGER")
+
+            with patch.object(IncrementalExecutor, "execute_append_strategy", failing_append):
+                results = engine.execute_models({"s.events": model}, ["s.events"])
+
+            assert results["executed_tables"] == []
+            assert "Conversion Error" in results["failed_tables"][0]["error"]
+            assert engine.adapter.get_table_info("s.events")["row_count"] == 1
+        finally:
+            engine.disconnect()
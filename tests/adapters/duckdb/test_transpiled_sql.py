@@ -0,0 +1,52 @@
+"""
+Unit tests for executing ahead-of-time transpiled SQL with the DuckDB adapter.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from tee.adapters.base.sql import sql_hash
+from tee.adapters.duckdb.adapter import DuckDBAdapter
+
+SOURCE_SQL = "SELECT 1 AS id, 'a' AS name"
+
+
+class TestDuckDBTranspiledSQL:
+    """Test cases for precompiled SQL reuse."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create a connected in-memory DuckDB adapter."""
+        adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+        adapter.connect()
+        yield adapter
+        adapter.disconnect()
+
+    def test_build_transpiled_sql(self, adapter):
+        """The entry records the transpiled SQL, the source hash and the schema."""
+        entry = adapter.build_transpiled_sql(SOURCE_SQL)
+
+        assert entry["sql"] == adapter.utils.convert_and_qualify_sql(SOURCE_SQL)
+        assert entry["source_hash"] == sql_hash(SOURCE_SQL)
+        assert entry["schema"] is None
+
+    def test_matching_hash_skips_sqlglot(self, adapter):
+        """Registered precompiled SQL is executed without parsing the model SQL."""
+        transpiled = {"duckdb": adapter.build_transpiled_sql(SOURCE_SQL)}
+
+        assert adapter.use_transpiled_sql(SOURCE_SQL, transpiled) is True
+        with patch("tee.ast_registry.sqlglot.parse_one") as parse_one:
+            adapter.create_table("precompiled", SOURCE_SQL)
+            parse_one.assert_not_called()
+
+        assert adapter.get_table_info("precompiled")["row_count"] == 1
+
+    def test_stale_or_foreign_entries_are_ignored(self, adapter):
+        """Entries for other SQL, another dialect or another schema are not used."""
+        entry = adapter.build_transpiled_sql(SOURCE_SQL)
+
+        assert adapter.use_transpiled_sql("SELECT 2 AS id", {"duckdb": entry}) is False
+        assert adapter.use_transpiled_sql(SOURCE_SQL, {"snowflake": entry}) is False
+        assert adapter.use_transpiled_sql(SOURCE_SQL, {"duckdb": {**entry, "schema": "x"}}) is False
+        assert adapter.get_precompiled_sql(SOURCE_SQL) is None
@@ -0,0 +1,134 @@
+"""
+Unit tests for PostgreSQL adapter connection pooling, concurrent queries, streaming and
+schema caching.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from tee.adapters.base.async_queries import QUERY_FAILED, QUERY_SUCCEEDED  # noqa: E402
+from tee.adapters.postgresql.adapter import PostgreSQLAdapter  # noqa: E402
+
+
+class TestPostgreSQLConnectionPool:
+    """Test cases for the pooled PostgreSQL adapter."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create a PostgreSQL adapter connected to a mocked connection pool."""
+        config = {
+            "type": "postgresql",
+            "host": "localhost",
+            "database": "test_db",
+            "user": "test_user",
+            "password": "test_password",
+            "extra": {"pool_max_size": 2},
+        }
+        with patch("psycopg2.pool.ThreadedConnectionPool") as pool:
+            pool.return_value.closed = False
+            pool.return_value.getconn.side_effect = lambda: MagicMock()
+            adapter = PostgreSQLAdapter(config)
+            adapter.connect()
+            yield adapter, pool
+
+    def test_connect_opens_pool(self, adapter):
+        adapter, pool = adapter
+        assert pool.call_args.args[:2] == (1, 2)
+        assert adapter.connection is not None
+
+    def test_schema_created_once_per_connection(self, adapter):
+        adapter, _ = adapter
+        adapter._ensure_schema("analytics")
+        adapter._ensure_schema("analytics")
+
+        executed = [
+            c.args[0] for c in adapter.connection.cursor.return_value.execute.call_args_list
+        ]
+        assert executed == ["CREATE SCHEMA IF NOT EXISTS analytics"]
+
+    def test_iter_query_batches_uses_named_cursor(self, adapter):
+        adapter, pool = adapter
+        connection = MagicMock()
+        pool.return_value.getconn.side_effect = None
+        pool.return_value.getconn.return_value = connection
+        cursor = connection.cursor.return_value
+        cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+
+        batches = list(adapter.iter_query_batches("SELECT id FROM big", batch_size=2))
+
+        assert batches == [[(1,), (2,)], [(3,)]]
+        assert connection.cursor.call_args.kwargs["name"].startswith("tee_stream_")
+        pool.return_value.putconn.assert_called_with(connection, close=False)
+
+    def test_iter_arrow_batches_uses_cursor_column_names(self, adapter):
+        pytest.importorskip("pyarrow")
+        adapter, pool = adapter
+        connection = MagicMock()
+        pool.return_value.getconn.side_effect = None
+        pool.return_value.getconn.return_value = connection
+        cursor = connection.cursor.return_value
+        cursor.fetchmany.side_effect = [[(1, "a"), (2, "b")], []]
+        cursor.description = [MagicMock(), MagicMock()]
+        cursor.description[0].name = "id"
+        cursor.description[1].name = "label"
+
+        table = adapter.execute_arrow("SELECT id, label FROM big")
+
+        assert table.to_pydict() == {"id": [1, 2], "label": ["a", "b"]}
+
+    def test_submitted_query_runs_on_pooled_connection(self, adapter):
+        adapter, pool = adapter
+        connection = MagicMock()
+        pool.return_value.getconn.side_effect = None
+        pool.return_value.getconn.return_value = connection
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [(1,)]
+
+        handle = adapter.submit_query("SELECT 1")
+
+        assert adapter.wait(handle, timeout=5) == [(1,)]
+        assert handle.state == QUERY_SUCCEEDED
+        cursor.execute.assert_called_once_with("SELECT 1")
+        connection.commit.assert_called_once()
+        pool.return_value.putconn.assert_called_with(connection, close=False)
+
+    def test_submitted_query_failure_rolls_back(self, adapter):
+        adapter, pool = adapter
+        connection = MagicMock()
+        pool.return_value.getconn.side_effect = None
+        pool.return_value.getconn.return_value = connection
+        connection.cursor.return_value.__enter__.return_value.execute.side_effect = ValueError(
+            "relation does not exist"
+        )
+
+        handle = adapter.submit_query("SELECT * FROM missing")
+
+        with pytest.raises(ValueError, match="relation does not exist"):
+            adapter.wait(handle, timeout=5)
+        assert handle.state == QUERY_FAILED
+        connection.rollback.assert_called_once()
+
+    def test_submit_create_table_creates_schema_on_primary_connection(self, adapter):
+        adapter, pool = adapter
+        connection = MagicMock()
+        pool.return_value.getconn.side_effect = None
+        pool.return_value.getconn.return_value = connection
+
+        handle = adapter.submit_create_table("analytics.orders", "SELECT 1 AS id")
+        adapter.wait(handle, timeout=5)
+
+        primary = [c.args[0] for c in adapter.connection.cursor.return_value.execute.call_args_list]
+        assert "CREATE SCHEMA IF NOT EXISTS analytics" in primary
+        statement = connection.cursor.return_value.__enter__.return_value.execute.call_args.args[0]
+        assert statement.startswith("CREATE TABLE IF NOT EXISTS analytics.orders AS")
+
+    def test_disconnect_closes_pool(self, adapter):
+        adapter, pool = adapter
+        adapter.disconnect()
+
+        pool.return_value.closeall.assert_called_once()
+        assert adapter.connection is None
+        assert adapter.pool is None
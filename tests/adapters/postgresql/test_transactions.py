@@ -0,0 +1,87 @@
+"""
+Unit tests for PostgreSQL adapter transactions.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from tee.adapters.postgresql.adapter import PostgreSQLAdapter  # noqa: E402
+
+
+class TestPostgreSQLTransactions:
+    """Test cases for adapter.transaction() on PostgreSQL."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create a PostgreSQL adapter connected to a mocked connection pool."""
+        config = {
+            "type": "postgresql",
+            "host": "localhost",
+            "database": "test_db",
+            "user": "test_user",
+            "password": "test_password",
+        }
+        with patch("psycopg2.pool.ThreadedConnectionPool") as pool:
+            pool.return_value.closed = False
+            pool.return_value.getconn.side_effect = lambda: MagicMock()
+            adapter = PostgreSQLAdapter(config)
+            adapter.connect()
+            yield adapter
+
+    def test_statements_commit_once_per_transaction(self, adapter):
+        with adapter.transaction():
+            adapter.create_table("analytics.a", "SELECT 1 AS id")
+            adapter.drop_table("analytics.b")
+            adapter.connection.commit.assert_not_called()
+
+        adapter.connection.commit.assert_called_once()
+
+    def test_statements_commit_individually_outside_transaction(self, adapter):
+        adapter.create_table("analytics.a", "SELECT 1 AS id")
+        adapter.drop_table("analytics.b")
+
+        # Schema creation, table creation and drop each commit
+        assert adapter.connection.commit.call_count == 3
+
+    def test_rolls_back_on_error(self, adapter):
+        with pytest.raises(RuntimeError, match="model failed"), adapter.transaction():
+            adapter.drop_table("analytics.b")
+            raise RuntimeError("model failed")
+
+        adapter.connection.rollback.assert_called_once()
+        adapter.connection.commit.assert_not_called()
+
+    def test_schema_failure_inside_transaction_uses_savepoint(self, adapter):
+        cursor = adapter.connection.cursor.return_value
+
+        def execute(statement, *_args):
+            if statement.startswith("CREATE SCHEMA"):
+                raise RuntimeError("permission denied")
+
+        cursor.execute.side_effect = execute
+        with adapter.transaction():
+            adapter._ensure_schema("analytics")
+
+        executed = [c.args[0] for c in cursor.execute.call_args_list]
+        assert executed == [
+            "SAVEPOINT tee_savepoint",
+            "CREATE SCHEMA IF NOT EXISTS analytics",
+            "ROLLBACK TO SAVEPOINT tee_savepoint",
+        ]
+        adapter.connection.rollback.assert_not_called()
+        adapter.connection.commit.assert_called_once()
+
+    def test_insert_overwrite_closes_cursor_on_error(self, adapter):
+        cursor = adapter.connection.cursor.return_value.__enter__.return_value
+        cursor.execute.side_effect = RuntimeError("division by zero")
+
+        with pytest.raises(RuntimeError, match="division by zero"):
+            adapter.execute_incremental_insert_overwrite(
+                "analytics.events", "SELECT 1 AS day", ["day"]
+            )
+
+        adapter.connection.cursor.return_value.__exit__.assert_called_once()
+        adapter.connection.rollback.assert_called_once()
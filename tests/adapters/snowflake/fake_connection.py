@@ -0,0 +1,150 @@
+"""
+Local fake of a Snowflake connection, backed by an in-memory DuckDB database.
+
+Implements the subset of the connector API the Snowflake adapter uses, including
+asynchronous submission (execute_async, get_query_status, get_results_from_sfqid and
+SYSTEM$CANCEL_QUERY) and Arrow results (fetch_arrow_all and fetch_arrow_batches). An async query keeps reporting RUNNING until its status has been
+polled polls_to_finish times, so tests can observe how many queries are in flight
+without a warehouse.
+"""
+
+import itertools
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+import duckdb
+
+RUNNING = "RUNNING"
+SUCCESS = "SUCCESS"
+FAILED_WITH_ERROR = "FAILED_WITH_ERROR"
+ABORTED = "ABORTED"
+
+
+@dataclass
+class FakeQuery:
+    """An asynchronously submitted query."""
+
+    sql: str
+    polls_left: int
+    status: str = RUNNING
+    rows: list[tuple[Any, ...]] = field(default_factory=list)
+    error: Exception | None = None
+
+
+class FakeSnowflakeConnection:
+    """DuckDB-backed stand-in for snowflake.connector.SnowflakeConnection."""
+
+    def __init__(self, database: str = "test_db", polls_to_finish: int = 2) -> None:
+        self.db = duckdb.connect(":memory:")
+        self.db.execute(f"ATTACH ':memory:' AS {database}")
+        self.db.execute(f"USE {database}")
+        self.polls_to_finish = polls_to_finish
+        self.queries: dict[str, FakeQuery] = {}
+        self.executed: list[str] = []
+        self.max_running = 0
+        self._ids = itertools.count(1)
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def close(self) -> None:
+        self.db.close()
+
+    @property
+    def running(self) -> int:
+        return sum(1 for query in self.queries.values() if query.status == RUNNING)
+
+    def get_query_status(self, query_id: str) -> str:
+        query = self.queries[query_id]
+        if query.status == RUNNING:
+            query.polls_left -= 1
+            if query.polls_left <= 0:
+                self._finish(query)
+        return query.status
+
+    def is_still_running(self, status: str) -> bool:
+        return status == RUNNING
+
+    def submit(self, sql: str) -> str:
+        query_id = f"fake-{next(self._ids)}"
+        self.queries[query_id] = FakeQuery(sql=sql, polls_left=self.polls_to_finish)
+        self.max_running = max(self.max_running, self.running)
+        return query_id
+
+    def run(self, sql: str, params: tuple[Any, ...] | None = None) -> list[tuple[Any, ...]]:
+        self.executed.append(sql)
+        result = self.db.execute(sql.replace("%s", "?"), params or [])
+        try:
+            return result.fetchall()
+        except duckdb.InvalidInputException:
+            return []
+
+    def _finish(self, query: FakeQuery) -> None:
+        try:
+            query.rows = self.run(query.sql)
+            query.status = SUCCESS
+        except Exception as e:
+            query.error = e
+            query.status = FAILED_WITH_ERROR
+
+
+class FakeCursor:
+    """Cursor of a FakeSnowflakeConnection."""
+
+    def __init__(self, connection: FakeSnowflakeConnection) -> None:
+        self.connection = connection
+        self.sfqid: str | None = None
+        self.rowcount = -1
+        self._rows: list[tuple[Any, ...]] = []
+        self._sql: str | None = None
+
+    def execute(self, sql: str, params: tuple[Any, ...] | None = None) -> FakeCursor:
+        cancel = re.search(r"SYSTEM\$CANCEL_QUERY\('([^']+)'\)", sql)
+        if cancel:
+            query = self.connection.queries[cancel.group(1)]
+            if query.status == RUNNING:
+                query.status = ABORTED
+            self._set_rows([("Identified SQL statement is being canceled.",)])
+            return self
+
+        self._sql = sql
+        self._set_rows(self.connection.run(sql, params))
+        return self
+
+    def execute_async(self, sql: str) -> dict[str, str]:
+        self.sfqid = self.connection.submit(sql)
+        return {"queryId": self.sfqid}
+
+    def get_results_from_sfqid(self, query_id: str) -> None:
+        query = self.connection.queries[query_id]
+        if query.status == RUNNING:
+            self.connection._finish(query)
+        if query.status == ABORTED:
+            raise RuntimeError(f"Query {query_id} was cancelled")
+        if query.error is not None:
+            raise query.error
+        self._set_rows(query.rows)
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        return list(self._rows)
+
+    def fetchone(self) -> tuple[Any, ...] | None:
+        return self._rows[0] if self._rows else None
+
+    def fetch_arrow_all(self, force_return_table: bool = False) -> Any:  # noqa: ARG002
+        return self.connection.db.execute(self._sql).fetch_arrow_table()
+
+    def fetch_arrow_batches(self) -> Any:
+        # Snowflake returns the result in chunks of its own size; split it in two
+        table = self.fetch_arrow_all()
+        half = table.num_rows // 2
+        yield table.slice(0, half)
+        yield table.slice(half)
+
+    def close(self) -> None:
+        pass
+
+    def _set_rows(self, rows: list[tuple[Any, ...]]) -> None:
+        self._rows = rows
+        self.rowcount = len(rows)
@@ -0,0 +1,45 @@
+"""
+Tests for Arrow query results on Snowflake.
+"""
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from tee.adapters.snowflake.adapter import SnowflakeAdapter  # noqa: E402
+
+from .fake_connection import FakeSnowflakeConnection  # noqa: E402
+
+
+@pytest.fixture
+def snowflake_adapter():
+    """Create a Snowflake adapter connected to a local fake."""
+    adapter = SnowflakeAdapter(
+        {
+            "type": "snowflake",
+            "host": "test.snowflakecomputing.com",
+            "user": "test_user",
+            "password": "test_password",
+            "database": "test_db",
+            "schema": "test_schema",
+        }
+    )
+    adapter.connection = FakeSnowflakeConnection()
+    yield adapter
+    adapter.connection.close()
+
+
+class TestSnowflakeArrowResults:
+    """Test cases for SnowflakeAdapter.execute_arrow and iter_arrow_batches."""
+
+    def test_execute_arrow_returns_a_table(self, snowflake_adapter):
+        table = snowflake_adapter.execute_arrow("SELECT range AS n FROM range(4)")
+
+        assert table.column("n").to_pylist() == [0, 1, 2, 3]
+
+    def test_result_chunks_are_split_to_batch_size(self, snowflake_adapter):
+        batches = list(
+            snowflake_adapter.iter_arrow_batches("SELECT range AS n FROM range(10)", batch_size=3)
+        )
+
+        assert [batch.num_rows for batch in batches] == [3, 2, 3, 2]
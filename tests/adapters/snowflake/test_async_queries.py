@@ -0,0 +1,93 @@
+"""
+Tests for asynchronous query submission (Snowflake implementation and default fallback).
+"""
+
+import duckdb
+import pytest
+
+from tee.adapters.base.async_queries import QUERY_CANCELLED, QUERY_FAILED, QUERY_SUCCEEDED
+from tee.adapters.duckdb.adapter import DuckDBAdapter
+from tee.adapters.snowflake.adapter import SnowflakeAdapter
+
+from .fake_connection import FakeSnowflakeConnection
+
+
+@pytest.fixture
+def snowflake_adapter():
+    """Create a Snowflake adapter connected to a local fake."""
+    adapter = SnowflakeAdapter(
+        {
+            "type": "snowflake",
+            "host": "test.snowflakecomputing.com",
+            "user": "test_user",
+            "password": "test_password",
+            "database": "test_db",
+            "schema": "test_schema",
+        }
+    )
+    adapter.connection = FakeSnowflakeConnection(polls_to_finish=3)
+    yield adapter
+    adapter.connection.close()
+
+
+class TestSnowflakeAsyncQueries:
+    """Test cases for SnowflakeAdapter submit_query/poll/wait/cancel."""
+
+    def test_submitted_query_runs_until_polled_to_completion(self, snowflake_adapter):
+        handle = snowflake_adapter.submit_query("SELECT 42")
+
+        assert handle.query_id == "fake-1"
+        assert not snowflake_adapter.poll(handle)
+        assert snowflake_adapter.wait(handle) == [(42,)]
+        assert handle.state == QUERY_SUCCEEDED
+
+    def test_many_queries_in_flight_on_one_connection(self, snowflake_adapter):
+        handles = [snowflake_adapter.submit_query(f"SELECT {i}") for i in range(5)]
+
+        assert snowflake_adapter.connection.running == 5
+        assert [snowflake_adapter.wait(h) for h in handles] == [[(i,)] for i in range(5)]
+
+    def test_failed_query_raises_on_wait(self, snowflake_adapter):
+        handle = snowflake_adapter.submit_query("SELECT * FROM missing_table")
+
+        with pytest.raises(Exception, match="missing_table"):
+            snowflake_adapter.wait(handle)
+        assert handle.state == QUERY_FAILED
+
+    def test_cancel(self, snowflake_adapter):
+        handle = snowflake_adapter.submit_query("SELECT 1")
+        snowflake_adapter.cancel(handle)
+
+        assert handle.state == QUERY_CANCELLED
+        assert snowflake_adapter.connection.queries["fake-1"].status == "ABORTED"
+
+    def test_submit_create_table_applies_metadata_on_completion(self, snowflake_adapter):
+        handle = snowflake_adapter.submit_create_table("my_schema.t", "SELECT 1 AS id")
+        snowflake_adapter.wait(handle)
+
+        assert handle.query.startswith("CREATE OR REPLACE TABLE test_db.my_schema.t")
+        assert snowflake_adapter.connection.db.execute(
+            "SELECT COUNT(*) FROM test_db.my_schema.t"
+        ).fetchone() == (1,)
+
+
+class TestDefaultAsyncQueries:
+    """Test cases for the synchronous fallback every adapter inherits."""
+
+    def test_submit_query_runs_synchronously(self):
+        adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+        adapter.connect()
+        try:
+            assert not adapter.supports_async_queries
+
+            handle = adapter.submit_query("SELECT 1 AS id")
+            assert handle.done
+            assert adapter.poll(handle)
+            assert adapter.wait(handle) == [(1,)]
+
+            failed = adapter.submit_query("SELECT * FROM missing_table")
+            assert failed.state == QUERY_FAILED
+            with pytest.raises(duckdb.CatalogException, match="missing_table"):
+                adapter.wait(failed)
+        finally:
+            adapter.disconnect()
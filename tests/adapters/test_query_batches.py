@@ -0,0 +1,41 @@
+"""
+Test cases for the default batched query results every adapter inherits.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from tee.adapters.duckdb.adapter import DuckDBAdapter
+from tee.testing.standard_tests import NotNullTest
+
+
+@pytest.fixture
+def adapter():
+    """Create an in-memory DuckDB adapter (it keeps the default iter_query_batches)."""
+    adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+    adapter.connect()
+    yield adapter
+    adapter.disconnect()
+
+
+class TestDefaultQueryBatches:
+    """Test cases for DatabaseAdapter.iter_query_batches."""
+
+    def test_rows_are_sliced_into_batches(self, adapter):
+        batches = list(adapter.iter_query_batches("SELECT * FROM range(5)", batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [row[0] for batch in batches for row in batch] == [0, 1, 2, 3, 4]
+
+    def test_empty_result_yields_no_batch(self, adapter):
+        assert list(adapter.iter_query_batches("SELECT * FROM range(0)")) == []
+
+    def test_streaming_adapters_count_test_rows_by_batch(self):
+        streaming_adapter = Mock(supports_streaming_results=True, supports_arrow_results=False)
+        streaming_adapter.iter_query_batches.return_value = iter([[(1,), (2,)], [(3,)]])
+
+        count = NotNullTest()._count_result_rows(streaming_adapter, "SELECT * FROM violations")
+
+        assert count == 3
+        streaming_adapter.execute_query.assert_not_called()
@@ -61,7 +61,9 @@ class TestSnowflakeSchemaTagAttachment:
 
         # Should attach tags
         alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER SCHEMA" in str(call)]
-        assert len(alter_calls) >= 3  # 2 for tags, 1 for object_tags
+        assert len(alter_calls) == 1  # All tags set in a single statement
+        assert "tee_tag_analytics" in alter_calls[0]
+        assert "sensitivity_tag" in alter_calls[0]
 
     def test_attach_tags_to_existing_schema_with_force_update(self, snowflake_adapter):
         """Test that tags can be attached to existing schema with force_update flag."""
@@ -110,7 +112,8 @@ class TestSnowflakeSchemaTagAttachment:
 
         # Should use ALTER SCHEMA syntax
         alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER SCHEMA" in str(call)]
-        assert len(alter_calls) == 2  # One for each tag
+        assert len(alter_calls) == 1  # Both tags set in a single statement
+        assert "tee_tag_production" in alter_calls[0]
 
     def test_attach_schema_object_tags(self, snowflake_adapter):
         """Test attaching database-style object tags to schema."""
@@ -128,7 +131,8 @@ class TestSnowflakeSchemaTagAttachment:
 
         # Should attach object tags
         alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER SCHEMA" in str(call)]
-        assert len(alter_calls) == 2  # One for each object tag
+        assert len(alter_calls) == 1  # Both object tags set in a single statement
+        assert "classification" in alter_calls[0]
 
     def test_attach_both_tags_and_object_tags_to_schema(self, snowflake_adapter):
         """Test attaching both tag types to schema."""
@@ -147,7 +151,7 @@ class TestSnowflakeSchemaTagAttachment:
 
         # Should attach both types
         alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER SCHEMA" in str(call)]
-        assert len(alter_calls) == 4  # 2 for tags, 2 for object_tags
+        assert len(alter_calls) == 1  # Tags and object_tags set in a single statement
 
     def test_schema_tag_attachment_handles_errors_gracefully(self, snowflake_adapter):
         """Test that schema tag attachment errors don't break schema creation."""
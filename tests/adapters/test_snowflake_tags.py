@@ -87,7 +87,9 @@ class TestSnowflakeTagAttachment:
 
         # Should use ALTER TABLE syntax
         alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER TABLE" in str(call)]
-        assert len(alter_calls) == 2  # One for each tag
+        assert len(alter_calls) == 1  # Both tags set in a single statement
+        assert "tee_tag_analytics" in alter_calls[0]
+        assert "tee_tag_production" in alter_calls[0]
 
     def test_attach_tags_for_views(self, snowflake_adapter):
         """Test attaching tags to views."""
@@ -98,7 +100,7 @@ class TestSnowflakeTagAttachment:
 
         # Should use ALTER VIEW syntax
         alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER VIEW" in str(call)]
-        assert len(alter_calls) == 2  # One for each tag
+        assert len(alter_calls) == 1  # Both tags set in a single statement
 
     def test_attach_tags_handles_empty_list(self, snowflake_adapter):
         """Test that empty tag list is handled gracefully."""
@@ -121,7 +123,10 @@ class TestSnowflakeTagAttachment:
 
         # Should only process valid tags
         alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER TABLE" in str(call)]
-        assert len(alter_calls) == 2  # Only valid tags
+        assert len(alter_calls) == 1
+        assert "tee_tag_valid_tag" in alter_calls[0]
+        assert "tee_tag_another_valid" in alter_calls[0]
+        assert "tee_tag_ =" not in alter_calls[0]  # Blank tags are skipped
 
     def test_attach_tags_continues_on_error(self, snowflake_adapter):
         """Test that tag attachment continues even if one tag fails."""
@@ -162,7 +167,7 @@ class TestSnowflakeTagAttachment:
 
         # Should also attach tags
         alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER TABLE" in str(call)]
-        assert len(alter_calls) == 2  # One for each tag
+        assert len(alter_calls) == 1  # Both tags set in a single statement
 
     def test_attach_tags_in_create_view(self, snowflake_adapter):
         """Test that tags are attached when creating a view with metadata."""
@@ -186,7 +191,7 @@ class TestSnowflakeTagAttachment:
 
         # Should also attach tags
         alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER VIEW" in str(call)]
-        assert len(alter_calls) == 2  # One for each tag
+        assert len(alter_calls) == 1  # Both tags set in a single statement
 
     def test_attach_tags_truncates_long_names(self, snowflake_adapter):
         """Test that very long tag names are truncated."""
@@ -228,7 +233,8 @@ class TestSnowflakeTagAttachment:
 
         # Should attach tags with values
         alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER TABLE" in str(call)]
-        assert len(alter_calls) == 3  # One for each tag
+        assert len(alter_calls) == 1  # All tags set in a single statement
+        assert "data_owner = 'analytics-team'" in alter_calls[0]
 
     def test_attach_object_tags_uses_exact_key_names(self, snowflake_adapter):
         """Test that object tag keys are used as-is (with sanitization)."""
@@ -271,7 +277,10 @@ class TestSnowflakeTagAttachment:
 
         # Should handle all types
         execute_calls = [str(call) for call in cursor.execute.call_args_list]
-        assert len([c for c in execute_calls if "ALTER TABLE" in c]) == 3
+        alter_calls = [c for c in execute_calls if "ALTER TABLE" in c]
+        assert len(alter_calls) == 1
+        assert "numeric_tag = '123'" in alter_calls[0]
+        assert "boolean_tag = 'True'" in alter_calls[0]
 
     def test_attach_object_tags_handles_empty_dict(self, snowflake_adapter):
         """Test that empty object_tags dict is handled gracefully."""
@@ -318,8 +327,10 @@ class TestSnowflakeTagAttachment:
 
         # Should attach object tags
         alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER TABLE" in str(call)]
-        # Should have calls for object_tags
-        assert len(alter_calls) >= 2
+        # Should set both object_tags in a single statement
+        assert len(alter_calls) == 1
+        assert "sensitivity_tag = 'pii'" in alter_calls[0]
+        assert "classification = 'public'" in alter_calls[0]
 
     def test_attach_both_tags_and_object_tags(self, snowflake_adapter):
         """Test that both tags and object_tags can be attached together."""
@@ -344,7 +355,76 @@ class TestSnowflakeTagAttachment:
         create_table_calls = [call for call in all_calls if "CREATE TABLE" in call or "CREATE OR REPLACE TABLE" in call]
         assert len(create_table_calls) > 0, f"No CREATE TABLE found. Calls were: {all_calls}"
 
-        # Should have calls for both tags and object_tags
+        # Should set both tags and object_tags in a single statement
         alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER TABLE" in str(call)]
-        assert len(alter_calls) >= 4  # 2 for tags, 2 for object_tags
+        assert len(alter_calls) == 1
+        assert "tee_tag_analytics" in alter_calls[0]
+        assert "classification" in alter_calls[0]
 
+
+    def test_existing_tags_are_created_once_per_run(self, snowflake_adapter):
+        """Test that tags are listed once and created only when missing."""
+        adapter, cursor = snowflake_adapter
+        cursor.fetchall.return_value = [("2024-01-01", "TEE_TAG_ANALYTICS")]
+
+        for table in ["t1", "t2", "t3"]:
+            adapter.attach_tags("TABLE", f"test_db.test_schema.{table}", ["analytics", "production"])
+
+        all_calls = [str(call) for call in cursor.execute.call_args_list]
+        assert len([c for c in all_calls if "SHOW TAGS" in c]) == 1
+        create_calls = [c for c in all_calls if "CREATE TAG" in c]
+        assert len(create_calls) == 1
+        assert "tee_tag_production" in create_calls[0]
+
+    def test_unchanged_assignments_are_not_reapplied(self, snowflake_adapter):
+        """Test that only tags whose value differs are set on an existing object."""
+        adapter, cursor = snowflake_adapter
+
+        def execute(query):
+            if "tag_references" in query:
+                cursor.fetchall.return_value = [
+                    ("TEE_TAG_ANALYTICS", "analytics"),
+                    ("CLASSIFICATION", "internal"),
+                ]
+            else:
+                cursor.fetchall.return_value = []
+
+        cursor.execute.side_effect = execute
+
+        adapter.tag_manager.apply_tags(
+            "TABLE",
+            "test_db.test_schema.test_table",
+            tags=["analytics"],
+            object_tags={"classification": "public"},
+        )
+
+        alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER TABLE" in str(call)]
+        assert len(alter_calls) == 1
+        assert "classification = 'public'" in alter_calls[0]
+        assert "tee_tag_analytics" not in alter_calls[0]
+
+    def test_new_objects_skip_tag_references_lookup(self, snowflake_adapter):
+        """Test that freshly created objects are not queried for existing tags."""
+        adapter, cursor = snowflake_adapter
+
+        adapter.create_table("test_schema.test_table", "SELECT 1 as id", metadata={"tags": ["fct"]})
+
+        all_calls = [str(call) for call in cursor.execute.call_args_list]
+        assert not any("tag_references" in c for c in all_calls)
+
+    def test_batched_assignment_falls_back_to_individual_tags(self, snowflake_adapter):
+        """Test that a failing batched ALTER is retried one tag at a time."""
+        adapter, cursor = snowflake_adapter
+
+        def execute(query):
+            if "ALTER TABLE" in query and "," in query:
+                raise Exception("Tag does not exist")
+            if "ALTER TABLE" in query and "failing" in query:
+                raise Exception("Tag does not exist")
+
+        cursor.execute.side_effect = execute
+
+        adapter.attach_tags("TABLE", "test_db.test_schema.test_table", ["valid", "failing"])
+
+        alter_calls = [str(call) for call in cursor.execute.call_args_list if "ALTER TABLE" in str(call)]
+        assert len(alter_calls) == 3  # One batched attempt, then one per tag
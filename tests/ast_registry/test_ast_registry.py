@@ -0,0 +1,88 @@
+"""
+Unit tests for the run-scoped AST registry.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import sqlglot
+from sqlglot.errors import ParseError
+
+from tee.ast_registry import (
+    ASTRegistry,
+    ast_registry_scope,
+    get_registry,
+    parse_sql,
+    shares_parsed_sql,
+)
+
+SQL = "SELECT id, name FROM my_schema.users WHERE id > 1"
+
+
+class TestASTRegistry:
+    """Test cases for ASTRegistry."""
+
+    def test_each_statement_is_parsed_once(self):
+        registry = ASTRegistry()
+
+        with patch("tee.ast_registry.sqlglot.parse_one", wraps=sqlglot.parse_one) as parse_one:
+            first = registry.parse(SQL)
+            second = registry.parse(SQL)
+
+        parse_one.assert_called_once()
+        assert first.sql() == second.sql()
+        assert registry.stats()["parse_count"] == 1
+        assert registry.stats()["reuse_count"] == 1
+
+    def test_dialects_are_parsed_separately(self):
+        registry = ASTRegistry()
+
+        registry.parse(SQL)
+        registry.parse(SQL, dialect="duckdb")
+
+        assert registry.stats()["statements"] == 2
+
+    def test_copies_do_not_leak_changes(self):
+        registry = ASTRegistry()
+
+        copy = registry.parse(SQL)
+        copy.set("where", None)
+
+        assert "WHERE" in registry.parse(SQL).sql()
+        assert registry.parse(SQL, copy=False) is registry.parse(SQL, copy=False)
+
+    def test_parse_errors_are_not_cached(self):
+        registry = ASTRegistry()
+
+        with pytest.raises(ParseError):
+            registry.parse("SELECT FROM WHERE (")
+
+        assert registry.stats()["statements"] == 0
+
+
+class TestRegistryScope:
+    """Test cases for the active registry."""
+
+    def test_parse_sql_without_scope_parses_directly(self):
+        assert get_registry() is None
+        assert parse_sql(SQL).sql() == sqlglot.parse_one(SQL).sql()
+
+    def test_nested_scopes_share_the_outer_registry(self):
+        with ast_registry_scope() as outer:
+            with ast_registry_scope() as inner:
+                assert inner is outer
+            parse_sql(SQL)
+            parse_sql(SQL)
+            assert outer.stats()["parse_count"] == 1
+
+        assert get_registry() is None
+
+    def test_shares_parsed_sql_decorator(self):
+        @shares_parsed_sql
+        def stage():
+            parse_sql(SQL)
+            parse_sql(SQL, copy=False)
+            return get_registry().stats()
+
+        assert stage()["reuse_count"] == 1
+        assert get_registry() is None
@@ -102,6 +102,11 @@ class TestBuildCommand:
             select_patterns=None,
             exclude_patterns=None,
             project_config=mock_ctx.config,
+            full_tests=False,
+            test_cache=True,
+            force_ddl=False,
+            defer_state=None,
+            defer_database=None,
         )
 
     @patch("tee.cli.commands.build.build_models")
@@ -440,3 +445,44 @@ class TestBuildCommand:
         assert call_args.kwargs["select_patterns"] == ["schema1.*"]
         assert call_args.kwargs["exclude_patterns"] == ["*.temp"]
 
+    @patch("tee.cli.commands.build.build_models")
+    @patch("tee.cli.commands.build.CommandContext")
+    def test_build_defer_passes_state(
+        self, mock_context_class, mock_build_models, mock_args, mock_config
+    ):
+        """Test that --defer passes the production state to build_models."""
+        mock_ctx = Mock()
+        mock_ctx.project_path = Path(mock_args.project_folder)
+        mock_ctx.vars = {}
+        mock_ctx.select_patterns = ["schema1.table2"]
+        mock_ctx.exclude_patterns = None
+        mock_ctx.config = mock_config
+        mock_context_class.return_value = mock_ctx
+        mock_build_models.return_value = {
+            "executed_tables": ["schema1.table2"],
+            "failed_tables": [],
+            "test_results": {"total": 0, "passed": 0, "failed": 0, "warnings": 0},
+        }
+
+        with patch("sys.stdout", new=StringIO()):
+            cmd_build(mock_args, defer=True, state="prod_artifacts", defer_database="prod")
+
+        call_kwargs = mock_build_models.call_args.kwargs
+        assert call_kwargs["defer_state"] == "prod_artifacts"
+        assert call_kwargs["defer_database"] == "prod"
+
+    @patch("tee.cli.commands.build.build_models")
+    @patch("tee.cli.commands.build.CommandContext")
+    def test_build_defer_requires_state(self, mock_context_class, mock_build_models, mock_args):
+        """Test that --defer without --state is reported as an error."""
+        mock_ctx = Mock()
+        mock_ctx.project_path = Path(mock_args.project_folder)
+        mock_ctx.handle_error = Mock()
+        mock_context_class.return_value = mock_ctx
+
+        with patch("sys.stdout", new=StringIO()):
+            cmd_build(mock_args, defer=True)
+
+        mock_ctx.handle_error.assert_called_once()
+        assert "--state" in str(mock_ctx.handle_error.call_args.args[0])
+        mock_build_models.assert_not_called()
@@ -0,0 +1,72 @@
+"""
+Unit tests for the critical-path CLI command.
+"""
+
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tee.cli.commands.critical_path import cmd_critical_path
+from tee.engine.model_state import ModelStateManager
+
+GRAPH = {
+    "dependencies": {
+        "s.a": [],
+        "s.b": ["s.a"],
+        "s.c": ["s.b"],
+        "s.slow": [],
+        "test:s.c.id.unique": ["s.c"],
+    }
+}
+
+
+class TestCriticalPathCommand:
+    """Test cases for the critical-path CLI command."""
+
+    @pytest.fixture
+    def project_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    def _run(self, project_dir, top=5):
+        mock_ctx = Mock()
+        mock_ctx.project_path = project_dir
+        mock_ctx.vars = {}
+        mock_ctx.config = {"connection": {"type": "duckdb", "path": ":memory:"}}
+
+        with (
+            patch("tee.cli.commands.critical_path.CommandContext", return_value=mock_ctx),
+            patch("tee.cli.commands.critical_path.ProjectParser") as mock_parser_class,
+            patch("sys.stdout", new=StringIO()) as fake_out,
+        ):
+            mock_parser_class.return_value.build_dependency_graph.return_value = GRAPH
+            cmd_critical_path(project_folder=str(project_dir), top=top)
+
+        mock_ctx.handle_error.assert_not_called()
+        return fake_out.getvalue()
+
+    def test_without_history_ranks_chains_by_length(self, project_dir):
+        output = self._run(project_dir)
+
+        assert "1. 3 node(s)  s.a -> s.b -> s.c" in output
+        assert "2. 1 node(s)  s.slow" in output
+        assert "test:" not in output
+        assert "No runtime history yet" in output
+
+    def test_history_ranks_chains_by_duration(self, project_dir):
+        state_manager = ModelStateManager(project_folder=str(project_dir))
+        state_manager.save_node_runtimes(
+            "run-1", "build", [("s.a", 1.0, "success"), ("s.b", 2.0, "success")]
+        )
+        state_manager.save_node_runtimes("run-1", "build", [("s.slow", 30.0, "success")])
+        state_manager.close()
+
+        output = self._run(project_dir, top=1)
+
+        assert "Estimated length: 30.00s" in output
+        assert "1. 30.00s  s.slow" in output
+        assert "s.a -> s.b" not in output
+        assert "covers 3 of 4 node(s); the others are estimated at 2.00s each" in output
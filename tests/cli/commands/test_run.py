@@ -82,6 +82,10 @@ class TestRunCommand:
             select_patterns=None,
             exclude_patterns=None,
             project_config=mock_ctx.config,
+            defer_state=None,
+            defer_database=None,
+            estimate=False,
+            force_ddl=False,
         )
 
     @patch("tee.cli.commands.run.execute_models")
@@ -346,3 +350,140 @@ class TestRunCommand:
         # Verify cleanup was still called
         mock_connection_manager.cleanup.assert_called_once()
 
+
+    @patch("tee.cli.commands.run.request_dev_server")
+    @patch("tee.cli.commands.run.execute_models")
+    @patch("tee.cli.commands.run.ConnectionManager")
+    @patch("tee.cli.commands.run.CommandContext")
+    def test_cmd_run_reuses_dev_server(self, mock_context_class, mock_connection_manager_class, mock_execute_models, mock_request_dev_server, mock_args):
+        """Test that a running dev server executes the models instead of a local run."""
+        mock_ctx = Mock()
+        mock_ctx.project_path = Path(mock_args.project_folder)
+        mock_ctx.vars = {}
+        mock_ctx.select_patterns = ["my_model"]
+        mock_ctx.exclude_patterns = None
+        mock_context_class.return_value = mock_ctx
+        mock_request_dev_server.return_value = {
+            "ok": True,
+            "results": {"executed_tables": ["schema1.my_model"], "failed_tables": []},
+        }
+
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            cmd_run(mock_args)
+
+        output = fake_out.getvalue()
+        assert "Using the running t4t dev server" in output
+        assert "All 1 table executed successfully!" in output
+        mock_request_dev_server.assert_called_once_with(
+            mock_ctx.project_path,
+            {"command": "run", "select": ["my_model"], "exclude": None, "variables": {}},
+        )
+        mock_execute_models.assert_not_called()
+        mock_connection_manager_class.assert_not_called()
+
+    @patch("tee.cli.commands.run.request_dev_server")
+    @patch("tee.cli.commands.run.execute_models")
+    @patch("tee.cli.commands.run.CommandContext")
+    def test_cmd_run_fails_when_dev_server_refuses(self, mock_context_class, mock_execute_models, mock_request_dev_server, mock_args):
+        """Test that a dev server refusing the run (e.g. other variables) is an error, not a local run."""
+        mock_ctx = Mock()
+        mock_ctx.project_path = Path(mock_args.project_folder)
+        mock_ctx.vars = {"env": "prod"}
+        mock_ctx.select_patterns = None
+        mock_ctx.exclude_patterns = None
+        mock_ctx.config = {"connection": {"type": "duckdb", "path": ":memory:"}}
+        mock_context_class.return_value = mock_ctx
+        mock_request_dev_server.return_value = {
+            "ok": False,
+            "error": "Variables differ from those of the dev session",
+        }
+
+        with patch("sys.stdout", new=StringIO()):
+            cmd_run(mock_args)
+
+        mock_execute_models.assert_not_called()
+        error = mock_ctx.handle_error.call_args.args[0]
+        assert isinstance(error, RuntimeError)
+        assert "Variables differ from those of the dev session" in str(error)
+        assert "stop `t4t dev`" in str(error)
+
+    @patch("tee.dev.server.request_dev_server")
+    @patch("tee.cli.commands.run.execute_models")
+    @patch("tee.cli.commands.run.CommandContext")
+    def test_cmd_run_local_options_fail_while_dev_server_runs(self, mock_context_class, mock_execute_models, mock_request_dev_server, mock_args):
+        """Test that options the dev server cannot run fail up front instead of on its locks."""
+        mock_ctx = Mock()
+        mock_ctx.project_path = Path(mock_args.project_folder)
+        mock_context_class.return_value = mock_ctx
+        mock_request_dev_server.return_value = {"ok": True, "pid": 1234}
+
+        with patch("sys.stdout", new=StringIO()):
+            cmd_run(mock_args, force_ddl=True)
+
+        mock_execute_models.assert_not_called()
+        mock_request_dev_server.assert_called_once_with(
+            mock_ctx.project_path, {"command": "ping"}, timeout=5
+        )
+        error = mock_ctx.handle_error.call_args.args[0]
+        assert "`t4t run --force-ddl` cannot run locally: stop `t4t dev` first" in str(error)
+
+    @patch("tee.cli.commands.run.request_dev_server")
+    @patch("tee.cli.commands.run.execute_models")
+    @patch("tee.cli.commands.run.CommandContext")
+    def test_cmd_run_defer_passes_state_and_skips_dev_server(self, mock_context_class, mock_execute_models, mock_request_dev_server, mock_args):
+        """Test that a deferred run executes locally against the production manifest."""
+        mock_ctx = Mock()
+        mock_ctx.project_path = Path(mock_args.project_folder)
+        mock_ctx.vars = {}
+        mock_ctx.select_patterns = ["my_model"]
+        mock_ctx.exclude_patterns = None
+        mock_ctx.config = {"connection": {"type": "duckdb", "path": ":memory:"}}
+        mock_context_class.return_value = mock_ctx
+        mock_execute_models.return_value = {"executed_tables": [], "failed_tables": []}
+
+        with patch("sys.stdout", new=StringIO()):
+            cmd_run(mock_args, defer=True, state="prod_artifacts", defer_database="prod")
+
+        mock_request_dev_server.assert_not_called()
+        call_kwargs = mock_execute_models.call_args.kwargs
+        assert call_kwargs["defer_state"] == "prod_artifacts"
+        assert call_kwargs["defer_database"] == "prod"
+
+    @patch("tee.cli.commands.run.request_dev_server")
+    @patch("tee.cli.commands.run.execute_models")
+    @patch("tee.cli.commands.run.CommandContext")
+    def test_cmd_run_estimate_dry_runs_locally(self, mock_context_class, mock_execute_models, mock_request_dev_server, mock_args):
+        """Test that --estimate is passed to the executor and skips the run summary."""
+        mock_ctx = Mock()
+        mock_ctx.project_path = Path(mock_args.project_folder)
+        mock_ctx.vars = {}
+        mock_ctx.select_patterns = None
+        mock_ctx.exclude_patterns = None
+        mock_ctx.config = {"connection": {"type": "bigquery"}}
+        mock_context_class.return_value = mock_ctx
+        mock_execute_models.return_value = {
+            "estimate": {"estimates": {}, "failed": [], "total_bytes": 0}
+        }
+
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            cmd_run(mock_args, estimate=True)
+
+        mock_request_dev_server.assert_not_called()
+        assert mock_execute_models.call_args.kwargs["estimate"] is True
+        assert "nothing was executed" in fake_out.getvalue()
+
+    @patch("tee.cli.commands.run.execute_models")
+    @patch("tee.cli.commands.run.CommandContext")
+    def test_cmd_run_defer_requires_state(self, mock_context_class, mock_execute_models, mock_args):
+        """Test that --defer without --state is reported as an error."""
+        mock_ctx = Mock()
+        mock_ctx.project_path = Path(mock_args.project_folder)
+        mock_ctx.handle_error = Mock()
+        mock_context_class.return_value = mock_ctx
+
+        with patch("sys.stdout", new=StringIO()):
+            cmd_run(mock_args, defer=True)
+
+        mock_ctx.handle_error.assert_called_once()
+        assert "--state" in str(mock_ctx.handle_error.call_args.args[0])
+        mock_execute_models.assert_not_called()
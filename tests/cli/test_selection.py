@@ -4,6 +4,7 @@ Unit tests for ModelSelector.
 
 import pytest
 from tee.cli.selection import ModelSelector
+from tee.parser.analysis import build_column_lineage
 
 
 class TestModelSelector:
@@ -222,3 +223,67 @@ class TestModelSelector:
         # Not excluded
         assert selector.is_selected("schema1.model2", sample_models["schema1.model2"]) is True
 
+
+
+class TestColumnChangedSelection:
+    """Test cases for column_changed: selection."""
+
+    @pytest.fixture
+    def column_lineage(self):
+        """Build the lineage of a staging model read by two marts."""
+        return build_column_lineage(
+            {
+                "staging.orders": "SELECT 1 AS id, 2 AS amount, 'x' AS note",
+                "marts.revenue": "SELECT id, amount FROM staging.orders",
+                "marts.notes": "SELECT id, note FROM staging.orders",
+            },
+            {
+                "staging.orders": [],
+                "marts.revenue": ["staging.orders"],
+                "marts.notes": ["staging.orders"],
+            },
+        )
+
+    def test_selects_only_downstream_models_reading_the_column(self, column_lineage):
+        selector = ModelSelector(
+            select_patterns=["column_changed:staging.orders.note+"],
+            column_lineage=column_lineage,
+        )
+
+        assert selector.is_selected("staging.orders", {}) is True
+        assert selector.is_selected("marts.notes", {}) is True
+        assert selector.is_selected("marts.revenue", {}) is False
+
+    def test_without_plus_selects_the_model_only(self, column_lineage):
+        selector = ModelSelector(
+            select_patterns=["column_changed:orders.note"], column_lineage=column_lineage
+        )
+
+        assert selector.is_selected("staging.orders", {}) is True
+        assert selector.is_selected("marts.notes", {}) is False
+
+    def test_accepts_the_lineage_dict_stored_in_the_graph(self, column_lineage):
+        selector = ModelSelector(
+            select_patterns=["column_changed:staging.orders.id,amount+"],
+            column_lineage=column_lineage.to_dict(),
+        )
+
+        assert selector.is_selected("marts.revenue", {}) is True
+        assert selector.is_selected("marts.notes", {}) is True
+
+    def test_exclude_column_changes(self, column_lineage):
+        selector = ModelSelector(
+            exclude_patterns=["column_changed:staging.orders.amount+"],
+            column_lineage=column_lineage,
+        )
+
+        assert selector.is_selected("marts.notes", {}) is True
+        assert selector.is_selected("marts.revenue", {}) is False
+
+    def test_requires_a_column(self, column_lineage):
+        with pytest.raises(ValueError, match="expected <model>.<column>"):
+            ModelSelector(select_patterns=["column_changed:orders+"], column_lineage=column_lineage)
+
+    def test_requires_the_lineage_index(self):
+        with pytest.raises(ValueError, match="column lineage index"):
+            ModelSelector(select_patterns=["column_changed:staging.orders.note+"])
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 from tee.compiler import compile_project, _merge_test_libraries, CompilationError
+from tee.adapters.base.sql import sql_hash
 
 
 class TestCompileProject:
@@ -215,6 +216,110 @@ class TestCompileProject:
             assert yaml_data["ots_version"] == "0.2.2"
             assert yaml_data["module_name"] == "test_project.schema1"
 
+    def test_compile_project_stores_transpiled_sql(self, temp_dir, mock_connection_config):
+        """Compiled OTS modules carry the model SQL transpiled to the target dialect."""
+        models_sql = {
+            "schema1.table1": "SELECT 1 as id, 'test' as name",
+        }
+        project_path = self._setup_project(temp_dir, models_sql, mock_connection_config)
+
+        results = compile_project(
+            project_folder=str(project_path),
+            connection_config=mock_connection_config,
+            variables={},
+            project_config={"name": "test_project", "project_folder": "test_project", "connection": mock_connection_config},
+        )
+
+        ots_file = next((project_path / "output" / "ots_modules").glob("*.ots.json"))
+        module = json.loads(ots_file.read_text())
+        sql_code = module["transformations"][0]["code"]["sql"]
+        entry = sql_code["transpiled"]["duckdb"]
+        assert entry["source_hash"] == sql_hash(sql_code["resolved_sql"])
+        assert entry["schema"] is None
+        assert "SELECT" in entry["sql"]
+        assert results["parsed_models"]["schema1.table1"]["code"]["sql"]["transpiled"] == {
+            "duckdb": entry
+        }
+
+    def test_compile_project_writes_schema_catalog(self, temp_dir, mock_connection_config):
+        """The schema catalog is written and its columns are exported to the OTS schema."""
+        models_sql = {
+            "schema1.base": "SELECT CAST(1 AS BIGINT) AS id, 'test' AS name",
+            "schema1.child": "SELECT b.id FROM schema1.base AS b",
+        }
+        project_path = self._setup_project(temp_dir, models_sql, mock_connection_config)
+
+        results = compile_project(
+            project_folder=str(project_path),
+            connection_config=mock_connection_config,
+            variables={},
+            project_config={"name": "test_project", "project_folder": "test_project", "connection": mock_connection_config},
+        )
+
+        catalog = json.loads((project_path / "output" / "schema_catalog.json").read_text())
+        assert catalog["relations"]["schema1.child"]["columns"] == [
+            {"name": "id", "type": "BIGINT"}
+        ]
+        assert results["schema_catalog"] == catalog
+
+        ots_file = next((project_path / "output" / "ots_modules").glob("*.ots.json"))
+        module = json.loads(ots_file.read_text())
+        child = next(
+            t for t in module["transformations"] if t["transformation_id"] == "schema1.child"
+        )
+        assert child["schema"]["columns"] == [
+            {"name": "id", "datatype": "number", "description": None}
+        ]
+
+    def test_compile_project_inlines_ephemerals_before_writing_artifacts(
+        self, temp_dir, mock_connection_config
+    ):
+        """parsed_models.json holds the SQL with ephemeral models inlined."""
+        models_sql = {
+            "schema1.stg": "SELECT 1 AS id",
+            "schema1.child": "SELECT id FROM schema1.stg",
+        }
+        project_path = self._setup_project(temp_dir, models_sql, mock_connection_config)
+        (project_path / "models" / "schema1" / "stg.py").write_text(
+            'metadata = {"materialization": "ephemeral"}\n'
+        )
+
+        results = compile_project(
+            project_folder=str(project_path),
+            connection_config=mock_connection_config,
+            variables={},
+            project_config={"name": "test_project", "project_folder": "test_project", "connection": mock_connection_config},
+        )
+
+        parsed = json.loads((project_path / "output" / "parsed_models.json").read_text())
+        child_sql = parsed["schema1.child"]["code"]["sql"]["resolved_sql"]
+        assert child_sql.startswith("WITH schema1__stg AS (")
+        assert results["parsed_models"]["schema1.child"]["code"]["sql"]["resolved_sql"] == child_sql
+
+    def test_compile_project_lazy_for_selection(self, temp_dir, mock_connection_config):
+        """Test that a selection only compiles the selected models and their upstream."""
+        models_sql = {
+            "schema1.base": "SELECT 1 as id",
+            "schema1.child": "SELECT id FROM schema1.base",
+            "schema1.unrelated": "SELECT 2 as id",
+        }
+        project_path = self._setup_project(temp_dir, models_sql, mock_connection_config)
+
+        results = compile_project(
+            project_folder=str(project_path),
+            connection_config=mock_connection_config,
+            variables={},
+            project_config={"name": "test_project", "project_folder": "test_project", "connection": mock_connection_config},
+            select_patterns=["child"],
+        )
+
+        assert results["lazy"] is True
+        assert sorted(results["parsed_models"]) == ["schema1.base", "schema1.child"]
+        assert results["execution_order"] == ["schema1.base", "schema1.child"]
+        # No artifacts are written for a partial compile
+        assert not (project_path / "output" / "ots_modules").exists()
+        assert not (project_path / "output" / "dependency_graph.json").exists()
+
 
 class TestMergeTestLibraries:
     """Test cases for _merge_test_libraries function."""
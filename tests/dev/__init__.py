@@ -0,0 +1,3 @@
+"""
+Dev session module tests.
+"""
@@ -0,0 +1,159 @@
+"""
+Tests for the resident dev session and its socket API.
+"""
+
+import json
+import socket
+import stat
+
+import pytest
+
+from tee.dev import (
+    DevServer,
+    DevSession,
+    ensure_no_dev_server,
+    request_dev_server,
+    server_info_path,
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a DuckDB project with a seed, a chain of models and an unrelated model."""
+    (tmp_path / "seeds" / "s").mkdir(parents=True)
+    (tmp_path / "seeds" / "s" / "people.csv").write_text("id,name\n1,a\n2,b\n")
+    models = tmp_path / "models" / "s"
+    models.mkdir(parents=True)
+    (models / "base.sql").write_text("SELECT id, name FROM people")
+    (models / "counted.sql").write_text("SELECT COUNT(*) AS n FROM s.base")
+    (models / "lone.sql").write_text("SELECT 1 AS x")
+    return tmp_path
+
+
+@pytest.fixture
+def session(project):
+    """Start a dev session on the project."""
+    session = DevSession(str(project), {"type": "duckdb", "path": str(project / "dev.duckdb")})
+    session.start()
+    yield session
+    session.close()
+
+
+class TestDevSession:
+    """Test cases for DevSession."""
+
+    def test_start_loads_project_and_runs_all_models(self, session):
+        results = session.run()
+
+        assert sorted(results["executed_tables"]) == ["s.base", "s.counted", "s.lone"]
+        assert session.engine.adapter.execute_query("SELECT n FROM s.counted") == [(2,)]
+
+    def test_refresh_reparses_changed_file_and_reports_dependents(self, session, project):
+        session.run()
+        base = project / "models" / "s" / "base.sql"
+        base.write_text("SELECT id, name FROM people WHERE id = 1")
+
+        refresh = session.refresh()
+        results = session.run(models=refresh["affected"])
+
+        assert refresh["affected"] == ["s.base", "s.counted"]
+        assert results["executed_tables"] == ["s.base", "s.counted"]
+        assert session.engine.adapter.execute_query("SELECT n FROM s.counted") == [(1,)]
+
+    def test_changed_seed_is_reloaded_and_affects_its_readers(self, session, project):
+        session.run()
+        (project / "seeds" / "s" / "people.csv").write_text("id,name\n1,a\n2,b\n3,c\n")
+
+        refresh = session.refresh()
+        session.run(models=refresh["affected"])
+
+        assert refresh["affected"] == ["s.base", "s.counted"]
+        assert session.engine.adapter.execute_query("SELECT n FROM s.counted") == [(3,)]
+
+    def test_new_deleted_and_broken_files(self, session, project):
+        models = project / "models" / "s"
+        (models / "extra.sql").write_text("SELECT * FROM s.lone")
+        assert session.refresh()["affected"] == ["s.extra"]
+
+        (models / "extra.sql").write_text("SELEC broken ((")
+        refresh = session.refresh()
+        assert refresh["affected"] == []
+        assert str(models / "extra.sql") in refresh["errors"]
+
+        (models / "extra.sql").unlink()
+        refresh = session.refresh()
+        assert refresh["errors"] == {}
+        assert "s.extra" not in session.all_models
+
+    def test_python_model_is_reparsed(self, session, project):
+        python_model = project / "models" / "s" / "generated.py"
+        python_model.write_text(
+            "from tee.parser.model import model\n\n"
+            '@model(table_name="generated")\n'
+            "def generated():\n"
+            '    return "SELECT 1 AS v"\n'
+        )
+        assert session.refresh()["affected"] == ["s.generated"]
+
+        python_model.write_text(python_model.read_text().replace("1 AS v", "2 AS v"))
+        refresh = session.refresh()
+        session.run(models=refresh["affected"])
+
+        assert refresh["affected"] == ["s.generated"]
+        assert session.engine.adapter.execute_query("SELECT v FROM s.generated") == [(2,)]
+
+    def test_run_applies_selection(self, session):
+        results = session.run(select=["s.lone"])
+
+        assert results["executed_tables"] == ["s.lone"]
+
+
+class TestDevServer:
+    """Test cases for the dev server socket API."""
+
+    def test_roundtrip_and_address_file(self, session, project):
+        server = DevServer(session)
+        server.start()
+        try:
+            assert server_info_path(project).exists()
+            assert request_dev_server(project, {"command": "ping"})["ok"]
+            assert request_dev_server(project, {"command": "status"})["status"]["models"] == 3
+            with pytest.raises(RuntimeError, match="stop `t4t dev` first"):
+                ensure_no_dev_server(project, "t4t build")
+
+            response = request_dev_server(project, {"command": "run", "select": ["s.lone"]})
+            assert response["ok"]
+            assert response["results"]["executed_tables"] == ["s.lone"]
+
+            response = request_dev_server(project, {"command": "run", "variables": {"x": 1}})
+            assert not response["ok"]
+            assert request_dev_server(project, {"command": "nope"})["error"] == (
+                "Unknown command: nope"
+            )
+
+            request_dev_server(project, {"command": "shutdown"})
+            assert server.shutdown_requested.is_set()
+        finally:
+            server.stop()
+
+        assert not server_info_path(project).exists()
+        assert request_dev_server(project, {"command": "ping"}) is None
+        ensure_no_dev_server(project, "t4t build")
+
+    def test_requests_need_the_session_token(self, session, project):
+        server = DevServer(session)
+        server.start()
+        try:
+            info_path = server_info_path(project)
+            assert stat.S_IMODE(info_path.stat().st_mode) == 0o600
+
+            info = json.loads(info_path.read_text())
+            with socket.create_connection((info["host"], info["port"]), timeout=5) as conn:
+                conn.sendall(b'{"command": "shutdown", "token": "guess"}\n')
+                with conn.makefile("rb") as reader:
+                    response = json.loads(reader.readline())
+
+            assert response == {"ok": False, "error": "Invalid dev server token"}
+            assert not server.shutdown_requested.is_set()
+        finally:
+            server.stop()
@@ -0,0 +1,41 @@
+"""
+Tests for the polling project watcher.
+"""
+
+from tee.dev import ADDED, DELETED, MODIFIED, ProjectWatcher
+
+
+class TestProjectWatcher:
+    """Test cases for ProjectWatcher."""
+
+    def test_reports_added_modified_and_deleted_files(self, tmp_path):
+        models = tmp_path / "models"
+        models.mkdir()
+        (models / "kept.sql").write_text("SELECT 1")
+        (models / "edited.sql").write_text("SELECT 1")
+        (models / "removed.sql").write_text("SELECT 1")
+        watcher = ProjectWatcher(tmp_path)
+        watcher.snapshot()
+
+        (models / "edited.sql").write_text("SELECT 1, 2")
+        (models / "removed.sql").unlink()
+        (models / "new.sql").write_text("SELECT 3")
+
+        assert watcher.poll() == {
+            models / "edited.sql": MODIFIED,
+            models / "removed.sql": DELETED,
+            models / "new.sql": ADDED,
+        }
+        assert watcher.poll() == {}
+
+    def test_ignores_unwatched_and_hidden_files(self, tmp_path):
+        (tmp_path / "models" / "__pycache__").mkdir(parents=True)
+        (tmp_path / "output").mkdir()
+        watcher = ProjectWatcher(tmp_path)
+        watcher.snapshot()
+
+        (tmp_path / "output" / "graph.json").write_text("{}")
+        (tmp_path / "models" / ".model.sql.swp").write_text("")
+        (tmp_path / "models" / "__pycache__" / "model.pyc").write_text("")
+
+        assert watcher.poll() == {}
@@ -2,7 +2,7 @@
 Test cases for strategy execution methods.
 """
 
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 from tests.engine.incremental.test_executor_base import TestIncrementalExecutor
 
@@ -50,6 +50,7 @@ class TestStrategyExecution(TestIncrementalExecutor):
         mock_adapter.get_table_info = Mock(return_value={"schema": []})
         mock_adapter.describe_query_schema = Mock(return_value=[])
         mock_adapter.execute_query = Mock(return_value=[])
+        mock_adapter.transaction = MagicMock()
 
         executor.execute_delete_insert_strategy(
             "test_model",
@@ -61,6 +62,30 @@ class TestStrategyExecution(TestIncrementalExecutor):
         )
 
         mock_adapter.execute_incremental_delete_insert.assert_called_once()
+        # Delete and insert run in one transaction
+        mock_adapter.transaction.return_value.__enter__.assert_called_once()
+        executor.state_manager.update_processed_value.assert_called_once()
+
+    def test_insert_overwrite_strategy_execution(self, executor):
+        """Test insert_overwrite strategy execution uses the model's partitions."""
+        mock_adapter = Mock()
+        mock_adapter.execute_incremental_insert_overwrite = Mock()
+        mock_adapter.table_exists = Mock(return_value=True)
+        mock_adapter.get_table_info = Mock(return_value={"schema": []})
+        mock_adapter.describe_query_schema = Mock(return_value=[])
+
+        executor.execute_insert_overwrite_strategy(
+            "test_model",
+            "SELECT * FROM source",
+            {},
+            mock_adapter,
+            "test_table",
+            metadata={"partitions": ["event_date"]},
+        )
+
+        mock_adapter.execute_incremental_insert_overwrite.assert_called_once_with(
+            "test_table", "SELECT * FROM source", ["event_date"]
+        )
         executor.state_manager.update_processed_value.assert_called_once()
 
     def test_fallback_to_regular_execution(self, executor, sample_append_config):
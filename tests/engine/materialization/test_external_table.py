@@ -0,0 +1,140 @@
+"""
+Tests for DuckDB external materialization to (partitioned) Parquet.
+"""
+
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from tee.adapters.base import AdapterConfig
+from tee.adapters.duckdb.adapter import DuckDBAdapter
+from tee.engine.materialization.materialization_handler import MaterializationHandler
+from tee.engine.model_state import ModelStateManager
+from tee.parser.shared.metadata_schema import validate_metadata_dict
+
+MODEL_SQL = "SELECT event_date, event_id, value FROM source_events"
+
+
+@pytest.fixture
+def state_manager(temp_state_db_path):
+    """Create a state manager backed by a temporary state database."""
+    manager = ModelStateManager(state_database_path=temp_state_db_path)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def adapter():
+    """Create a DuckDB adapter with a source table of events over two days."""
+    adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+    adapter.connect()
+    adapter.execute_query(
+        """
+        CREATE TABLE source_events AS
+        SELECT * FROM (VALUES
+            ('2024-01-01', 1, 10),
+            ('2024-01-02', 2, 20),
+            ('2024-01-02', 3, 30)
+        ) AS t(event_date, event_id, value)
+        """
+    )
+    yield adapter
+    adapter.disconnect()
+
+
+class TestDuckDBExternalTable:
+    """Test cases for external_table materialization on DuckDB."""
+
+    def test_writes_hive_partitioned_parquet_and_registers_view(
+        self, adapter, state_manager, tmp_path
+    ):
+        location = str(tmp_path / "events")
+        metadata = {
+            "materialization": "external_table",
+            "partitions": ["event_date"],
+            "external": {"location": location, "row_group_size": 1000, "compression": "zstd"},
+        }
+        handler = MaterializationHandler(adapter, state_manager, {})
+
+        handler.materialize("analytics.events", MODEL_SQL, "external_table", metadata)
+
+        assert sorted(os.listdir(location)) == ["event_date=2024-01-01", "event_date=2024-01-02"]
+        assert adapter.execute_query(
+            "SELECT CAST(event_date AS VARCHAR), COUNT(*) FROM analytics.events "
+            "GROUP BY 1 ORDER BY 1"
+        ) == [("2024-01-01", 1), ("2024-01-02", 2)]
+        # Downstream models resolve the external model like any other relation
+        assert adapter.execute_query("SELECT SUM(value) FROM analytics.events") == [(60,)]
+
+    def test_rerun_replaces_previous_files(self, adapter, state_manager, tmp_path):
+        location = str(tmp_path / "events")
+        metadata = {"partitions": ["event_date"], "external": {"location": location}}
+        handler = MaterializationHandler(adapter, state_manager, {})
+
+        handler.materialize("events", MODEL_SQL, "external_table", metadata)
+        adapter.execute_query("DELETE FROM source_events WHERE event_date = '2024-01-01'")
+        handler.materialize("events", MODEL_SQL, "external_table", metadata)
+
+        # Stale partition directories may remain, but their files are gone
+        assert sorted(
+            os.path.relpath(os.path.join(root, name), location)
+            for root, _, files in os.walk(location)
+            for name in files
+        ) == ["event_date=2024-01-02/data_0.parquet"]
+        assert adapter.execute_query("SELECT COUNT(*) FROM events") == [(2,)]
+
+    def test_location_defaults_below_connection_root(self, state_manager, tmp_path):
+        adapter = DuckDBAdapter(
+            {"type": "duckdb", "path": ":memory:", "extra": {"external_location": str(tmp_path)}}
+        )
+        adapter.connect()
+        try:
+            handler = MaterializationHandler(adapter, state_manager, {})
+            handler.materialize(
+                "analytics.numbers", "SELECT 1 AS id", "external_table", {}, adapter.config
+            )
+
+            assert os.listdir(tmp_path / "analytics" / "numbers")
+            assert adapter.execute_query("SELECT id FROM analytics.numbers") == [(1,)]
+        finally:
+            adapter.disconnect()
+
+    def test_other_adapters_receive_connection_location_unchanged(self, state_manager):
+        # BigQuery uses the location as its external table uris, wildcards included
+        adapter = Mock()
+        config = AdapterConfig(
+            type="bigquery", extra={"external_location": "gs://bucket/events/*.parquet"}
+        )
+        handler = MaterializationHandler(adapter, state_manager, {})
+
+        handler.materialize("analytics.events", MODEL_SQL, "external_table", {}, config)
+
+        adapter.create_external_table.assert_called_once_with(
+            "analytics.events", MODEL_SQL, "gs://bucket/events/*.parquet", {}
+        )
+
+    def test_replaces_table_materialized_by_a_previous_run(self, adapter, state_manager, tmp_path):
+        adapter.execute_query("CREATE TABLE events AS SELECT 1 AS id")
+        metadata = {"external": {"location": str(tmp_path / "events")}}
+        handler = MaterializationHandler(adapter, state_manager, {})
+
+        handler.materialize("events", MODEL_SQL, "external_table", metadata)
+
+        assert adapter.execute_query("SELECT COUNT(*) FROM events") == [(3,)]
+
+    def test_rejects_unsupported_format(self, adapter, state_manager, tmp_path):
+        metadata = {"external": {"location": str(tmp_path / "events"), "format": "csv"}}
+        handler = MaterializationHandler(adapter, state_manager, {})
+
+        with pytest.raises(ValueError, match="Unsupported external format"):
+            handler.materialize("events", MODEL_SQL, "external_table", metadata)
+
+    def test_metadata_validation_accepts_external_table(self):
+        validated = validate_metadata_dict(
+            {"materialization": "external_table", "external": {"location": "out/events"}}
+        )
+        assert validated.materialization == "external_table"
+
+        with pytest.raises(ValueError, match="External configuration must be a dictionary"):
+            validate_metadata_dict({"materialization": "external_table", "external": "out"})
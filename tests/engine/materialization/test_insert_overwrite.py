@@ -0,0 +1,162 @@
+"""
+Tests for the partition-aware insert_overwrite incremental strategy.
+"""
+
+import duckdb
+import pytest
+
+from tee.adapters.duckdb.adapter import DuckDBAdapter
+from tee.adapters.snowflake.adapter import SnowflakeAdapter
+from tee.engine.materialization.materialization_handler import MaterializationHandler
+from tee.engine.model_state import ModelStateManager
+from tee.parser.shared.metadata_schema import validate_metadata_dict
+from tests.adapters.snowflake.fake_connection import FakeSnowflakeConnection
+
+MODEL_SQL = "SELECT event_date, event_id, value FROM source_events"
+
+METADATA = {
+    "materialization": "incremental",
+    "partitions": ["event_date"],
+    "incremental": {"strategy": "insert_overwrite"},
+}
+
+
+@pytest.fixture
+def state_manager(temp_state_db_path):
+    """Create a state manager backed by a temporary state database."""
+    manager = ModelStateManager(state_database_path=temp_state_db_path)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def adapter():
+    """Create a DuckDB adapter with a source table of events over three days."""
+    adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+    adapter.connect()
+    adapter.execute_query(
+        """
+        CREATE TABLE source_events AS
+        SELECT * FROM (VALUES
+            (DATE '2024-01-01', 1, 10),
+            (DATE '2024-01-02', 2, 20),
+            (DATE '2024-01-02', 3, 30),
+            (DATE '2024-01-03', 4, 40)
+        ) AS t(event_date, event_id, value)
+        """
+    )
+    yield adapter
+    adapter.disconnect()
+
+
+def _rows(adapter, table_name):
+    return adapter.execute_query(
+        f"SELECT CAST(event_date AS VARCHAR), event_id, value FROM {table_name} "
+        "ORDER BY event_date, event_id"
+    )
+
+
+class TestInsertOverwriteStrategy:
+    """Test cases for insert_overwrite through the materialization handler."""
+
+    def test_replaces_only_partitions_present_in_batch(self, adapter, state_manager):
+        handler = MaterializationHandler(adapter, state_manager, {})
+        handler.materialize("target_events", MODEL_SQL, "incremental", METADATA)
+        assert len(_rows(adapter, "target_events")) == 4
+
+        # Source retention drops the oldest day; day 2 is restated; day 4 is new
+        adapter.execute_query("DELETE FROM source_events WHERE event_date = DATE '2024-01-01'")
+        adapter.execute_query("DELETE FROM source_events WHERE event_id = 3")
+        adapter.execute_query("UPDATE source_events SET value = 21 WHERE event_id = 2")
+        adapter.execute_query("INSERT INTO source_events VALUES (DATE '2024-01-04', 5, 50)")
+
+        handler.materialize("target_events", MODEL_SQL, "incremental", METADATA)
+
+        assert _rows(adapter, "target_events") == [
+            ("2024-01-01", 1, 10),
+            ("2024-01-02", 2, 21),
+            ("2024-01-03", 4, 40),
+            ("2024-01-04", 5, 50),
+        ]
+
+    def test_null_partition_is_replaced(self, adapter):
+        adapter.execute_query(
+            "CREATE TABLE target_events AS SELECT * FROM source_events "
+            "UNION ALL SELECT NULL, 99, 990"
+        )
+
+        adapter.execute_incremental_insert_overwrite(
+            "target_events",
+            "SELECT NULL::DATE AS event_date, 100 AS event_id, 1000 AS value",
+            ["event_date"],
+        )
+
+        rows = _rows(adapter, "target_events")
+        assert (None, 100, 1000) in rows
+        assert (None, 99, 990) not in rows
+        assert len(rows) == 5
+
+    def test_failed_batch_leaves_table_untouched(self, adapter):
+        adapter.execute_query("CREATE TABLE target_events AS SELECT * FROM source_events")
+
+        with pytest.raises(duckdb.ConversionException, match="Could not convert"):
+            adapter.execute_incremental_insert_overwrite(
+                "target_events",
+                "SELECT event_date, event_id, CAST('x' AS INTEGER) AS value FROM source_events",
+                ["event_date"],
+            )
+
+        assert len(_rows(adapter, "target_events")) == 4
+
+    def test_snowflake_replaces_partitions_in_transaction(self):
+        adapter = SnowflakeAdapter(
+            {
+                "type": "snowflake",
+                "host": "test.snowflakecomputing.com",
+                "user": "test_user",
+                "password": "test_password",
+                "database": "test_db",
+                "schema": "s",
+            }
+        )
+        adapter.connection = FakeSnowflakeConnection()
+        try:
+            adapter.connection.run("CREATE SCHEMA test_db.s")
+            adapter.connection.run(
+                "CREATE TABLE test_db.s.target AS SELECT * FROM (VALUES (1, 'a'), (2, 'b')) "
+                "AS t(day, value)"
+            )
+
+            adapter.execute_incremental_insert_overwrite(
+                "s.target", "SELECT 2 AS day, 'c' AS value", ["day"]
+            )
+
+            statements = [sql.split()[0] for sql in adapter.connection.executed[2:]]
+            assert statements == ["CREATE", "BEGIN", "DELETE", "INSERT", "COMMIT", "DROP"]
+            assert adapter.connection.db.execute(
+                "SELECT * FROM test_db.s.target ORDER BY day"
+            ).fetchall() == [(1, "a"), (2, "c")]
+        finally:
+            adapter.connection.close()
+
+
+class TestInsertOverwriteValidation:
+    """Test cases for insert_overwrite metadata validation."""
+
+    def test_requires_partition_columns(self):
+        with pytest.raises(ValueError, match="partition_by"):
+            validate_metadata_dict(
+                {"materialization": "incremental", "incremental": {"strategy": "insert_overwrite"}}
+            )
+
+    def test_accepts_partition_by_override(self):
+        validated = validate_metadata_dict(
+            {
+                "materialization": "incremental",
+                "incremental": {
+                    "strategy": "insert_overwrite",
+                    "insert_overwrite": {"partition_by": ["event_date"]},
+                },
+            }
+        )
+        assert validated.incremental["strategy"] == "insert_overwrite"
@@ -0,0 +1,167 @@
+"""
+Tests for the schema comparison cache used by incremental on_schema_change checks.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tee.adapters.duckdb.adapter import DuckDBAdapter
+from tee.engine.materialization.materialization_handler import MaterializationHandler
+from tee.engine.materialization.schema_cache import SchemaCache
+from tee.engine.materialization.schema_comparator import SchemaComparator
+from tee.engine.model_state import ModelStateManager
+
+SOURCE_TABLE_SQL = (
+    "CREATE TABLE source_table AS SELECT 1 AS id, 'a' AS name, TIMESTAMP '2024-06-01' AS created_at"
+)
+
+
+class TestSchemaCache:
+    """Test cases for SchemaCache and its state database persistence."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create a DuckDB adapter instance."""
+        with tempfile.NamedTemporaryFile(suffix=".duckdb", delete=False) as tmp_file:
+            db_path = tmp_file.name
+
+        Path(db_path).unlink(missing_ok=True)
+
+        adapter = DuckDBAdapter({"type": "duckdb", "path": db_path})
+        adapter.connect()
+
+        yield adapter
+
+        adapter.disconnect()
+        Path(db_path).unlink(missing_ok=True)
+
+    @pytest.fixture
+    def state_manager(self):
+        """Create a state manager backed by a temporary state database."""
+        temp_dir = tempfile.mkdtemp()
+        temp_state_db = os.path.join(temp_dir, "test_state.db")
+
+        manager = ModelStateManager(state_database_path=temp_state_db)
+        yield manager
+        manager.close()
+        Path(temp_state_db).unlink(missing_ok=True)
+        os.rmdir(temp_dir)
+
+    @pytest.fixture
+    def handler(self, adapter, state_manager):
+        """Create a MaterializationHandler instance."""
+        return MaterializationHandler(adapter, state_manager, {})
+
+    @pytest.fixture
+    def metadata(self):
+        """Append-strategy metadata with on_schema_change set."""
+        return {
+            "incremental": {
+                "strategy": "append",
+                "on_schema_change": "append_new_columns",
+                "append": {"filter_column": "created_at", "start_value": "2024-01-01"},
+            }
+        }
+
+    def test_entry_round_trip_and_ddl_versions(self, state_manager):
+        cache = SchemaCache(state_manager)
+        schema = [{"name": "id", "type": "INTEGER"}]
+
+        assert not cache.is_unchanged("s.t", "SELECT 1 AS id")
+
+        cache.save("s.t", "SELECT 1 AS id", schema, schema)
+        entry = state_manager.get_schema_cache("s.t")
+        assert entry.query_schema == schema
+        assert entry.ddl_version == 0
+        assert cache.is_unchanged("s.t", "SELECT 1 AS id")
+        assert not cache.is_unchanged("s.t", "SELECT 2 AS id")
+
+        cache.invalidate("s.t")
+        assert state_manager.get_ddl_version("s.t") == 1
+        assert not cache.is_unchanged("s.t", "SELECT 1 AS id")
+
+    def test_ddl_on_untracked_table_is_not_recorded(self, state_manager):
+        cache = SchemaCache(state_manager)
+
+        cache.invalidate("s.other")
+
+        assert state_manager.get_ddl_version("s.other") == 0
+        assert state_manager.record_ddl("s.other", tracked_only=True) == 0
+
+    def test_upstream_ddl_invalidates_cache(self, state_manager):
+        cache = SchemaCache(state_manager)
+        schema = [{"name": "id", "type": "INTEGER"}]
+        sql_query = "WITH recent AS (SELECT * FROM s.orders) SELECT id FROM recent"
+
+        cache.save("s.t", sql_query, schema, schema)
+        assert cache.is_unchanged("s.t", sql_query)
+
+        # The CTE is not a relation, the upstream table is
+        cache.invalidate("recent")
+        assert cache.is_unchanged("s.t", sql_query)
+        cache.invalidate("s.orders")
+        assert not cache.is_unchanged("s.t", sql_query)
+
+    def test_unchanged_schema_skips_comparison(self, handler, adapter, metadata):
+        adapter.execute_query(SOURCE_TABLE_SQL)
+        sql_query = "SELECT id, name, created_at FROM source_table"
+
+        # First run creates the table, second run compares and caches the result
+        handler.materialize("target", sql_query, "incremental", metadata)
+        handler.materialize("target", sql_query, "incremental", metadata)
+
+        with patch.object(SchemaComparator, "infer_query_schema") as infer_query_schema:
+            handler.materialize("target", sql_query, "incremental", metadata)
+
+        infer_query_schema.assert_not_called()
+
+    def test_tee_ddl_invalidates_cache(self, handler, adapter, metadata):
+        adapter.execute_query(SOURCE_TABLE_SQL)
+        sql_query = "SELECT id, name, created_at FROM source_table"
+        handler.materialize("target", sql_query, "incremental", metadata)
+        handler.materialize("target", sql_query, "incremental", metadata)
+        assert handler.schema_cache.is_unchanged("target", sql_query)
+
+        # A model switched to a table materialization replaces the target
+        handler.materialize("target", sql_query, "table")
+        assert not handler.schema_cache.is_unchanged("target", sql_query)
+
+    def test_schema_change_is_still_detected(self, handler, adapter, metadata):
+        adapter.execute_query(SOURCE_TABLE_SQL)
+        sql_query = "SELECT id, created_at FROM source_table"
+        handler.materialize("target", sql_query, "incremental", metadata)
+        handler.materialize("target", sql_query, "incremental", metadata)
+
+        # Changed SQL misses the cache, so the new column reaches the target
+        new_sql_query = "SELECT id, name, created_at FROM source_table"
+        assert not handler.schema_cache.is_unchanged("target", new_sql_query)
+        handler.materialize("target", new_sql_query, "incremental", metadata)
+
+        columns = [col["name"] for col in SchemaComparator(adapter).get_table_schema("target")]
+        assert "name" in columns
+
+    def test_rebuilt_upstream_table_misses_cache(self, handler, adapter, metadata):
+        adapter.execute_query("CREATE SCHEMA s")
+        handler.materialize(
+            "s.upstream", "SELECT 1 AS id, TIMESTAMP '2024-06-01' AS created_at", "table"
+        )
+        sql_query = "SELECT * FROM s.upstream"
+        handler.materialize("s.target", sql_query, "incremental", metadata)
+        handler.materialize("s.target", sql_query, "incremental", metadata)
+        assert handler.schema_cache.is_unchanged("s.target", sql_query)
+
+        # The upstream gains a column without any change to the model SQL
+        handler.materialize(
+            "s.upstream",
+            "SELECT 1 AS id, 'a' AS name, TIMESTAMP '2024-06-02' AS created_at",
+            "table",
+        )
+        assert not handler.schema_cache.is_unchanged("s.target", sql_query)
+        handler.materialize("s.target", sql_query, "incremental", metadata)
+
+        columns = [col["name"] for col in SchemaComparator(adapter).get_table_schema("s.target")]
+        assert "name" in columns
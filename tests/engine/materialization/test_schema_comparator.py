@@ -210,6 +210,20 @@ class TestSchemaComparator:
         assert schema[0]["name"] == "id"
         mock_adapter.describe_query_schema.assert_called_once_with("SELECT id, name FROM test")
 
+    def test_infer_query_schema_uses_known_output_schema(self, comparator, mock_adapter):
+        """Test that a registered compile-time output schema skips the database."""
+        known_schema = [{"name": "id", "type": "BIGINT"}]
+        mock_adapter.get_known_query_schema = Mock(return_value=known_schema)
+        mock_adapter.describe_query_schema = Mock()
+
+        schema = comparator.infer_query_schema(
+            "SELECT id FROM test WHERE id > 1", schema_key="SELECT id FROM test"
+        )
+
+        assert schema == known_schema
+        mock_adapter.get_known_query_schema.assert_called_once_with("SELECT id FROM test")
+        mock_adapter.describe_query_schema.assert_not_called()
+
     def test_infer_query_schema_fallback_on_error(self, comparator, mock_adapter):
         """Test that infer_query_schema falls back to LIMIT 0 on adapter method error."""
         mock_adapter.describe_query_schema = Mock(side_effect=Exception("Not implemented"))
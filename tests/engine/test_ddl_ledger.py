@@ -0,0 +1,190 @@
+"""
+Test cases for no-op DDL elimination with the definition-hash ledger.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from tee.engine.execution_engine import ExecutionEngine
+from tee.engine.model_state import ModelStateManager
+from tee.engine.state import DDLLedger
+
+FUNCTION_SQL = "CREATE OR REPLACE MACRO my_schema.add_one(x) AS (x + 1)"
+
+
+def _view(sql):
+    """Build parsed data for a view model."""
+    return {
+        "code": {"sql": {"resolved_sql": sql}},
+        "model_metadata": {"metadata": {"materialization": "view"}},
+    }
+
+
+def _table(sql):
+    """Build parsed data for a table model."""
+    return {
+        "code": {"sql": {"resolved_sql": sql}},
+        "model_metadata": {"metadata": {"materialization": "table"}},
+    }
+
+
+def _function(sql):
+    """Build parsed data for a SQL function."""
+    return {
+        "code": {"sql": {"resolved_sql": sql}},
+        "function_metadata": {
+            "function_name": "add_one",
+            "function_type": "scalar",
+            "language": "sql",
+            "parameters": [{"name": "x", "type": "INTEGER"}],
+            "return_type": "INTEGER",
+        },
+    }
+
+
+class TestDDLLedger:
+    """Test cases for DDLLedger."""
+
+    @pytest.fixture
+    def state_manager(self, temp_state_db_path):
+        manager = ModelStateManager(state_database_path=temp_state_db_path)
+        yield manager
+        manager.close()
+
+    def test_unchanged_definition_of_existing_object_is_skipped(self, state_manager):
+        ledger = DDLLedger(state_manager)
+        definition_hash = ledger.compute_hash("VIEW", "SELECT 1")
+
+        assert not ledger.is_unchanged("VIEW", "s.v", definition_hash, lambda: True)
+        ledger.record("VIEW", "s.v", definition_hash)
+
+        assert ledger.is_unchanged("VIEW", "s.v", definition_hash, lambda: True)
+        assert not ledger.is_unchanged("VIEW", "s.v", definition_hash, lambda: False)
+        assert not ledger.is_unchanged(
+            "VIEW", "s.v", ledger.compute_hash("VIEW", "SELECT 2"), lambda: True
+        )
+
+    def test_force_and_forget(self, state_manager):
+        ledger = DDLLedger(state_manager)
+        definition_hash = ledger.compute_hash("FUNCTION", "SELECT 1")
+        ledger.record("FUNCTION", "s.f", definition_hash)
+
+        forced = DDLLedger(state_manager, force=True)
+        assert not forced.is_unchanged("FUNCTION", "s.f", definition_hash, lambda: True)
+
+        ledger.forget("FUNCTION", "s.f")
+        assert not ledger.is_unchanged("FUNCTION", "s.f", definition_hash, lambda: True)
+
+    def test_hash_depends_on_scope(self, state_manager):
+        dev = DDLLedger(state_manager, scope="duckdb:dev.duckdb")
+        prod = DDLLedger(state_manager, scope="duckdb:prod.duckdb")
+
+        assert dev.compute_hash("VIEW", "SELECT 1") != prod.compute_hash("VIEW", "SELECT 1")
+
+
+class TestDDLSkipping:
+    """Test cases for skipping view and function DDL across runs."""
+
+    def _run(
+        self, temp_project_dir, temp_db_path, parsed_models=None, functions=None, force_ddl=False
+    ):
+        """Run models and functions in a fresh engine, returning results and DDL calls."""
+        engine = ExecutionEngine(
+            config={"type": "duckdb", "path": temp_db_path},
+            project_folder=str(temp_project_dir),
+            force_ddl=force_ddl,
+        )
+        engine.connect()
+        try:
+            adapter = engine.adapter
+            with (
+                patch.object(adapter, "create_view", wraps=adapter.create_view) as create_view,
+                patch.object(
+                    adapter, "create_function", wraps=adapter.create_function
+                ) as create_function,
+            ):
+                results = {}
+                if functions:
+                    results.update(engine.execute_functions(functions, list(functions)))
+                if parsed_models:
+                    results.update(engine.execute_models(parsed_models, list(parsed_models)))
+            return results, create_view.call_count, create_function.call_count
+        finally:
+            engine.disconnect()
+
+    @pytest.fixture
+    def temp_db_path(self, temp_project_dir):
+        return str(temp_project_dir / "data" / "warehouse.duckdb")
+
+    def test_unchanged_view_is_not_recreated(self, temp_project_dir, temp_db_path):
+        models = {"my_schema.v": _view("SELECT 1 AS id")}
+
+        _, first, _ = self._run(temp_project_dir, temp_db_path, models)
+        results, second, _ = self._run(temp_project_dir, temp_db_path, models)
+
+        assert (first, second) == (1, 0)
+        assert results["executed_tables"] == ["my_schema.v"]
+
+    def test_changed_or_dropped_view_is_recreated(self, temp_project_dir, temp_db_path):
+        self._run(temp_project_dir, temp_db_path, {"my_schema.v": _view("SELECT 1 AS id")})
+
+        _, changed, _ = self._run(
+            temp_project_dir, temp_db_path, {"my_schema.v": _view("SELECT 2 AS id")}
+        )
+        assert changed == 1
+
+        import duckdb
+
+        with duckdb.connect(temp_db_path) as conn:
+            conn.execute("DROP VIEW my_schema.v")
+        _, dropped, _ = self._run(
+            temp_project_dir, temp_db_path, {"my_schema.v": _view("SELECT 2 AS id")}
+        )
+        assert dropped == 1
+
+    def test_view_over_rebuilt_table_is_recreated(self, temp_project_dir, temp_db_path):
+        models = {
+            "my_schema.t": _table("SELECT 1 AS id"),
+            "my_schema.v": _view("SELECT * FROM my_schema.t"),
+        }
+        self._run(temp_project_dir, temp_db_path, models)
+
+        models["my_schema.t"] = _table("SELECT 1 AS id, 'a' AS name")
+        _, recreated, _ = self._run(temp_project_dir, temp_db_path, models)
+
+        assert recreated == 1
+        import duckdb
+
+        with duckdb.connect(temp_db_path) as conn:
+            columns = conn.execute("SELECT * FROM my_schema.v").description
+        assert [column[0] for column in columns] == ["id", "name"]
+
+    def test_view_over_unchanged_view_is_not_recreated(self, temp_project_dir, temp_db_path):
+        models = {
+            "my_schema.v": _view("SELECT 1 AS id"),
+            "my_schema.w": _view("SELECT * FROM my_schema.v"),
+        }
+        self._run(temp_project_dir, temp_db_path, models)
+
+        _, second, _ = self._run(temp_project_dir, temp_db_path, models)
+
+        assert second == 0
+
+    def test_force_ddl_recreates_unchanged_view(self, temp_project_dir, temp_db_path):
+        models = {"my_schema.v": _view("SELECT 1 AS id")}
+        self._run(temp_project_dir, temp_db_path, models)
+
+        _, forced, _ = self._run(temp_project_dir, temp_db_path, models, force_ddl=True)
+
+        assert forced == 1
+
+    def test_unchanged_function_is_not_recreated(self, temp_project_dir, temp_db_path):
+        functions = {"my_schema.add_one": _function(FUNCTION_SQL)}
+
+        _, _, first = self._run(temp_project_dir, temp_db_path, functions=functions)
+        results, _, second = self._run(temp_project_dir, temp_db_path, functions=functions)
+
+        assert (first, second) == (1, 0)
+        assert results["executed_functions"] == ["my_schema.add_one"]
+        assert results["execution_log"][0]["ddl"] == "skipped"
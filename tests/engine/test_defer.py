@@ -0,0 +1,162 @@
+"""
+Test cases for deferring unselected upstream models to production.
+"""
+
+import json
+from unittest.mock import patch
+
+import duckdb
+import pytest
+
+from tee.adapters.base.sql import sql_hash
+from tee.engine.defer import (
+    DeferError,
+    ProductionManifest,
+    defer_to_production,
+    load_production_manifest,
+)
+
+UPSTREAM_SQL = "SELECT 1 AS id"
+DOWNSTREAM_SQL = "SELECT orders.id FROM staging.orders AS orders"
+
+
+def _model(sql, materialization="table"):
+    """Build parsed data for a SQL model."""
+    return {
+        "code": {"sql": {"original_sql": sql, "resolved_sql": sql}},
+        "model_metadata": {"metadata": {"materialization": materialization}},
+    }
+
+
+def _write_module(folder, transformations, database="prod"):
+    """Write a compiled OTS module with the given model name -> SQL mapping."""
+    folder.mkdir(parents=True, exist_ok=True)
+    module = {
+        "ots_version": "0.2.2",
+        "module_name": f"{database}.staging",
+        "target": {"database": database, "schema": "staging"},
+        "transformations": [
+            {
+                "transformation_id": name,
+                "code": {"sql": {"original_sql": sql, "resolved_sql": sql, "source_tables": []}},
+                "materialization": {"type": "table"},
+            }
+            for name, sql in transformations.items()
+        ],
+    }
+    (folder / f"{database}__staging.ots.json").write_text(json.dumps(module))
+
+
+class TestLoadProductionManifest:
+    """Test cases for load_production_manifest."""
+
+    def test_reads_compiled_modules_of_a_project(self, tmp_path):
+        _write_module(tmp_path / "output" / "ots_modules", {"staging.orders": UPSTREAM_SQL})
+
+        manifest = load_production_manifest(tmp_path)
+
+        assert manifest.database == "prod"
+        assert manifest.model_hashes == {"staging.orders": sql_hash(UPSTREAM_SQL)}
+
+    def test_explicit_database_overrides_target(self, tmp_path):
+        _write_module(tmp_path, {"staging.orders": UPSTREAM_SQL})
+
+        manifest = load_production_manifest(tmp_path, database="warehouse")
+
+        assert manifest.database == "warehouse"
+
+    def test_keeps_only_models_built_from_the_same_sql(self, tmp_path):
+        _write_module(
+            tmp_path / "output" / "ots_modules",
+            {"staging.orders": UPSTREAM_SQL, "staging.customers": "SELECT 2 AS id"},
+        )
+        (tmp_path / "data").mkdir()
+        conn = duckdb.connect(str(tmp_path / "data" / "tee_state.db"))
+        conn.execute("CREATE TABLE tee_model_state (model_name VARCHAR, sql_hash VARCHAR)")
+        conn.execute(
+            "INSERT INTO tee_model_state VALUES (?, ?), (?, ?)",
+            ["staging.orders", sql_hash(UPSTREAM_SQL), "staging.customers", "stale"],
+        )
+        conn.close()
+
+        manifest = load_production_manifest(tmp_path)
+
+        assert list(manifest.model_hashes) == ["staging.orders"]
+
+    def test_locked_state_database_defers_nothing(self, tmp_path, caplog):
+        _write_module(tmp_path / "output" / "ots_modules", {"staging.orders": UPSTREAM_SQL})
+        (tmp_path / "data").mkdir()
+        (tmp_path / "data" / "tee_state.db").touch()
+
+        with patch(
+            "tee.engine.defer.duckdb.connect",
+            side_effect=duckdb.IOException("Could not set lock on file"),
+        ):
+            manifest = load_production_manifest(tmp_path)
+
+        assert manifest.model_hashes == {}
+        assert "no models will be deferred" in caplog.text
+
+    def test_missing_modules_raise(self, tmp_path):
+        with pytest.raises(DeferError, match="No compiled OTS modules"):
+            load_production_manifest(tmp_path)
+
+
+class TestDeferToProduction:
+    """Test cases for defer_to_production."""
+
+    def test_unchanged_upstream_is_read_from_production(self):
+        parsed_models = {
+            "staging.orders": _model(UPSTREAM_SQL),
+            "marts.summary": _model(DOWNSTREAM_SQL),
+        }
+        manifest = ProductionManifest({"staging.orders": sql_hash(UPSTREAM_SQL)}, "prod")
+
+        results = defer_to_production(parsed_models, ["marts.summary"], manifest)
+
+        assert results == {"deferred": {"staging.orders": "prod.staging.orders"}, "modified": []}
+        resolved_sql = parsed_models["marts.summary"]["code"]["sql"]["resolved_sql"]
+        assert "prod.staging.orders AS orders" in resolved_sql
+
+    def test_changed_upstream_is_reported_and_not_deferred(self):
+        parsed_models = {
+            "staging.orders": _model("SELECT 2 AS id"),
+            "marts.summary": _model(DOWNSTREAM_SQL),
+        }
+        manifest = ProductionManifest({"staging.orders": sql_hash(UPSTREAM_SQL)}, "prod")
+
+        results = defer_to_production(parsed_models, ["marts.summary"], manifest)
+
+        assert results == {"deferred": {}, "modified": ["staging.orders"]}
+        assert parsed_models["marts.summary"]["code"]["sql"]["resolved_sql"] == DOWNSTREAM_SQL
+
+    def test_selected_upstream_is_not_deferred(self):
+        parsed_models = {
+            "staging.orders": _model(UPSTREAM_SQL),
+            "marts.summary": _model(DOWNSTREAM_SQL),
+        }
+        manifest = ProductionManifest({"staging.orders": sql_hash(UPSTREAM_SQL)}, "prod")
+
+        results = defer_to_production(parsed_models, ["staging.orders", "marts.summary"], manifest)
+
+        assert results["deferred"] == {}
+        assert parsed_models["marts.summary"]["code"]["sql"]["resolved_sql"] == DOWNSTREAM_SQL
+
+    def test_deferred_sql_runs_against_attached_production_database(self, tmp_path):
+        prod = duckdb.connect(str(tmp_path / "prod.duckdb"))
+        prod.execute("CREATE SCHEMA staging")
+        prod.execute(f"CREATE TABLE staging.orders AS {UPSTREAM_SQL}")
+        prod.close()
+
+        parsed_models = {
+            "staging.orders": _model(UPSTREAM_SQL),
+            "marts.summary": _model(DOWNSTREAM_SQL),
+        }
+        manifest = ProductionManifest({"staging.orders": sql_hash(UPSTREAM_SQL)}, "prod")
+        defer_to_production(parsed_models, ["marts.summary"], manifest)
+
+        dev = duckdb.connect()
+        dev.execute(f"ATTACH '{tmp_path / 'prod.duckdb'}' AS prod (READ_ONLY)")
+        resolved_sql = parsed_models["marts.summary"]["code"]["sql"]["resolved_sql"]
+        assert dev.execute(resolved_sql).fetchall() == [(1,)]
+        dev.close()
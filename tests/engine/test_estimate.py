@@ -0,0 +1,92 @@
+"""
+Test cases for bytes-scanned estimation of a run.
+"""
+
+import pytest
+
+from tee.adapters.duckdb.adapter import DuckDBAdapter
+from tee.engine.estimate import estimate_models, format_bytes
+
+
+class FakeEstimatingAdapter:
+    """Adapter stand-in whose dry runs scan a fixed number of bytes per query."""
+
+    def __init__(self, bytes_per_query):
+        self.bytes_per_query = bytes_per_query
+        self.queries = []
+
+    def estimate_query_bytes(self, query):
+        self.queries.append(query)
+        if "missing" in query:
+            raise ValueError("Not found: Table missing")
+        return self.bytes_per_query
+
+
+def _model(sql, materialization="table"):
+    """Build parsed data for a SQL model."""
+    return {
+        "code": {"sql": {"original_sql": sql, "resolved_sql": sql}},
+        "model_metadata": {"metadata": {"materialization": materialization}},
+    }
+
+
+class TestEstimateModels:
+    """Test cases for estimate_models."""
+
+    def test_sums_bytes_of_materialized_models(self):
+        parsed_models = {
+            "staging.orders": _model("SELECT 1 AS id"),
+            "staging.orders_inc": _model("SELECT 2 AS id", materialization="incremental"),
+            "marts.summary": _model("SELECT 3 AS id", materialization="view"),
+        }
+
+        results = estimate_models(FakeEstimatingAdapter(1000), parsed_models, list(parsed_models))
+
+        assert list(results["estimates"]) == list(parsed_models)
+        # Views are validated but scan nothing when created
+        assert results["total_bytes"] == 2000
+        assert results["failed"] == []
+
+    def test_skips_ephemeral_and_unknown_names(self):
+        adapter = FakeEstimatingAdapter(10)
+        parsed_models = {
+            "staging.base": _model("SELECT 1 AS id", materialization="ephemeral"),
+            "staging.orders": _model("SELECT 2 AS id"),
+        }
+
+        results = estimate_models(
+            adapter, parsed_models, ["my_schema.my_function", "staging.base", "staging.orders"]
+        )
+
+        assert list(results["estimates"]) == ["staging.orders"]
+        assert adapter.queries == ["SELECT 2 AS id"]
+
+    def test_failed_dry_runs_are_reported(self):
+        parsed_models = {
+            "staging.orders": _model("SELECT 1 FROM missing"),
+            "staging.customers": _model("SELECT 2 AS id"),
+        }
+
+        results = estimate_models(FakeEstimatingAdapter(5), parsed_models, list(parsed_models))
+
+        assert results["failed"] == [
+            {"model": "staging.orders", "error": "Not found: Table missing"}
+        ]
+        assert results["total_bytes"] == 5
+
+    def test_adapters_without_dry_run_raise(self):
+        adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+
+        with pytest.raises(NotImplementedError, match="cannot estimate"):
+            estimate_models(adapter, {"staging.orders": _model("SELECT 1")}, ["staging.orders"])
+
+
+class TestFormatBytes:
+    """Test cases for format_bytes."""
+
+    @pytest.mark.parametrize(
+        "num_bytes, expected",
+        [(0, "0 B"), (512, "512 B"), (2048, "2.00 KiB"), (3 * 1024**3, "3.00 GiB")],
+    )
+    def test_format_bytes(self, num_bytes, expected):
+        assert format_bytes(num_bytes) == expected
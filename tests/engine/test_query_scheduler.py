@@ -0,0 +1,235 @@
+"""
+Test cases for the asynchronous query scheduler.
+"""
+
+import pytest
+
+from tee.engine.execution_engine import ExecutionEngine
+from tee.engine.scheduler import JOB_ERROR, JOB_SKIPPED, JOB_SUCCESS, QueryScheduler, ScheduledJob
+from tee.engine.state.ddl_ledger import VIEW
+from tests.adapters.snowflake.fake_connection import FakeSnowflakeConnection
+
+SNOWFLAKE_CONFIG = {
+    "type": "snowflake",
+    "host": "test.snowflakecomputing.com",
+    "user": "test_user",
+    "password": "test_password",
+    "database": "test_db",
+    "schema": "test_schema",
+}
+
+
+def _model(sql, tables=(), materialization=None):
+    """Build parsed model data the way the parser produces it."""
+    model = {"code": {"sql": {"resolved_sql": sql}}, "tables": list(tables)}
+    if materialization:
+        model["model_metadata"] = {"metadata": {"materialization": materialization}}
+    return model
+
+
+@pytest.fixture
+def snowflake_engine(temp_project_dir):
+    """Create an execution engine for a Snowflake adapter backed by a local fake."""
+    engine = ExecutionEngine(
+        config={**SNOWFLAKE_CONFIG, "extra": {"max_concurrent_queries": 4}},
+        project_folder=str(temp_project_dir),
+    )
+    engine.adapter.connection = FakeSnowflakeConnection(polls_to_finish=2)
+    yield engine
+    engine.adapter.connection.close()
+    engine.state_checker.close()
+
+
+class TestQueryScheduler:
+    """Test cases for QueryScheduler."""
+
+    @pytest.fixture
+    def adapter(self):
+        from tee.adapters.snowflake.adapter import SnowflakeAdapter
+
+        adapter = SnowflakeAdapter(SNOWFLAKE_CONFIG)
+        adapter.connection = FakeSnowflakeConnection(polls_to_finish=3)
+        yield adapter
+        adapter.connection.close()
+
+    def test_independent_queries_run_concurrently_up_to_limit(self, adapter):
+        scheduler = QueryScheduler(adapter, max_in_flight=3, poll_interval=0)
+        for i in range(6):
+            scheduler.add(
+                ScheduledJob(name=f"q{i}", submit=lambda i=i: adapter.submit_query(f"SELECT {i}"))
+            )
+
+        results = scheduler.run()
+
+        assert all(result.status == JOB_SUCCESS for result in results.values())
+        assert adapter.connection.max_running == 3
+
+    def test_dependents_start_after_upstream_completes(self, adapter):
+        completed = []
+        scheduler = QueryScheduler(adapter, max_in_flight=4, poll_interval=0)
+        scheduler.add(
+            ScheduledJob(
+                name="upstream",
+                submit=lambda: adapter.submit_query("SELECT 1"),
+                on_complete=lambda _: completed.append("upstream"),
+            )
+        )
+        scheduler.add(
+            ScheduledJob(
+                name="downstream",
+                depends_on={"upstream"},
+                run=lambda: completed.append("downstream"),
+            )
+        )
+
+        scheduler.run()
+
+        assert completed == ["upstream", "downstream"]
+
+    def test_failed_upstream_skips_dependents(self, adapter):
+        errors = {}
+        scheduler = QueryScheduler(adapter, max_in_flight=4, poll_interval=0)
+        scheduler.add(
+            ScheduledJob(name="bad", submit=lambda: adapter.submit_query("SELECT * FROM nope"))
+        )
+        scheduler.add(
+            ScheduledJob(
+                name="child",
+                depends_on={"bad"},
+                run=lambda: None,
+                on_error=lambda e: errors.setdefault("child", e),
+            )
+        )
+        scheduler.add(ScheduledJob(name="other", submit=lambda: adapter.submit_query("SELECT 1")))
+
+        results = scheduler.run()
+
+        assert results["bad"].status == JOB_ERROR
+        assert results["child"].status == JOB_SKIPPED
+        assert results["other"].status == JOB_SUCCESS
+        assert "bad" in str(errors["child"])
+
+    def test_interrupt_cancels_in_flight_queries(self, adapter):
+        def interrupt():
+            raise KeyboardInterrupt
+
+        scheduler = QueryScheduler(adapter, max_in_flight=4, poll_interval=0)
+        scheduler.add(ScheduledJob(name="slow", submit=lambda: adapter.submit_query("SELECT 1")))
+        scheduler.add(ScheduledJob(name="boom", run=interrupt))
+
+        with pytest.raises(KeyboardInterrupt):
+            scheduler.run()
+
+        assert adapter.connection.queries["fake-1"].status == "ABORTED"
+
+    def test_ready_jobs_start_by_priority(self, adapter):
+        started = []
+        scheduler = QueryScheduler(adapter, max_in_flight=1, poll_interval=0)
+        for name, priority in [("low", 1.0), ("high", 5.0), ("tie", 1.0), ("mid", 3.0)]:
+            scheduler.add(
+                ScheduledJob(
+                    name=name, priority=priority, run=lambda name=name: started.append(name)
+                )
+            )
+
+        scheduler.run()
+
+        assert started == ["high", "mid", "low", "tie"]
+
+    def test_job_requires_exactly_one_action(self, adapter):
+        scheduler = QueryScheduler(adapter)
+        with pytest.raises(ValueError):
+            scheduler.add(ScheduledJob(name="empty"))
+
+
+class TestScheduledModelExecution:
+    """Test cases for ModelExecutor building models through the scheduler."""
+
+    def test_independent_tables_build_concurrently(self, snowflake_engine):
+        parsed_models = {
+            "s.a": _model("SELECT 1 AS id"),
+            "s.b": _model("SELECT 2 AS id"),
+            "s.c": _model(
+                "SELECT id FROM test_db.s.a UNION ALL SELECT id FROM test_db.s.b", ["a", "b"]
+            ),
+            "s.v": _model("SELECT id FROM test_db.s.c", ["c"], materialization="view"),
+        }
+
+        results = snowflake_engine.execute_models(parsed_models, ["s.a", "s.b", "s.c", "s.v"])
+
+        assert results["failed_tables"] == []
+        assert results["executed_tables"] == ["s.a", "s.b", "s.c", "s.v"]
+        assert results["table_info"]["s.c"]["row_count"] == 2
+        assert snowflake_engine.adapter.connection.max_running == 2
+
+    def test_failed_table_skips_dependents(self, snowflake_engine):
+        parsed_models = {
+            "s.bad": _model("SELECT * FROM missing_table"),
+            "s.child": _model("SELECT * FROM test_db.s.bad", ["bad"]),
+            "s.ok": _model("SELECT 1 AS id"),
+        }
+
+        results = snowflake_engine.execute_models(parsed_models, ["s.bad", "s.child", "s.ok"])
+
+        assert results["executed_tables"] == ["s.ok"]
+        assert [failure["table"] for failure in results["failed_tables"]] == ["s.bad", "s.child"]
+
+    def test_scheduled_table_goes_through_materialization_handler(self, snowflake_engine):
+        ledger = snowflake_engine.materialization_handler.ddl_ledger
+        ledger.record(VIEW, "s.a", "view-definition")
+
+        results = snowflake_engine.execute_models({"s.a": _model("SELECT 1 AS id")}, ["s.a"])
+
+        # The name no longer holds the view, so its next view DDL is never skipped
+        assert results["executed_tables"] == ["s.a"]
+        assert snowflake_engine.state_checker.state_manager.get_definition_hash(VIEW, "s.a") is None
+
+    def test_models_on_the_slowest_path_start_first(self, snowflake_engine):
+        snowflake_engine.state_checker.state_manager.save_node_runtimes(
+            "earlier-run", "run", [("s.quick", 1.0, "success"), ("s.child", 30.0, "success")]
+        )
+        parsed_models = {
+            "s.quick": _model("SELECT 1 AS id"),
+            "s.parent": _model("SELECT 2 AS id"),
+            "s.child": _model("SELECT id FROM test_db.s.parent", ["parent"]),
+        }
+
+        results = snowflake_engine.execute_models(parsed_models, ["s.quick", "s.parent", "s.child"])
+
+        # s.parent starts the 30s chain, so it is submitted before s.quick
+        assert results["executed_tables"] == ["s.parent", "s.quick", "s.child"]
+
+    def test_sync_adapters_keep_sequential_execution(self, temp_project_dir):
+        engine = ExecutionEngine(
+            config={"type": "duckdb", "path": ":memory:", "extra": {"max_concurrent_queries": 4}},
+            project_folder=str(temp_project_dir),
+        )
+        engine.connect()
+        try:
+            assert not engine.model_executor._use_scheduler()
+            results = engine.execute_models({"a": _model("SELECT 1 AS id")}, ["a"])
+            assert results["executed_tables"] == ["a"]
+        finally:
+            engine.disconnect()
+
+    def test_sequential_execution_attempts_every_model(self, temp_project_dir):
+        engine = ExecutionEngine(
+            config={"type": "duckdb", "path": ":memory:"}, project_folder=str(temp_project_dir)
+        )
+        engine.connect()
+        try:
+            parsed_models = {
+                "bad": _model("SELECT * FROM missing_table"),
+                "child": _model("SELECT * FROM bad", ["bad"]),
+                "ok": _model("SELECT 1 AS id"),
+            }
+
+            results = engine.execute_models(parsed_models, ["bad", "child", "ok"])
+
+            assert results["executed_tables"] == ["ok"]
+            failures = {failure["table"]: failure["error"] for failure in results["failed_tables"]}
+            assert list(failures) == ["bad", "child"]
+            # Without the scheduler, dependents of a failed model still run
+            assert "Upstream" not in failures["child"]
+        finally:
+            engine.disconnect()
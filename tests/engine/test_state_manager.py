@@ -0,0 +1,169 @@
+"""
+Test cases for the processed values tracked by the state manager.
+"""
+
+import duckdb
+
+from tee.engine import state_manager as state_manager_module
+from tee.engine.execution_engine import ExecutionEngine
+from tee.engine.state_manager import StateManager
+
+
+class TestProcessedValues:
+    """Test cases for last and previous processed values."""
+
+    def test_keeps_previous_value_of_incremental_batch(self, temp_state_db_path):
+        manager = StateManager(temp_state_db_path)
+        try:
+            manager.update_processed_value("events", "2024-01-01", strategy="append")
+            manager.update_processed_value("events", "2024-01-02", strategy="append")
+
+            state = manager.get_model_state("events")
+            assert state.last_processed_value == "2024-01-02"
+            assert state.previous_processed_value == "2024-01-01"
+
+            manager.update_processed_value("events", "2024-01-03", full_load=True)
+
+            state = manager.get_model_state("events")
+            assert state.last_processed_value == "2024-01-03"
+            assert state.previous_processed_value is None
+        finally:
+            manager.close()
+
+    def test_adds_previous_value_to_existing_state_database(self, temp_state_db_path):
+        conn = duckdb.connect(temp_state_db_path)
+        conn.execute(
+            """
+            CREATE TABLE tee_model_state (
+                model_name VARCHAR PRIMARY KEY,
+                materialization VARCHAR NOT NULL,
+                last_execution_timestamp VARCHAR,
+                sql_hash VARCHAR,
+                config_hash VARCHAR,
+                created_at VARCHAR,
+                updated_at VARCHAR,
+                last_processed_value VARCHAR,
+                strategy VARCHAR
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO tee_model_state VALUES "
+            "('events', 'incremental', NULL, 'h', 'c', NULL, NULL, '2024-01-01', 'append')"
+        )
+        conn.close()
+
+        manager = StateManager(temp_state_db_path)
+        try:
+            state = manager.get_model_state("events")
+            assert state.last_processed_value == "2024-01-01"
+            assert state.previous_processed_value is None
+
+            manager.update_processed_value("events", "2024-01-02")
+            assert manager.get_model_state("events").previous_processed_value == "2024-01-01"
+        finally:
+            manager.close()
+
+    def test_model_executor_keeps_processed_values(self, temp_project_dir):
+        model = {
+            "code": {"sql": {"resolved_sql": "SELECT id, updated_at FROM src"}},
+            "tables": ["src"],
+            "model_metadata": {
+                "metadata": {
+                    "materialization": "incremental",
+                    "incremental": {
+                        "strategy": "append",
+                        "append": {"filter_column": "updated_at"},
+                    },
+                }
+            },
+        }
+
+        def build():
+            engine = ExecutionEngine(
+                config={"type": "duckdb", "path": str(temp_project_dir / "warehouse.duckdb")},
+                project_folder=str(temp_project_dir),
+            )
+            engine.connect()
+            try:
+                engine.adapter.execute_query(
+                    "CREATE OR REPLACE TABLE src AS SELECT 1 AS id, CURRENT_TIMESTAMP AS updated_at"
+                )
+                results = engine.execute_models({"s.events": model}, ["s.events"])
+                assert results["executed_tables"] == ["s.events"]
+                return engine.state_checker.state_manager.get_model_state("s.events")
+            finally:
+                engine.disconnect()
+
+        first = build()
+        second = build()
+
+        assert first.last_processed_value is not None
+        assert second.last_processed_value is not None
+        assert second.previous_processed_value == first.last_processed_value
+
+
+class TestTestResults:
+    """Test cases for the recorded passes of model tests."""
+
+    def test_saves_replaces_and_deletes_test_results(self, temp_state_db_path):
+        manager = StateManager(temp_state_db_path)
+        try:
+            assert manager.get_test_result("orders", "abc") is None
+
+            manager.save_test_result("orders", "abc", "fingerprint 1", 0, "exact")
+            manager.save_test_result("orders", "abc", "fingerprint 2", 0, "approx")
+
+            entry = manager.get_test_result("orders", "abc")
+            assert entry.fingerprint == "fingerprint 2"
+            assert entry.rows_returned == 0
+            assert entry.mode == "approx"
+
+            manager.delete_test_result("orders", "abc")
+            assert manager.get_test_result("orders", "abc") is None
+        finally:
+            manager.close()
+
+
+class TestNodeRuntimes:
+    """Test cases for the runtime history of executed nodes."""
+
+    def test_estimates_are_the_median_of_recent_runs(self, temp_state_db_path):
+        manager = StateManager(temp_state_db_path)
+        try:
+            assert manager.get_node_runtime_estimates() == {}
+
+            # The oldest run falls outside the estimate window
+            for i, duration in enumerate([100.0, 1.0, 2.0, 3.0, 4.0, 5.0]):
+                manager.save_node_runtimes(f"run-{i}", "build", [("s.a", duration, "success")])
+            manager.save_node_runtimes("run-6", "run", [("s.b", 7.0, "success")])
+
+            assert manager.get_node_runtime_estimates() == {"s.a": 3.0, "s.b": 7.0}
+            assert manager.get_node_runtime_estimates(window=1) == {"s.a": 5.0, "s.b": 7.0}
+        finally:
+            manager.close()
+
+    def test_history_keeps_latest_runs_of_each_node(self, temp_state_db_path, monkeypatch):
+        monkeypatch.setattr(state_manager_module, "RUNTIME_HISTORY_LIMIT", 2)
+        manager = StateManager(temp_state_db_path)
+        try:
+            for i in range(4):
+                manager.save_node_runtimes(
+                    f"run-{i}", "build", [("s.a", float(i), "success"), ("s.b", 1.0, "pass")]
+                )
+
+            rows = (
+                manager._get_connection()
+                .execute(
+                    "SELECT node_name, run_id FROM tee_node_runtimes ORDER BY node_name, run_id"
+                )
+                .fetchall()
+            )
+            assert rows == [
+                ("s.a", "run-2"),
+                ("s.a", "run-3"),
+                ("s.b", "run-2"),
+                ("s.b", "run-3"),
+            ]
+        finally:
+            manager.close()
@@ -611,3 +611,44 @@ class TestBuildModels:
         # Should be called twice (once for each table)
         assert mock_execution_engine.execute_models.call_count == 2
 
+
+    def test_build_models_defers_unselected_upstream_to_production(self, temp_dir):
+        """Test that --defer reads unselected, unchanged upstream models from production."""
+
+        def write_project(folder, extra=None):
+            models = {
+                "staging.orders": "SELECT 1 AS id",
+                "marts.summary": "SELECT id FROM staging.orders",
+            }
+            for name, sql in models.items():
+                schema, table = name.split(".")
+                (folder / "models" / schema).mkdir(parents=True, exist_ok=True)
+                (folder / "models" / schema / f"{table}.sql").write_text(sql)
+            connection = {"type": "duckdb", "path": str(folder / "warehouse.duckdb")}
+            if extra:
+                connection["extra"] = extra
+            return connection
+
+        prod = temp_dir / "prod"
+        prod_connection = write_project(prod)
+        build_models(
+            project_folder=str(prod),
+            connection_config=dict(prod_connection),
+            save_analysis=False,
+            project_config={"name": "prod", "connection": dict(prod_connection)},
+        )
+
+        dev = temp_dir / "dev"
+        dev_connection = write_project(dev, {"attach": {"prod": str(prod / "warehouse.duckdb")}})
+        results = build_models(
+            project_folder=str(dev),
+            connection_config=dict(dev_connection),
+            save_analysis=False,
+            select_patterns=["marts.summary"],
+            project_config={"name": "dev", "connection": dict(dev_connection)},
+            defer_state=str(prod),
+            defer_database="prod",
+        )
+
+        assert results["executed_tables"] == ["marts.summary"]
+        assert results["deferred_models"] == {"staging.orders": "prod.staging.orders"}
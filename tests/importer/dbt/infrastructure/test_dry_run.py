@@ -0,0 +1,136 @@
+"""
+Unit tests for the zero-row dry run of imported dbt models.
+"""
+
+import sqlglot
+
+from tee.importer.dbt.infrastructure.dry_run import (
+    DryRunModel,
+    ShadowRelation,
+    dry_run_models,
+)
+
+ORDERS = ShadowRelation(
+    "raw.orders",
+    [
+        {"name": "id", "type": "INTEGER"},
+        {"name": "amount", "type": "DECIMAL(10, 2)"},
+        {"name": "ordered_at", "type": "TIMESTAMP"},
+    ],
+)
+
+
+def _model(name, sql):
+    """Build a dry-run model from SQL."""
+    return DryRunModel(name, f"models/{name.replace('.', '/')}.sql", sqlglot.parse_one(sql))
+
+
+class TestDryRunModels:
+    """Test cases for dry_run_models."""
+
+    def test_models_are_bound_in_topological_order(self):
+        result = dry_run_models(
+            [
+                _model("marts.daily", "SELECT DATE_TRUNC('day', ordered_at) AS d FROM stg.orders"),
+                _model("stg.orders", "SELECT id, amount, ordered_at FROM raw.orders"),
+            ],
+            {"raw.orders": ORDERS},
+        )
+
+        assert sorted(result.verified) == ["marts.daily", "stg.orders"]
+        assert result.errors == []
+        assert result.warnings == []
+
+    def test_broken_model_is_an_error_and_downstream_is_skipped(self):
+        result = dry_run_models(
+            [
+                _model("stg.orders", "SELECT id, total FROM raw.orders"),
+                _model("marts.orders", "SELECT id FROM stg.orders"),
+            ],
+            {"raw.orders": ORDERS},
+        )
+
+        assert result.verified == []
+        assert len(result.errors) == 1
+        assert result.errors[0]["model"] == "stg.orders"
+        assert result.errors[0]["file"] == "models/stg/orders.sql"
+        assert '"total" not found' in result.errors[0]["error"]
+        assert result.warnings[0]["model"] == "marts.orders"
+        assert "upstream model(s) failed: stg.orders" in result.warnings[0]["error"]
+
+    def test_undeclared_relations_are_shadowed_with_referenced_columns(self):
+        result = dry_run_models(
+            [
+                _model(
+                    "stg.customers",
+                    "WITH source AS (SELECT * FROM raw.customers) "
+                    "SELECT id AS customer_id, name FROM source",
+                )
+            ]
+        )
+
+        assert result.verified == ["stg.customers"]
+
+    def test_failures_over_guessed_relations_are_warnings(self):
+        result = dry_run_models(
+            [_model("stg.payments", "SELECT SUM(amount) AS total FROM raw.payments")]
+        )
+
+        assert result.errors == []
+        assert "without declared columns" in result.warnings[0]["error"]
+
+    def test_variables_are_replaced_with_null(self):
+        result = dry_run_models(
+            [_model("stg.recent", "SELECT id FROM raw.orders WHERE ordered_at > @start_date")],
+            {"raw.orders": ORDERS},
+        )
+
+        assert result.verified == ["stg.recent"]
+
+    def test_cycles_are_errors(self):
+        result = dry_run_models(
+            [
+                _model("s.a", "SELECT id FROM s.b"),
+                _model("s.b", "SELECT id FROM s.a"),
+            ]
+        )
+
+        assert sorted(error["model"] for error in result.errors) == ["s.a", "s.b"]
+
+    def test_dialect_gaps_are_warnings_for_other_dialects(self):
+        events = ShadowRelation(
+            "raw.events",
+            [{"name": "id", "type": "INTEGER"}, {"name": "payload", "type": "VARCHAR"}],
+        )
+        flatten = (
+            "SELECT e.id, f.value FROM raw.events AS e, LATERAL FLATTEN(input => e.payload) AS f"
+        )
+
+        result = dry_run_models(
+            [
+                DryRunModel("stg.items", "items.sql", sqlglot.parse_one(flatten, read="snowflake")),
+                DryRunModel(
+                    "stg.missing",
+                    "missing.sql",
+                    sqlglot.parse_one("SELECT total FROM raw.events", read="snowflake"),
+                ),
+            ],
+            {"raw.events": events},
+            dialect="snowflake",
+        )
+
+        assert [warning["model"] for warning in result.warnings] == ["stg.items"]
+        assert "may not transpile from snowflake" in result.warnings[0]["error"]
+        assert [error["model"] for error in result.errors] == ["stg.missing"]
+
+    def test_unknown_functions_are_warnings_for_other_dialects(self):
+        sql = "SELECT SAFE.PARSE_DATE('%Y%m%d', CAST(id AS STRING)) AS day FROM raw.orders"
+
+        result = dry_run_models(
+            [DryRunModel("stg.days", "days.sql", sqlglot.parse_one(sql, read="bigquery"))],
+            {"raw.orders": ORDERS},
+            dialect="bigquery",
+        )
+
+        assert result.errors == []
+        assert "does not exist" in result.warnings[0]["error"]
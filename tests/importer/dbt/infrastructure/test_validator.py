@@ -4,8 +4,10 @@ Unit tests for dbt project validator.
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import sqlglot
 
 from tee.importer.dbt.infrastructure import ProjectValidator, ValidationResult
 
@@ -248,3 +250,83 @@ def users():
             assert result.is_valid is False
             assert len(result.syntax_errors) > 0
 
+
+
+class TestProjectValidatorDryRun:
+    """Tests for the zero-row dry run of ProjectValidator."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Create an imported project with a seed and two models."""
+        (tmp_path / "seeds" / "raw").mkdir(parents=True)
+        (tmp_path / "seeds" / "raw" / "customers.csv").write_text("id,name\n1,Ann\n")
+        (tmp_path / "models" / "staging").mkdir(parents=True)
+        (tmp_path / "models" / "staging" / "stg_customers.sql").write_text(
+            "SELECT id AS customer_id, name FROM raw.customers"
+        )
+        (tmp_path / "models" / "staging" / "stg_orders.sql").write_text(
+            "SELECT id, customer_id FROM raw.orders"
+        )
+        return tmp_path
+
+    def test_validate_all_reports_dry_run_errors(self, project):
+        (project / "models" / "staging" / "stg_customers.sql").write_text(
+            "SELECT id, email FROM raw.customers"
+        )
+
+        result = ProjectValidator(target_path=project, model_name_map={}).validate_all()
+
+        assert result.is_valid is False
+        assert result.dry_run_errors[0]["file"] == "models/staging/stg_customers.sql"
+        assert "email" in result.dry_run_errors[0]["error"]
+        assert result.to_dict()["dry_run_errors"] == result.dry_run_errors
+
+    def test_declared_source_columns_make_failures_errors(self, project):
+        validator = ProjectValidator(
+            target_path=project,
+            model_name_map={},
+            source_columns={"raw.orders": [{"name": "id", "type": "integer"}]},
+        )
+
+        errors, warnings = validator.validate_dry_run()
+
+        assert [error["model"] for error in errors] == ["staging.stg_orders"]
+        assert warnings == []
+
+    def test_dry_run_reuses_syntax_validation_asts(self, project):
+        validator = ProjectValidator(target_path=project, model_name_map={})
+        validator.validate_syntax()
+
+        with patch("sqlglot.parse_one", wraps=sqlglot.parse_one) as parse_one:
+            errors, warnings = validator.validate_dry_run()
+
+        model_sql = (project / "models" / "staging" / "stg_orders.sql").read_text()
+        assert all(call.args[:1] != (model_sql,) for call in parse_one.call_args_list)
+        assert errors == []
+        assert warnings == []
+
+    def test_model_name_is_read_from_metadata(self, project):
+        (project / "models" / "staging" / "stg_customers.py").write_text(
+            'metadata = {"table_name": "staging.customers"}\n'
+        )
+        (project / "models" / "staging" / "stg_orders.sql").write_text(
+            "SELECT customer_id FROM staging.customers"
+        )
+
+        errors, warnings = ProjectValidator(
+            target_path=project, model_name_map={}
+        ).validate_dry_run()
+
+        assert errors == []
+        assert warnings == []
+
+    def test_dry_run_can_be_disabled(self, project):
+        (project / "models" / "staging" / "stg_customers.sql").write_text(
+            "SELECT email FROM raw.customers"
+        )
+
+        result = ProjectValidator(target_path=project, model_name_map={}).validate_all(
+            dry_run=False
+        )
+
+        assert result.dry_run_errors == []
@@ -278,3 +278,36 @@ class TestSourceParser:
             
             assert "raw" in sources
 
+
+    def test_parse_source_columns(self, tmp_path):
+        """Test extracting declared source columns."""
+        source_file = tmp_path / "__sources.yml"
+        source_content = {
+            "sources": [
+                {
+                    "name": "ecom",
+                    "schema": "raw",
+                    "tables": [
+                        {
+                            "name": "orders",
+                            "columns": [
+                                {"name": "id", "data_type": "integer"},
+                                {"name": "status"},
+                            ],
+                        },
+                        {"name": "customers"},
+                    ],
+                }
+            ]
+        }
+        with source_file.open("w", encoding="utf-8") as f:
+            yaml.dump(source_content, f)
+
+        columns = SourceParser().parse_source_columns([source_file])
+
+        assert columns == {
+            "raw.orders": [
+                {"name": "id", "type": "integer"},
+                {"name": "status", "type": None},
+            ]
+        }
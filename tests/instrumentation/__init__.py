@@ -0,0 +1,3 @@
+"""
+Instrumentation module tests.
+"""
@@ -0,0 +1,214 @@
+"""
+Tests for run instrumentation (spans, run_results.json and Chrome trace export).
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tee import instrumentation
+from tee.adapters.duckdb.adapter import DuckDBAdapter
+from tee.engine.model_state import ModelStateManager
+from tee.executor_helpers.shared_helpers import record_run
+from tee.instrumentation import (
+    CATEGORY_NODE,
+    RunRecorder,
+    build_chrome_trace,
+    build_run_results,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_active_run():
+    """Make sure no recorder leaks between tests."""
+    instrumentation.end_run()
+    yield
+    instrumentation.end_run()
+
+
+class TestRunRecorder:
+    """Test cases for RunRecorder spans and queries."""
+
+    def test_child_spans_inherit_node(self):
+        recorder = RunRecorder(command="run")
+        with (
+            recorder.span("my_schema.orders", category=CATEGORY_NODE, node="my_schema.orders"),
+            recorder.span("materialize") as phase,
+        ):
+            pass
+
+        assert phase.node == "my_schema.orders"
+        assert phase.end is not None
+        assert [s.name for s in recorder.spans] == ["materialize", "my_schema.orders"]
+
+    def test_span_records_error_and_reraises(self):
+        recorder = RunRecorder()
+        with (
+            pytest.raises(ValueError),
+            recorder.span("failing", category=CATEGORY_NODE, node="failing"),
+        ):
+            raise ValueError("boom")
+
+        span = recorder.spans[0]
+        assert span.attributes["status"] == "error"
+        assert span.attributes["error"] == "boom"
+
+    def test_queries_attributed_to_open_node_and_phase(self):
+        recorder = RunRecorder()
+        with (
+            recorder.span("a.b", category=CATEGORY_NODE, node="a.b"),
+            recorder.span("materialize"),
+        ):
+            recorder.record_query("CREATE TABLE a.b AS SELECT 1", 0.01, rows=3)
+        recorder.record_query("SELECT 1", 0.01)
+
+        first, second = recorder.queries
+        assert (first.node, first.phase, first.rows) == ("a.b", "materialize", 3)
+        assert (second.node, second.phase) == (None, None)
+
+    def test_non_integer_counters_are_dropped(self):
+        recorder = RunRecorder()
+        recorder.record_query("SELECT 1", 0.0, rows=-1, bytes_processed="n/a")
+
+        assert recorder.queries[0].rows is None
+        assert recorder.queries[0].bytes_processed is None
+
+    def test_module_span_without_active_run_is_noop(self):
+        with instrumentation.span("parse_sql") as span:
+            span.set(status="success")
+
+        assert instrumentation.get_recorder() is None
+
+
+class TestArtifacts:
+    """Test cases for run_results and Chrome trace documents."""
+
+    def _recorder(self) -> RunRecorder:
+        recorder = RunRecorder(command="run")
+        with recorder.span("compile"):
+            pass
+        with recorder.span("s.t", category=CATEGORY_NODE, node="s.t", node_type="model") as node:
+            with recorder.span("materialize"):
+                recorder.record_query("INSERT INTO s.t SELECT 1", 0.002, rows=5)
+            with recorder.span("collect_stats"):
+                recorder.record_query("SELECT COUNT(*) FROM s.t", 0.001, bytes_processed=128)
+            node.set(status="success", materialization="table", row_count=5)
+        recorder.finish()
+        return recorder
+
+    def test_build_run_results(self):
+        results = build_run_results(self._recorder())
+
+        assert results["metadata"]["command"] == "run"
+        assert "compile" in results["phases"]
+        assert results["queries"] == 2
+
+        (node,) = results["results"]
+        assert node["unique_id"] == "s.t"
+        assert node["node_type"] == "model"
+        assert node["status"] == "success"
+        assert node["materialization"] == "table"
+        assert set(node["phases"]) == {"materialize", "collect_stats"}
+        assert node["queries"] == 2
+        assert node["rows_affected"] == 5
+        assert node["bytes_processed"] == 128
+        assert node["started_at"] <= node["completed_at"]
+
+    def test_build_chrome_trace(self):
+        trace = build_chrome_trace(self._recorder())
+
+        events = trace["traceEvents"]
+        assert all(e["ph"] == "X" for e in events)
+        assert {e["cat"] for e in events} == {"phase", "node", "query"}
+        node_event = next(e for e in events if e["cat"] == "node")
+        assert node_event["args"]["node"] == "s.t"
+        assert node_event["ts"] >= 0
+
+
+class TestRecordRun:
+    """Test cases for recording a run end to end."""
+
+    @pytest.fixture
+    def project_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    def test_writes_run_results(self, project_dir):
+        with (
+            record_run("run", str(project_dir)),
+            instrumentation.span("s.t", category=CATEGORY_NODE, node="s.t"),
+        ):
+            pass
+
+        run_results = json.loads((project_dir / "output" / "run_results.json").read_text())
+        assert run_results["results"][0]["unique_id"] == "s.t"
+        assert not (project_dir / "output" / "run_trace.json").exists()
+        assert instrumentation.get_recorder() is None
+
+    def test_records_node_runtimes(self, project_dir):
+        with record_run("build", str(project_dir)):
+            with instrumentation.span("s.t", category=CATEGORY_NODE, node="s.t") as node:
+                node.set(status="success")
+            with instrumentation.span("s.bad", category=CATEGORY_NODE, node="s.bad") as node:
+                node.set(status="error")
+            test_node = "test:s.t.id.unique"
+            with instrumentation.span(test_node, category=CATEGORY_NODE, node=test_node) as node:
+                node.set(status="pass", cached=True)
+
+        state_manager = ModelStateManager(project_folder=str(project_dir))
+        try:
+            assert list(state_manager.get_node_runtime_estimates()) == ["s.t"]
+        finally:
+            state_manager.close()
+
+    def test_writes_chrome_trace_when_flag_set(self, project_dir):
+        with record_run("build", str(project_dir), {"flags": {"chrome_trace": True}}):
+            pass
+
+        trace = json.loads((project_dir / "output" / "run_trace.json").read_text())
+        assert trace["otherData"]["command"] == "build"
+
+    def test_duckdb_queries_recorded(self, project_dir):
+        adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+        adapter.connect()
+        try:
+            with (
+                record_run("run", str(project_dir)) as recorder,
+                instrumentation.span("s.t", category=CATEGORY_NODE, node="s.t"),
+            ):
+                adapter.create_table("s.t", "SELECT 1 AS id UNION ALL SELECT 2")
+                adapter.execute_query("SELECT * FROM s.t")
+        finally:
+            adapter.disconnect()
+
+        node_queries = [q for q in recorder.queries if q.node == "s.t"]
+        assert len(node_queries) >= 2
+        assert node_queries[-1].rows == 2
+
+    def test_duckdb_rows_affected(self, project_dir):
+        adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+        adapter.connect()
+        try:
+            with record_run("run", str(project_dir)) as recorder:
+                adapter.execute_query("CREATE TABLE t AS SELECT * FROM range(5)")
+                adapter.execute_query("DELETE FROM t WHERE range < 2")
+                adapter.execute_query("CREATE VIEW v AS SELECT * FROM t")
+                adapter.execute_query("SELECT COUNT(*) AS Count FROM t")
+        finally:
+            adapter.disconnect()
+
+        assert [q.rows for q in recorder.queries] == [5, 2, None, 1]
+
+    def test_duckdb_statements_not_parsed_outside_recorded_runs(self):
+        adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+        adapter.connect()
+        try:
+            with patch("tee.adapters.duckdb.adapter.duckdb.extract_statements") as extract:
+                adapter.execute_query("CREATE TABLE t AS SELECT * FROM range(5)")
+        finally:
+            adapter.disconnect()
+
+        extract.assert_not_called()
@@ -0,0 +1,138 @@
+"""
+Unit tests for the compile-time column lineage index.
+"""
+
+import json
+
+from tee.parser.analysis.column_lineage import (
+    ALL_COLUMNS,
+    COLUMN_LINEAGE_FILENAME,
+    ColumnLineage,
+    build_column_lineage,
+)
+from tee.parser.analysis.schema_catalog import SchemaCatalog
+
+MODEL_SQL = {
+    "staging.orders": "SELECT * FROM raw.orders",
+    "marts.revenue": (
+        "WITH paid AS (SELECT id, amount * 2 AS amount, status FROM staging.orders "
+        "WHERE status = 'paid') SELECT id, SUM(amount) AS total FROM paid GROUP BY id"
+    ),
+    "marts.notes": "SELECT id, note FROM staging.orders",
+    "marts.order_count": "SELECT COUNT(*) AS n FROM staging.orders",
+    "marts.top_revenue": "SELECT id FROM marts.revenue WHERE total > 10",
+}
+
+DEPENDENCIES = {
+    "staging.orders": [],
+    "marts.revenue": ["staging.orders"],
+    "marts.notes": ["staging.orders"],
+    "marts.order_count": ["staging.orders"],
+    "marts.top_revenue": ["marts.revenue"],
+}
+
+
+def _catalog():
+    """Build a catalog describing the raw.orders seed."""
+    catalog = SchemaCatalog()
+    catalog.add(
+        "raw.orders",
+        [{"name": name, "type": "VARCHAR"} for name in ("id", "amount", "status", "note")],
+        authoritative=True,
+        source="seed",
+    )
+    return catalog
+
+
+def _lineage(model_sql=MODEL_SQL):
+    """Build the lineage of the test models the way the compiler does."""
+    catalog = _catalog()
+    catalog.add_models({name: _model(sql) for name, sql in model_sql.items()}, list(model_sql))
+    return build_column_lineage(model_sql, DEPENDENCIES, catalog)
+
+
+def _model(sql):
+    """Build parsed data for a SQL model."""
+    return {"code": {"sql": {"original_sql": sql, "resolved_sql": sql}}, "model_metadata": {}}
+
+
+class TestBuildColumnLineage:
+    """Test cases for build_column_lineage."""
+
+    def test_output_columns_are_traced_through_ctes(self):
+        entry = _lineage().models["marts.revenue"]
+
+        assert entry["columns"] == {
+            "id": {"staging.orders": ["id"]},
+            "total": {"staging.orders": ["amount"]},
+        }
+        assert entry["filters"] == {"staging.orders": ["id", "status"]}
+        assert entry["relations"] == ["staging.orders"]
+
+    def test_stars_are_expanded_with_the_catalog(self):
+        entry = _lineage().models["staging.orders"]
+
+        assert entry["opaque"] == []
+        assert entry["columns"]["note"] == {"raw.orders": ["note"]}
+
+    def test_unexpanded_star_marks_relations_as_opaque(self):
+        lineage = build_column_lineage({"marts.copy": "SELECT * FROM raw.unknown"})
+
+        assert lineage.models["marts.copy"]["opaque"] == ["raw.unknown"]
+
+    def test_unparseable_sql_has_no_entry(self):
+        lineage = build_column_lineage({"marts.bad": "SELECT FROM WHERE ("})
+
+        assert "marts.bad" not in lineage.models
+
+    def test_save_writes_the_index(self, tmp_path):
+        path = _lineage().save(tmp_path)
+
+        assert path == tmp_path / COLUMN_LINEAGE_FILENAME
+        data = json.loads(path.read_text())
+        assert ColumnLineage.from_dict(data).models == _lineage().models
+
+
+class TestAffectedModels:
+    """Test cases for ColumnLineage.affected_models."""
+
+    def test_only_models_reading_the_column_are_affected(self):
+        assert _lineage().affected_models("staging.orders", ["note"]) == {"marts.notes": {"note"}}
+
+    def test_change_propagates_through_affected_columns(self):
+        affected = _lineage().affected_models("staging.orders", ["amount"])
+
+        assert affected == {
+            "marts.revenue": {"total"},
+            "marts.top_revenue": {ALL_COLUMNS},
+        }
+
+    def test_filter_columns_affect_every_output(self):
+        affected = _lineage().affected_models("staging.orders", ["status"])
+
+        assert affected["marts.revenue"] == {ALL_COLUMNS}
+        assert affected["marts.top_revenue"] == {ALL_COLUMNS}
+        assert "marts.notes" not in affected
+
+    def test_row_changes_affect_every_reader(self):
+        affected = _lineage().affected_models("staging.orders", [ALL_COLUMNS])
+
+        assert set(affected) == {
+            "marts.revenue",
+            "marts.notes",
+            "marts.order_count",
+            "marts.top_revenue",
+        }
+
+    def test_changes_to_seed_columns(self):
+        affected = _lineage().affected_models("raw.orders", ["note"])
+
+        assert affected == {"staging.orders": {"note"}, "marts.notes": {"note"}}
+
+    def test_models_without_lineage_fall_back_to_dependencies(self):
+        lineage = _lineage()
+        del lineage.models["marts.notes"]
+
+        assert lineage.affected_models("staging.orders", ["status"])["marts.notes"] == {
+            ALL_COLUMNS
+        }
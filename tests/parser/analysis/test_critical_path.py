@@ -0,0 +1,96 @@
+"""
+Tests for critical-path analysis of the dependency graph.
+"""
+
+from graphlib import CycleError
+
+import pytest
+
+from tee.parser.analysis.critical_path import (
+    DEFAULT_NODE_WEIGHT,
+    critical_path_order,
+    node_weights,
+    remaining_path_weights,
+    slowest_chains,
+)
+
+# a -> b -> c is the long chain, x and y are quick standalone models
+DEPENDENCIES = {
+    "a": [],
+    "b": ["a"],
+    "c": ["b"],
+    "x": [],
+    "y": [],
+}
+
+
+class TestNodeWeights:
+    """Test cases for estimating node durations."""
+
+    def test_without_durations_every_node_weighs_the_default(self):
+        weights = node_weights({"b": ["a"]})
+
+        assert weights == {"a": DEFAULT_NODE_WEIGHT, "b": DEFAULT_NODE_WEIGHT}
+
+    def test_unknown_nodes_weigh_the_median_of_known_durations(self):
+        weights = node_weights(DEPENDENCIES, {"a": 1.0, "b": 3.0, "c": 10.0})
+
+        assert weights["b"] == 3.0
+        assert weights["x"] == 3.0
+        assert weights["y"] == 3.0
+
+
+class TestCriticalPathOrder:
+    """Test cases for critical-path-first topological ordering."""
+
+    def test_longest_chain_starts_first(self):
+        assert remaining_path_weights(DEPENDENCIES) == {
+            "a": 3.0,
+            "b": 2.0,
+            "c": 1.0,
+            "x": 1.0,
+            "y": 1.0,
+        }
+        assert critical_path_order(DEPENDENCIES) == ["a", "b", "c", "x", "y"]
+
+    def test_durations_decide_the_order(self):
+        durations = {"a": 1.0, "b": 1.0, "c": 1.0, "x": 1.0, "y": 60.0}
+
+        order = critical_path_order(DEPENDENCIES, durations)
+
+        assert order == ["y", "a", "b", "c", "x"]
+
+    def test_dependencies_come_first(self):
+        dependencies = {"report": ["slow", "fast"], "slow": [], "fast": []}
+
+        order = critical_path_order(dependencies, {"slow": 100.0, "fast": 1.0})
+
+        assert order == ["slow", "fast", "report"]
+
+    def test_cycle_raises(self):
+        with pytest.raises(CycleError):
+            critical_path_order({"a": ["b"], "b": ["a"]})
+
+
+class TestSlowestChains:
+    """Test cases for finding the slowest chains of the graph."""
+
+    def test_chains_ordered_from_slowest(self):
+        durations = {"a": 2.0, "b": 5.0, "c": 1.0, "x": 4.0, "y": 0.5}
+
+        chains = slowest_chains(DEPENDENCIES, durations)
+
+        assert [chain.nodes for chain in chains] == [["a", "b", "c"], ["x"], ["y"]]
+        assert chains[0].durations == [2.0, 5.0, 1.0]
+        assert chains[0].duration == 8.0
+
+    def test_chain_follows_slowest_dependency(self):
+        dependencies = {"report": ["slow", "fast"], "slow": [], "fast": []}
+
+        chains = slowest_chains(dependencies, {"slow": 10.0, "fast": 1.0, "report": 1.0})
+
+        assert len(chains) == 1
+        assert chains[0].nodes == ["slow", "report"]
+
+    def test_limit(self):
+        assert len(slowest_chains(DEPENDENCIES, limit=2)) == 2
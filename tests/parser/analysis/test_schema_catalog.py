@@ -0,0 +1,185 @@
+"""
+Unit tests for the compile-time schema catalog.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from tee.adapters.base.sql import sql_hash
+from tee.adapters.duckdb.adapter import DuckDBAdapter
+from tee.engine.materialization.schema_comparator import SchemaComparator
+from tee.parser.analysis.schema_catalog import SchemaCatalog, build_schema_catalog
+
+STAGING_SQL = "SELECT id, CAST(amount AS DECIMAL(10, 2)) AS amount, day FROM raw.orders"
+SUMMARY_SQL = "SELECT o.id, COUNT(*) AS n FROM staging.orders AS o GROUP BY o.id"
+
+
+def _model(sql, schema=None):
+    """Build parsed data for a SQL model."""
+    metadata = {"schema": schema} if schema else {}
+    return {
+        "code": {"sql": {"original_sql": sql, "resolved_sql": sql}},
+        "model_metadata": {"metadata": metadata},
+    }
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project folder with one seed in the raw schema."""
+    (tmp_path / "seeds" / "raw").mkdir(parents=True)
+    (tmp_path / "seeds" / "raw" / "orders.csv").write_text(
+        "id,amount,day\n1,2.5,2024-01-01\n2,3.0,2024-01-02\n"
+    )
+    return tmp_path
+
+
+class TestSchemaCatalog:
+    """Test cases for SchemaCatalog."""
+
+    def test_duckdb_seeds_are_described_with_their_loaded_types(self, project):
+        catalog = SchemaCatalog("duckdb")
+
+        assert catalog.add_seeds(project / "seeds", "duckdb") == 1
+        assert catalog.get("raw.orders") == {
+            "columns": [
+                {"name": "id", "type": "BIGINT"},
+                {"name": "amount", "type": "DOUBLE"},
+                {"name": "day", "type": "DATE"},
+            ],
+            "authoritative": True,
+            "source": "seed",
+        }
+
+    def test_other_databases_load_seed_columns_as_varchar(self, project):
+        catalog = SchemaCatalog("postgres")
+        catalog.add_seeds(project / "seeds", "postgresql")
+
+        assert catalog.get("raw.orders")["columns"] == [
+            {"name": "id", "type": "VARCHAR"},
+            {"name": "amount", "type": "VARCHAR"},
+            {"name": "day", "type": "VARCHAR"},
+        ]
+
+    def test_types_propagate_through_models_in_execution_order(self, project):
+        models = {
+            "marts.summary": _model(SUMMARY_SQL),
+            "staging.orders": _model(STAGING_SQL),
+        }
+
+        catalog = build_schema_catalog(
+            models,
+            ["staging.orders", "marts.summary"],
+            project_path=project,
+            connection_type="duckdb",
+            dialect="duckdb",
+        )
+
+        staging = catalog.get("staging.orders")
+        assert staging["columns"] == [
+            {"name": "id", "type": "BIGINT"},
+            {"name": "amount", "type": "DECIMAL(10, 2)"},
+            {"name": "day", "type": "DATE"},
+        ]
+        assert staging["authoritative"] is True
+        # Aggregates are typed but not trusted to match the database
+        summary = catalog.get("marts.summary")
+        assert summary["columns"] == [
+            {"name": "id", "type": "BIGINT"},
+            {"name": "n", "type": "BIGINT"},
+        ]
+        assert summary["authoritative"] is False
+
+    def test_output_schema_is_stored_in_the_model(self, project):
+        models = {"staging.orders": _model(STAGING_SQL)}
+
+        build_schema_catalog(models, ["staging.orders"], project, "duckdb", "duckdb")
+
+        output_schema = models["staging.orders"]["code"]["sql"]["output_schema"]
+        assert output_schema["authoritative"] is True
+        assert output_schema["dialect"] == "duckdb"
+        assert output_schema["source_hash"] == sql_hash(STAGING_SQL)
+        assert [col["name"] for col in output_schema["columns"]] == ["id", "amount", "day"]
+
+    def test_declared_schema_is_used_but_not_authoritative(self):
+        models = {
+            "staging.orders": _model(
+                "SELECT 1 AS id", schema=[{"name": "id", "datatype": "integer"}]
+            )
+        }
+
+        catalog = build_schema_catalog(models, ["staging.orders"], dialect="duckdb")
+
+        assert catalog.get("staging.orders") == {
+            "columns": [{"name": "id", "type": "BIGINT"}],
+            "authoritative": False,
+            "source": "declared",
+        }
+
+    def test_star_over_unknown_relation_has_no_entry(self):
+        models = {"staging.orders": _model("SELECT * FROM external.orders")}
+
+        catalog = build_schema_catalog(models, ["staging.orders"], dialect="duckdb")
+
+        assert catalog.get("staging.orders") is None
+        assert "output_schema" not in models["staging.orders"]["code"]["sql"]
+
+    def test_set_operations_are_not_authoritative(self, project):
+        models = {
+            "staging.ids": _model("SELECT id FROM raw.orders UNION ALL SELECT id FROM raw.orders")
+        }
+
+        catalog = build_schema_catalog(models, ["staging.ids"], project, "duckdb", "duckdb")
+
+        assert catalog.get("staging.ids")["authoritative"] is False
+
+    def test_save_writes_catalog_json(self, project):
+        catalog = SchemaCatalog("duckdb")
+        catalog.add_seeds(project / "seeds", "duckdb")
+
+        path = catalog.save(project / "output")
+
+        data = json.loads(path.read_text())
+        assert data["dialect"] == "duckdb"
+        assert list(data["relations"]) == ["raw.orders"]
+
+
+class TestOutputSchemaInSchemaComparisons:
+    """Authoritative entries replace describing the query in schema comparisons."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create a connected in-memory DuckDB adapter."""
+        adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+        adapter.connect()
+        yield adapter
+        adapter.disconnect()
+
+    def test_authoritative_schema_matches_table_without_describing_query(self, project, adapter):
+        models = {"staging.orders": _model(STAGING_SQL)}
+        build_schema_catalog(models, ["staging.orders"], project, "duckdb", "duckdb")
+        seed = str(project / "seeds" / "raw" / "orders.csv")
+        adapter.execute_query("CREATE SCHEMA raw")
+        adapter.execute_query(f"CREATE TABLE raw.orders AS SELECT * FROM read_csv_auto('{seed}')")
+        adapter.execute_query("CREATE SCHEMA staging")
+        adapter.execute_query(f"CREATE TABLE staging.orders AS {STAGING_SQL}")
+
+        output_schema = models["staging.orders"]["code"]["sql"]["output_schema"]
+        assert adapter.use_output_schema(STAGING_SQL, output_schema) is True
+
+        comparator = SchemaComparator(adapter)
+        with patch.object(adapter, "describe_query_schema") as describe_query_schema:
+            query_schema = comparator.infer_query_schema(STAGING_SQL)
+        describe_query_schema.assert_not_called()
+
+        table_schema = comparator.get_table_schema("staging.orders")
+        assert comparator.compare_schemas(query_schema, table_schema)["has_changes"] is False
+
+    def test_stale_output_schema_is_ignored(self, project, adapter):
+        models = {"staging.orders": _model(STAGING_SQL)}
+        build_schema_catalog(models, ["staging.orders"], project, "duckdb", "duckdb")
+        output_schema = models["staging.orders"]["code"]["sql"]["output_schema"]
+
+        assert adapter.use_output_schema("SELECT 1 AS id", output_schema) is False
+        assert adapter.get_known_query_schema("SELECT 1 AS id") is None
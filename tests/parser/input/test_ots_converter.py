@@ -54,6 +54,70 @@ class TestOTSConverter:
         assert "model_metadata" in parsed_model
         assert parsed_model["code"]["sql"]["original_sql"] == "SELECT 1 as col1, 'test' as col2"
 
+    def test_convert_module_keeps_transpiled_sql(self):
+        """Test that ahead-of-time transpiled SQL survives the conversion."""
+        converter = OTSConverter()
+        transpiled = {"duckdb": {"sql": "SELECT 1 AS col1", "source_hash": "abc", "schema": None}}
+
+        module: OTSModule = {
+            "ots_version": "0.1.0",
+            "module_name": "test.module",
+            "target": {"database": "test_db", "schema": "test_schema"},
+            "transformations": [
+                {
+                    "transformation_id": "test_schema.test_table",
+                    "code": {
+                        "sql": {
+                            "original_sql": "SELECT 1 as col1",
+                            "resolved_sql": "SELECT 1 as col1",
+                            "source_tables": [],
+                            "transpiled": transpiled,
+                        }
+                    },
+                    "materialization": {"type": "table"},
+                    "metadata": {},
+                }
+            ],
+        }
+
+        parsed_models, _ = converter.convert_module(module)
+        assert parsed_models["test_schema.test_table"]["code"]["sql"]["transpiled"] == transpiled
+
+    def test_convert_module_keeps_output_schema(self):
+        """Test that the compile-time output schema survives the conversion."""
+        converter = OTSConverter()
+        output_schema = {
+            "columns": [{"name": "col1", "type": "INT"}],
+            "authoritative": False,
+            "dialect": "duckdb",
+            "source_hash": "abc",
+        }
+
+        module: OTSModule = {
+            "ots_version": "0.1.0",
+            "module_name": "test.module",
+            "target": {"database": "test_db", "schema": "test_schema"},
+            "transformations": [
+                {
+                    "transformation_id": "test_schema.test_table",
+                    "code": {
+                        "sql": {
+                            "original_sql": "SELECT 1 as col1",
+                            "resolved_sql": "SELECT 1 as col1",
+                            "source_tables": [],
+                            "output_schema": output_schema,
+                        }
+                    },
+                    "materialization": {"type": "table"},
+                    "metadata": {},
+                }
+            ],
+        }
+
+        parsed_models, _ = converter.convert_module(module)
+        sql_data = parsed_models["test_schema.test_table"]["code"]["sql"]
+        assert sql_data["output_schema"] == output_schema
+
     def test_convert_module_with_tests(self):
         """Test converting a module with tests."""
         converter = OTSConverter()
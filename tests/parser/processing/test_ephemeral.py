@@ -0,0 +1,147 @@
+"""
+Tests for inlining ephemeral models as CTEs.
+"""
+
+import duckdb
+import pytest
+
+from tee.engine.execution_engine import ExecutionEngine
+from tee.parser.processing import EphemeralInliningError, inline_ephemeral_models
+
+
+def _model(sql, materialization=None):
+    """Build parsed model data the way the parser produces it."""
+    metadata = {"materialization": materialization} if materialization else {}
+    return {"code": {"sql": {"resolved_sql": sql}}, "model_metadata": {"metadata": metadata}}
+
+
+def _sql(models, name):
+    return models[name]["code"]["sql"]["resolved_sql"]
+
+
+@pytest.fixture
+def connection():
+    """DuckDB connection with a raw.orders source table."""
+    conn = duckdb.connect(":memory:")
+    conn.execute("CREATE SCHEMA raw")
+    conn.execute("CREATE TABLE raw.orders AS SELECT * FROM (VALUES (1, 5), (2, -1)) t(id, amount)")
+    yield conn
+    conn.close()
+
+
+class TestInlineEphemeralModels:
+    """Test cases for inline_ephemeral_models."""
+
+    def test_downstream_model_gets_cte(self, connection):
+        models = {
+            "staging.stg_orders": _model(
+                "SELECT id, amount FROM raw.orders WHERE amount > 0", "ephemeral"
+            ),
+            "mart.orders": _model("SELECT stg_orders.id FROM staging.stg_orders"),
+        }
+
+        assert inline_ephemeral_models(models) == ["mart.orders"]
+
+        sql = _sql(models, "mart.orders")
+        assert sql.startswith("WITH staging__stg_orders AS (")
+        assert "FROM staging__stg_orders AS stg_orders" in sql
+        assert connection.execute(sql).fetchall() == [(1,)]
+        # The ephemeral node itself is left untouched
+        assert _sql(models, "staging.stg_orders").startswith("SELECT id")
+
+    def test_rewritten_models_are_copies(self):
+        original = _model("SELECT id FROM staging.stg_orders")
+        models = {
+            "staging.stg_orders": _model("SELECT id FROM raw.orders", "ephemeral"),
+            "mart.orders": original,
+        }
+
+        inline_ephemeral_models(models)
+
+        # Other holders of the model dict (e.g. the parser's cache) keep the SQL as written
+        assert models["mart.orders"] is not original
+        assert _sql({"m": original}, "m") == "SELECT id FROM staging.stg_orders"
+        assert _sql(models, "mart.orders").startswith("WITH staging__stg_orders AS (")
+
+    def test_nested_ephemerals_are_ordered_by_dependency(self, connection):
+        models = {
+            "staging.positive": _model(
+                "SELECT base.id FROM staging.base WHERE amount > 0", "ephemeral"
+            ),
+            "staging.base": _model("SELECT id, amount FROM raw.orders", "ephemeral"),
+            "mart.orders": _model("SELECT id FROM staging.positive"),
+        }
+
+        inline_ephemeral_models(models)
+
+        sql = _sql(models, "mart.orders")
+        assert sql.index("staging__base AS") < sql.index("staging__positive AS")
+        assert connection.execute(sql).fetchall() == [(1,)]
+
+    def test_cte_name_collision(self, connection):
+        models = {
+            "staging.stg_orders": _model("SELECT id FROM raw.orders", "ephemeral"),
+            "mart.orders": _model(
+                "WITH staging__stg_orders AS (SELECT 42 AS id) "
+                "SELECT s.id FROM staging.stg_orders AS s "
+                "UNION ALL SELECT id FROM staging__stg_orders"
+            ),
+        }
+
+        inline_ephemeral_models(models)
+
+        sql = _sql(models, "mart.orders")
+        assert "staging__stg_orders_1 AS (" in sql
+        assert sorted(connection.execute(sql).fetchall()) == [(1,), (2,), (42,)]
+
+    def test_unqualified_references_in_body_use_ephemeral_schema(self, connection):
+        models = {
+            "raw.stg_orders": _model("SELECT id FROM orders", "ephemeral"),
+            "mart.orders": _model("SELECT id FROM raw.stg_orders"),
+        }
+
+        inline_ephemeral_models(models)
+
+        sql = _sql(models, "mart.orders")
+        assert "FROM raw.orders" in sql
+        assert sorted(connection.execute(sql).fetchall()) == [(1,), (2,)]
+
+    def test_models_without_ephemeral_references_are_unchanged(self):
+        models = {
+            "staging.stg_orders": _model("SELECT id FROM raw.orders", "ephemeral"),
+            "mart.other": _model("SELECT id FROM raw.orders"),
+        }
+
+        assert inline_ephemeral_models(models) == []
+        assert _sql(models, "mart.other") == "SELECT id FROM raw.orders"
+
+    def test_cycle_between_ephemerals_raises(self):
+        models = {
+            "s.a": _model("SELECT * FROM s.b", "ephemeral"),
+            "s.b": _model("SELECT * FROM s.a", "ephemeral"),
+            "s.c": _model("SELECT * FROM s.a"),
+        }
+
+        with pytest.raises(EphemeralInliningError, match="s.a -> s.b -> s.a"):
+            inline_ephemeral_models(models)
+
+    def test_engine_builds_dependents_but_not_ephemerals(self, temp_project_dir):
+        models = {
+            "staging.stg": _model("SELECT 1 AS id", "ephemeral"),
+            "mart.final": _model("SELECT id FROM staging.stg"),
+        }
+        models["mart.final"]["tables"] = ["stg"]
+        inline_ephemeral_models(models)
+
+        engine = ExecutionEngine(
+            config={"type": "duckdb", "path": ":memory:"}, project_folder=str(temp_project_dir)
+        )
+        engine.connect()
+        try:
+            results = engine.execute_models(models, ["staging.stg", "mart.final"])
+
+            assert results["executed_tables"] == ["mart.final"]
+            assert results["failed_tables"] == []
+            assert not engine.adapter.table_exists("staging.stg")
+        finally:
+            engine.disconnect()
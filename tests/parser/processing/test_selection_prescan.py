@@ -0,0 +1,62 @@
+"""
+Tests for the reference pre-scan used by selection-aware (lazy) compilation.
+"""
+
+import pytest
+
+from tee.parser.analysis import TableResolver
+from tee.parser.processing import FileDiscovery, select_model_files
+from tee.parser.processing.selection_prescan import scan_identifiers
+
+
+@pytest.fixture
+def models_folder(tmp_path):
+    """Create a models folder with a small chain of models and an unrelated branch."""
+    folder = tmp_path / "models" / "s"
+    folder.mkdir(parents=True)
+    (folder / "raw.sql").write_text("SELECT 1 AS id")
+    (folder / "staged.sql").write_text("-- reads unrelated in a comment only\nSELECT id FROM raw")
+    (folder / "final.sql").write_text("SELECT * FROM s.staged JOIN other ON TRUE")
+    (folder / "other.sql").write_text("SELECT 2 AS id")
+    (folder / "unrelated.sql").write_text("SELECT 3 AS id")
+    (folder / "final.py").write_text('metadata = {"materialization": "table"}')
+    return tmp_path / "models"
+
+
+def _select(models_folder, patterns):
+    files = FileDiscovery(models_folder).discover_all_files()
+    selected = select_model_files(
+        files, models_folder, TableResolver({"type": "duckdb"}), patterns
+    )
+    return None if selected is None else sorted(path.name for path in selected)
+
+
+class TestSelectionPrescan:
+    """Test cases for select_model_files."""
+
+    def test_selected_model_with_upstream_closure(self, models_folder):
+        assert _select(models_folder, ["final"]) == [
+            "final.sql",
+            "other.sql",
+            "raw.sql",
+            "staged.sql",
+        ]
+
+    def test_selection_without_dependencies(self, models_folder):
+        assert _select(models_folder, ["s.raw"]) == ["raw.sql"]
+
+    def test_python_models_references_are_followed(self, models_folder):
+        (models_folder / "s" / "summary.py").write_text(
+            '@model(table_name="summary")\ndef f():\n    return "SELECT * FROM unrelated"\n'
+        )
+
+        assert _select(models_folder, ["s.raw"]) == ["raw.sql", "unrelated.sql"]
+
+    def test_tag_selection_requires_full_compile(self, models_folder):
+        assert _select(models_folder, ["tag:nightly"]) is None
+
+    def test_column_change_selection_requires_full_compile(self, models_folder):
+        assert _select(models_folder, ["column_changed:s.raw.id+"]) is None
+
+    def test_scan_identifiers_ignores_comments(self):
+        assert scan_identifiers("SELECT a /* FROM b */ FROM C -- d") == {"select", "a", "from", "c"}
@@ -4,6 +4,7 @@ Tests for SQL variable substitution functionality.
 
 import pytest
 from tee.parser.processing.variable_substitution import (
+    compile_sql_template,
     substitute_sql_variables,
     validate_sql_variables,
     get_nested_value,
@@ -332,3 +333,50 @@ class TestSQLVariableSubstitution:
         # When no variables are provided, defaults are not processed
         expected = "SELECT * FROM users WHERE active = @active:true"
         assert result == expected
+
+
+class TestSQLTemplate:
+    """Test compiled SQL templates."""
+
+    def test_compile_splits_literals_and_placeholders(self):
+        """Test that a template holds the literal text around each placeholder."""
+        template = compile_sql_template("SELECT @a, {{ b:x }} FROM t WHERE c = {{ c }}")
+
+        assert template.parts == ["SELECT ", ", ", " FROM t WHERE c = ", ""]
+        assert [(p.name, p.default) for p in template.placeholders] == [
+            ("a", None),
+            ("b", "x"),
+            ("c", None),
+        ]
+
+    def test_compiled_template_is_cached_and_reused_across_variable_sets(self):
+        """Test that the same content compiles once and renders with any variables."""
+        sql = "SELECT * FROM events WHERE day = @day"
+
+        template = compile_sql_template(sql)
+        assert compile_sql_template(sql) is template
+
+        rendered = [template.render({"day": day}) for day in ("2024-01-01", "2024-01-02")]
+        assert rendered == [
+            "SELECT * FROM events WHERE day = '2024-01-01'",
+            "SELECT * FROM events WHERE day = '2024-01-02'",
+        ]
+
+    def test_variable_name_prefix_of_another(self):
+        """Test that @name does not replace the start of @names."""
+        sql = "SELECT @name, @names"
+        result = substitute_sql_variables(sql, {"name": "a", "names": "b"})
+        assert result == "SELECT 'a', 'b'"
+
+    def test_substituted_values_are_not_substituted_again(self):
+        """Test that placeholders inside variable values are kept literally."""
+        sql = "SELECT @first, @second"
+        result = substitute_sql_variables(sql, {"first": "@second", "second": "x"})
+        assert result == "SELECT '@second', 'x'"
+
+    def test_validate_checks_full_nested_path(self):
+        """Test that validation fails when a nested variable would not be substituted."""
+        sql = "SELECT * FROM users WHERE host = @config.database.host"
+
+        with pytest.raises(VariableSubstitutionError, match="@config.database.host"):
+            validate_sql_variables(sql, {"config": {"database": {}}})
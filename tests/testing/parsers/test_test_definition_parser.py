@@ -5,7 +5,7 @@ Unit tests for TestDefinitionParser.
 import pytest
 
 from tee.testing.parsers.test_definition_parser import TestDefinitionParser, ParsedTestDefinition
-from tee.testing.base import TestSeverity
+from tee.testing.base import TestMode, TestSeverity
 
 
 class TestTestDefinitionParser:
@@ -175,3 +175,24 @@ class TestTestDefinitionParser:
         assert result.severity_override == TestSeverity.WARNING
 
 
+
+    def test_parse_dict_test_def_mode(self):
+        """Test that the mode and sample percentage are not test params."""
+        test_def = {"name": "unique", "mode": "SAMPLE", "sample_percent": 5}
+
+        result = TestDefinitionParser.parse(test_def, {}, "context")
+
+        assert result is not None
+        assert result.params is None
+        assert result.mode == TestMode.SAMPLE
+        assert result.sample_percent == 5.0
+
+    def test_parse_dict_test_def_invalid_mode(self):
+        """Test that an invalid mode or sample percentage falls back to the default."""
+        test_def = {"name": "unique", "mode": "fast", "sample_percent": 150}
+
+        result = TestDefinitionParser.parse(test_def, {}, "context")
+
+        assert result is not None
+        assert result.mode is None
+        assert result.sample_percent is None
@@ -0,0 +1,181 @@
+"""
+Tests for limiting the tests of incremental models to their last batch.
+"""
+
+import pytest
+
+from tee.adapters.duckdb.adapter import DuckDBAdapter
+from tee.testing.base import TestRegistry
+from tee.testing.executors import ModelTestExecutor
+from tee.testing.incremental_scope import incremental_test_filter
+from tee.testing.standard_tests import ACCEPTED_VALUES, NOT_NULL, ROW_COUNT_GT_0, UNIQUE
+
+METADATA = {
+    "materialization": "incremental",
+    "incremental": {"strategy": "append", "append": {"filter_column": "created_at"}},
+    "schema": [
+        {"name": "id", "tests": ["not_null", "unique"]},
+        {
+            "name": "status",
+            "tests": [{"name": "accepted_values", "values": ["open", "closed"]}],
+        },
+    ],
+}
+
+
+@pytest.fixture
+def adapter():
+    """Create a DuckDB adapter with an incremental table loaded in two batches."""
+    adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+    adapter.connect()
+    adapter.execute_query(
+        """
+        CREATE TABLE events AS
+        SELECT * FROM (VALUES
+            (1, 'open', TIMESTAMP '2024-01-01 10:00:00'),
+            (NULL, 'unknown', TIMESTAMP '2024-01-01 11:00:00'),
+            (3, 'open', TIMESTAMP '2024-01-01 12:00:00'),
+            (3, 'closed', TIMESTAMP '2024-01-01 13:00:00'),
+            (5, 'open', TIMESTAMP '2024-01-02 10:00:00'),
+            (6, 'closed', TIMESTAMP '2024-01-02 11:00:00')
+        ) AS t(id, status, created_at)
+        """
+    )
+    yield adapter
+    adapter.disconnect()
+
+
+def _record_batches(state_manager, *values):
+    for value in values:
+        state_manager.update_processed_value("events", value, strategy="append")
+
+
+def _failures(results):
+    return sorted(f"{r.column_name}.{r.test_name}" for r in results if not r.passed)
+
+
+class TestIncrementalTestFilter:
+    """Test cases for the condition selecting the last batch."""
+
+    def test_filters_on_previous_processed_value(self, adapter, state_manager):
+        _record_batches(state_manager, "2024-01-01 23:59:59", "2024-01-02 23:59:59")
+
+        where = incremental_test_filter(adapter, state_manager, "events", METADATA)
+
+        assert where == "created_at > '2024-01-01 23:59:59'"
+
+    def test_applies_lookback_and_destination_column(self, adapter, state_manager):
+        _record_batches(state_manager, "2024-01-01 23:59:59", "2024-01-02 23:59:59")
+        metadata = {
+            "materialization": "incremental",
+            "incremental": {
+                "strategy": "merge",
+                "merge": {
+                    "unique_key": ["id"],
+                    "filter_column": "updated_at",
+                    "destination_filter_column": "created_at",
+                    "lookback": "2 hours",
+                },
+            },
+        }
+
+        where = incremental_test_filter(adapter, state_manager, "events", metadata)
+
+        assert where == (
+            "created_at > (CAST('2024-01-01 23:59:59' AS TIMESTAMP) - INTERVAL '2 hours')"
+        )
+
+    def test_no_filter_after_full_load(self, adapter, state_manager):
+        _record_batches(state_manager, "2024-01-01 23:59:59")
+        state_manager.update_processed_value(
+            "events", "2024-01-02 23:59:59", strategy="append", full_load=True
+        )
+
+        assert incremental_test_filter(adapter, state_manager, "events", METADATA) is None
+
+    def test_no_filter_on_first_batch(self, adapter, state_manager):
+        _record_batches(state_manager, "2024-01-01 23:59:59")
+
+        assert incremental_test_filter(adapter, state_manager, "events", METADATA) is None
+
+    def test_no_filter_without_filter_column_in_table(self, adapter, state_manager):
+        _record_batches(state_manager, "2024-01-01 23:59:59", "2024-01-02 23:59:59")
+        metadata = {
+            "materialization": "incremental",
+            "incremental": {"strategy": "append", "append": {"filter_column": "loaded_at"}},
+        }
+
+        assert incremental_test_filter(adapter, state_manager, "events", metadata) is None
+
+    def test_no_filter_for_tables(self, adapter, state_manager):
+        _record_batches(state_manager, "2024-01-01 23:59:59", "2024-01-02 23:59:59")
+
+        metadata = {**METADATA, "materialization": "table"}
+        assert incremental_test_filter(adapter, state_manager, "events", metadata) is None
+
+
+class TestScopedModelTests:
+    """Test cases for running model tests on the last batch."""
+
+    @pytest.fixture(autouse=True)
+    def standard_tests(self):
+        """Register the standard tests (other test modules clear the registry)."""
+        for test in (NOT_NULL, UNIQUE, ACCEPTED_VALUES, ROW_COUNT_GT_0):
+            TestRegistry.register(test)
+
+    def test_old_rows_are_not_tested(self, adapter, state_manager):
+        _record_batches(state_manager, "2024-01-01 23:59:59", "2024-01-02 23:59:59")
+        executor = ModelTestExecutor(adapter, state_manager)
+
+        results = executor.execute_tests_for_model("events", METADATA)
+
+        assert len(results) == 3
+        assert _failures(results) == []
+        assert all("last incremental batch" in r.message for r in results)
+
+    def test_new_rows_are_tested(self, adapter, state_manager):
+        _record_batches(state_manager, "2024-01-01 23:59:59", "2024-01-02 23:59:59")
+        adapter.execute_query(
+            """
+            INSERT INTO events VALUES
+                (NULL, 'pending', TIMESTAMP '2024-01-03 10:00:00'),
+                (1, 'open', TIMESTAMP '2024-01-03 11:00:00')
+            """
+        )
+        _record_batches(state_manager, "2024-01-03 23:59:59")
+        executor = ModelTestExecutor(adapter, state_manager)
+
+        results = executor.execute_tests_for_model("events", METADATA)
+
+        # id 1 duplicates a row of an older batch
+        assert _failures(results) == ["id.not_null", "id.unique", "status.accepted_values"]
+        unique = next(r for r in results if r.test_name == "unique")
+        assert unique.rows_returned == 1
+
+    def test_full_tests_check_whole_table(self, adapter, state_manager):
+        _record_batches(state_manager, "2024-01-01 23:59:59", "2024-01-02 23:59:59")
+        executor = ModelTestExecutor(adapter, state_manager, full_tests=True)
+
+        results = executor.execute_tests_for_model("events", METADATA)
+
+        assert _failures(results) == ["id.not_null", "id.unique", "status.accepted_values"]
+
+    def test_without_state_manager_tests_whole_table(self, adapter, state_manager):
+        _record_batches(state_manager, "2024-01-01 23:59:59", "2024-01-02 23:59:59")
+        executor = ModelTestExecutor(adapter)
+
+        results = executor.execute_tests_for_model("events", METADATA)
+
+        assert _failures(results) == ["id.not_null", "id.unique", "status.accepted_values"]
+
+    def test_model_level_tests_without_scope_check_whole_table(self, adapter, state_manager):
+        _record_batches(state_manager, "2024-01-01 23:59:59", "2024-01-02 23:59:59")
+        adapter.execute_query("DELETE FROM events WHERE created_at > TIMESTAMP '2024-01-02'")
+        metadata = {**METADATA, "schema": [], "tests": ["row_count_gt_0"]}
+        executor = ModelTestExecutor(adapter, state_manager)
+
+        results = executor.execute_tests_for_model("events", metadata)
+
+        # The last batch is empty, but row_count_gt_0 is about the whole table
+        assert results[0].passed
+        assert results[0].rows_returned == 4
@@ -174,3 +174,59 @@ class TestQueryGeneration:
                 "my_schema.users",
                 ["id", "name"],  # Length 2 vs 1
             )
+
+    def test_generate_row_local_queries_with_where(self, generator):
+        """Test that row-local test queries can be limited to some rows."""
+        where = "created_at > '2024-01-01'"
+
+        not_null = generator.generate_not_null_test_query("my_table", "id", where=where)
+        accepted = generator.generate_accepted_values_test_query(
+            "my_table", "status", ["open"], where=where
+        )
+        relationships = generator.generate_relationships_test_query(
+            "my_table", ["user_id"], "users", ["id"], where=where
+        )
+
+        assert f"WHERE ({where}) AND id IS NULL" in not_null
+        assert f"WHERE ({where}) AND status NOT IN ('open')" in accepted
+        assert f"FROM (SELECT * FROM my_table WHERE {where}) AS source" in relationships
+
+    def test_generate_unique_new_rows_test_query(self, generator):
+        """Test unique query generation limited to the keys of some rows."""
+        query = generator.generate_unique_new_rows_test_query(
+            "my_table", ["col1", "col2"], "created_at > '2024-01-01'"
+        )
+
+        assert "FROM my_table AS existing" in query
+        assert "SELECT col1, col2 FROM my_table WHERE created_at > '2024-01-01'" in query
+        assert "new_rows.col1 = existing.col1 AND new_rows.col2 = existing.col2" in query
+        assert "GROUP BY existing.col1, existing.col2" in query
+
+    def test_generate_unique_sampled_keys_test_query(self, generator):
+        """Test the keys of a sample are checked against the whole table."""
+        query = generator.generate_unique_new_rows_test_query("my_table", ["id"], sample_percent=5)
+
+        assert "FROM my_table AS existing" in query
+        assert "(SELECT id FROM my_table TABLESAMPLE SYSTEM (5)) AS new_rows" in query
+        assert query.count("TABLESAMPLE") == 1
+
+    def test_generate_queries_with_sample(self, generator):
+        """Test that test queries can read a sample of the table."""
+        not_null = generator.generate_not_null_test_query("my_table", "id", sample_percent=5)
+        unique = generator.generate_unique_test_query("my_table", ["id"], sample_percent=5)
+        relationships = generator.generate_relationships_test_query(
+            "my_table", ["user_id"], "users", ["id"], sample_percent=2.5
+        )
+
+        assert "FROM my_table TABLESAMPLE SYSTEM (5) WHERE id IS NULL" in not_null
+        assert "FROM my_table TABLESAMPLE SYSTEM (5)" in unique
+        assert "FROM (SELECT * FROM my_table TABLESAMPLE SYSTEM (2.5)) AS source" in relationships
+        assert "users TABLESAMPLE" not in relationships
+
+    def test_generate_unique_approx_query(self, generator):
+        """Test the approximate duplicate count counts NULLs as one value."""
+        query = generator.generate_unique_approx_query("my_table", "id")
+
+        assert "COUNT(*) - APPROX_COUNT_DISTINCT(id)" in query
+        assert "CASE WHEN COUNT(*) > COUNT(id) THEN 1 ELSE 0 END" in query
+        assert "FROM my_table" in query
@@ -0,0 +1,157 @@
+"""
+Tests for reusing the passes of model tests on unchanged relations.
+"""
+
+import pytest
+
+from tee.adapters.duckdb.adapter import DuckDBAdapter
+from tee.testing.base import TestMode, TestRegistry
+from tee.testing.executors import ModelTestExecutor
+from tee.testing.standard_tests import (
+    ACCEPTED_VALUES,
+    NOT_NULL,
+    RELATIONSHIPS,
+    ROW_COUNT_GT_0,
+    UNIQUE,
+)
+
+METADATA = {
+    "schema": [
+        {"name": "id", "tests": ["not_null", "unique"]},
+        {"name": "user_id", "tests": [{"name": "relationships", "to": "users", "field": "id"}]},
+    ],
+    "tests": ["row_count_gt_0"],
+}
+
+
+@pytest.fixture
+def adapter():
+    """Create a DuckDB adapter with an orders table referencing a users table."""
+    adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+    adapter.connect()
+    adapter.execute_query(
+        "CREATE TABLE orders AS SELECT * FROM (VALUES (1, 10), (2, 20)) AS t(id, user_id)"
+    )
+    adapter.execute_query("CREATE TABLE users AS SELECT * FROM (VALUES (10), (20)) AS t(id)")
+    yield adapter
+    adapter.disconnect()
+
+
+@pytest.fixture(autouse=True)
+def standard_tests():
+    """Register the standard tests (other test modules clear the registry)."""
+    for test in (NOT_NULL, UNIQUE, ACCEPTED_VALUES, ROW_COUNT_GT_0, RELATIONSHIPS):
+        TestRegistry.register(test)
+
+
+def _build(state_manager, *tables, materialization="table"):
+    for table in tables:
+        state_manager.save_model_state(table, materialization, "sql_hash", "config_hash")
+
+
+def _cached(results):
+    return sorted(f"{r.column_name or r.table_name}.{r.test_name}" for r in results if r.cached)
+
+
+def _run(adapter, state_manager, metadata=METADATA, **kwargs):
+    executor = ModelTestExecutor(adapter, state_manager, test_cache=True, **kwargs)
+    return executor.execute_tests_for_model("orders", metadata)
+
+
+class TestResultCaching:
+    """Test cases for cached passes."""
+
+    def test_unchanged_relations_reuse_passes(self, adapter, state_manager):
+        _build(state_manager, "orders", "users")
+
+        first = _run(adapter, state_manager)
+        second = _run(adapter, state_manager)
+
+        assert _cached(first) == []
+        assert _cached(second) == [
+            "id.not_null",
+            "id.unique",
+            "orders.row_count_gt_0",
+            "user_id.relationships",
+        ]
+        assert all(r.passed for r in second)
+        assert second[0].message.startswith("Cached pass: not_null")
+        assert str(second[0]).startswith("✅ CACHED PASS not_null on orders.id")
+
+    def test_rebuild_invalidates_passes(self, adapter, state_manager):
+        _build(state_manager, "orders", "users")
+        _run(adapter, state_manager)
+
+        _build(state_manager, "users")
+        results = _run(adapter, state_manager)
+
+        # Only relationships reads users
+        assert _cached(results) == ["id.not_null", "id.unique", "orders.row_count_gt_0"]
+
+        # Every test reads orders
+        state_manager.record_ddl("orders")
+        assert _cached(_run(adapter, state_manager)) == []
+
+    def test_warehouse_changes_invalidate_passes(self, adapter, state_manager, monkeypatch):
+        _build(state_manager, "orders", "users")
+        monkeypatch.setattr(adapter, "get_table_fingerprint", lambda _table: "altered 1")
+        _run(adapter, state_manager)
+
+        monkeypatch.setattr(adapter, "get_table_fingerprint", lambda _table: "altered 2")
+
+        assert _cached(_run(adapter, state_manager)) == []
+
+    def test_failures_are_not_cached(self, adapter, state_manager):
+        _build(state_manager, "orders", "users")
+        adapter.execute_query("INSERT INTO orders VALUES (NULL, 10)")
+        _run(adapter, state_manager)
+
+        results = _run(adapter, state_manager)
+
+        not_null = next(r for r in results if r.test_name == "not_null")
+        assert not not_null.passed
+        assert not not_null.cached
+
+    def test_changed_definition_runs_again(self, adapter, state_manager):
+        _build(state_manager, "orders", "users")
+        metadata = {"schema": [{"name": "id", "tests": ["not_null"]}]}
+        _run(adapter, state_manager, metadata)
+
+        assert _cached(_run(adapter, state_manager, metadata, mode=TestMode.APPROX)) == []
+        # Severity does not change the outcome of a test
+        test = {"name": "not_null", "severity": "warning"}
+        metadata = {"schema": [{"name": "id", "tests": [test]}]}
+        assert _cached(_run(adapter, state_manager, metadata)) == ["id.not_null"]
+
+    def test_relations_without_build_state_are_not_cached(self, adapter, state_manager):
+        _build(state_manager, "orders")
+        _run(adapter, state_manager)
+
+        results = _run(adapter, state_manager)
+
+        assert "user_id.relationships" not in _cached(results)
+        assert "id.not_null" in _cached(results)
+
+    def test_views_are_not_cached(self, adapter, state_manager):
+        _build(state_manager, "orders", "users", materialization="view")
+        _run(adapter, state_manager)
+
+        assert _cached(_run(adapter, state_manager)) == []
+
+    def test_sampled_tests_are_not_cached(self, adapter, state_manager):
+        _build(state_manager, "orders", "users")
+        _run(adapter, state_manager, mode="sample")
+
+        results = _run(adapter, state_manager, mode="sample")
+
+        # row_count_gt_0 has no sample mode and runs exactly
+        assert _cached(results) == ["orders.row_count_gt_0"]
+
+    def test_disabled_cache_runs_every_test(self, adapter, state_manager):
+        _build(state_manager, "orders", "users")
+        _run(adapter, state_manager)
+
+        executor = ModelTestExecutor(adapter, state_manager)
+        results = executor.execute_tests_for_model("orders", METADATA)
+
+        assert _cached(results) == []
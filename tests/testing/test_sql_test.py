@@ -319,3 +319,20 @@ WHERE status = {{ status | default('active') }}
 
         assert result.rows_returned == 0
         assert result.passed is True
+
+    def test_execute_counts_violations_on_arrow_results(self, sql_test):
+        """Test that adapters with Arrow results count violations without fetching rows."""
+        pytest.importorskip("pyarrow")
+        from tee.adapters.duckdb.adapter import DuckDBAdapter
+
+        adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+        adapter.connect()
+        adapter.execute_query("CREATE TABLE my_table AS SELECT * FROM range(3)")
+
+        with patch.object(adapter, "execute_query") as execute_query:
+            result = sql_test.execute(adapter=adapter, table_name="my_table")
+        adapter.disconnect()
+
+        execute_query.assert_not_called()
+        assert result.rows_returned == 1
+        assert result.passed is False
@@ -0,0 +1,238 @@
+"""
+Tests for running standard tests in sample and approx mode.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from tee.adapters.duckdb.adapter import DuckDBAdapter
+from tee.testing.base import (
+    DEFAULT_SAMPLE_PERCENT,
+    TestMode,
+    TestRegistry,
+    TestResult,
+    TestSeverity,
+    parse_sample_percent,
+    parse_test_mode,
+)
+from tee.testing.executor import TestExecutor
+from tee.testing.executors import ModelTestExecutor
+from tee.testing.standard_tests import (
+    ACCEPTED_VALUES,
+    NOT_NULL,
+    RELATIONSHIPS,
+    ROW_COUNT_GT_0,
+    UNIQUE,
+)
+
+METADATA = {
+    "schema": [
+        {"name": "id", "tests": ["not_null", "unique"]},
+        {"name": "code", "tests": ["unique"]},
+    ],
+    "tests": ["row_count_gt_0"],
+}
+
+
+@pytest.fixture
+def adapter():
+    """Create a DuckDB adapter with a table with a duplicate and a NULL id."""
+    adapter = DuckDBAdapter({"type": "duckdb", "path": ":memory:"})
+    adapter.connect()
+    adapter.execute_query(
+        """
+        CREATE TABLE orders AS
+        SELECT * FROM (VALUES
+            (1, 'a', 10),
+            (2, 'b', 20),
+            (2, 'c', 99),
+            (NULL, 'd', 10)
+        ) AS t(id, code, user_id)
+        """
+    )
+    adapter.execute_query("CREATE TABLE users AS SELECT * FROM (VALUES (10), (20)) AS t(id)")
+    yield adapter
+    adapter.disconnect()
+
+
+@pytest.fixture(autouse=True)
+def standard_tests():
+    """Register the standard tests (other test modules clear the registry)."""
+    for test in (NOT_NULL, UNIQUE, ACCEPTED_VALUES, ROW_COUNT_GT_0, RELATIONSHIPS):
+        TestRegistry.register(test)
+
+
+def _by_test(results):
+    return {f"{r.column_name or r.table_name}.{r.test_name}": r for r in results}
+
+
+class TestModeParsing:
+    """Test cases for parsing the configured mode and sample percentage."""
+
+    def test_parse_test_mode(self):
+        assert parse_test_mode(None) == TestMode.EXACT
+        assert parse_test_mode("Approx") == TestMode.APPROX
+        assert parse_test_mode(TestMode.SAMPLE) == TestMode.SAMPLE
+        with pytest.raises(ValueError, match="Invalid test mode 'fast'"):
+            parse_test_mode("fast")
+
+    def test_parse_sample_percent(self):
+        assert parse_sample_percent(None) == DEFAULT_SAMPLE_PERCENT
+        assert parse_sample_percent(1) == 1.0
+        for invalid in (0, 101, "10", True):
+            with pytest.raises(ValueError, match="Invalid sample_percent"):
+                parse_sample_percent(invalid)
+
+    def test_result_shows_mode(self):
+        result = TestResult(test_name="unique", table_name="t", column_name="id", passed=True)
+        assert "[" not in str(result)
+
+        result.mode = TestMode.SAMPLE
+        assert str(result).startswith("✅ PASS [sample] unique on t.id")
+
+
+class TestSampleMode:
+    """Test cases for tests checking a sample of the table."""
+
+    def test_sample_finds_violations_in_sample(self, adapter):
+        result = NOT_NULL.execute(adapter, "orders", "id", mode=TestMode.SAMPLE, sample_percent=100)
+
+        assert not result.passed
+        assert result.rows_returned == 1
+        assert result.mode == TestMode.SAMPLE
+        assert "(100% sample)" in result.message
+
+    def test_sample_query_uses_percent(self, adapter):
+        query = UNIQUE.get_scoped_test_query(adapter, "orders", "id", sample_percent=5)
+
+        assert "orders TABLESAMPLE SYSTEM (5 PERCENT)" in query
+
+    def test_unique_sample_checks_sampled_keys_against_whole_table(self, adapter):
+        # A "sample" holding only one of the two rows with id 2
+        def one_row_sample(table_name, _percent):
+            return f"(SELECT * FROM {table_name} WHERE code = 'b') AS sampled"
+
+        with patch.object(adapter, "generate_table_sample", one_row_sample):
+            result = UNIQUE.execute(adapter, "orders", "id", mode=TestMode.SAMPLE, sample_percent=5)
+
+        assert not result.passed
+        assert result.rows_returned == 1
+        assert result.mode == TestMode.SAMPLE
+
+    def test_relationships_sample_source_only(self, adapter):
+        params = {"to": "users", "field": "id"}
+        result = RELATIONSHIPS.execute(
+            adapter, "orders", "user_id", params=params, mode=TestMode.SAMPLE, sample_percent=100
+        )
+
+        assert not result.passed
+        assert result.rows_returned == 1
+        assert result.mode == TestMode.SAMPLE
+
+    def test_unsupported_test_runs_exact(self, adapter):
+        result = ROW_COUNT_GT_0.execute(adapter, "orders", mode=TestMode.SAMPLE)
+
+        assert result.passed
+        assert result.rows_returned == 4
+        assert result.mode == TestMode.EXACT
+
+
+class TestApproxMode:
+    """Test cases for approximate pre-checks escalating to exact tests."""
+
+    def test_approx_check_never_passes_without_exact_query(self, adapter):
+        result = UNIQUE.execute(adapter, "orders", "code", mode=TestMode.APPROX)
+
+        assert not result.passed
+        assert result.severity == TestSeverity.WARNING
+        assert result.mode == TestMode.APPROX
+        assert "not verified" in result.message
+
+    def test_overestimated_distinct_count_is_not_a_pass(self, adapter):
+        # APPROX_COUNT_DISTINCT overestimates this column, hiding its duplicate
+        adapter.execute_query(
+            "CREATE TABLE ids AS SELECT range AS id FROM range(1000) UNION ALL SELECT 7"
+        )
+        estimate = adapter.execute_query(adapter.generate_unique_approx_query("ids", "id"))
+        assert estimate[0][0] <= 0
+
+        result = UNIQUE.execute(adapter, "ids", "id", mode=TestMode.APPROX)
+
+        assert not result.passed
+        assert result.severity == TestSeverity.WARNING
+
+    def test_possible_violation_escalates_to_exact(self, adapter):
+        result = UNIQUE.execute(adapter, "orders", "id", mode=TestMode.APPROX)
+
+        assert not result.passed
+        assert result.rows_returned == 1
+        assert result.mode == TestMode.EXACT
+        assert "approximate check estimated" in result.message
+
+    def test_composite_key_runs_exact(self, adapter):
+        params = {"columns": ["id", "code"]}
+        result = UNIQUE.execute(adapter, "orders", params=params, mode=TestMode.APPROX)
+
+        assert result.passed
+        assert result.mode == TestMode.EXACT
+
+    def test_database_without_approx_count_distinct_runs_exact(self, adapter):
+        adapter.supports_approx_count_distinct = False
+
+        assert UNIQUE.get_approx_check_query(adapter, "orders", "code") is None
+        result = UNIQUE.execute(adapter, "orders", "code", mode=TestMode.APPROX)
+        assert result.passed
+        assert result.mode == TestMode.EXACT
+
+    def test_incremental_scope_runs_exact(self, adapter):
+        result = UNIQUE.execute(
+            adapter, "orders", "code", where="user_id = 10", mode=TestMode.APPROX
+        )
+
+        assert result.passed
+        assert result.mode == TestMode.EXACT
+
+
+class TestModeConfiguration:
+    """Test cases for the project and per-test mode configuration."""
+
+    def test_project_mode_applies_to_tests_that_support_it(self, adapter):
+        executor = TestExecutor(adapter, test_config={"mode": "approx"})
+
+        results = _by_test(executor.execute_tests_for_model("orders", METADATA))
+
+        assert results["id.not_null"].mode == TestMode.EXACT
+        assert results["id.unique"].mode == TestMode.EXACT
+        assert not results["id.unique"].passed
+        assert results["code.unique"].mode == TestMode.APPROX
+        assert results["orders.row_count_gt_0"].mode == TestMode.EXACT
+
+    def test_test_definition_overrides_project_mode(self, adapter):
+        metadata = {
+            "schema": [
+                {"name": "id", "tests": [{"name": "not_null", "mode": "exact"}]},
+                {
+                    "name": "code",
+                    "tests": [{"name": "unique", "mode": "sample", "sample_percent": 100}],
+                },
+            ]
+        }
+        executor = ModelTestExecutor(adapter, mode="approx", sample_percent=1)
+
+        results = _by_test(executor.execute_tests_for_model("orders", metadata))
+
+        assert results["id.not_null"].mode == TestMode.EXACT
+        assert results["code.unique"].mode == TestMode.SAMPLE
+        assert "(100% sample)" in results["code.unique"].message
+
+    def test_full_tests_run_exact(self, adapter):
+        executor = ModelTestExecutor(adapter, full_tests=True, mode="sample")
+
+        results = executor.execute_tests_for_model("orders", METADATA)
+
+        assert all(result.mode == TestMode.EXACT for result in results)
+
+    def test_invalid_project_mode(self, adapter):
+        with pytest.raises(ValueError, match="Invalid test mode"):
+            TestExecutor(adapter, test_config={"mode": "fast"})